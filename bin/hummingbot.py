@@ -3,6 +3,7 @@
 import path_util        # noqa: F401
 import asyncio
 import errno
+import logging
 import socket
 from typing import (
     List,
@@ -10,6 +11,7 @@ from typing import (
 )
 
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.settings import connector_import_report
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.config.config_helpers import (
     create_yml_files,
@@ -56,6 +58,7 @@ async def main():
         init_logging("hummingbot_logs.yml",
                      override_log_level=global_config_map.get("log_level").value,
                      dev_mode=dev_mode)
+        logging.getLogger(__name__).debug("\n".join(connector_import_report()))
         tasks: List[Coroutine] = [hb.run()]
         if global_config_map.get("debug_console").value:
             if not hasattr(__builtins__, "help"):
@@ -16,6 +16,7 @@ from hummingbot import (
     init_logging,
 )
 from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.settings import connector_import_report
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.config.config_helpers import (
     create_yml_files,
@@ -107,6 +108,7 @@ async def quick_start(args):
         init_logging("hummingbot_logs.yml",
                      override_log_level=log_level,
                      dev_mode=dev_mode)
+        logging.getLogger(__name__).debug("\n".join(connector_import_report()))
 
         if hb.strategy_file_name is not None and hb.strategy_name is not None:
             await write_config_to_yml(hb.strategy_name, hb.strategy_file_name)
@@ -23,7 +23,8 @@ from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils import map_df_to_str
 from hummingbot.model.inventory_cost import InventoryCost
 from hummingbot.strategy.pure_market_making import (
-    PureMarketMakingStrategy
+    PureMarketMakingStrategy,
+    PureMarketMakingMultiPairStrategy,
 )
 from hummingbot.strategy.perpetual_market_making import (
     PerpetualMarketMakingStrategy
@@ -40,6 +41,9 @@ global_configs_to_display = ["0x_active_cancels",
                              "autofill_import",
                              "kill_switch_enabled",
                              "kill_switch_rate",
+                             "risk_max_drawdown_pct",
+                             "risk_max_position_pct",
+                             "risk_max_orders_per_minute",
                              "telegram_enabled",
                              "telegram_token",
                              "telegram_chat_id",
@@ -163,9 +167,14 @@ class ConfigCommand:
             if isinstance(self.strategy, PureMarketMakingStrategy) or \
                isinstance(self.strategy, PerpetualMarketMakingStrategy):
                 updated = ConfigCommand.update_running_mm(self.strategy, key, config_var.value)
-                if updated:
-                    self._notify(f"\nThe current {self.strategy_name} strategy has been updated "
-                                 f"to reflect the new configuration.")
+            elif isinstance(self.strategy, PureMarketMakingMultiPairStrategy):
+                updated = all([ConfigCommand.update_running_mm(strategy, key, config_var.value)
+                               for strategy in self.strategy.strategies])
+            else:
+                updated = False
+            if updated:
+                self._notify(f"\nThe current {self.strategy_name} strategy has been updated "
+                             f"to reflect the new configuration.")
         except asyncio.TimeoutError:
             self.logger().error("Prompt timeout")
         except Exception as err:
@@ -17,10 +17,12 @@ from hummingbot.client.settings import (
     ConnectorType,
     DERIVATIVES
 )
+from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.user.user_balances import UserBalances
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.core.event.events import PriceType
 
 s_float_0 = float(0)
 s_decimal_0 = Decimal("0")
@@ -50,9 +52,13 @@ class HistoryCommand:
         if global_config_map.get("paper_trade_enabled").value:
             self._notify("\n  Paper Trading ON: All orders are simulated, and no real orders are placed.")
         start_time = get_timestamp(days) if days > 0 else self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
-        if not trades:
+        trades: Optional[List[TradeFill]] = None
+        if self._performance_tracked(start_time):
+            has_trades = self.performance_tracker.trade_count > 0
+        else:
+            trades = self._get_trades_from_session(int(start_time * 1e3), config_file_path=self.strategy_file_name)
+            has_trades = len(trades) > 0
+        if not has_trades:
             self._notify("\n  No past trades to report.")
             return
         if verbose:
@@ -62,17 +68,18 @@ class HistoryCommand:
 
     async def history_report(self,  # type: HummingbotApplication
                              start_time: float,
-                             trades: List[TradeFill],
+                             trades: Optional[List[TradeFill]] = None,
                              precision: Optional[int] = None,
                              display_report: bool = True) -> Decimal:
-        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
+        """
+        Reports the performance of each market since the start time.
+        :param trades: The trades since the start time, only queried if needed when not given
+        :returns The average return of the markets
+        """
         if display_report:
             self.report_header(start_time)
         return_pcts = []
-        for market, symbol in market_info:
-            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-            cur_balances = await self.get_current_balances(market)
-            perf = await PerformanceMetrics.create(market, symbol, cur_trades, cur_balances)
+        for market, symbol, perf in await self.get_performance_metrics(start_time, trades):
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
@@ -81,6 +88,61 @@ class HistoryCommand:
             self._notify(f"\nAveraged Return = {avg_return:.2%}")
         return avg_return
 
+    def _performance_tracked(self,  # type: HummingbotApplication
+                             start_time: float) -> bool:
+        return (self.performance_tracker is not None and
+                self.performance_tracker.covers(start_time, self.strategy_file_name))
+
+    async def get_performance_metrics(self,  # type: HummingbotApplication
+                                      start_time: float,
+                                      trades: Optional[List[TradeFill]] = None
+                                      ) -> List[Tuple[str, str, PerformanceMetrics]]:
+        """
+        Calculates the performance of each market and trading pair traded since the start time.
+        Spot markets are reported from the running totals of the performance tracker when it covers the start time.
+        The other markets (derivatives, or all of them for other start times) are calculated from their trades.
+        :param trades: The trades since the start time, only queried if needed when not given
+        :returns A list of (market, trading pair, performance)
+        """
+        results: List[Tuple[str, str, PerformanceMetrics]] = []
+        tracked_markets: Set[Tuple[str, str]] = set()
+        if self._performance_tracked(start_time):
+            for (market, symbol), state in self.performance_tracker.market_states.items():
+                if not state.is_derivative:
+                    cur_balances = await self.get_current_balances(market)
+                    perf = self.performance_tracker.performance_metrics(market,
+                                                                        symbol,
+                                                                        cur_balances,
+                                                                        self._get_current_price(market, symbol))
+                    results.append((market, symbol, perf))
+                    tracked_markets.add((market, symbol))
+            if len(tracked_markets) == len(self.performance_tracker.market_states):
+                return results
+
+        if trades is None:
+            trades = self._get_trades_from_session(int(start_time * 1e3), config_file_path=self.strategy_file_name)
+        market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades) - tracked_markets
+        for market, symbol in market_info:
+            cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
+            cur_balances = await self.get_current_balances(market)
+            perf = await PerformanceMetrics.create(market, symbol, cur_trades, cur_balances)
+            results.append((market, symbol, perf))
+        return results
+
+    def _get_current_price(self,  # type: HummingbotApplication
+                           market: str,
+                           trading_pair: str) -> Optional[Decimal]:
+        """
+        The mid price of the trading pair on the market if it's running, from its order book
+        """
+        for connector in self.markets.values():
+            if connector.display_name == market and connector.ready and isinstance(connector, ExchangeBase):
+                try:
+                    return connector.get_price_by_type(trading_pair, PriceType.MidPrice)
+                except ValueError:
+                    return None
+        return None
+
     async def get_current_balances(self,  # type: HummingbotApplication
                                    market: str):
         if market in self.markets and self.markets[market].ready:
@@ -189,7 +251,6 @@ class HistoryCommand:
                                       ) -> Decimal:
         """
         Determines the profitability of the trading bot.
-        This function is used by the KillSwitch class.
         Must be updated if the method of performance report gets updated.
         """
         if not self.markets_recorder:
@@ -197,10 +258,7 @@ class HistoryCommand:
         if any(not market.ready for market in self.markets.values()):
             return s_decimal_0
 
-        start_time = self.init_time
-        trades: List[TradeFill] = self._get_trades_from_session(int(start_time * 1e3),
-                                                                config_file_path=self.strategy_file_name)
-        avg_return = await self.history_report(start_time, trades, display_report=False)
+        avg_return = await self.history_report(self.init_time, display_report=False)
         return avg_return
 
     def list_trades(self,  # type: HummingbotApplication
@@ -19,15 +19,17 @@ from hummingbot.client.config.config_helpers import (
 )
 import hummingbot.client.settings as settings
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from hummingbot.core.utils.kill_switch import KillSwitch
+from hummingbot.client.risk_guard import RiskGuard
 from typing import TYPE_CHECKING
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.script.script_iterator import ScriptIterator
+from hummingbot.strategy.pure_market_making import PureMarketMakingMultiPairStrategy
 from hummingbot.connector.connector_status import get_connector_status, warning_messages
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.command.rate_command import RateCommand
 from hummingbot.client.config.config_validators import validate_bool
-from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle, RateOracleSource
+from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.exceptions import OracleRateUnavailable
 
 if TYPE_CHECKING:
@@ -64,7 +66,8 @@ class StartCommand:
             return
 
         if settings.required_rate_oracle:
-            if not (await self.confirm_oracle_conversion_rate()):
+            # Order book rates are only available once the markets of the strategy are running.
+            if RateOracle.source != RateOracleSource.order_book and not (await self.confirm_oracle_conversion_rate()):
                 self._notify("The strategy failed to start.")
                 return
             else:
@@ -131,8 +134,16 @@ class StartCommand:
                             await market.cancel_all(5.0)
                         else:
                             self._notify(f"Restored {len(market.limit_orders)} limit orders on {market.name}...")
+            # The oracle conversion rates from the order books are only known once the markets are ready
+            wait_for_order_book_rates = RateOracle.source == RateOracleSource.order_book and \
+                settings.required_rate_oracle
             if self.strategy:
                 self.clock.add_iterator(self.strategy)
+                if wait_for_order_book_rates:
+                    self.clock.pause_iterator(self.strategy)
+            if RateOracle.source == RateOracleSource.order_book:
+                RateOracle.get_instance().set_order_book_markets(
+                    [market for market in self.markets.values() if isinstance(market, ExchangeBase)])
             if global_config_map["script_enabled"].value:
                 script_file = global_config_map["script_file_path"].value
                 folder = dirname(script_file)
@@ -140,13 +151,22 @@ class StartCommand:
                     script_file = join(settings.SCRIPTS_PATH, script_file)
                 if self.strategy_name != "pure_market_making":
                     self._notify("Error: script feature is only available for pure_market_making strategy (for now).")
+                elif isinstance(self.strategy, PureMarketMakingMultiPairStrategy):
+                    self._notify("Error: script feature is not available with pure_market_making additional markets.")
                 else:
                     self._script_iterator = ScriptIterator(script_file, list(self.markets.values()),
-                                                           self.strategy, 0.1)
+                                                           self.strategy)
                     self.clock.add_iterator(self._script_iterator)
                     self._notify(f"Script ({script_file}) started.")
 
             self.strategy_task: asyncio.Task = safe_ensure_future(self._run_clock(), loop=self.ev_loop)
+            if self.strategy and wait_for_order_book_rates:
+                self._notify("\nWaiting for the order books of the markets to get the oracle conversion rates...")
+                if not await self.wait_till_ready(self.confirm_order_book_conversion_rate):
+                    self._notify("The strategy failed to start.")
+                    self.stop()
+                    return
+                self.clock.resume_iterator(self.strategy)
             self._notify(f"\n'{strategy_name}' strategy started.\n"
                          f"Run `status` command to query the progress.")
             self.logger().info("start command initiated.")
@@ -155,11 +175,26 @@ class StartCommand:
                 self._notify("Warning: Ensure that the trading pair is in the right order .i.e. {BASE}-{QUOTE}.")
 
             if self._trading_required:
-                self.kill_switch = KillSwitch(self)
-                await self.wait_till_ready(self.kill_switch.start)
+                self.risk_guard = RiskGuard(self)
+                await self.wait_till_ready(self.risk_guard.start)
         except Exception as e:
             self.logger().error(str(e), exc_info=True)
 
+    def confirm_order_book_conversion_rate(self,  # type: HummingbotApplication
+                                           ) -> bool:
+        rate_oracle = RateOracle.get_instance()
+        rate_oracle.update_order_book_prices()
+        result = True
+        for pair in settings.rate_oracle_pairs:
+            rate = rate_oracle.rate(pair)
+            if rate is None:
+                self._notify(f"Oracle rate is not available for {pair} from the order books of the markets.")
+                result = False
+            else:
+                base, quote = pair.split("-")
+                self._notify(f"\nRate Oracle:\nSource: {RateOracle.source.name}\n1 {base} = {rate} {quote}")
+        return result
+
     async def confirm_oracle_conversion_rate(self,  # type: HummingbotApplication
                                              ) -> bool:
         try:
@@ -51,8 +51,11 @@ class StopCommand:
         if self.markets_recorder is not None:
             self.markets_recorder.stop()
 
-        if self.kill_switch is not None:
-            self.kill_switch.stop()
+        if self.performance_tracker is not None:
+            self.performance_tracker.stop()
+
+        if self.risk_guard is not None:
+            self.risk_guard.stop()
 
         self.wallet = None
         self.strategy_task = None
@@ -60,4 +63,5 @@ class StopCommand:
         self.market_pair = None
         self.clock = None
         self.markets_recorder = None
+        self.performance_tracker = None
         self.market_trading_pairs_map.clear()
@@ -30,7 +30,8 @@ from hummingbot.client.settings import (
     CONF_FILE_PATH,
     CONF_POSTFIX,
     CONF_PREFIX,
-    CONNECTOR_SETTINGS
+    CONNECTOR_SETTINGS,
+    import_connector_module,
 )
 from hummingbot.client.config.security import Security
 from hummingbot.core.utils.market_price import get_last_price
@@ -174,8 +175,7 @@ def _merge_dicts(*args: Dict[str, ConfigVar]) -> OrderedDict:
 
 def get_connector_class(connector_name: str) -> Callable:
     conn_setting = CONNECTOR_SETTINGS[connector_name]
-    mod = __import__(conn_setting.module_path(),
-                     fromlist=[conn_setting.class_name()])
+    mod = import_connector_module(conn_setting.module_path())
     return getattr(mod, conn_setting.class_name())
 
 
@@ -7,7 +7,8 @@ import hummingbot.client.settings as settings
 from hummingbot.client.config.config_methods import paper_trade_disabled, using_exchange as using_exchange_pointer
 from hummingbot.client.config.config_validators import (
     validate_bool,
-    validate_decimal
+    validate_decimal,
+    validate_int,
 )
 from hummingbot.core.rate_oracle.rate_oracle import RateOracleSource, RateOracle
 
@@ -188,6 +189,30 @@ main_config_map = {
                   default=-100,
                   validator=lambda v: validate_decimal(v, Decimal(-100), Decimal(100)),
                   required_if=lambda: global_config_map["kill_switch_enabled"].value),
+    "risk_max_drawdown_pct":
+        ConfigVar(key="risk_max_drawdown_pct",
+                  prompt="By how much may the profit/loss rate fall from its highest value before the bot stops? "
+                         "(Enter 5 to indicate 5 percent, leave empty for no limit) >>> ",
+                  type_str="decimal",
+                  required_if=lambda: False,
+                  default=None,
+                  validator=lambda v: validate_decimal(v, Decimal(0), Decimal(100), inclusive=False) if v else None),
+    "risk_max_position_pct":
+        ConfigVar(key="risk_max_position_pct",
+                  prompt="How large a position may the bot take on a trading pair, as a percentage of the starting "
+                         "value of its assets? (Enter 20 to indicate 20 percent, leave empty for no limit) >>> ",
+                  type_str="decimal",
+                  required_if=lambda: False,
+                  default=None,
+                  validator=lambda v: validate_decimal(v, Decimal(0), inclusive=False) if v else None),
+    "risk_max_orders_per_minute":
+        ConfigVar(key="risk_max_orders_per_minute",
+                  prompt="How many orders may the bot create per minute before the strategy is paused? "
+                         "(Leave empty for no limit) >>> ",
+                  type_str="int",
+                  required_if=lambda: False,
+                  default=None,
+                  validator=lambda v: validate_int(v, min_value=1) if v else None),
     "autofill_import":
         ConfigVar(key="autofill_import",
                   prompt="What to auto-fill in the prompt after each import command? (start/config) >>> ",
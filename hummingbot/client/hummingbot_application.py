@@ -27,13 +27,14 @@ from hummingbot.client.config.config_helpers import (
 )
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.cross_exchange_market_making import CrossExchangeMarketPair
-from hummingbot.core.utils.kill_switch import KillSwitch
+from hummingbot.client.risk_guard import RiskGuard
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.connector.markets_recorder import MarketsRecorder
+from hummingbot.client.performance_tracker import PerformanceTracker
 from hummingbot.client.config.security import Security
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType
@@ -89,13 +90,14 @@ class HummingbotApplication(*commands):
         self.log_queue_listener: Optional[logging.handlers.QueueListener] = None
         self.data_feed: Optional[DataFeedBase] = None
         self.notifiers: List[NotifierBase] = []
-        self.kill_switch: Optional[KillSwitch] = None
+        self.risk_guard: Optional[RiskGuard] = None
         self._app_warnings: Deque[ApplicationWarning] = deque()
         self._trading_required: bool = True
         self._last_started_strategy_file: Optional[str] = None
 
         self.trade_fill_db: Optional[SQLConnectionManager] = None
         self.markets_recorder: Optional[MarketsRecorder] = None
+        self.performance_tracker: Optional[PerformanceTracker] = None
         self._script_iterator = None
         self._binance_connector = None
 
@@ -288,6 +290,12 @@ class HummingbotApplication(*commands):
         )
         self.markets_recorder.start()
 
+        self.performance_tracker = PerformanceTracker(self.strategy_file_name, self.init_time)
+        self.performance_tracker.bootstrap(
+            lambda start_timestamp: self._get_trades_from_session(start_timestamp,
+                                                                  config_file_path=self.strategy_file_name))
+        self.performance_tracker.start(list(self.markets.values()))
+
     def _initialize_notifiers(self):
         if global_config_map.get("telegram_enabled").value:
             # TODO: refactor to use single instance
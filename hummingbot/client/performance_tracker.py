@@ -0,0 +1,429 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from hummingbot import data_path
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    TradeFee,
+    TradeType,
+    interchangeable,
+)
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.trade_fill import TradeFill
+
+if TYPE_CHECKING:
+    from hummingbot.connector.connector_base import ConnectorBase
+
+s_decimal_0 = Decimal("0")
+s_decimal_nan = Decimal("NaN")
+
+# (market, order id, exchange trade id) identifying a fill
+FillKey = Tuple[str, str, str]
+
+
+@dataclass
+class MarketPerformanceState:
+    """
+    Running totals of the fills of a trading pair on a market. Volumes are kept as absolute amounts, the signs used in
+    the performance report are applied by to_performance_metrics.
+    """
+    num_buys: int = 0
+    num_sells: int = 0
+    b_vol_base: Decimal = s_decimal_0
+    b_vol_quote: Decimal = s_decimal_0
+    s_vol_base: Decimal = s_decimal_0
+    s_vol_quote: Decimal = s_decimal_0
+    # Fees paid in the base or quote asset, valued in quote at the fill price
+    fee_in_quote: Decimal = s_decimal_0
+    # Fee amounts by token, percent fees being counted in the quote asset
+    fees: Dict[str, Decimal] = field(default_factory=dict)
+    start_price: Decimal = s_decimal_nan
+    last_price: Decimal = s_decimal_nan
+    is_derivative: bool = False
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def net_base(self) -> Decimal:
+        return self.b_vol_base - self.s_vol_base
+
+    @property
+    def realized_pnl(self) -> Decimal:
+        """
+        PnL of the volume bought and sold back, at the average buy and sell prices.
+        """
+        matched_amount: Decimal = min(self.b_vol_base, self.s_vol_base)
+        if matched_amount == s_decimal_0:
+            return s_decimal_0
+        return matched_amount * (self.s_vol_quote / self.s_vol_base - self.b_vol_quote / self.b_vol_base)
+
+    def unrealized_pnl(self, current_price: Decimal) -> Decimal:
+        """
+        PnL of the open inventory (net bought or net sold amount) valued at the current price.
+        """
+        net_base: Decimal = self.net_base
+        if net_base > s_decimal_0:
+            return net_base * (current_price - self.b_vol_quote / self.b_vol_base)
+        elif net_base < s_decimal_0:
+            return net_base * (current_price - self.s_vol_quote / self.s_vol_base)
+        return s_decimal_0
+
+    def trade_pnl(self, current_price: Decimal) -> Decimal:
+        """
+        The current portfolio value minus the value of holding the starting balances, i.e. realized plus unrealized PnL
+        """
+        return self.net_base * current_price + self.s_vol_quote - self.b_vol_quote
+
+    def record(self,
+               trading_pair: str,
+               trade_type: TradeType,
+               price: Decimal,
+               amount: Decimal,
+               trade_fee: TradeFee,
+               position: str = "NILL"):
+        if self.num_trades == 0:
+            self.start_price = price
+        self.last_price = price
+        quote_amount: Decimal = price * amount
+        if trade_type is TradeType.BUY:
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote += quote_amount
+        else:
+            self.num_sells += 1
+            self.s_vol_base += amount
+            self.s_vol_quote += quote_amount
+        if position != "NILL":
+            self.is_derivative = True
+
+        quote: str = trading_pair.split("-")[1]
+        if trade_fee.percent > 0:
+            self.fees[quote] = self.fees.get(quote, s_decimal_0) + quote_amount * trade_fee.percent
+        for fee_asset, fee_amount in trade_fee.flat_fees:
+            self.fees[fee_asset] = self.fees.get(fee_asset, s_decimal_0) + fee_amount
+        self.fee_in_quote += trade_fee.fee_amount_in_quote(trading_pair, price, amount)
+
+    def to_performance_metrics(self,
+                               trading_pair: str,
+                               current_balances: Dict[str, Decimal],
+                               current_price: Decimal,
+                               fee_in_quote: Decimal) -> PerformanceMetrics:
+        """
+        Fills the performance report of the trading pair the same way PerformanceMetrics.create does from the list of
+        trades, without going through the trades.
+        """
+        base, quote = trading_pair.split("-")
+        divide = PerformanceMetrics.divide
+        perf: PerformanceMetrics = PerformanceMetrics()
+        perf.num_buys = self.num_buys
+        perf.num_sells = self.num_sells
+        perf.num_trades = self.num_trades
+
+        perf.b_vol_base = self.b_vol_base
+        perf.s_vol_base = -self.s_vol_base
+        perf.tot_vol_base = perf.b_vol_base + perf.s_vol_base
+        perf.b_vol_quote = -self.b_vol_quote
+        perf.s_vol_quote = self.s_vol_quote
+        perf.tot_vol_quote = perf.b_vol_quote + perf.s_vol_quote
+        perf.avg_b_price = divide(self.b_vol_quote, self.b_vol_base)
+        perf.avg_s_price = divide(self.s_vol_quote, self.s_vol_base)
+        perf.avg_tot_price = divide(self.b_vol_quote + self.s_vol_quote, self.b_vol_base + self.s_vol_base)
+
+        perf.cur_base_bal = current_balances.get(base, s_decimal_0)
+        perf.cur_quote_bal = current_balances.get(quote, s_decimal_0)
+        perf.start_base_bal = perf.cur_base_bal - perf.tot_vol_base
+        perf.start_quote_bal = perf.cur_quote_bal - perf.tot_vol_quote
+        perf.start_price = self.start_price
+        perf.cur_price = current_price
+        perf.start_base_ratio_pct = divide(perf.start_base_bal * perf.start_price,
+                                           (perf.start_base_bal * perf.start_price) + perf.start_quote_bal)
+        perf.cur_base_ratio_pct = divide(perf.cur_base_bal * perf.cur_price,
+                                         (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal)
+        perf.hold_value = (perf.start_base_bal * perf.cur_price) + perf.start_quote_bal
+        perf.cur_value = (perf.cur_base_bal * perf.cur_price) + perf.cur_quote_bal
+        perf.trade_pnl = self.trade_pnl(current_price)
+
+        perf.fees = dict(self.fees)
+        perf.fee_in_quote = fee_in_quote
+        perf.total_pnl = perf.trade_pnl - perf.fee_in_quote
+        perf.return_pct = divide(perf.total_pnl, perf.hold_value)
+        return perf
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "num_buys": self.num_buys,
+            "num_sells": self.num_sells,
+            "b_vol_base": str(self.b_vol_base),
+            "b_vol_quote": str(self.b_vol_quote),
+            "s_vol_base": str(self.s_vol_base),
+            "s_vol_quote": str(self.s_vol_quote),
+            "fee_in_quote": str(self.fee_in_quote),
+            "fees": {token: str(amount) for token, amount in self.fees.items()},
+            "start_price": str(self.start_price),
+            "last_price": str(self.last_price),
+            "is_derivative": self.is_derivative,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "MarketPerformanceState":
+        return MarketPerformanceState(
+            num_buys=data["num_buys"],
+            num_sells=data["num_sells"],
+            b_vol_base=Decimal(data["b_vol_base"]),
+            b_vol_quote=Decimal(data["b_vol_quote"]),
+            s_vol_base=Decimal(data["s_vol_base"]),
+            s_vol_quote=Decimal(data["s_vol_quote"]),
+            fee_in_quote=Decimal(data["fee_in_quote"]),
+            fees={token: Decimal(amount) for token, amount in data["fees"].items()},
+            start_price=Decimal(data["start_price"]),
+            last_price=Decimal(data["last_price"]),
+            is_derivative=data["is_derivative"],
+        )
+
+
+class PerformanceTracker:
+    """
+    Accumulates the performance of the fills of a strategy config since a start time, market by market, as the fill
+    events come in. Reports are then built from the running totals in O(markets) instead of going through all the
+    trades of the session.
+
+    The state is checkpointed to a file at most every CHECKPOINT_INTERVAL seconds and when the tracker stops. A tracker
+    created later for the same config and start time (e.g. on a strategy restart) resumes from the checkpoint and only
+    catches up with the fills recorded after it.
+    """
+    _pt_logger: Optional[HummingbotLogger] = None
+
+    CHECKPOINT_INTERVAL = 60.0
+    # Fills recorded within this many milliseconds before the last fill are remembered, so the catch-up from the trade
+    # fills table doesn't count them twice when their recorded timestamps differ slightly from the tracker's.
+    FILL_DEDUP_WINDOW_MS = 1000
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._pt_logger is None:
+            cls._pt_logger = logging.getLogger(__name__)
+        return cls._pt_logger
+
+    def __init__(self,
+                 config_file_path: str,
+                 start_time: float,
+                 checkpoint_path: Optional[str] = None):
+        """
+        :param config_file_path: The strategy config file the fills are recorded for
+        :param start_time: Fills before this time (in seconds) are not accounted for
+        :param checkpoint_path: The file to save checkpoints to, defaults to performance_<config>.json in the data path
+        """
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._config_file_path: str = config_file_path
+        self._start_time: float = start_time
+        self._checkpoint_path: str = checkpoint_path or os.path.join(
+            data_path(), f"performance_{config_file_path[:-4]}.json")
+        self._market_states: Dict[Tuple[str, str], MarketPerformanceState] = {}
+        self._last_fill_timestamp: int = 0
+        self._recent_fills: Deque[Tuple[int, FillKey]] = deque()
+        self._recent_fill_keys: Set[FillKey] = set()
+        self._last_checkpoint_time: float = 0
+        self._markets: List["ConnectorBase"] = []
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+
+    @property
+    def config_file_path(self) -> str:
+        return self._config_file_path
+
+    @property
+    def start_time(self) -> float:
+        return self._start_time
+
+    @property
+    def checkpoint_path(self) -> str:
+        return self._checkpoint_path
+
+    @property
+    def market_states(self) -> Dict[Tuple[str, str], MarketPerformanceState]:
+        """
+        Running states by (market, trading pair)
+        """
+        return self._market_states
+
+    @property
+    def trade_count(self) -> int:
+        return sum(state.num_trades for state in self._market_states.values())
+
+    def covers(self, start_time: float, config_file_path: str) -> bool:
+        """
+        Whether the tracker accounts for the fills of the config since the start time.
+        """
+        return self._start_time == start_time and self._config_file_path == config_file_path
+
+    def bootstrap(self, get_trades: Callable[[int], List[TradeFill]]):
+        """
+        Restores the last checkpoint of the tracker, if any, and accounts for the fills recorded since.
+        :param get_trades: Returns the trade fills of the config from a timestamp (in milliseconds), in time order
+        """
+        self._load_checkpoint()
+        from_timestamp: int = max(int(self._start_time * 1e3), self._last_fill_timestamp - self.FILL_DEDUP_WINDOW_MS)
+        for trade_fill in get_trades(from_timestamp):
+            self.record_trade_fill(trade_fill)
+
+    def start(self, markets: List["ConnectorBase"]):
+        self._markets = markets
+        for market in self._markets:
+            market.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def stop(self):
+        for market in self._markets:
+            market.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+        self._markets = []
+        self.save_checkpoint()
+
+    def record_trade_fill(self, trade_fill: TradeFill):
+        self._record(trade_fill.market,
+                     trade_fill.symbol,
+                     TradeType[trade_fill.trade_type.upper()],
+                     Decimal(str(trade_fill.price)),
+                     Decimal(str(trade_fill.amount)),
+                     TradeFee.from_json(trade_fill.trade_fee),
+                     trade_fill.position or "NILL",
+                     trade_fill.timestamp,
+                     (trade_fill.market, trade_fill.order_id, trade_fill.exchange_trade_id or ""),
+                     skip_recent=True)
+
+    def _did_fill_order(self,
+                        event_tag: int,
+                        market: "ConnectorBase",
+                        evt: OrderFilledEvent):
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
+            return
+
+        self._record(market.display_name,
+                     evt.trading_pair,
+                     evt.trade_type,
+                     evt.price,
+                     evt.amount,
+                     evt.trade_fee,
+                     evt.position or "NILL",
+                     int(time.time() * 1e3),
+                     (market.display_name, evt.order_id, evt.exchange_trade_id or ""))
+        if time.time() - self._last_checkpoint_time >= self.CHECKPOINT_INTERVAL:
+            self.save_checkpoint()
+
+    def _record(self,
+                market: str,
+                trading_pair: str,
+                trade_type: TradeType,
+                price: Decimal,
+                amount: Decimal,
+                trade_fee: TradeFee,
+                position: str,
+                timestamp: int,
+                fill_key: FillKey,
+                skip_recent: bool = False):
+        if timestamp < self._start_time * 1e3 or (skip_recent and fill_key in self._recent_fill_keys):
+            return
+        state: Optional[MarketPerformanceState] = self._market_states.get((market, trading_pair))
+        if state is None:
+            state = self._market_states[(market, trading_pair)] = MarketPerformanceState()
+        state.record(trading_pair, trade_type, price, amount, trade_fee, position)
+
+        self._last_fill_timestamp = max(self._last_fill_timestamp, timestamp)
+        self._recent_fills.append((timestamp, fill_key))
+        self._recent_fill_keys.add(fill_key)
+        while self._recent_fills[0][0] < self._last_fill_timestamp - self.FILL_DEDUP_WINDOW_MS:
+            self._recent_fill_keys.discard(self._recent_fills.popleft()[1])
+
+    @staticmethod
+    def fee_in_quote(state: MarketPerformanceState, trading_pair: str) -> Decimal:
+        """
+        The fees paid for a trading pair in its quote asset. Fees paid in other tokens than the base and quote assets
+        are valued at the rate oracle's current rates, and left out if the oracle has no rate for them.
+        """
+        base, quote = trading_pair.split("-")
+        fee_in_quote: Decimal = state.fee_in_quote
+        for fee_token, fee_amount in state.fees.items():
+            if not interchangeable(fee_token, base) and not interchangeable(fee_token, quote):
+                rate: Optional[Decimal] = RateOracle.get_instance().rate(f"{fee_token}-{quote}")
+                if rate is not None:
+                    fee_in_quote += fee_amount * rate
+        return fee_in_quote
+
+    def performance_metrics(self,
+                            market: str,
+                            trading_pair: str,
+                            current_balances: Dict[str, Decimal],
+                            current_price: Optional[Decimal] = None) -> PerformanceMetrics:
+        """
+        :param market: The market display name
+        :param trading_pair: The trading pair
+        :param current_balances: The current balances of the market
+        :param current_price: The current price of the trading pair, the last fill price is used if not available
+        :returns The performance of the trading pair on the market since the start time
+        """
+        state: MarketPerformanceState = self._market_states[(market, trading_pair)]
+        if current_price is None or current_price.is_nan():
+            current_price = state.last_price
+        return state.to_performance_metrics(trading_pair,
+                                            current_balances,
+                                            current_price,
+                                            self.fee_in_quote(state, trading_pair))
+
+    def save_checkpoint(self):
+        checkpoint: Dict[str, Any] = {
+            "config_file_path": self._config_file_path,
+            "start_time": self._start_time,
+            "last_fill_timestamp": self._last_fill_timestamp,
+            "recent_fills": [[timestamp, list(fill_key)] for timestamp, fill_key in self._recent_fills],
+            "markets": [[market, trading_pair, state.to_json()]
+                        for (market, trading_pair), state in self._market_states.items()],
+        }
+        try:
+            with open(self._checkpoint_path, "w") as checkpoint_file:
+                json.dump(checkpoint, checkpoint_file)
+            self._last_checkpoint_time = time.time()
+        except OSError:
+            self.logger().error(f"Error saving performance checkpoint to {self._checkpoint_path}.", exc_info=True)
+
+    def _load_checkpoint(self):
+        if not os.path.exists(self._checkpoint_path):
+            return
+        try:
+            with open(self._checkpoint_path) as checkpoint_file:
+                checkpoint: Dict[str, Any] = json.load(checkpoint_file)
+            if not self.covers(checkpoint["start_time"], checkpoint["config_file_path"]):
+                return
+            self._market_states = {(market, trading_pair): MarketPerformanceState.from_json(state)
+                                   for market, trading_pair, state in checkpoint["markets"]}
+            self._last_fill_timestamp = checkpoint["last_fill_timestamp"]
+            self._recent_fills = deque((timestamp, tuple(fill_key))
+                                       for timestamp, fill_key in checkpoint["recent_fills"])
+            self._recent_fill_keys = set(fill_key for _, fill_key in self._recent_fills)
+        except Exception:
+            self.logger().warning(f"Ignoring invalid performance checkpoint {self._checkpoint_path}.", exc_info=True)
+            self._market_states = {}
+            self._last_fill_timestamp = 0
+            self._recent_fills.clear()
+            self._recent_fill_keys.clear()
@@ -0,0 +1,301 @@
+import asyncio
+import copy
+import logging
+import threading
+import time
+from collections import deque
+from decimal import Decimal
+from functools import partial
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_tracker import (
+    MarketPerformanceState,
+    PerformanceTracker,
+)
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.event.event_forwarder import (
+    EventForwarder,
+    SourceInfoEventForwarder,
+)
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    OrderFilledEvent,
+    SellOrderCreatedEvent,
+)
+from hummingbot.core.pubsub import PubSub
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+    from hummingbot.connector.connector_base import ConnectorBase
+
+s_decimal_0 = Decimal("0")
+s_decimal_100 = Decimal("100")
+
+# (market display name, trading pair)
+MarketKey = Tuple[str, str]
+
+
+class RiskGuard:
+    """
+    Guards the running strategy against losses, large positions and bursts of orders. The performance of each traded
+    pair is updated as its fills come in and as its order book trades move its mark price, and only the limits the
+    event may have breached are evaluated:
+    - kill switch: the average return of the traded pairs reaches the kill switch rate
+    - max drawdown: the average return falls by more than the max drawdown from its highest value
+    - max position: the amount bought or sold on a pair, at the mark price, exceeds a share of its starting value
+    The bot is stopped as soon as one of these is breached. When more orders are created in a minute than the max order
+    rate, the strategy is paused until the oldest of these orders is a minute old.
+
+    Returns are calculated the same way as the performance report, from the fills since the start of the bot.
+    """
+    _rg_logger: Optional[HummingbotLogger] = None
+
+    ORDER_RATE_WINDOW = 60.0
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._rg_logger is None:
+            cls._rg_logger = logging.getLogger(__name__)
+        return cls._rg_logger
+
+    def __init__(self, hummingbot_application: "HummingbotApplication"):
+        self._hummingbot_application = hummingbot_application
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        kill_switch_rate: Optional[Decimal] = None
+        if global_config_map.get("kill_switch_enabled").value:
+            kill_switch_rate = Decimal(global_config_map.get("kill_switch_rate").value or "0.0") / s_decimal_100
+        self._kill_switch_rate: Optional[Decimal] = kill_switch_rate
+        self._max_drawdown: Optional[Decimal] = self._pct_config("risk_max_drawdown_pct")
+        self._max_position: Optional[Decimal] = self._pct_config("risk_max_position_pct")
+        self._max_orders_per_minute: Optional[int] = global_config_map.get("risk_max_orders_per_minute").value
+
+        self._started: bool = False
+        self._markets: Dict[str, "ConnectorBase"] = {}
+        self._market_states: Dict[MarketKey, MarketPerformanceState] = {}
+        self._initial_balances: Dict[str, Dict[str, Decimal]] = {}
+        # Balances of the base and quote assets before the first fill of each pair
+        self._start_balances: Dict[MarketKey, Tuple[Decimal, Decimal]] = {}
+        self._mark_prices: Dict[MarketKey, Decimal] = {}
+        self._returns: Dict[MarketKey, Decimal] = {}
+        self._returns_sum: Decimal = s_decimal_0
+        self._peak_return: Optional[Decimal] = None
+        self._order_timestamps: Deque[float] = deque()
+        self._resume_handle: Optional[asyncio.TimerHandle] = None
+        self._listeners: List[Tuple[PubSub, Union[MarketEvent, OrderBookEvent], EventListener]] = []
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+        self._create_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_create_order)
+
+    @staticmethod
+    def _pct_config(key: str) -> Optional[Decimal]:
+        value = global_config_map.get(key).value
+        return Decimal(str(value)) / s_decimal_100 if value is not None else None
+
+    @property
+    def started(self) -> bool:
+        return self._started
+
+    @property
+    def enabled(self) -> bool:
+        return any(limit is not None for limit in [self._kill_switch_rate, self._max_drawdown, self._max_position,
+                                                   self._max_orders_per_minute])
+
+    @property
+    def average_return(self) -> Decimal:
+        return self._returns_sum / len(self._returns) if len(self._returns) > 0 else s_decimal_0
+
+    @property
+    def drawdown(self) -> Decimal:
+        return self._peak_return - self.average_return if self._peak_return is not None else s_decimal_0
+
+    @property
+    def strategy_paused(self) -> bool:
+        return self._resume_handle is not None
+
+    def market_return(self, market: str, trading_pair: str) -> Optional[Decimal]:
+        return self._returns.get((market, trading_pair))
+
+    def start(self):
+        """
+        Starts guarding the markets of the application, once they are ready. The performance of the fills recorded
+        since the start of the bot, before the guard started, is taken from the performance tracker.
+        """
+        self.stop()
+        if not self.enabled:
+            return
+        self._markets = {market.display_name: market for market in self._hummingbot_application.markets.values()
+                         if market is not None}
+        self._initial_balances = {name: market.get_all_balances() for name, market in self._markets.items()}
+        self._market_states.clear()
+        self._start_balances.clear()
+        self._returns.clear()
+        self._returns_sum = s_decimal_0
+        self._peak_return = None
+        self._order_timestamps.clear()
+
+        application: "HummingbotApplication" = self._hummingbot_application
+        performance_tracker: Optional[PerformanceTracker] = application.performance_tracker
+        if performance_tracker is not None and performance_tracker.covers(application.init_time,
+                                                                          application.strategy_file_name):
+            for (market_name, trading_pair), state in performance_tracker.market_states.items():
+                if market_name in self._markets:
+                    self._market_states[(market_name, trading_pair)] = copy.deepcopy(state)
+
+        for market in self._markets.values():
+            self._add_listener(market, MarketEvent.OrderFilled, self._fill_order_forwarder)
+            if self._max_orders_per_minute is not None:
+                self._add_listener(market, MarketEvent.BuyOrderCreated, self._create_order_forwarder)
+                self._add_listener(market, MarketEvent.SellOrderCreated, self._create_order_forwarder)
+            if isinstance(market, ExchangeBase):
+                trade_forwarder: EventForwarder = EventForwarder(partial(self._did_trade, market.display_name))
+                for order_book in market.order_books.values():
+                    self._add_listener(order_book, OrderBookEvent.TradeEvent, trade_forwarder)
+        self._started = True
+
+        for (market_name, trading_pair), state in self._market_states.items():
+            base, quote = trading_pair.split("-")
+            balances: Dict[str, Decimal] = self._initial_balances[market_name]
+            self._start_balances[(market_name, trading_pair)] = (
+                balances.get(base, s_decimal_0) - state.net_base,
+                balances.get(quote, s_decimal_0) + state.b_vol_quote - state.s_vol_quote)
+        for key in list(self._market_states):
+            if self._evaluate(key):
+                break
+
+    def stop(self):
+        for pubsub, event_tag, listener in self._listeners:
+            pubsub.remove_listener(event_tag, listener)
+        self._listeners.clear()
+        if self._resume_handle is not None:
+            self._resume_handle.cancel()
+            self._resume_handle = None
+        self._started = False
+
+    def _add_listener(self, pubsub: PubSub, event_tag: Union[MarketEvent, OrderBookEvent], listener: EventListener):
+        pubsub.add_listener(event_tag, listener)
+        self._listeners.append((pubsub, event_tag, listener))
+
+    def _did_fill_order(self,
+                        event_tag: int,
+                        market: "ConnectorBase",
+                        evt: OrderFilledEvent):
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self._did_fill_order, event_tag, market, evt)
+            return
+        if not self._started:
+            return
+
+        key: MarketKey = (market.display_name, evt.trading_pair)
+        state: Optional[MarketPerformanceState] = self._market_states.get(key)
+        if state is None:
+            base, quote = evt.trading_pair.split("-")
+            balances: Dict[str, Decimal] = self._initial_balances.get(market.display_name, {})
+            state = self._market_states[key] = MarketPerformanceState()
+            self._start_balances[key] = (balances.get(base, s_decimal_0), balances.get(quote, s_decimal_0))
+        state.record(evt.trading_pair, evt.trade_type, evt.price, evt.amount, evt.trade_fee, evt.position or "NILL")
+        self._evaluate(key)
+
+    def _did_trade(self, market_name: str, evt: OrderBookTradeEvent):
+        if not self._started:
+            return
+        key: MarketKey = (market_name, evt.trading_pair)
+        self._mark_prices[key] = Decimal(str(evt.price))
+        if key in self._market_states:
+            self._evaluate(key)
+
+    def _did_create_order(self,
+                          event_tag: int,
+                          market: "ConnectorBase",
+                          evt: Union[BuyOrderCreatedEvent, SellOrderCreatedEvent]):
+        if threading.current_thread() != threading.main_thread():
+            self._ev_loop.call_soon_threadsafe(self._did_create_order, event_tag, market, evt)
+            return
+        if not self._started:
+            return
+
+        now: float = time.time()
+        self._order_timestamps.append(now)
+        while self._order_timestamps[0] <= now - self.ORDER_RATE_WINDOW:
+            self._order_timestamps.popleft()
+        if len(self._order_timestamps) > self._max_orders_per_minute and self._resume_handle is None:
+            self._pause_strategy(self._order_timestamps[0] + self.ORDER_RATE_WINDOW - now)
+
+    def _evaluate(self, key: MarketKey) -> bool:
+        """
+        Updates the return of the pair and checks the limits it affects.
+        :returns True if the bot is stopped
+        """
+        state: MarketPerformanceState = self._market_states[key]
+        trading_pair: str = key[1]
+        price: Decimal = self._mark_prices.get(key, state.last_price)
+        start_base, start_quote = self._start_balances[key]
+        hold_value: Decimal = start_base * price + start_quote
+        total_pnl: Decimal = state.trade_pnl(price) - PerformanceTracker.fee_in_quote(state, trading_pair)
+        pair_return: Decimal = PerformanceMetrics.divide(total_pnl, hold_value)
+
+        self._returns_sum += pair_return - self._returns.get(key, s_decimal_0)
+        self._returns[key] = pair_return
+        average_return: Decimal = self.average_return
+        if self._peak_return is None or average_return > self._peak_return:
+            self._peak_return = average_return
+
+        if self._kill_switch_rate is not None and \
+                ((average_return <= self._kill_switch_rate < s_decimal_0) or
+                 (average_return >= self._kill_switch_rate > s_decimal_0)):
+            return self._stop_bot("Kill switch threshold reached", f"Current profitability is {average_return}.")
+        if self._max_drawdown is not None and self._peak_return - average_return >= self._max_drawdown:
+            return self._stop_bot("Max drawdown reached",
+                                  f"Current profitability is {average_return}, down from {self._peak_return}.")
+        if self._max_position is not None:
+            position: Decimal = PerformanceMetrics.divide(abs(state.net_base) * price, hold_value)
+            if position >= self._max_position:
+                return self._stop_bot("Max position reached",
+                                      f"The position on {trading_pair} ({key[0]}) is {position:.2%} of its value.")
+        return False
+
+    def _stop_bot(self, reason: str, details: str) -> bool:
+        self.logger().info(f"{reason}. Stopping the bot...")
+        self._hummingbot_application._notify(f"\n[{reason}]\n{details} Stopping the bot...")
+        # The strategy ticks are paused right away, so it doesn't create any other order while the bot stops.
+        self._pause_strategy_ticks()
+        self.stop()
+        self._hummingbot_application.stop()
+        return True
+
+    def _pause_strategy(self, duration: float):
+        self.logger().info(f"Max order rate reached. Pausing the strategy for {duration:.1f} seconds...")
+        self._hummingbot_application._notify(f"\n[Max order rate reached]\n"
+                                             f"More than {self._max_orders_per_minute} orders were created in the "
+                                             f"last minute. Pausing the strategy for {duration:.1f} seconds...")
+        # The strategy is only skipped on clock ticks, stopping it would remove its market listeners.
+        self._pause_strategy_ticks()
+        self._resume_handle = self._ev_loop.call_later(duration, self._resume_strategy)
+
+    def _resume_strategy(self):
+        self._resume_handle = None
+        clock = self._hummingbot_application.clock
+        strategy = self._hummingbot_application.strategy
+        if self._started and clock is not None and strategy is not None and strategy in clock.paused_iterators:
+            self.logger().info("Resuming the strategy.")
+            clock.resume_iterator(strategy)
+
+    def _pause_strategy_ticks(self):
+        clock = self._hummingbot_application.clock
+        strategy = self._hummingbot_application.strategy
+        if clock is not None and strategy is not None:
+            clock.pause_iterator(strategy)
@@ -3,7 +3,14 @@ Define ConnectorSetting class (contains metadata about the exchanges hummingbot
 generate a dictionary of exchange names to ConnectorSettings.
 """
 
+import hashlib
 import importlib
+import inspect
+import json
+import logging
+import os
+import sys
+import time
 from os import scandir
 from os.path import (
     realpath,
@@ -11,9 +18,11 @@ from os.path import (
 )
 from enum import Enum
 from decimal import Decimal
-from typing import List, NamedTuple, Dict, Any
+from types import ModuleType
+from typing import List, NamedTuple, Dict, Any, Optional, Tuple
 from hummingbot import get_strategy_list
 from pathlib import Path
+from hummingbot.client.config.config_methods import using_exchange
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.core.event.events import TradeFeeType
 
@@ -46,6 +55,13 @@ GATEAWAY_CA_CERT_PATH = realpath(join(__file__, join(f"../../../{CERTS_PATH}/ca_
 GATEAWAY_CLIENT_CERT_PATH = realpath(join(__file__, join(f"../../../{CERTS_PATH}/client_cert.pem")))
 GATEAWAY_CLIENT_KEY_PATH = realpath(join(__file__, join(f"../../../{CERTS_PATH}/client_key.pem")))
 
+# Cached connectors metadata, generated from the connector utils modules so that they don't have to be imported
+CONNECTOR_MANIFEST_PATH = realpath(join(__file__, "../../connector/.connector_manifest.json"))
+CONNECTOR_MANIFEST_VERSION = 1
+
+# Time (in seconds) the import of each connector module took, including the modules it imported
+connector_import_times: Dict[str, float] = {}
+
 
 class ConnectorType(Enum):
     """
@@ -109,12 +125,36 @@ class ConnectorSetting(NamedTuple):
             return self.name
 
 
-def _create_connector_settings() -> Dict[str, ConnectorSetting]:
+def import_connector_module(module_path: str) -> ModuleType:
+    """
+    Imports a connector module, recording how long the import took for the import cost report.
+    """
+    if module_path in sys.modules:
+        return sys.modules[module_path]
+    start_time = time.perf_counter()
+    try:
+        return importlib.import_module(module_path)
+    finally:
+        connector_import_times[module_path] = time.perf_counter() - start_time
+
+
+def connector_import_report(max_rows: int = 20) -> List[str]:
+    """
+    Returns the lines of a report of the connector modules imported so far, from the most expensive to import.
+    """
+    import_times = sorted(connector_import_times.items(), key=lambda item: item[1], reverse=True)
+    lines = [f"Connector modules imported: {len(import_times)} in "
+             f"{sum(import_time for _, import_time in import_times):.3f}s"]
+    lines.extend(f"  {import_time:8.3f}s  {module_path}" for module_path, import_time in import_times[:max_rows])
+    return lines
+
+
+def _connector_utils_paths() -> Dict[str, Tuple[str, str]]:
     """
-    Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+    Returns the connector type directory name and the utils file path of each connector directory.
     """
     connector_exceptions = ["paper_trade", "eterbase"]
-    connector_settings = {}
+    utils_paths = {}
     package_dir = Path(__file__).resolve().parent.parent.parent
     type_dirs = [f for f in scandir(f'{str(package_dir)}/hummingbot/connector') if f.is_dir()]
     for type_dir in type_dirs:
@@ -123,50 +163,195 @@ def _create_connector_settings() -> Dict[str, ConnectorSetting]:
             if connector_dir.name.startswith("_") or \
                     connector_dir.name in connector_exceptions:
                 continue
-            if connector_dir.name in connector_settings:
+            if connector_dir.name in utils_paths:
                 raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-            path = f"hummingbot.connector.{type_dir.name}.{connector_dir.name}.{connector_dir.name}_utils"
-            try:
-                util_module = importlib.import_module(path)
-            except ModuleNotFoundError:
-                continue
-            fee_type = TradeFeeType.Percent
-            fee_type_setting = getattr(util_module, "FEE_TYPE", None)
-            if fee_type_setting is not None:
-                fee_type = TradeFeeType[fee_type_setting]
-            connector_settings[connector_dir.name] = ConnectorSetting(
-                name=connector_dir.name,
-                type=ConnectorType[type_dir.name.capitalize()],
-                centralised=getattr(util_module, "CENTRALIZED", True),
-                example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
-                fee_type=fee_type,
-                fee_token=getattr(util_module, "FEE_TOKEN", ""),
-                default_fees=getattr(util_module, "DEFAULT_FEES", []),
-                config_keys=getattr(util_module, "KEYS", {}),
-                is_sub_domain=False,
-                parent_name=None,
-                domain_parameter=None,
-                use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False)
+            utils_paths[connector_dir.name] = (type_dir.name, join(connector_dir.path, f"{connector_dir.name}_utils.py"))
+    return utils_paths
+
+
+def _utils_module_path(type_dir_name: str, connector_name: str) -> str:
+    return f"hummingbot.connector.{type_dir_name}.{connector_name}.{connector_name}_utils"
+
+
+def _manifest_fingerprint(utils_paths: Dict[str, Tuple[str, str]]) -> str:
+    """
+    Fingerprints the connector utils files, a change to any of them makes the manifest out of date.
+    """
+    fingerprint = hashlib.sha1(str(CONNECTOR_MANIFEST_VERSION).encode())
+    for name, (type_dir_name, utils_path) in sorted(utils_paths.items()):
+        try:
+            stat = os.stat(utils_path)
+            fingerprint.update(f"{type_dir_name}/{name}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+        except FileNotFoundError:
+            fingerprint.update(f"{type_dir_name}/{name}:-;".encode())
+    return fingerprint.hexdigest()
+
+
+def _config_var_spec(config_var: ConfigVar) -> Optional[Dict[str, Any]]:
+    """
+    Returns the attributes a connector config var can be created again from, or None if it has behaviours (e.g. a
+    validator) that can only be found in its utils module.
+    """
+    init_defaults = inspect.signature(ConfigVar.__init__).parameters
+    if config_var._validator is not init_defaults["validator"].default or \
+            config_var._on_validated is not init_defaults["on_validated"].default or \
+            not isinstance(config_var.prompt, (str, type(None))) or \
+            not isinstance(config_var.default, (str, bool, int, float, type(None))):
+        return None
+    required_if_exchange = None
+    if config_var._required_if is not init_defaults["required_if"].default:
+        if config_var._required_if.__code__ is not using_exchange("").__code__:
+            return None
+        required_if_exchange = inspect.getclosurevars(config_var._required_if).nonlocals["exchange"]
+    return {
+        "prompt": config_var.prompt,
+        "is_secure": config_var.is_secure,
+        "default": config_var.default,
+        "type_str": config_var.type,
+        "required_if_exchange": required_if_exchange,
+        "prompt_on_new": config_var.prompt_on_new,
+        "is_connect_key": config_var.is_connect_key,
+        "printable_key": config_var.printable_key,
+    }
+
+
+def _config_keys_spec(config_keys: Dict[str, ConfigVar]) -> Optional[Dict[str, Dict[str, Any]]]:
+    specs = {key: _config_var_spec(config_var) for key, config_var in config_keys.items()}
+    return None if any(spec is None for spec in specs.values()) else specs
+
+
+def _config_keys_from_spec(specs: Dict[str, Dict[str, Any]]) -> Dict[str, ConfigVar]:
+    config_keys = {}
+    for key, spec in specs.items():
+        spec = dict(spec)
+        required_if_exchange = spec.pop("required_if_exchange")
+        if required_if_exchange is not None:
+            spec["required_if"] = using_exchange(required_if_exchange)
+        config_keys[key] = ConfigVar(key=key, **spec)
+    return config_keys
+
+
+def _connector_manifest_entry(type_dir_name: str, util_module: ModuleType) -> Dict[str, Any]:
+    """
+    Reads the metadata of a connector and of its other domains from its utils module.
+    """
+    entry = {
+        "type": type_dir_name,
+        "centralised": getattr(util_module, "CENTRALIZED", True),
+        "example_pair": getattr(util_module, "EXAMPLE_PAIR", ""),
+        "use_ethereum_wallet": getattr(util_module, "USE_ETHEREUM_WALLET", False),
+        "fee_type": getattr(util_module, "FEE_TYPE", None),
+        "fee_token": getattr(util_module, "FEE_TOKEN", ""),
+        "default_fees": getattr(util_module, "DEFAULT_FEES", []),
+        "config_keys": _config_keys_spec(getattr(util_module, "KEYS", {})),
+        "use_eth_gas_lookup": getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+        "other_domains": {},
+    }
+    for domain in getattr(util_module, "OTHER_DOMAINS", []):
+        entry["other_domains"][domain] = {
+            "example_pair": getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+            "default_fees": getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain],
+            "config_keys": _config_keys_spec(getattr(util_module, "OTHER_DOMAINS_KEYS")[domain]),
+            "domain_parameter": getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+        }
+    return entry
+
+
+def _generate_connector_manifest(utils_paths: Dict[str, Tuple[str, str]], fingerprint: str) -> Dict[str, Any]:
+    """
+    Imports every connector utils module to generate the manifest, and caches it for the next start.
+    """
+    manifest = {"version": CONNECTOR_MANIFEST_VERSION, "fingerprint": fingerprint, "connectors": {},
+                "unavailable": []}
+    for name, (type_dir_name, _) in utils_paths.items():
+        try:
+            util_module = import_connector_module(_utils_module_path(type_dir_name, name))
+        except ModuleNotFoundError:
+            manifest["unavailable"].append(name)
+            continue
+        manifest["connectors"][name] = _connector_manifest_entry(type_dir_name, util_module)
+    try:
+        temp_path = f"{CONNECTOR_MANIFEST_PATH}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.replace(temp_path, CONNECTOR_MANIFEST_PATH)
+    except OSError:
+        logging.getLogger(__name__).debug("Could not save the connector manifest.", exc_info=True)
+    return manifest
+
+
+def _load_connector_manifest() -> Dict[str, Any]:
+    """
+    Loads the cached connector manifest, generating it again when the connector utils have changed or when a
+    connector that couldn't be imported (e.g. because of a missing dependency) can now be.
+    """
+    utils_paths = _connector_utils_paths()
+    fingerprint = _manifest_fingerprint(utils_paths)
+    try:
+        with open(CONNECTOR_MANIFEST_PATH) as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        manifest = None
+    if manifest is None or manifest.get("fingerprint") != fingerprint:
+        return _generate_connector_manifest(utils_paths, fingerprint)
+    for name in manifest["unavailable"]:
+        try:
+            import_connector_module(_utils_module_path(utils_paths[name][0], name))
+        except ModuleNotFoundError:
+            continue
+        return _generate_connector_manifest(utils_paths, fingerprint)
+    return manifest
+
+
+def _create_connector_settings() -> Dict[str, ConnectorSetting]:
+    """
+    Create a dictionary of exchange names to ConnectorSetting from the connector manifest, only the utils modules of
+    the connectors with config keys that can't be described in the manifest are imported.
+    """
+    connector_settings = {}
+    for name, entry in _load_connector_manifest()["connectors"].items():
+        util_module = None
+        if entry["config_keys"] is None or \
+                any(domain["config_keys"] is None for domain in entry["other_domains"].values()):
+            util_module = import_connector_module(_utils_module_path(entry["type"], name))
+        fee_type = TradeFeeType.Percent
+        if entry["fee_type"] is not None:
+            fee_type = TradeFeeType[entry["fee_type"]]
+        connector_settings[name] = ConnectorSetting(
+            name=name,
+            type=ConnectorType[entry["type"].capitalize()],
+            centralised=entry["centralised"],
+            example_pair=entry["example_pair"],
+            use_ethereum_wallet=entry["use_ethereum_wallet"],
+            fee_type=fee_type,
+            fee_token=entry["fee_token"],
+            default_fees=entry["default_fees"],
+            config_keys=_config_keys_from_spec(entry["config_keys"]) if entry["config_keys"] is not None
+            else getattr(util_module, "KEYS", {}),
+            is_sub_domain=False,
+            parent_name=None,
+            domain_parameter=None,
+            use_eth_gas_lookup=entry["use_eth_gas_lookup"]
+        )
+        for domain, domain_entry in entry["other_domains"].items():
+            parent = connector_settings[name]
+            connector_settings[domain] = ConnectorSetting(
+                name=domain,
+                type=parent.type,
+                centralised=parent.centralised,
+                example_pair=domain_entry["example_pair"],
+                use_ethereum_wallet=parent.use_ethereum_wallet,
+                fee_type=parent.fee_type,
+                fee_token=parent.fee_token,
+                default_fees=domain_entry["default_fees"],
+                config_keys=_config_keys_from_spec(domain_entry["config_keys"])
+                if domain_entry["config_keys"] is not None
+                else getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
+                is_sub_domain=True,
+                parent_name=parent.name,
+                domain_parameter=domain_entry["domain_parameter"],
+                use_eth_gas_lookup=parent.use_eth_gas_lookup
             )
-            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-            for domain in other_domains:
-                parent = connector_settings[connector_dir.name]
-                connector_settings[domain] = ConnectorSetting(
-                    name=domain,
-                    type=parent.type,
-                    centralised=parent.centralised,
-                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                    use_ethereum_wallet=parent.use_ethereum_wallet,
-                    fee_type=parent.fee_type,
-                    fee_token=parent.fee_token,
-                    default_fees=getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain],
-                    config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                    is_sub_domain=True,
-                    parent_name=parent.name,
-                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                    use_eth_gas_lookup=parent.use_eth_gas_lookup
-                )
     return connector_settings
 
 
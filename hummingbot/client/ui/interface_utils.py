@@ -1,8 +1,7 @@
 from decimal import Decimal
 from typing import (
-    Set,
-    Tuple,
-    List
+    List,
+    Optional,
 )
 import psutil
 import datetime
@@ -56,16 +55,19 @@ async def start_trade_monitor(trade_monitor):
     while True:
         if hb.strategy_task is not None and not hb.strategy_task.done():
             if all(market.ready for market in hb.markets.values()):
-                trades: List[TradeFill] = hb._get_trades_from_session(int(hb.init_time * 1e3),
-                                                                      config_file_path=hb.strategy_file_name)
-                if len(trades) > total_trades:
-                    total_trades = len(trades)
-                    market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
-                    for market, symbol in market_info:
+                trades: Optional[List[TradeFill]] = None
+                if hb.performance_tracker is not None and hb.performance_tracker.covers(hb.init_time,
+                                                                                        hb.strategy_file_name):
+                    # The running totals are kept up to date by the tracker, there is no need to query the trades
+                    trade_count = hb.performance_tracker.trade_count
+                else:
+                    trades = hb._get_trades_from_session(int(hb.init_time * 1e3),
+                                                         config_file_path=hb.strategy_file_name)
+                    trade_count = len(trades)
+                if trade_count > total_trades:
+                    total_trades = trade_count
+                    for market, symbol, perf in await hb.get_performance_metrics(hb.init_time, trades):
                         quote_asset = symbol.split("-")[1]  # Note that the qiote asset of the last pair is assumed to be the quote asset of P&L for simplicity
-                        cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-                        cur_balances = await hb.get_current_balances(market)
-                        perf = await PerformanceMetrics.create(market, symbol, cur_trades, cur_balances)
                         return_pcts.append(perf.return_pct)
                         pnls.append(perf.total_pnl)
                     avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
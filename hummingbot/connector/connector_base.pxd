@@ -14,6 +14,8 @@ cdef class ConnectorBase(NetworkIterator):
         public double _in_flight_orders_snapshot_timestamp
         public set _current_trade_fills
         public dict _exchange_order_ids
+        object _fill_balance_ledger
+        object _fill_balance_forwarder
 
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
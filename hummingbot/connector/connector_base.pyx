@@ -11,8 +11,10 @@ from hummingbot.core.event.events import (
     OrderType,
     TradeType
 )
+from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.network_iterator import NetworkIterator
+from hummingbot.connector.fill_balance_ledger import FillBalanceLedger
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.event.events import OrderFilledEvent
@@ -44,15 +46,20 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.RangePositionFailure,
         MarketEvent.RangePositionInitiated,
     ]
+    # Number of most recent events kept in the event log
+    EVENT_LOG_SIZE = 10000
 
     def __init__(self):
         super().__init__()
 
         self._event_reporter = EventReporter(event_source=self.display_name)
-        self._event_logger = EventLogger(event_source=self.display_name)
+        self._event_logger = EventLogger(event_source=self.display_name, max_events=self.EVENT_LOG_SIZE)
         for event_tag in self.MARKET_EVENTS:
             self.c_add_listener(event_tag.value, self._event_reporter)
             self.c_add_listener(event_tag.value, self._event_logger)
+        self._fill_balance_ledger = FillBalanceLedger()
+        self._fill_balance_forwarder = EventForwarder(self._record_fill_balance)
+        self.c_add_listener(MarketEvent.OrderFilled.value, self._fill_balance_forwarder)
 
         self._account_balances = {}  # Dict[asset_name:str, Decimal]
         self._account_available_balances = {}  # Dict[asset_name:str, Decimal]
@@ -137,24 +144,11 @@ cdef class ConnectorBase(NetworkIterator):
         :param starting_timestamp: The starting timestamp to include filter order filled events
         :returns A dictionary of tokens and their balance
         """
-        order_filled_events = list(filter(lambda e: isinstance(e, OrderFilledEvent), self.event_logs))
-        order_filled_events = [o for o in order_filled_events if o.timestamp > starting_timestamp]
-        balances = {}
-        for event in order_filled_events:
-            base, quote = event.trading_pair.split("-")[0], event.trading_pair.split("-")[1]
-            if event.trade_type is TradeType.BUY:
-                quote_value = Decimal("-1") * event.price * event.amount
-                base_value = event.amount
-            else:
-                quote_value = event.price * event.amount
-                base_value = Decimal("-1") * event.amount
-            if base not in balances:
-                balances[base] = s_decimal_0
-            if quote not in balances:
-                balances[quote] = s_decimal_0
-            balances[base] += base_value
-            balances[quote] += quote_value
-        return balances
+        return self._fill_balance_ledger.balances_since(starting_timestamp)
+
+    def _record_fill_balance(self, event: OrderFilledEvent):
+        if isinstance(event, OrderFilledEvent):
+            self._fill_balance_ledger.record(event)
 
     def get_exchange_limit_config(self, market: str) -> Dict[str, object]:
         """
@@ -17,6 +17,7 @@ from typing import (
 )
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -55,7 +56,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         params = {
             "symbol": convert_to_exchange_trading_pair(trading_pair)
         }
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             async with client.get(url=url, params=params) as resp:
                 resp_json = await resp.json()
                 return float(resp_json["lastPrice"])
@@ -69,7 +70,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         url = utils.rest_url(path_url=CONSTANTS.EXCHANGE_INFO_URL, domain=domain)
         throttler = throttler or BinancePerpetualAPIOrderBookDataSource._get_throttler_instance()
         async with throttler.execute_task(limit_id=CONSTANTS.EXCHANGE_INFO_URL):
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 async with client.get(url=url, timeout=10) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -99,7 +100,7 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         url = utils.rest_url(CONSTANTS.SNAPSHOT_REST_URL, domain)
         throttler = throttler or BinancePerpetualAPIOrderBookDataSource._get_throttler_instance()
         async with throttler.execute_task(limit_id=CONSTANTS.SNAPSHOT_REST_URL):
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 async with client.get(url=url, params=params) as response:
                     response: aiohttp.ClientResponse = response
                     if response.status != 200:
@@ -18,6 +18,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.connector.derivative.dydx_perpetual.dydx_perpetual_order_book import DydxPerpetualOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.logger import HummingbotLogger
@@ -56,7 +57,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             retval = {}
             for pair in trading_pairs:
                 resp = await client.get(f"{DYDX_V3_API_URL}{TICKER_URL}/{pair}")
@@ -84,7 +85,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = DydxPerpetualOrderBook.snapshot_message_from_exchange(
@@ -129,7 +130,7 @@ class DydxPerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 async with client.get(f"{DYDX_V3_API_URL}{MARKETS_URL}", timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
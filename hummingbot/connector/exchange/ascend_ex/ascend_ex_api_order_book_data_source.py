@@ -1,13 +1,13 @@
 #!/usr/bin/env python
 import asyncio
 import logging
-import aiohttp
 import websockets
 import ujson
 import time
 import pandas as pd
 
 from typing import Optional, List, Dict, Any, AsyncIterable
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.data_type.order_book import OrderBook
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
@@ -53,7 +53,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
         result = {}
 
         for trading_pair in trading_pairs:
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 throttler = throttler or cls._get_throttler_instance()
                 async with throttler.execute_task(CONSTANTS.TRADES_PATH_URL):
                     resp = await client.get(
@@ -84,7 +84,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs(throttler: Optional[AsyncThrottler] = None) -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             throttler = throttler or AscendExAPIOrderBookDataSource._get_throttler_instance()
             async with throttler.execute_task(CONSTANTS.TICKER_PATH_URL):
                 resp = await client.get(f"{CONSTANTS.REST_URL}/{CONSTANTS.TICKER_PATH_URL}")
@@ -101,7 +101,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Get whole orderbook
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             throttler = throttler or AscendExAPIOrderBookDataSource._get_throttler_instance()
             async with throttler.execute_task(CONSTANTS.DEPTH_PATH_URL):
                 resp = await client.get(
@@ -18,6 +18,9 @@ TRADES_PATH_URL = "trades"
 DEPTH_PATH_URL = "depth"
 INFO_PATH_URL = "info"
 
+# Maximum number of orders of a batch order or batch cancel request
+MAX_ORDERS_PER_BATCH = 10
+
 # WS API ENDPOINTS
 SUB_ENDPOINT_NAME = "sub"
 PONG_ENDPOINT_NAME = "pong"
@@ -475,6 +475,38 @@ class AscendExExchange(ExchangePyBase):
         safe_ensure_future(self._execute_cancel(trading_pair, order_id))
         return order_id
 
+    def batch_create_orders(self, orders_to_create: List[LimitOrder], order_type: OrderType = OrderType.LIMIT,
+                            **kwargs) -> List[LimitOrder]:
+        """
+        Places several orders with the batch order API end point. This function returns immediately.
+        To see the actual orders, you'll have to wait for their BuyOrderCreatedEvent and SellOrderCreatedEvent.
+        :param orders_to_create: The orders to place, their client order ids are not used
+        :param order_type: The order type of all the orders
+        :returns The orders with their new internal order ids
+        """
+        created_orders = [LimitOrder(ascend_ex_utils.gen_client_order_id(order.is_buy, order.trading_pair),
+                                     order.trading_pair,
+                                     order.is_buy,
+                                     order.base_currency,
+                                     order.quote_currency,
+                                     order.price,
+                                     order.quantity)
+                          for order in orders_to_create]
+        for i in range(0, len(created_orders), CONSTANTS.MAX_ORDERS_PER_BATCH):
+            safe_ensure_future(self._create_orders_batch(created_orders[i:i + CONSTANTS.MAX_ORDERS_PER_BATCH],
+                                                         order_type))
+        return created_orders
+
+    def batch_cancel_orders(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Cancels several orders with the batch cancel API end point. This function returns immediately.
+        To get the cancellation results, you'll have to wait for their OrderCancelledEvent.
+        :param orders_to_cancel: The orders to cancel
+        """
+        order_ids = [order.client_order_id for order in orders_to_cancel]
+        for i in range(0, len(order_ids), CONSTANTS.MAX_ORDERS_PER_BATCH):
+            safe_ensure_future(self._execute_batch_cancel(order_ids[i:i + CONSTANTS.MAX_ORDERS_PER_BATCH]))
+
     async def _create_order(self,
                             trade_type: TradeType,
                             order_id: str,
@@ -552,6 +584,73 @@ class AscendExExchange(ExchangePyBase):
             self.trigger_event(MarketEvent.OrderFailure,
                                MarketOrderFailureEvent(self.current_timestamp, order_id, order_type))
 
+    async def _create_orders_batch(self, orders: List[LimitOrder], order_type: OrderType):
+        """
+        Calls the batch order API end point to place the orders, starts tracking them. The exchange rejects the whole
+        batch when one of the orders is invalid, in which case all the orders fail.
+        The order created events are triggered by the order status updates, as for a single order with Ack response.
+        :param orders: The orders to place, with their internal order ids
+        :param order_type: The order type
+        """
+        if not order_type.is_limit_type():
+            raise Exception(f"Unsupported order type: {order_type}")
+        timestamp = ascend_ex_utils.get_ms_timestamp()
+        orders_params = []
+        for order in orders:
+            trade_type = TradeType.BUY if order.is_buy else TradeType.SELL
+            amount = self.quantize_order_amount(order.trading_pair, order.quantity, order.price)
+            price = self.quantize_order_price(order.trading_pair, order.price)
+            if amount <= s_decimal_0:
+                self.logger().warning(f"Order amount of {order.client_order_id} must be greater than zero.")
+                self.trigger_event(MarketEvent.OrderFailure,
+                                   MarketOrderFailureEvent(self.current_timestamp, order.client_order_id, order_type))
+                continue
+            orders_params.append({
+                "id": order.client_order_id,
+                "time": timestamp,
+                "symbol": ascend_ex_utils.convert_to_exchange_trading_pair(order.trading_pair),
+                "orderPrice": f"{price:f}",
+                "orderQty": f"{amount:f}",
+                "orderType": "limit",
+                "side": "buy" if trade_type == TradeType.BUY else "sell",
+            })
+            self.start_tracking_order(
+                order.client_order_id,
+                None,
+                order.trading_pair,
+                trade_type,
+                price,
+                amount,
+                order_type
+            )
+        if len(orders_params) == 0:
+            return
+        try:
+            resp = await self._api_request(
+                method="post",
+                path_url=CONSTANTS.ORDER_BATCH_PATH_URL,
+                data={"orders": orders_params},
+                is_auth_required=True,
+                force_auth_path_url="order/batch")
+            for order_info in resp["data"]["info"]:
+                tracked_order: AscendExInFlightOrder = self._in_flight_orders.get(order_info["id"])
+                if tracked_order is not None:
+                    tracked_order.update_exchange_order_id(str(order_info["orderId"]))
+            self.logger().info(f"Created {len(orders_params)} {order_type.name} orders with a batch order request.")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            msg = f"Error submitting {len(orders_params)} {order_type.name} orders to AscendEx in batch."
+            self.logger().network(
+                msg,
+                exc_info=True,
+                app_warning_msg=msg
+            )
+            for order_params in orders_params:
+                self.stop_tracking_order(order_params["id"])
+                self.trigger_event(MarketEvent.OrderFailure,
+                                   MarketOrderFailureEvent(self.current_timestamp, order_params["id"], order_type))
+
     def trigger_order_created_event(self, order: AscendExInFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
@@ -638,6 +737,46 @@ class AscendExExchange(ExchangePyBase):
                                 f"Check API key and network connection."
             )
 
+    async def _execute_batch_cancel(self, order_ids: List[str]):
+        """
+        Calls the batch cancel API end point for the orders. As for a single order, the API result doesn't confirm
+        whether the cancellations are successful, the orders are cancelled by the order status updates.
+        :param order_ids: The internal order ids
+        """
+        try:
+            tracked_orders = [self._in_flight_orders[order_id] for order_id in order_ids
+                              if order_id in self._in_flight_orders]
+            if len(tracked_orders) == 0:
+                return
+            exchange_order_ids = await safe_gather(*[order.get_exchange_order_id() for order in tracked_orders])
+            timestamp = ascend_ex_utils.get_ms_timestamp()
+            api_params = {
+                "orders": [
+                    {
+                        "id": ascend_ex_utils.uuid32(),
+                        "orderId": exchange_order_id,
+                        "symbol": ascend_ex_utils.convert_to_exchange_trading_pair(order.trading_pair),
+                        "time": timestamp
+                    }
+                    for order, exchange_order_id in zip(tracked_orders, exchange_order_ids)
+                ]
+            }
+            await self._api_request(
+                method="delete",
+                path_url=CONSTANTS.ORDER_BATCH_PATH_URL,
+                data=api_params,
+                is_auth_required=True,
+                force_auth_path_url="order/batch"
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger().network(
+                f"Failed to cancel orders {order_ids}: {str(e)}",
+                exc_info=True,
+                app_warning_msg="Failed to cancel the orders on AscendEx. Check API key and network connection."
+            )
+
     async def _status_polling_loop(self):
         """
         Periodically update user balances and order status via REST API. This serves as a fallback measure for web
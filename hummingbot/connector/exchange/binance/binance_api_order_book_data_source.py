@@ -6,16 +6,14 @@ import logging
 import pandas as pd
 from typing import (
     Any,
-    AsyncIterable,
     Dict,
     List,
     Optional
 )
 from decimal import Decimal
 import time
-import ujson
-import websockets
-from websockets.exceptions import ConnectionClosed
+from hummingbot.core.utils.http_client_manager import shared_http_client
+from hummingbot.core.utils.websocket_manager import WebsocketManager
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -24,18 +22,15 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.binance.binance_order_book import BinanceOrderBook
 from hummingbot.connector.exchange.binance.binance_utils import convert_to_exchange_trading_pair
+from hummingbot.connector.exchange.binance.binance_websocket_venue import BinanceWebsocketVenue
 
 SNAPSHOT_REST_URL = "https://api.binance.{}/api/v1/depth"
-DIFF_STREAM_URL = "wss://stream.binance.{}:9443/ws"
 TICKER_PRICE_CHANGE_URL = "https://api.binance.{}/api/v1/ticker/24hr"
 EXCHANGE_INFO_URL = "https://api.binance.{}/api/v1/exchangeInfo"
 
 
 class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
-    MESSAGE_TIMEOUT = 30.0
-    PING_TIMEOUT = 10.0
-
     _baobds_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -57,7 +52,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str, domain: str = "com") -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             url = TICKER_PRICE_CHANGE_URL.format(domain)
             resp = await client.get(f"{url}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
             resp_json = await resp.json()
@@ -67,7 +62,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @async_ttl_cache(ttl=2, maxsize=1)
     async def get_all_mid_prices(domain="com") -> Optional[Decimal]:
         from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             url = "https://api.binance.{}/api/v3/ticker/bookTicker".format(domain)
             resp = await client.get(url)
             resp_json = await resp.json()
@@ -81,7 +76,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def fetch_trading_pairs(domain="com") -> List[str]:
         try:
             from hummingbot.connector.exchange.binance.binance_utils import convert_from_exchange_trading_pair
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 url = EXCHANGE_INFO_URL.format(domain)
                 async with client.get(url, timeout=10) as response:
                     if response.status == 200:
@@ -124,7 +119,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000, self._domain)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BinanceOrderBook.snapshot_message_from_exchange(
@@ -136,72 +131,31 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
             order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
             return order_book
 
-    async def _inner_messages(self,
-                              ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
-        # Terminate the recv() loop as soon as the next message timed out, so the outer loop can reconnect.
-        try:
-            while True:
-                try:
-                    msg: str = await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
-                    yield msg
-                except asyncio.TimeoutError:
-                    pong_waiter = await ws.ping()
-                    await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
-        except asyncio.TimeoutError:
-            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
-            return
-        except ConnectionClosed:
-            return
-        finally:
-            await ws.close()
-
     async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                ws_path: str = "/".join([f"{convert_to_exchange_trading_pair(trading_pair).lower()}@trade"
-                                         for trading_pair in self._trading_pairs])
-                url = DIFF_STREAM_URL.format(self._domain)
-                stream_url: str = f"{url}/{ws_path}"
-
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
-                        output.put_nowait(trade_msg)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+        streams: List[str] = [f"{convert_to_exchange_trading_pair(trading_pair).lower()}@trade"
+                              for trading_pair in self._trading_pairs]
+
+        def handle_trade(msg: Dict[str, Any]):
+            trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
+            output.put_nowait(trade_msg)
+
+        # The trade and diff streams share the same multiplexed connection
+        await WebsocketManager.get_instance().listen(BinanceWebsocketVenue(self._domain), streams, handle_trade)
 
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                ws_path: str = "/".join([f"{convert_to_exchange_trading_pair(trading_pair).lower()}@depth"
-                                         for trading_pair in self._trading_pairs])
-                url = DIFF_STREAM_URL.format(self._domain)
-                stream_url: str = f"{url}/{ws_path}"
-
-                async with websockets.connect(stream_url) as ws:
-                    ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
-                            msg, time.time())
-                        output.put_nowait(order_book_message)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error with WebSocket connection. Retrying after 30 seconds...",
-                                    exc_info=True)
-                await asyncio.sleep(30.0)
+        streams: List[str] = [f"{convert_to_exchange_trading_pair(trading_pair).lower()}@depth"
+                              for trading_pair in self._trading_pairs]
+
+        def handle_diff(msg: Dict[str, Any]):
+            order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(msg, time.time())
+            output.put_nowait(order_book_message)
+
+        await WebsocketManager.get_instance().listen(BinanceWebsocketVenue(self._domain), streams, handle_diff)
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_http_client() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair,
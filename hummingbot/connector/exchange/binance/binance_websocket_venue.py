@@ -0,0 +1,52 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.utils.websocket_manager import WebsocketVenue
+
+COMBINED_STREAM_URL = "wss://stream.binance.{}:9443/stream"
+
+
+class BinanceWebsocketVenue(WebsocketVenue):
+    """
+    Binance combined streams: the streams are subscribed with SUBSCRIBE requests, and each message is wrapped as
+    {"stream": <stream name>, "data": <payload>}.
+    """
+    # Binance allows up to 1024 streams per connection, and 5 requests per second
+    max_streams_per_connection: int = 1024
+    MAX_STREAMS_PER_REQUEST: int = 200
+
+    def __init__(self, domain: str = "com"):
+        self._domain = domain
+
+    @property
+    def name(self) -> str:
+        return f"binance_{self._domain}"
+
+    @property
+    def url(self) -> str:
+        return COMBINED_STREAM_URL.format(self._domain)
+
+    def _requests(self, method: str, streams: List[str], request_id: int) -> List[Dict[str, Any]]:
+        return [{"method": method, "params": streams[i:i + self.MAX_STREAMS_PER_REQUEST], "id": request_id}
+                for i in range(0, len(streams), self.MAX_STREAMS_PER_REQUEST)]
+
+    def subscribe_messages(self, streams: List[str], request_id: int) -> List[Dict[str, Any]]:
+        return self._requests("SUBSCRIBE", streams, request_id)
+
+    def unsubscribe_messages(self, streams: List[str], request_id: int) -> List[Dict[str, Any]]:
+        return self._requests("UNSUBSCRIBE", streams, request_id)
+
+    def route(self, message: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+        if "stream" not in message:
+            # Request responses, e.g. {"result": null, "id": 1}
+            return None
+        return message["stream"], message["data"]
+
+    def message_timestamp(self, stream: str, payload: Dict[str, Any]) -> Optional[float]:
+        event_time: Optional[int] = payload.get("E")
+        return event_time * 1e-3 if event_time is not None else None
@@ -14,6 +14,7 @@ import signalr_aio
 import ujson
 from async_timeout import timeout
 
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -55,7 +56,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             resp = await client.get(f"{BITTREX_REST_URL}{BITTREX_TICKER_PATH}")
             resp_json = await resp.json()
             for trading_pair in trading_pairs:
@@ -64,7 +65,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return results
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BittrexOrderBook.snapshot_message_from_exchange(
@@ -81,7 +82,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 async with client.get(f"{BITTREX_REST_URL}{BITTREX_EXCHANGE_INFO_PATH}", timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: List[Dict[str, Any]] = await response.json()
@@ -216,7 +217,7 @@ class BittrexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         # Technically this does not listen for snapshot, Instead it periodically queries for snapshots.
         while True:
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_http_client() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
@@ -17,6 +17,7 @@ import time
 import ujson
 import websockets
 
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
@@ -54,7 +55,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             resp = await client.get(TICKER_PRICE_CHANGE_URL)
             resp_json = await resp.json()
 
@@ -68,7 +69,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 async with client.get(EXCHANGE_INFO_URL, timeout=API_CALL_TIMEOUT) as response:
                     if response.status == 200:
                         data = await response.json()
@@ -105,7 +106,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return _prepare_snapshot(trading_pair, data["bids"], data["asks"])
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = BlocktaneOrderBook.snapshot_message_from_exchange(
@@ -185,7 +186,7 @@ class BlocktaneAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
-                async with aiohttp.ClientSession() as client:
+                async with shared_http_client() as client:
                     for trading_pair in self._trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
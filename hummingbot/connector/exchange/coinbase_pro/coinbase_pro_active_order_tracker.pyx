@@ -7,10 +7,9 @@ from decimal import Decimal
 from typing import Dict
 
 from hummingbot.logger import HummingbotLogger
-from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.l3_order_book cimport L3OrderBook
 
 _cbpaot_logger = None
-s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
 
 CoinbaseProOrderBookTrackingDictionary = Dict[Decimal, Dict[str, Dict[str, any]]]
 
@@ -21,248 +20,114 @@ TYPE_DONE = "done"
 SIDE_BUY = "buy"
 SIDE_SELL = "sell"
 
-cdef class CoinbaseProActiveOrderTracker:
-    def __init__(self,
-                 active_asks: CoinbaseProOrderBookTrackingDictionary = None,
-                 active_bids: CoinbaseProOrderBookTrackingDictionary = None):
-        super().__init__()
-        self._active_asks = active_asks or {}
-        self._active_bids = active_bids or {}
 
-    @classmethod
-    def logger(cls) -> HummingbotLogger:
-        global _cbpaot_logger
-        if _cbpaot_logger is None:
-            _cbpaot_logger = logging.getLogger(__name__)
-        return _cbpaot_logger
-
-    @property
-    def active_asks(self) -> CoinbaseProOrderBookTrackingDictionary:
-        """
-        Get all asks on the order book in dictionary format
-        :returns: Dict[price, Dict[order_id, order_book_message]]
-        """
-        return self._active_asks
-
-    @property
-    def active_bids(self) -> CoinbaseProOrderBookTrackingDictionary:
-        """
-        Get all bids on the order book in dictionary format
-        :returns: Dict[price, Dict[order_id, order_book_message]]
-        """
-        return self._active_bids
-
-    def volume_for_ask_price(self, price) -> float:
-        """
-        For a certain price, get the volume sum of all ask order book rows with that price
-        :returns: volume sum
-        """
-        return sum([float(msg["remaining_size"]) for msg in self._active_asks[price].values()])
-
-    def volume_for_bid_price(self, price) -> float:
-        """
-        For a certain price, get the volume sum of all bid order book rows with that price
-        :returns: volume sum
-        """
-        return sum([float(msg["remaining_size"]) for msg in self._active_bids[price].values()])
-
-    cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
-        """
-        Interpret an incoming diff message and apply changes to the order book accordingly
-        :returns: new order book rows: Tuple(np.array (bids), np.array (asks))
-        """
+cdef class CoinbaseProL3MessageAdapter(L3MessageAdapter):
+    """
+    Applies the Coinbase Pro full channel messages to an L3OrderBook. The orders are found by their id, so 'change',
+    'match' and 'done' messages without price (market orders) are accepted, they do not match any order of the book.
+    """
 
+    cdef c_apply_diff_message(self, L3OrderBook l3_book, object message):
         cdef:
             dict content = message.content
             str msg_type = content["type"]
-            str order_id
+            str order_id = content.get("order_id") or content.get("maker_order_id")
             str order_side
             str price_raw
-            object price
-            dict order_dict
-            str remaining_size
-            double timestamp = message.timestamp
-            double quantity = 0
 
-        order_id = content.get("order_id") or content.get("maker_order_id")
-        order_side = content.get("side")
-        price_raw = content.get("price")
         if order_id is None:
             raise ValueError(f"Unknown order id for message - '{message}'. Aborting.")
-        if order_side not in [SIDE_BUY, SIDE_SELL]:
-            raise ValueError(f"Unknown order side for message - '{message}'. Aborting.")
-        if price_raw is None:
-            raise ValueError(f"Unknown order price for message - '{message}'. Aborting.")
-        elif price_raw == "null":  # 'change' messages have 'null' as price for market orders
-            return s_empty_diff, s_empty_diff
-        price = Decimal(price_raw)
 
         if msg_type == TYPE_OPEN:
-            order_dict = {
-                "order_id": order_id,
-                "remaining_size": content["remaining_size"]
-            }
-            if order_side == SIDE_BUY:
-                if price in self._active_bids:
-                    self._active_bids[price][order_id] = order_dict
-                else:
-                    self._active_bids[price] = {order_id: order_dict}
-                quantity = self.volume_for_bid_price(price)
-                return np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"), s_empty_diff
-            else:
-                if price in self._active_asks:
-                    self._active_asks[price][order_id] = order_dict
-                else:
-                    self._active_asks[price] = {order_id: order_dict}
-                quantity = self.volume_for_ask_price(price)
-                return s_empty_diff, np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
+            order_side = content.get("side")
+            price_raw = content.get("price")
+            if order_side not in [SIDE_BUY, SIDE_SELL]:
+                raise ValueError(f"Unknown order side for message - '{message}'. Aborting.")
+            if price_raw is None or price_raw == "null":
+                raise ValueError(f"Unknown order price for message - '{message}'. Aborting.")
+            l3_book.c_add_order(order_id.encode("utf8"), order_side == SIDE_BUY, float(price_raw),
+                                float(content["remaining_size"]))
 
         elif msg_type == TYPE_CHANGE:
             if content.get("new_size") is not None:
-                remaining_size = content["new_size"]
+                l3_book.c_set_order_size(order_id.encode("utf8"), float(content["new_size"]))
             elif content.get("new_funds") is not None:
-                remaining_size = str(Decimal(content["new_funds"]) / price)
+                price_raw = content.get("price")
+                # 'change' messages have 'null' as price for market orders, which are not on the book
+                if price_raw is not None and price_raw != "null":
+                    l3_book.c_set_order_size(order_id.encode("utf8"),
+                                             float(Decimal(content["new_funds"]) / Decimal(price_raw)))
             else:
                 raise ValueError(f"Invalid change message - '{message}'. Aborting.")
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    self._active_bids[price][order_id]["remaining_size"] = remaining_size
-                    quantity = self.volume_for_bid_price(price)
-                    return (
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                        s_empty_diff
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-            else:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    self._active_asks[price][order_id]["remaining_size"] = remaining_size
-                    quantity = self.volume_for_ask_price(price)
-                    return (
-                        s_empty_diff,
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
 
         elif msg_type == TYPE_MATCH:
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    remaining_size = self._active_bids[price][order_id]["remaining_size"]
-                    self._active_bids[price][order_id]["remaining_size"] = str(float(remaining_size) - float(content["size"]))
-                    quantity = self.volume_for_bid_price(price)
-                    return (
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                        s_empty_diff
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-            else:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    remaining_size = self._active_asks[price][order_id]["remaining_size"]
-                    self._active_asks[price][order_id]["remaining_size"] = str(float(remaining_size) - float(content["size"]))
-                    quantity = self.volume_for_ask_price(price)
-                    return (
-                        s_empty_diff,
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
+            l3_book.c_reduce_order_size(order_id.encode("utf8"), float(content["size"]))
 
         elif msg_type == TYPE_DONE:
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    del self._active_bids[price][order_id]
-                    if len(self._active_bids[price]) < 1:
-                        del self._active_bids[price]
-                        return (
-                            np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"),
-                            s_empty_diff
-                        )
-                    else:
-                        quantity = self.volume_for_bid_price(price)
-                        return (
-                            np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                            s_empty_diff
-                        )
-                return s_empty_diff, s_empty_diff
-            else:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    del self._active_asks[price][order_id]
-                    if len(self._active_asks[price]) < 1:
-                        del self._active_asks[price]
-                        return (
-                            s_empty_diff,
-                            np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64")
-                        )
-                    else:
-                        quantity = self.volume_for_ask_price(price)
-                        return (
-                            s_empty_diff,
-                            np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                        )
-                return s_empty_diff, s_empty_diff
+            l3_book.c_remove_order(order_id.encode("utf8"))
 
         else:
             raise ValueError(f"Unknown message type '{msg_type}' - {message}. Aborting.")
 
-    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message):
-        """
-        Interpret an incoming snapshot message and apply changes to the order book accordingly
-        :returns: new order book rows: Tuple(np.array (bids), np.array (asks))
-        """
-        cdef:
-            object price
-            str order_id
-            str amount
-            dict order_dict
+    cdef c_apply_snapshot_message(self, L3OrderBook l3_book, object message):
+        # The snapshot orders are [price, size, order_id]
+        for order in message.content["bids"]:
+            l3_book.c_add_order(order[2].encode("utf8"), True, float(order[0]), float(order[1]))
+        for order in message.content["asks"]:
+            l3_book.c_add_order(order[2].encode("utf8"), False, float(order[0]), float(order[1]))
 
-        # Refresh all order tracking.
-        self._active_bids.clear()
-        self._active_asks.clear()
-        for snapshot_orders, active_orders in [(message.content["bids"], self._active_bids),
-                                               (message.content["asks"], self._active_asks)]:
-            for order in snapshot_orders:
-                price = Decimal(order[0])
-                order_id = order[2]
-                amount = order[1]
-                order_dict = {
-                    "order_id": order_id,
-                    "remaining_size": amount
-                }
 
-                if price in active_orders:
-                    active_orders[price][order_id] = order_dict
-                else:
-                    active_orders[price] = {
-                        order_id: order_dict
-                    }
+cdef class CoinbaseProActiveOrderTracker(L3ActiveOrderTracker):
+    def __init__(self):
+        super().__init__(CoinbaseProL3MessageAdapter())
 
-        # Return the sorted snapshot tables.
-        cdef:
-            np.ndarray[np.float64_t, ndim=2] bids = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remaining_size"])
-                       for order_dict in self._active_bids[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_bids.keys(), reverse=True)], dtype="float64", ndmin=2)
-            np.ndarray[np.float64_t, ndim=2] asks = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remaining_size"])
-                       for order_dict in self._active_asks[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_asks.keys(), reverse=True)], dtype="float64", ndmin=2)
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global _cbpaot_logger
+        if _cbpaot_logger is None:
+            _cbpaot_logger = logging.getLogger(__name__)
+        return _cbpaot_logger
+
+    def _active_orders(self, is_bid: bool) -> CoinbaseProOrderBookTrackingDictionary:
+        return {
+            Decimal(str(price)): {order_id: {"order_id": order_id, "remaining_size": size}
+                                  for order_id, size in orders.items()}
+            for price, orders in self._l3_book.get_orders_by_price(is_bid).items()
+        }
+
+    @property
+    def active_asks(self) -> CoinbaseProOrderBookTrackingDictionary:
+        """
+        Get all asks on the order book in dictionary format. It is a copy built from the tracked orders on each access,
+        with the remaining sizes as floats, as they are kept by the L3 order book (they were the message strings).
+        Use volume_for_ask_price to get the size of a price level.
+        :returns: Dict[price, Dict[order_id, {"order_id": order_id, "remaining_size": float}]]
+        """
+        return self._active_orders(False)
+
+    @property
+    def active_bids(self) -> CoinbaseProOrderBookTrackingDictionary:
+        """
+        Get all bids on the order book in dictionary format. It is a copy built from the tracked orders on each access,
+        with the remaining sizes as floats, as they are kept by the L3 order book (they were the message strings).
+        Use volume_for_bid_price to get the size of a price level.
+        :returns: Dict[price, Dict[order_id, {"order_id": order_id, "remaining_size": float}]]
+        """
+        return self._active_orders(True)
 
-        # If there're no rows, the shape would become (1, 0) and not (0, 4).
-        # Reshape to fix that.
-        if bids.shape[1] != 4:
-            bids = bids.reshape((0, 4))
-        if asks.shape[1] != 4:
-            asks = asks.reshape((0, 4))
+    def volume_for_ask_price(self, price) -> float:
+        """
+        For a certain price, get the volume sum of all ask order book rows with that price
+        :returns: volume sum
+        """
+        return self._l3_book.c_get_level_size(False, float(price))
 
-        return bids, asks
+    def volume_for_bid_price(self, price) -> float:
+        """
+        For a certain price, get the volume sum of all bid order book rows with that price
+        :returns: volume sum
+        """
+        return self._l3_book.c_get_level_size(True, float(price))
 
     cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message):
         """
@@ -276,23 +141,3 @@ cdef class CoinbaseProActiveOrderTracker:
             [message.timestamp, trade_type_value, float(message.content["price"]), float(message.content["size"])],
             dtype="float64"
         )
-
-    def convert_diff_message_to_order_book_row(self, message):
-        """
-        Convert an incoming diff message to Tuple of np.arrays, and then convert to OrderBookRow
-        :returns: Tuple(List[bids_row], List[asks_row])
-        """
-        np_bids, np_asks = self.c_convert_diff_message_to_np_arrays(message)
-        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
-        return bids_row, asks_row
-
-    def convert_snapshot_message_to_order_book_row(self, message):
-        """
-        Convert an incoming snapshot message to Tuple of np.arrays, and then convert to OrderBookRow
-        :returns: Tuple(List[bids_row], List[asks_row])
-        """
-        np_bids, np_asks = self.c_convert_snapshot_message_to_np_arrays(message)
-        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
-        return bids_row, asks_row
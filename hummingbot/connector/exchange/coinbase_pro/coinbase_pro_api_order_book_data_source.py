@@ -15,6 +15,7 @@ import time
 import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_order_book import CoinbaseProOrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -55,7 +56,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str) -> float:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             ticker_url: str = f"{COINBASE_REST_URL}/products/{trading_pair}/ticker"
             resp = await client.get(ticker_url)
             resp_json = await resp.json()
@@ -64,7 +65,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 async with client.get(f"{COINBASE_REST_URL}/products/", timeout=5) as response:
                     if response.status == 200:
                         markets = await response.json()
@@ -96,7 +97,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = CoinbaseProOrderBook.snapshot_message_from_exchange(
@@ -105,9 +106,8 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 metadata={"trading_pair": trading_pair}
             )
             active_order_tracker: CoinbaseProActiveOrderTracker = CoinbaseProActiveOrderTracker()
-            bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
             order_book = self.order_book_create_function()
-            order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
+            active_order_tracker.apply_snapshot_message(order_book, snapshot_msg)
             return order_book
 
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
@@ -118,7 +118,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
         :returns: A dictionary of order book trackers for each trading pair
         """
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             trading_pairs: List[str] = self._trading_pairs
             retval: Dict[str, OrderBookTrackerEntry] = {}
 
@@ -134,8 +134,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
                     )
                     order_book: OrderBook = self.order_book_create_function()
                     active_order_tracker: CoinbaseProActiveOrderTracker = CoinbaseProActiveOrderTracker()
-                    bids, asks = active_order_tracker.convert_snapshot_message_to_order_book_row(snapshot_msg)
-                    order_book.apply_snapshot(bids, asks, snapshot_msg.update_id)
+                    active_order_tracker.apply_snapshot_message(order_book, snapshot_msg)
 
                     retval[trading_pair] = CoinbaseProOrderBookTrackerEntry(
                         trading_pair,
@@ -241,7 +240,7 @@ class CoinbaseProAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = self._trading_pairs
-                async with aiohttp.ClientSession() as client:
+                async with shared_http_client() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
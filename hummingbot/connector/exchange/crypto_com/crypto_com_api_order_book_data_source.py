@@ -2,11 +2,11 @@
 import asyncio
 import logging
 import time
-import aiohttp
 import pandas as pd
 import hummingbot.connector.exchange.crypto_com.crypto_com_constants as constants
 
 from typing import Optional, List, Dict, Any
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -40,7 +40,7 @@ class CryptoComAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         result = {}
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             resp = await client.get(f"{constants.REST_URL}/public/get-ticker")
             resp_json = await resp.json()
             for t_pair in trading_pairs:
@@ -52,7 +52,7 @@ class CryptoComAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             async with client.get(f"{constants.REST_URL}/public/get-ticker", timeout=10) as response:
                 if response.status == 200:
                     from hummingbot.connector.exchange.crypto_com.crypto_com_utils import \
@@ -70,7 +70,7 @@ class CryptoComAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Get whole orderbook
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             orderbook_response = await client.get(
                 f"{constants.REST_URL}/public/get-book?depth=150&instrument_name="
                 f"{crypto_com_utils.convert_to_exchange_trading_pair(trading_pair)}"
@@ -10,6 +10,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.connector.exchange.dydx.dydx_order_book import DydxOrderBook
 from hummingbot.connector.exchange.dydx.dydx_active_order_tracker import DydxActiveOrderTracker
 from hummingbot.connector.exchange.dydx.dydx_api_token_configuration_data_source import DydxAPITokenConfigurationDataSource
@@ -68,7 +69,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             resp = await client.get(f"{DYDX_V1_API_URL}{TICKER_URL}")
             resp_json = await resp.json()
             retval = {}
@@ -96,7 +97,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = DydxOrderBook.snapshot_message_from_exchange(
@@ -130,7 +131,7 @@ class DydxAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 async with client.get(DYDX_MARKET_INFO_URL.format(""), timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
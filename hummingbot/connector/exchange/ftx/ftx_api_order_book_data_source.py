@@ -15,6 +15,7 @@ from signalr_aio import Connection
 from typing import Optional, List, Dict, AsyncIterable, Any
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.connector.exchange.ftx.ftx_order_book import FtxOrderBook
 from hummingbot.connector.exchange.ftx.ftx_utils import convert_from_exchange_trading_pair, convert_to_exchange_trading_pair
 from hummingbot.core.data_type.order_book import OrderBook
@@ -53,7 +54,7 @@ class FtxAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             async with await client.get(f"{FTX_REST_URL}{FTX_EXCHANGE_INFO_PATH}", timeout=API_CALL_TIMEOUT) as response:
                 response_json = await response.json()
                 results = response_json['result']
@@ -74,7 +75,7 @@ class FtxAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 async with client.get(f"{FTX_REST_URL}{FTX_EXCHANGE_INFO_PATH}", timeout=API_CALL_TIMEOUT) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
@@ -105,7 +106,7 @@ class FtxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = FtxOrderBook.restful_snapshot_message_from_exchange(
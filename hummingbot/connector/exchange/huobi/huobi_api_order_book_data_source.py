@@ -17,6 +17,7 @@ from typing import (
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -49,7 +50,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             resp = await client.get(HUOBI_TICKER_URL)
             resp_json = await resp.json()
             for trading_pair in trading_pairs:
@@ -62,7 +63,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         try:
             from hummingbot.connector.exchange.huobi.huobi_utils import convert_from_exchange_trading_pair
 
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 async with client.get(HUOBI_SYMBOLS_URL, timeout=10) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
@@ -98,7 +99,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
             snapshot_msg: OrderBookMessage = HuobiOrderBook.snapshot_message_from_exchange(
                 snapshot,
@@ -203,7 +204,7 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = self._trading_pairs
-                async with aiohttp.ClientSession() as client:
+                async with shared_http_client() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
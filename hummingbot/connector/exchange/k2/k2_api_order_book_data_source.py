@@ -2,13 +2,13 @@
 import asyncio
 import logging
 import time
-import aiohttp
 import ujson
 import websockets
 
 import hummingbot.connector.exchange.k2.k2_constants as constants
 
 from typing import Optional, List, Dict, AsyncIterable, Any
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -40,7 +40,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         result = {}
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             async with client.get(f"{constants.REST_URL}{constants.GET_TRADING_PAIRS_STATS}") as resp:
                 resp_json = await resp.json()
                 if resp_json["success"] is False:
@@ -58,7 +58,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             async with client.get(f"{constants.REST_URL}{constants.GET_TRADING_PAIRS}", timeout=10) as response:
                 if response.status == 200:
                     try:
@@ -74,7 +74,7 @@ class K2APIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Obtain orderbook using REST API
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             params = {"symbol": k2_utils.convert_to_exchange_trading_pair(trading_pair)}
             async with client.get(url=f"{constants.REST_URL}{constants.GET_ORDER_BOOK}",
                                   params=params) as resp:
@@ -25,6 +25,7 @@ from websockets.client import Connect as WSConnectionContext
 from urllib.parse import urlencode
 from yarl import URL
 
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -105,7 +106,7 @@ class KucoinWSConnectionIterator:
     @classmethod
     async def get_ws_connection_context(cls, throttler: Optional[AsyncThrottler] = None) -> WSConnectionContext:
         throttler = throttler or cls._get_throttler_instance()
-        async with aiohttp.ClientSession() as session:
+        async with shared_http_client() as session:
             url = CONSTANTS.BASE_PATH_URL + CONSTANTS.PUBLIC_WS_DATA_PATH_URL
             async with throttler.execute_task(CONSTANTS.PUBLIC_WS_DATA_PATH_URL):
                 async with session.post(url, data=b'') as resp:
@@ -329,7 +330,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
     ) -> Dict[str, float]:
         throttler = throttler or cls._get_throttler_instance()
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             url = CONSTANTS.BASE_PATH_URL + CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL
             async with throttler.execute_task(CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL):
                 async with client.get(url) as response:
@@ -345,7 +346,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def fetch_trading_pairs(cls, throttler: Optional[AsyncThrottler] = None) -> List[str]:
         throttler = throttler or cls._get_throttler_instance()
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             url = CONSTANTS.BASE_PATH_URL + CONSTANTS.EXCHANGE_INFO_PATH_URL
             async with throttler.execute_task(CONSTANTS.EXCHANGE_INFO_PATH_URL):
                 async with client.get(url, timeout=5) as response:
@@ -392,7 +393,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, self._auth, self._throttler)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = KucoinOrderBook.snapshot_message_from_exchange(
@@ -571,7 +572,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 trading_pairs: List[str] = (
                     self._trading_pairs if self._trading_pairs else await self.fetch_trading_pairs(self._throttler)
                 )
-                async with aiohttp.ClientSession() as client:
+                async with shared_http_client() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(
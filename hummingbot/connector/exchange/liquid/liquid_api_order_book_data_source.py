@@ -8,6 +8,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -37,7 +38,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         results = dict()
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             resp = await client.get(Constants.GET_EXCHANGE_MARKETS_URL)
             resp_json = await resp.json()
             for record in resp_json:
@@ -136,7 +137,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         |-- cfd_enabled: bool
         |-- last_event_timestamp: str
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             exchange_markets_response: aiohttp.ClientResponse = await client.get(
                 Constants.GET_EXCHANGE_MARKETS_URL)
 
@@ -163,7 +164,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def fetch_trading_pairs() -> List[str]:
         try:
             # Returns a List of str, representing each active trading pair on the exchange.
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 async with client.get(f"{Constants.BASE_URL}{Constants.PRODUCTS_URI}", timeout=10) as response:
                     if response.status == 200:
                         products: List[Dict[str, Any]] = await response.json()
@@ -237,7 +238,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
         await self.get_trading_pairs()
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1)
             snapshot_timestamp: float = time.time()
             snapshot_msg: OrderBookMessage = LiquidOrderBook.snapshot_message_from_exchange(
@@ -256,7 +257,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         active markets
         """
         # Get the currently active markets
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
 
             trading_pairs: List[str] = await self.get_trading_pairs()
 
@@ -394,7 +395,7 @@ class LiquidAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_http_client() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
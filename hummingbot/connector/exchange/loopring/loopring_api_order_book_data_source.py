@@ -12,6 +12,7 @@ from websockets.exceptions import ConnectionClosed
 # from hummingbot.core.utils import async_ttl_cache
 # from hummingbot.core.utils.async_utils import safe_gather
 # from hummingbot.connector.exchange.loopring.loopring_active_order_tracker import LoopringActiveOrderTracker
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.connector.exchange.loopring.loopring_order_book import LoopringOrderBook
 # from hummingbot.connector.exchange.loopring.loopring_order_book_tracker_entry import LoopringOrderBookTrackerEntry
 from hummingbot.connector.exchange.loopring.loopring_api_token_configuration_data_source import LoopringAPITokenConfigurationDataSource
@@ -55,7 +56,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             resp = await client.get(f"https://api3.loopring.io{TICKER_URL}".replace(":markets", ",".join(trading_pairs)))
             resp_json = await resp.json()
             return {x[0]: float(x[7]) for x in resp_json.get("tickers", [])}
@@ -80,7 +81,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
             snapshot["data"] = {"bids": snapshot["bids"], "asks": snapshot["asks"]}
             snapshot_timestamp: float = time.time()
@@ -114,7 +115,7 @@ class LoopringAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         try:
-            async with aiohttp.ClientSession() as client:
+            async with shared_http_client() as client:
                 async with client.get(f"https://api3.loopring.io{MARKETS_URL}", timeout=5) as response:
                     if response.status == 200:
                         all_trading_pairs: Dict[str, Any] = await response.json()
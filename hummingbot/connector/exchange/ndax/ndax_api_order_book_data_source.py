@@ -1,4 +1,3 @@
-import aiohttp
 import asyncio
 import logging
 import time
@@ -11,6 +10,7 @@ from typing import (
     Optional,
 )
 
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.connector.exchange.ndax import ndax_constants as CONSTANTS, ndax_utils
 from hummingbot.connector.exchange.ndax.ndax_order_book import NdaxOrderBook
 from hummingbot.connector.exchange.ndax.ndax_order_book_message import NdaxOrderBookEntry, NdaxOrderBookMessage
@@ -60,7 +60,7 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         params = {
             "OMSId": 1
         }
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             throttler = throttler or cls._get_throttler_instance()
             async with throttler.execute_task(CONSTANTS.MARKETS_URL):
                 async with client.get(
@@ -92,7 +92,7 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         results = {}
 
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             for trading_pair in trading_pairs:
                 if trading_pair in cls._last_traded_prices:
                     results[trading_pair] = cls._last_traded_prices[trading_pair]
@@ -122,7 +122,7 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Returns:
             List[str]: List of supported trading pairs in Hummingbot's format. (i.e. BASE-QUOTE)
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             params = {
                 "OMSId": 1
             }
@@ -160,7 +160,7 @@ class NdaxAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "Depth": 200,
         }
 
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             throttler = throttler or cls._get_throttler_instance()
             async with throttler.execute_task(CONSTANTS.ORDER_BOOK_URL):
                 async with client.get(
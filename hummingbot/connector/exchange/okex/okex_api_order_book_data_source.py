@@ -17,6 +17,7 @@ from typing import (
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -63,7 +64,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         Refer to Calling a Class method for an example on how to test this particular function.
         Returned data frame should have trading pair as index and include usd volume, baseAsset and quoteAsset
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             async with client.get(OKEX_TICKERS_URL) as products_response:
 
                 products_response: aiohttp.ClientResponse = products_response
@@ -81,7 +82,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @staticmethod
     async def fetch_trading_pairs() -> List[str]:
         # Returns a List of str, representing each active trading pair on the exchange.
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             async with client.get(OKEX_INSTRUMENTS_URL) as products_response:
 
                 products_response: aiohttp.ClientResponse = products_response
@@ -100,7 +101,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         return trading_pairs
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
 
             snapshot_msg: OrderBookMessage = OkexOrderBook.snapshot_message_from_exchange(
@@ -115,7 +116,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
     # Move this to OrderBookTrackerDataSource or this needs a whole refactor?
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             async with client.get(OKEX_TICKERS_URL) as products_response:
 
                 products_response: aiohttp.ClientResponse = products_response
@@ -278,7 +279,7 @@ class OkexAPIOrderBookDataSource(OrderBookTrackerDataSource):
         while True:
             try:
                 trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
+                async with shared_http_client() as client:
                     for trading_pair in trading_pairs:
                         try:
                             snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair)
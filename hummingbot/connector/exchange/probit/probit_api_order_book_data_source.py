@@ -1,5 +1,4 @@
 #!/usr/bin/env python
-import aiohttp
 import asyncio
 import logging
 import pandas as pd
@@ -16,6 +15,7 @@ from typing import (
     List,
     Optional,
 )
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -47,7 +47,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str], domain: str = "com") -> Dict[str, float]:
         result = {}
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             async with client.get(f"{CONSTANTS.TICKER_URL.format(domain)}") as response:
                 if response.status == 200:
                     resp_json = await response.json()
@@ -60,7 +60,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @staticmethod
     async def fetch_trading_pairs(domain: str = "com") -> List[str]:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             async with client.get(f"{CONSTANTS.MARKETS_URL.format(domain)}") as response:
                 if response.status == 200:
                     resp_json: Dict[str, Any] = await response.json()
@@ -72,7 +72,7 @@ class ProbitAPIOrderBookDataSource(OrderBookTrackerDataSource):
         """
         Get whole orderbook
         """
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             async with client.get(url=f"{CONSTANTS.ORDER_BOOK_URL.format(domain)}",
                                   params={"market_id": trading_pair}) as response:
                 if response.status != 200:
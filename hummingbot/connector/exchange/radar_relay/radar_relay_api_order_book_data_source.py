@@ -16,6 +16,7 @@ import ujson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.utils.http_client_manager import shared_http_client
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.connector.exchange.radar_relay.radar_relay_order_book import RadarRelayOrderBook
 from hummingbot.connector.exchange.radar_relay.radar_relay_active_order_tracker import RadarRelayActiveOrderTracker
@@ -104,7 +105,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             trading_pairs = set()
             page_count = 1
             while True:
-                async with aiohttp.ClientSession() as client:
+                async with shared_http_client() as client:
                     async with client.get(f"{MARKETS_URL}?perPage=100&page={page_count}", timeout=10) \
                             as response:
                         if response.status == 200:
@@ -137,7 +138,7 @@ class RadarRelayAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return await response.json()
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
+        async with shared_http_client() as client:
             snapshot: Dict[str, any] = await self.get_snapshot(client, trading_pair)
             snapshot_timestamp: float = time.time()
             snapshot_msg: RadarRelayOrderBookMessage = RadarRelayOrderBook.snapshot_message_from_exchange(
@@ -14,6 +14,8 @@ cdef class ExchangeBase(ConnectorBase):
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef c_cancel(self, str trading_pair, str client_order_id)
+    cdef list c_batch_create_orders(self, list orders_to_create, object order_type=*, dict kwargs=*)
+    cdef c_batch_cancel_orders(self, list orders_to_cancel)
     cdef c_stop_tracking_order(self, str order_id)
     cdef OrderBook c_get_order_book(self, str trading_pair)
     cdef object c_get_price(self, str trading_pair, bint is_buy)
@@ -77,6 +77,51 @@ cdef class ExchangeBase(ConnectorBase):
     cdef c_cancel(self, str trading_pair, str client_order_id):
         return self.cancel(trading_pair, client_order_id)
 
+    cdef list c_batch_create_orders(self, list orders_to_create, object order_type=OrderType.LIMIT, dict kwargs={}):
+        return self.batch_create_orders(orders_to_create, order_type, **kwargs)
+
+    cdef c_batch_cancel_orders(self, list orders_to_cancel):
+        return self.batch_cancel_orders(orders_to_cancel)
+
+    def batch_create_orders(self, orders_to_create: List[LimitOrder], order_type: OrderType = OrderType.LIMIT,
+                            **kwargs) -> List[LimitOrder]:
+        """
+        Places several limit orders. This function returns immediately, the orders are created when their
+        BuyOrderCreatedEvent or SellOrderCreatedEvent are triggered.
+        The default implementation places the orders one by one with buy and sell, which send their requests
+        concurrently. Connectors with a batch order end point override it to place the orders in fewer requests.
+        :param orders_to_create: The orders to place, their client order ids are not used
+        :param order_type: The order type of all the orders
+        :returns The placed orders, in the same order, with the client order ids given by the connector
+        """
+        cdef:
+            list created_orders = []
+            str order_id
+        for order in orders_to_create:
+            if order.is_buy:
+                order_id = self.c_buy(order.trading_pair, order.quantity, order_type, order.price, kwargs)
+            else:
+                order_id = self.c_sell(order.trading_pair, order.quantity, order_type, order.price, kwargs)
+            created_orders.append(LimitOrder(order_id,
+                                             order.trading_pair,
+                                             order.is_buy,
+                                             order.base_currency,
+                                             order.quote_currency,
+                                             order.price,
+                                             order.quantity))
+        return created_orders
+
+    def batch_cancel_orders(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Cancels several orders. This function returns immediately, the cancellation results are given by the
+        OrderCancelledEvent of each order.
+        The default implementation cancels the orders one by one with cancel, connectors with a batch cancel end point
+        override it to cancel the orders in fewer requests.
+        :param orders_to_cancel: The orders to cancel
+        """
+        for order in orders_to_cancel:
+            self.c_cancel(order.trading_pair, order.client_order_id)
+
     cdef c_stop_tracking_order(self, str order_id):
         raise NotImplementedError
 
@@ -0,0 +1,72 @@
+from bisect import bisect_right
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+from hummingbot.core.event.events import (
+    OrderFilledEvent,
+    TradeType,
+)
+
+s_decimal_0 = Decimal(0)
+
+
+class FillBalanceLedger:
+    """
+    Keeps the asset balance changes from order fills as running totals per asset, ordered by fill timestamp, so the
+    balance change since any timestamp is found with a binary search instead of a scan of every fill.
+    For BUY fills the quote balance goes down while the base balance goes up, and for SELL fills it's the opposite.
+    Fees are not accounted for.
+    """
+
+    def __init__(self):
+        self._timestamps: Dict[str, List[float]] = {}
+        self._running_totals: Dict[str, List[Decimal]] = {}
+        self._trading_pair_assets: Dict[str, Tuple[str, str]] = {}
+
+    def _assets(self, trading_pair: str) -> Tuple[str, str]:
+        assets: Tuple[str, str] = self._trading_pair_assets.get(trading_pair)
+        if assets is None:
+            base, quote = trading_pair.split("-")[:2]
+            assets = self._trading_pair_assets[trading_pair] = (base, quote)
+        return assets
+
+    def _add(self, asset: str, timestamp: float, amount: Decimal):
+        timestamps: List[float] = self._timestamps.setdefault(asset, [])
+        running_totals: List[Decimal] = self._running_totals.setdefault(asset, [])
+        if len(timestamps) == 0 or timestamp >= timestamps[-1]:
+            timestamps.append(timestamp)
+            running_totals.append((running_totals[-1] if len(running_totals) > 0 else s_decimal_0) + amount)
+            return
+        # Out of order fill, shift the running totals after it.
+        index: int = bisect_right(timestamps, timestamp)
+        timestamps.insert(index, timestamp)
+        running_totals.insert(index, (running_totals[index - 1] if index > 0 else s_decimal_0) + amount)
+        for i in range(index + 1, len(running_totals)):
+            running_totals[i] += amount
+
+    def record(self, event: OrderFilledEvent):
+        base, quote = self._assets(event.trading_pair)
+        quote_value: Decimal = event.price * event.amount
+        if event.trade_type is TradeType.BUY:
+            self._add(base, event.timestamp, event.amount)
+            self._add(quote, event.timestamp, -quote_value)
+        else:
+            self._add(base, event.timestamp, -event.amount)
+            self._add(quote, event.timestamp, quote_value)
+
+    def balances_since(self, starting_timestamp: float = 0) -> Dict[str, Decimal]:
+        """
+        :param starting_timestamp: Only fills after this timestamp are accounted for
+        :returns A dictionary of the assets traded since the timestamp and their balance changes
+        """
+        balances: Dict[str, Decimal] = {}
+        for asset, timestamps in self._timestamps.items():
+            index: int = bisect_right(timestamps, starting_timestamp)
+            if index < len(timestamps):
+                running_totals: List[Decimal] = self._running_totals[asset]
+                balances[asset] = running_totals[-1] - (running_totals[index - 1] if index > 0 else s_decimal_0)
+        return balances
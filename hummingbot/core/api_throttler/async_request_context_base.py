@@ -5,12 +5,14 @@ import time
 from abc import ABC, abstractmethod
 from typing import (
     List,
+    Optional,
     Tuple,
 )
 
 from hummingbot.core.api_throttler.data_types import (
     RateLimit,
     TaskLog,
+    WaitTimeStats,
 )
 from hummingbot.logger.logger import HummingbotLogger
 
@@ -40,6 +42,7 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 wait_time_stats: Optional[WaitTimeStats] = None,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -48,6 +51,7 @@ class AsyncRequestContextBase(ABC):
         :param rate_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param wait_time_stats: Optional WaitTimeStats the time spent waiting for capacity is recorded to
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -55,6 +59,7 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._wait_time_stats: Optional[WaitTimeStats] = wait_time_stats
 
     def flush(self):
         """
@@ -72,13 +77,20 @@ class AsyncRequestContextBase(ABC):
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def record_wait_time(self, wait_time: float, throttled: bool):
+        if self._wait_time_stats is not None:
+            self._wait_time_stats.record(wait_time, throttled)
+
     async def acquire(self):
+        start: float = time.perf_counter()
+        throttled: bool = False
         while True:
             async with self._lock:
                 self.flush()
 
                 if self.within_capacity():
                     break
+            throttled = True
             await asyncio.sleep(self._retry_interval)
         async with self._lock:
             now = time.time()
@@ -89,6 +101,7 @@ class AsyncRequestContextBase(ABC):
             for limit, weight in self._related_limits:
                 task = TaskLog(timestamp=now, rate_limit=limit, weight=weight)
                 self._task_logs.append(task)
+        self.record_wait_time(time.perf_counter() - start, throttled)
 
     async def __aenter__(self):
         await self.acquire()
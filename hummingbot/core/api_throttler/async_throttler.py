@@ -66,4 +66,5 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            wait_time_stats=self._wait_time_stats.get(limit_id),
         )
@@ -16,7 +16,8 @@ from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
 from hummingbot.core.api_throttler.data_types import (
     RateLimit,
-    TaskLog
+    TaskLog,
+    WaitTimeStats,
 )
 from hummingbot.logger.logger import HummingbotLogger
 
@@ -65,6 +66,12 @@ class AsyncThrottlerBase(ABC):
         # List of TaskLog used to determine the API requests within a set time window.
         self._task_logs: List[TaskLog] = []
 
+        # Time spent waiting for capacity, per limit_id
+        self._wait_time_stats: Dict[str, WaitTimeStats] = {
+            limit.limit_id: WaitTimeStats()
+            for limit in self._rate_limits
+        }
+
         # Throttler Parameters
         self._retry_interval: float = retry_interval
         self._safety_margin_pct: float = safety_margin_pct
@@ -83,6 +90,13 @@ class AsyncThrottlerBase(ABC):
 
         return rate_limit, related_limits
 
+    @property
+    def wait_time_stats(self) -> Dict[str, WaitTimeStats]:
+        """
+        Time spent waiting for rate limit capacity by the requests of each limit_id.
+        """
+        return self._wait_time_stats
+
     @abstractmethod
     def execute_task(self, limit_ids: List[str]) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -54,3 +54,25 @@ class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+
+
+@dataclass
+class WaitTimeStats:
+    """
+    Time requests spent waiting for rate limit capacity.
+    """
+    request_count: int = 0
+    throttled_count: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.total_wait_time / self.request_count if self.request_count > 0 else 0.0
+
+    def record(self, wait_time: float, throttled: bool):
+        self.request_count += 1
+        if throttled:
+            self.throttled_count += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
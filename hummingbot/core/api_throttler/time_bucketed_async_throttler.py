@@ -0,0 +1,206 @@
+import asyncio
+import time
+
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    AsyncRequestContextBase,
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import (
+    RateLimit,
+    WaitTimeStats,
+)
+
+DEFAULT_BUCKET_COUNT = 10
+MIN_RETRY_INTERVAL = 0.001
+
+
+class RateLimitBuckets:
+    """
+    Capacity consumed against a single rate limit, aggregated into fixed width time buckets with a running total.
+    A bucket is only expired once every task in it has left the sliding window, so the running total never under
+    counts the capacity used. Capacity checks are O(1), and each bucket is expired exactly once.
+    """
+
+    def __init__(self, rate_limit: RateLimit, window: float, bucket_count: int = DEFAULT_BUCKET_COUNT):
+        """
+        :param rate_limit: The RateLimit the capacity is consumed against
+        :param window: The sliding window length in seconds, the limit's time interval plus any safety margin
+        :param bucket_count: Number of buckets the window is divided into
+        """
+        self._rate_limit: RateLimit = rate_limit
+        self._window: float = window
+        self._bucket_width: float = window / bucket_count
+        # [bucket start timestamp, weight] pairs, oldest first
+        self._buckets: Deque[List[float]] = deque()
+        self._capacity_used: int = 0
+
+    @property
+    def rate_limit(self) -> RateLimit:
+        return self._rate_limit
+
+    @property
+    def capacity_used(self) -> int:
+        return self._capacity_used
+
+    def _bucket_expiry(self, bucket_start: float) -> float:
+        return bucket_start + self._bucket_width + self._window
+
+    def expire(self, now: float):
+        while len(self._buckets) > 0 and self._bucket_expiry(self._buckets[0][0]) <= now:
+            _, weight = self._buckets.popleft()
+            self._capacity_used -= weight
+
+    def has_capacity(self, weight: int) -> bool:
+        return self._capacity_used + weight <= self._rate_limit.limit
+
+    def add(self, now: float, weight: int):
+        bucket_start: float = now - (now % self._bucket_width)
+        if len(self._buckets) > 0 and self._buckets[-1][0] >= bucket_start:
+            self._buckets[-1][1] += weight
+        else:
+            self._buckets.append([bucket_start, weight])
+        self._capacity_used += weight
+
+    def time_until_capacity(self, now: float, weight: int) -> float:
+        """
+        Returns the time until enough buckets expire for a task of the given weight to fit in the limit.
+        """
+        excess: int = self._capacity_used + weight - self._rate_limit.limit
+        if excess <= 0:
+            return 0.0
+        freed: int = 0
+        for bucket_start, bucket_weight in self._buckets:
+            freed += bucket_weight
+            if freed >= excess:
+                return max(0.0, self._bucket_expiry(bucket_start) - now)
+        # The weight on its own exceeds the limit.
+        return self._window
+
+
+class TimeBucketedAsyncRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that checks the rate limits against the running totals of their
+    time buckets, and sleeps until enough capacity is expected to be freed if needed.
+    The capacity check and the reservation happen without yielding to the event loop, so no lock is needed.
+    """
+
+    def __init__(self,
+                 buckets: Dict[str, RateLimitBuckets],
+                 rate_limit: RateLimit,
+                 related_limits: List[Tuple[RateLimit, int]],
+                 lock: asyncio.Lock,
+                 safety_margin_pct: float,
+                 retry_interval: float = 0.1,
+                 wait_time_stats: Optional[WaitTimeStats] = None,
+                 ):
+        """
+        :param buckets: Shared RateLimitBuckets of every limit_id
+        """
+        super().__init__(task_logs=[],
+                         rate_limit=rate_limit,
+                         related_limits=related_limits,
+                         lock=lock,
+                         safety_margin_pct=safety_margin_pct,
+                         retry_interval=retry_interval,
+                         wait_time_stats=wait_time_stats)
+        self._buckets: Dict[str, RateLimitBuckets] = buckets
+
+    def flush(self):
+        now: float = time.time()
+        for rate_limit, _ in self._related_limits:
+            self._buckets[rate_limit.limit_id].expire(now)
+
+    def within_capacity(self) -> bool:
+        for rate_limit, weight in self._related_limits:
+            buckets: RateLimitBuckets = self._buckets[rate_limit.limit_id]
+            if not buckets.has_capacity(weight):
+                now: float = time.time()
+                if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                    msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                          f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                          f"is {buckets.capacity_used} in the last " \
+                          f"{rate_limit.time_interval} seconds"
+                    self.logger().notify(msg)
+                    AsyncRequestContextBase._last_max_cap_warning_ts = now
+                return False
+        return True
+
+    def time_until_capacity(self) -> float:
+        now: float = time.time()
+        return max(self._buckets[rate_limit.limit_id].time_until_capacity(now, weight)
+                   for rate_limit, weight in self._related_limits)
+
+    async def acquire(self):
+        start: float = time.perf_counter()
+        throttled: bool = False
+        while True:
+            self.flush()
+            if self.within_capacity():
+                break
+            throttled = True
+            await asyncio.sleep(max(self.time_until_capacity(), MIN_RETRY_INTERVAL))
+        now: float = time.time()
+        for rate_limit, weight in self._related_limits:
+            self._buckets[rate_limit.limit_id].add(now, weight)
+        self.record_wait_time(time.perf_counter() - start, throttled)
+
+
+class TimeBucketedAsyncThrottler(AsyncThrottlerBase):
+    """
+    Drop-in replacement for AsyncThrottler for connectors with many concurrent requests.
+
+    Instead of scanning a shared log of every task in the window on each capacity check, it keeps a running total per
+    limit_id over time buckets that expire as the window slides, making capacity checks constant time.
+    Waiting tasks sleep until the buckets they need to expire do, instead of polling every retry interval.
+    """
+
+    def __init__(self,
+                 rate_limits: List[RateLimit],
+                 retry_interval: float = 0.1,
+                 safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
+                 bucket_count: int = DEFAULT_BUCKET_COUNT,
+                 ):
+        """
+        :param bucket_count: Number of buckets each rate limit's window is divided into. More buckets free capacity
+        closer to when individual tasks leave the window, at the cost of more memory per limit.
+        """
+        super().__init__(rate_limits=rate_limits, retry_interval=retry_interval, safety_margin_pct=safety_margin_pct)
+        self._buckets: Dict[str, RateLimitBuckets] = {
+            limit.limit_id: RateLimitBuckets(rate_limit=limit,
+                                             window=limit.time_interval * (1 + (self._safety_margin_pct or 0)),
+                                             bucket_count=bucket_count)
+            for limit in self._rate_limits
+        }
+
+    def capacity_used(self, limit_id: str) -> int:
+        buckets: RateLimitBuckets = self._buckets[limit_id]
+        buckets.expire(time.time())
+        return buckets.capacity_used
+
+    def execute_task(self, limit_id: str) -> TimeBucketedAsyncRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        return TimeBucketedAsyncRequestContext(
+            buckets=self._buckets,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+            wait_time_stats=self._wait_time_stats.get(limit_id),
+        )
@@ -8,5 +8,6 @@ cdef class Clock:
         double _end_time
         list _child_iterators
         list _current_context
+        set _paused_iterators
         double _current_tick
         bint _started
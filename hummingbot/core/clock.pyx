@@ -35,6 +35,7 @@ cdef class Clock:
         self._current_tick = start_time if clock_mode is ClockMode.BACKTEST else (time.time() // tick_size) * tick_size
         self._child_iterators = []
         self._current_context = None
+        self._paused_iterators = set()
         self._started = False
 
     @property
@@ -53,6 +54,10 @@ cdef class Clock:
     def child_iterators(self) -> List[TimeIterator]:
         return self._child_iterators
 
+    @property
+    def paused_iterators(self) -> List[TimeIterator]:
+        return list(self._paused_iterators)
+
     @property
     def current_timestamp(self) -> float:
         return self._current_tick
@@ -81,6 +86,17 @@ cdef class Clock:
             (<TimeIterator>iterator).c_stop(self)
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
+        self._paused_iterators.discard(iterator)
+
+    def pause_iterator(self, iterator: TimeIterator):
+        """
+        Skips the ticks of a child iterator without stopping it, so it keeps its state and listeners.
+        """
+        if iterator in self._child_iterators:
+            self._paused_iterators.add(iterator)
+
+    def resume_iterator(self, iterator: TimeIterator):
+        self._paused_iterators.discard(iterator)
 
     async def run(self):
         await self.run_til(float("nan"))
@@ -114,6 +130,8 @@ cdef class Clock:
 
                 # Run through all the child iterators.
                 for ci in self._current_context:
+                    if self._paused_iterators and ci in self._paused_iterators:
+                        continue
                     child_iterator = ci
                     try:
                         child_iterator.c_tick(self._current_tick)
@@ -140,6 +158,8 @@ cdef class Clock:
             while not (self._current_tick >= timestamp):
                 self._current_tick += self._tick_size
                 for ci in self._child_iterators:
+                    if self._paused_iterators and ci in self._paused_iterators:
+                        continue
                     child_iterator = ci
                     try:
                         child_iterator.c_tick(self._current_tick)
@@ -32,6 +32,7 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self.c_invalidate_depth_index()
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -75,6 +76,7 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self.c_invalidate_depth_index()
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -196,3 +198,32 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    cdef c_rebuild_depth_index(self):
+        # The depth index has to reflect the composite entries, i.e. the original book net of the recorded fills.
+        cdef:
+            double cum_base = 0
+            double cum_quote = 0
+
+        self._bid_prices.clear()
+        self._bid_cum_base.clear()
+        self._bid_cum_quote.clear()
+        self._ask_prices.clear()
+        self._ask_cum_base.clear()
+        self._ask_cum_quote.clear()
+
+        for row in self.bid_entries():
+            cum_base += row.amount
+            cum_quote += row.amount * row.price
+            self._bid_prices.push_back(row.price)
+            self._bid_cum_base.push_back(cum_base)
+            self._bid_cum_quote.push_back(cum_quote)
+
+        cum_base = 0
+        cum_quote = 0
+        for row in self.ask_entries():
+            cum_base += row.amount
+            cum_quote += row.amount * row.price
+            self._ask_prices.push_back(row.price)
+            self._ask_cum_base.push_back(cum_base)
+            self._ask_cum_quote.push_back(cum_quote)
@@ -0,0 +1,55 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+from libcpp.string cimport string
+from libcpp.unordered_map cimport unordered_map
+from libcpp.unordered_set cimport unordered_set
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport OrderBook
+
+
+cdef struct L3Order:
+    double price
+    double size
+    bint is_bid
+
+
+cdef struct L3PriceLevel:
+    double size
+    int64_t order_count
+
+
+cdef class L3OrderBook:
+    cdef unordered_map[string, L3Order] _orders
+    cdef unordered_map[double, L3PriceLevel] _bid_levels
+    cdef unordered_map[double, L3PriceLevel] _ask_levels
+    cdef unordered_set[double] _changed_bid_prices
+    cdef unordered_set[double] _changed_ask_prices
+
+    cdef c_add_order(self, string order_id, bint is_bid, double price, double size)
+    cdef bint c_set_order_size(self, string order_id, double size)
+    cdef bint c_reduce_order_size(self, string order_id, double size)
+    cdef bint c_remove_order(self, string order_id)
+    cdef c_clear(self)
+    cdef c_change_level(self, bint is_bid, double price, double size_delta, int64_t order_count_delta)
+    cdef double c_get_level_size(self, bint is_bid, double price)
+    cdef vector[OrderBookEntry] c_pop_changed_levels(self, bint is_bid, int64_t update_id)
+    cdef vector[OrderBookEntry] c_get_levels(self, bint is_bid, int64_t update_id)
+    cdef c_apply_diffs_to(self, OrderBook order_book, int64_t update_id)
+    cdef c_apply_snapshot_to(self, OrderBook order_book, int64_t update_id)
+
+
+cdef class L3MessageAdapter:
+    cdef c_apply_diff_message(self, L3OrderBook l3_book, object message)
+    cdef c_apply_snapshot_message(self, L3OrderBook l3_book, object message)
+
+
+cdef class L3ActiveOrderTracker:
+    cdef L3OrderBook _l3_book
+    cdef L3MessageAdapter _adapter
+
+    cdef c_apply_diff_message_to_order_book(self, OrderBook order_book, object message)
+    cdef c_apply_snapshot_message_to_order_book(self, OrderBook order_book, object message)
+    cdef tuple c_convert_diff_message_to_np_arrays(self, object message)
+    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message)
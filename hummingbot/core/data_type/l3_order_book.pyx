@@ -0,0 +1,325 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+"""
+Level 3 (order by order) order book engine shared by the exchange active order trackers.
+The orders are kept in a C++ hash map by order id, with the aggregated size and order count of each price level. Only
+the price levels changed by the order messages are applied to the OrderBook, straight through OrderBook.c_apply_diffs.
+The message format of each exchange is handled by its L3MessageAdapter.
+"""
+
+from cython.operator cimport(
+    postincrement as inc,
+    dereference as deref,
+)
+from libc.math cimport fabs
+from libcpp.pair cimport pair
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+cimport numpy as np
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
+
+# Level sizes below this fraction of the sizes added or removed are rounding errors
+cdef double s_size_rounding_tolerance = 1e-10
+
+
+cdef np.ndarray c_entries_to_np_array(vector[OrderBookEntry] entries, double timestamp):
+    cdef:
+        np.ndarray[np.float64_t, ndim=2] rows
+        size_t i
+
+    if entries.size() == 0:
+        return s_empty_diff
+    rows = np.empty((entries.size(), 4), dtype="float64")
+    for i in range(entries.size()):
+        rows[i, 0] = timestamp
+        rows[i, 1] = entries[i].getPrice()
+        rows[i, 2] = entries[i].getAmount()
+        rows[i, 3] = entries[i].getUpdateId()
+    return rows
+
+
+cdef class L3OrderBook:
+    """
+    Orders by id and aggregated price levels of one order book. The changed price levels are collected until they are
+    applied to an OrderBook with c_apply_diffs_to.
+    """
+
+    cdef c_add_order(self, string order_id, bint is_bid, double price, double size):
+        cdef L3Order order
+
+        self.c_remove_order(order_id)
+        order.price = price
+        order.size = max(size, 0.0)
+        order.is_bid = is_bid
+        self._orders[order_id] = order
+        self.c_change_level(is_bid, price, order.size, 1)
+
+    cdef bint c_set_order_size(self, string order_id, double size):
+        cdef:
+            unordered_map[string, L3Order].iterator it = self._orders.find(order_id)
+            L3Order *order
+
+        if it == self._orders.end():
+            return False
+        order = &deref(it).second
+        size = max(size, 0.0)
+        self.c_change_level(order.is_bid, order.price, size - order.size, 0)
+        order.size = size
+        return True
+
+    cdef bint c_reduce_order_size(self, string order_id, double size):
+        cdef unordered_map[string, L3Order].iterator it = self._orders.find(order_id)
+
+        if it == self._orders.end():
+            return False
+        return self.c_set_order_size(order_id, deref(it).second.size - size)
+
+    cdef bint c_remove_order(self, string order_id):
+        cdef:
+            unordered_map[string, L3Order].iterator it = self._orders.find(order_id)
+            L3Order order
+
+        if it == self._orders.end():
+            return False
+        order = deref(it).second
+        self._orders.erase(it)
+        self.c_change_level(order.is_bid, order.price, -order.size, -1)
+        return True
+
+    cdef c_clear(self):
+        """
+        Removes all the orders, without recording any price level change. Used before loading a snapshot.
+        """
+        self._orders.clear()
+        self._bid_levels.clear()
+        self._ask_levels.clear()
+        self._changed_bid_prices.clear()
+        self._changed_ask_prices.clear()
+
+    cdef c_change_level(self, bint is_bid, double price, double size_delta, int64_t order_count_delta):
+        cdef:
+            unordered_map[double, L3PriceLevel] *levels = &self._bid_levels if is_bid else &self._ask_levels
+            L3PriceLevel *level = &deref(levels)[price]
+            double magnitude = level.size + fabs(size_delta)
+
+        level.size += size_delta
+        level.order_count += order_count_delta
+        if level.order_count <= 0:
+            levels.erase(price)
+        elif level.size <= magnitude * s_size_rounding_tolerance:
+            # Rounding leftovers of the removed sizes must not keep an empty level on the order book
+            level.size = 0
+        if is_bid:
+            self._changed_bid_prices.insert(price)
+        else:
+            self._changed_ask_prices.insert(price)
+
+    cdef double c_get_level_size(self, bint is_bid, double price):
+        cdef:
+            unordered_map[double, L3PriceLevel] *levels = &self._bid_levels if is_bid else &self._ask_levels
+            unordered_map[double, L3PriceLevel].iterator it = levels.find(price)
+
+        if it == levels.end():
+            return 0
+        return deref(it).second.size
+
+    cdef vector[OrderBookEntry] c_pop_changed_levels(self, bint is_bid, int64_t update_id):
+        """
+        The current size of each changed price level (0 for removed levels), the changes are then forgotten.
+        """
+        cdef:
+            unordered_set[double] *changed_prices = &self._changed_bid_prices if is_bid else &self._changed_ask_prices
+            unordered_set[double].iterator it = changed_prices.begin()
+            vector[OrderBookEntry] entries
+
+        entries.reserve(changed_prices.size())
+        while it != changed_prices.end():
+            entries.push_back(OrderBookEntry(deref(it), self.c_get_level_size(is_bid, deref(it)), update_id))
+            inc(it)
+        changed_prices.clear()
+        return entries
+
+    cdef vector[OrderBookEntry] c_get_levels(self, bint is_bid, int64_t update_id):
+        cdef:
+            unordered_map[double, L3PriceLevel] *levels = &self._bid_levels if is_bid else &self._ask_levels
+            unordered_map[double, L3PriceLevel].iterator it = levels.begin()
+            vector[OrderBookEntry] entries
+
+        entries.reserve(levels.size())
+        while it != levels.end():
+            entries.push_back(OrderBookEntry(deref(it).first, deref(it).second.size, update_id))
+            inc(it)
+        return entries
+
+    cdef c_apply_diffs_to(self, OrderBook order_book, int64_t update_id):
+        order_book.c_apply_diffs(self.c_pop_changed_levels(True, update_id),
+                                 self.c_pop_changed_levels(False, update_id),
+                                 update_id)
+
+    cdef c_apply_snapshot_to(self, OrderBook order_book, int64_t update_id):
+        self._changed_bid_prices.clear()
+        self._changed_ask_prices.clear()
+        order_book.c_apply_snapshot(self.c_get_levels(True, update_id), self.c_get_levels(False, update_id), update_id)
+
+    @property
+    def order_count(self) -> int:
+        return self._orders.size()
+
+    def add_order(self, order_id: str, is_bid: bool, price: float, size: float):
+        self.c_add_order(order_id.encode("utf8"), is_bid, price, size)
+
+    def set_order_size(self, order_id: str, size: float) -> bool:
+        return self.c_set_order_size(order_id.encode("utf8"), size)
+
+    def reduce_order_size(self, order_id: str, size: float) -> bool:
+        return self.c_reduce_order_size(order_id.encode("utf8"), size)
+
+    def remove_order(self, order_id: str) -> bool:
+        return self.c_remove_order(order_id.encode("utf8"))
+
+    def clear(self):
+        self.c_clear()
+
+    def get_order(self, order_id: str) -> Optional[Tuple[bool, float, float]]:
+        """
+        :returns: (is_bid, price, size) of the order, None if the order is not in the book
+        """
+        cdef unordered_map[string, L3Order].iterator it = self._orders.find(order_id.encode("utf8"))
+
+        if it == self._orders.end():
+            return None
+        return deref(it).second.is_bid, deref(it).second.price, deref(it).second.size
+
+    def get_level_size(self, is_bid: bool, price: float) -> float:
+        return self.c_get_level_size(is_bid, price)
+
+    def get_levels(self, is_bid: bool) -> Dict[float, float]:
+        """
+        :returns: the aggregated size of each price level of a side
+        """
+        return {entry.getPrice(): entry.getAmount() for entry in self.c_get_levels(is_bid, 0)}
+
+    def get_orders_by_price(self, is_bid: bool) -> Dict[float, Dict[str, float]]:
+        """
+        :returns: the size of each order by order id, for each price level of a side
+        """
+        cdef:
+            unordered_map[string, L3Order].iterator it = self._orders.begin()
+            pair[string, L3Order] item
+            dict orders_by_price = {}
+
+        while it != self._orders.end():
+            item = deref(it)
+            if item.second.is_bid == is_bid:
+                orders_by_price.setdefault(item.second.price, {})[item.first.decode("utf8")] = item.second.size
+            inc(it)
+        return orders_by_price
+
+    def apply_diffs_to(self, order_book: OrderBook, update_id: int):
+        self.c_apply_diffs_to(order_book, update_id)
+
+    def apply_snapshot_to(self, order_book: OrderBook, update_id: int):
+        self.c_apply_snapshot_to(order_book, update_id)
+
+
+cdef class L3MessageAdapter:
+    """
+    Translates the order book messages of an exchange into order changes of an L3OrderBook.
+    """
+
+    cdef c_apply_diff_message(self, L3OrderBook l3_book, object message):
+        raise NotImplementedError
+
+    cdef c_apply_snapshot_message(self, L3OrderBook l3_book, object message):
+        raise NotImplementedError
+
+
+cdef class L3ActiveOrderTracker:
+    """
+    Active order tracker of the level 3 exchanges, the exchange specifics are in its message adapter.
+    """
+
+    def __init__(self, adapter: L3MessageAdapter):
+        super().__init__()
+        self._l3_book = L3OrderBook()
+        self._adapter = adapter
+
+    @property
+    def l3_book(self) -> L3OrderBook:
+        return self._l3_book
+
+    cdef c_apply_diff_message_to_order_book(self, OrderBook order_book, object message):
+        self._adapter.c_apply_diff_message(self._l3_book, message)
+        self._l3_book.c_apply_diffs_to(order_book, message.update_id)
+
+    cdef c_apply_snapshot_message_to_order_book(self, OrderBook order_book, object message):
+        self._l3_book.c_clear()
+        self._adapter.c_apply_snapshot_message(self._l3_book, message)
+        self._l3_book.c_apply_snapshot_to(order_book, message.update_id)
+
+    cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
+        """
+        Interpret an incoming diff message and apply changes to the order book accordingly
+        :returns: new order book rows: Tuple(np.array (bids), np.array (asks))
+        """
+        self._adapter.c_apply_diff_message(self._l3_book, message)
+        return (c_entries_to_np_array(self._l3_book.c_pop_changed_levels(True, message.update_id), message.timestamp),
+                c_entries_to_np_array(self._l3_book.c_pop_changed_levels(False, message.update_id), message.timestamp))
+
+    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message):
+        """
+        Interpret an incoming snapshot message and apply changes to the order book accordingly
+        :returns: new order book rows, sorted by descending prices: Tuple(np.array (bids), np.array (asks))
+        """
+        cdef:
+            np.ndarray[np.float64_t, ndim=2] bids
+            np.ndarray[np.float64_t, ndim=2] asks
+
+        self._l3_book.c_clear()
+        self._adapter.c_apply_snapshot_message(self._l3_book, message)
+        self._l3_book._changed_bid_prices.clear()
+        self._l3_book._changed_ask_prices.clear()
+        bids = c_entries_to_np_array(self._l3_book.c_get_levels(True, message.update_id), message.timestamp)
+        asks = c_entries_to_np_array(self._l3_book.c_get_levels(False, message.update_id), message.timestamp)
+        return bids[bids[:, 1].argsort()[::-1]], asks[asks[:, 1].argsort()[::-1]]
+
+    def apply_diff_message(self, order_book: OrderBook, message):
+        """
+        Applies a diff message to the tracked orders and the changed price levels to the order book
+        """
+        self.c_apply_diff_message_to_order_book(order_book, message)
+
+    def apply_snapshot_message(self, order_book: OrderBook, message):
+        """
+        Replaces the tracked orders with the snapshot message orders, and the order book levels with their levels
+        """
+        self.c_apply_snapshot_message_to_order_book(order_book, message)
+
+    def convert_diff_message_to_order_book_row(self, message) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Convert an incoming diff message to Tuple of np.arrays, and then convert to OrderBookRow
+        :returns: Tuple(List[bids_row], List[asks_row])
+        """
+        np_bids, np_asks = self.c_convert_diff_message_to_np_arrays(message)
+        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
+        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
+        return bids_row, asks_row
+
+    def convert_snapshot_message_to_order_book_row(self, message) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Convert an incoming snapshot message to Tuple of np.arrays, and then convert to OrderBookRow
+        :returns: Tuple(List[bids_row], List[asks_row])
+        """
+        np_bids, np_asks = self.c_convert_snapshot_message_to_np_arrays(message)
+        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
+        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
+        return bids_row, asks_row
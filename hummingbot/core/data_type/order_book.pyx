@@ -22,7 +22,7 @@ from aiokafka import ConsumerRecord
 import pandas as pd
 import numpy as np
 import time
-from .order_book_message import OrderBookMessage
+from .order_book_message import OrderBookMessage, OrderBookMessageType
 from .order_book_row import OrderBookRow
 from .order_book_query_result import OrderBookQueryResult
 from sqlalchemy.engine import RowProxy
@@ -33,6 +33,60 @@ ob_logger = None
 NaN = float("nan")
 
 
+cdef int64_t c_copy_numpy_entries(np.ndarray[np.float64_t, ndim=2] array, vector[OrderBookEntry] &entries):
+    """
+    Copies [price, amount, update_id] rows into the entries vector. Returns the largest update id seen.
+    """
+    cdef:
+        Py_ssize_t i
+        Py_ssize_t rows = array.shape[0]
+        int64_t update_id
+        int64_t last_update_id = 0
+    entries.reserve(entries.size() + rows)
+    for i in range(rows):
+        update_id = <int64_t>array[i, 2]
+        entries.push_back(OrderBookEntry(array[i, 0], array[i, 1], update_id))
+        if update_id > last_update_id:
+            last_update_id = update_id
+    return last_update_id
+
+
+cdef inline size_t c_first_at_least(const vector[double] &values, double target):
+    """
+    Binary search over a non-decreasing array. Returns the index of the first element >= target, or the array size
+    if there is none.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = values.size()
+        size_t mid
+    while low < high:
+        mid = (low + high) >> 1
+        if values[mid] >= target:
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
+cdef inline size_t c_count_within_price(const vector[double] &prices, double price, bint is_buy):
+    """
+    Returns the number of leading levels that can be filled at the given price - i.e. asks priced at or below, or bids
+    priced at or above the price. Ask prices are sorted ascending and bid prices descending.
+    """
+    cdef:
+        size_t low = 0
+        size_t high = prices.size()
+        size_t mid
+    while low < high:
+        mid = (low + high) >> 1
+        if (prices[mid] > price) if is_buy else (prices[mid] < price):
+            high = mid
+        else:
+            low = mid + 1
+    return low
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
 
@@ -52,6 +106,7 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._depth_index_dirty = True
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -92,6 +147,7 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_invalidate_depth_index()
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -132,12 +188,67 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_invalidate_depth_index()
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_invalidate_depth_index(self):
+        self._depth_index_dirty = True
+
+    cdef c_rebuild_depth_index(self):
+        """
+        Rebuilds the cumulative depth index - contiguous price, cumulative base amount and cumulative quote amount
+        arrays per side, ordered from the best price outwards. The volume and VWAP queries binary search these arrays
+        instead of walking the order book.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            OrderBookEntry entry
+            double cum_base = 0
+            double cum_quote = 0
+
+        self._bid_prices.clear()
+        self._bid_cum_base.clear()
+        self._bid_cum_quote.clear()
+        self._ask_prices.clear()
+        self._ask_cum_base.clear()
+        self._ask_cum_quote.clear()
+        self._bid_prices.reserve(self._bid_book.size())
+        self._bid_cum_base.reserve(self._bid_book.size())
+        self._bid_cum_quote.reserve(self._bid_book.size())
+        self._ask_prices.reserve(self._ask_book.size())
+        self._ask_cum_base.reserve(self._ask_book.size())
+        self._ask_cum_quote.reserve(self._ask_book.size())
+
+        while bid_it != self._bid_book.rend():
+            entry = deref(bid_it)
+            cum_base += entry.getAmount()
+            cum_quote += entry.getAmount() * entry.getPrice()
+            self._bid_prices.push_back(entry.getPrice())
+            self._bid_cum_base.push_back(cum_base)
+            self._bid_cum_quote.push_back(cum_quote)
+            inc(bid_it)
+
+        cum_base = 0
+        cum_quote = 0
+        while ask_it != self._ask_book.end():
+            entry = deref(ask_it)
+            cum_base += entry.getAmount()
+            cum_quote += entry.getAmount() * entry.getPrice()
+            self._ask_prices.push_back(entry.getPrice())
+            self._ask_cum_base.push_back(cum_base)
+            self._ask_cum_quote.push_back(cum_quote)
+            inc(ask_it)
+
+    cdef c_ensure_depth_index(self):
+        if self._depth_index_dirty:
+            self.c_rebuild_depth_index()
+            self._depth_index_dirty = False
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -224,12 +335,8 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+        last_update_id = max(c_copy_numpy_entries(bids_array, cpp_bids),
+                             c_copy_numpy_entries(asks_array, cpp_asks))
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -251,14 +358,34 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
 
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+        last_update_id = max(c_copy_numpy_entries(bids_array, cpp_bids),
+                             c_copy_numpy_entries(asks_array, cpp_asks))
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
+    def apply_diffs_message(self, message: OrderBookMessage):
+        """
+        Applies a diff message through its cached, pre-parsed [price, amount, update_id] arrays, without building
+        any OrderBookRow.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_copy_numpy_entries(message.bids_array, cpp_bids)
+        c_copy_numpy_entries(message.asks_array, cpp_asks)
+        self.c_apply_diffs(cpp_bids, cpp_asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        """
+        Applies a snapshot message through its cached, pre-parsed [price, amount, update_id] arrays, without building
+        any OrderBookRow.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        c_copy_numpy_entries(message.bids_array, cpp_bids)
+        c_copy_numpy_entries(message.asks_array, cpp_asks)
+        self.c_apply_snapshot(cpp_bids, cpp_asks, message.update_id)
+
     def bid_entries(self) -> Iterator[OrderBookRow]:
         cdef:
             set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
@@ -317,140 +444,131 @@ cdef class OrderBook(PubSub):
 
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            size_t index
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_ensure_depth_index()
+        prices = ref(self._ask_prices) if is_buy else ref(self._bid_prices)
+        cum_base = ref(self._ask_cum_base) if is_buy else ref(self._bid_cum_base)
+        index = c_first_at_least(deref(cum_base), volume)
+        if index < deref(cum_base).size():
+            cumulative_volume = deref(cum_base)[index]
+            result_price = deref(prices)[index]
+        elif deref(cum_base).size() > 0:
+            cumulative_volume = deref(cum_base).back()
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t index
             double total_cost = 0
             double total_volume = 0
+            double incremental_amount
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+
+        self.c_ensure_depth_index()
+        prices = ref(self._ask_prices) if is_buy else ref(self._bid_prices)
+        cum_base = ref(self._ask_cum_base) if is_buy else ref(self._bid_cum_base)
+        cum_quote = ref(self._ask_cum_quote) if is_buy else ref(self._bid_cum_quote)
+        index = c_first_at_least(deref(cum_base), volume)
+        if index < deref(cum_base).size():
+            # Take all the levels before the index in full, and only the remaining amount from the level at the index.
+            if index > 0:
+                total_cost = deref(cum_quote)[index - 1]
+                total_volume = deref(cum_base)[index - 1]
+            incremental_amount = volume - total_volume
+            total_cost += incremental_amount * deref(prices)[index]
+            total_volume += incremental_amount
+            result_vwap = total_cost / total_volume
+        elif deref(cum_base).size() > 0:
+            total_volume = deref(cum_base).back()
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_quote
+            size_t index
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+        self.c_ensure_depth_index()
+        prices = ref(self._ask_prices) if is_buy else ref(self._bid_prices)
+        cum_quote = ref(self._ask_cum_quote) if is_buy else ref(self._bid_cum_quote)
+        index = c_first_at_least(deref(cum_quote), quote_volume)
+        if index < deref(cum_quote).size():
+            cumulative_volume = deref(cum_quote)[index]
+            result_price = deref(prices)[index]
+        elif deref(cum_quote).size() > 0:
+            cumulative_volume = deref(cum_quote).back()
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            vector[double] *cum_quote
+            size_t index
             double cumulative_volume = 0
             double cumulative_base_amount = 0
-            double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+
+        self.c_ensure_depth_index()
+        prices = ref(self._ask_prices) if is_buy else ref(self._bid_prices)
+        cum_base = ref(self._ask_cum_base) if is_buy else ref(self._bid_cum_base)
+        cum_quote = ref(self._ask_cum_quote) if is_buy else ref(self._bid_cum_quote)
+        index = c_first_at_least(deref(cum_base), base_amount)
+        if index < deref(cum_base).size():
+            if index > 0:
+                cumulative_volume = deref(cum_quote)[index - 1]
+                cumulative_base_amount = deref(cum_base)[index - 1]
+            cumulative_volume += (base_amount - cumulative_base_amount) * deref(prices)[index]
+        elif deref(cum_quote).size() > 0:
+            cumulative_volume = deref(cum_quote).back()
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_base
+            size_t count
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        self.c_ensure_depth_index()
+        prices = ref(self._ask_prices) if is_buy else ref(self._bid_prices)
+        cum_base = ref(self._ask_cum_base) if is_buy else ref(self._bid_cum_base)
+        count = c_count_within_price(deref(prices), price, is_buy)
+        if count > 0:
+            cumulative_volume = deref(cum_base)[count - 1]
+            result_price = deref(prices)[count - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
+            vector[double] *prices
+            vector[double] *cum_quote
+            size_t count
             double cumulative_volume = 0
             double result_price = NaN
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        self.c_ensure_depth_index()
+        prices = ref(self._ask_prices) if is_buy else ref(self._bid_prices)
+        cum_quote = ref(self._ask_cum_quote) if is_buy else ref(self._bid_cum_quote)
+        count = c_count_within_price(deref(prices), price, is_buy)
+        if count > 0:
+            cumulative_volume = deref(cum_quote)[count - 1]
+            result_price = deref(prices)[count - 1]
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -474,11 +592,14 @@ cdef class OrderBook(PubSub):
 
     @classmethod
     def snapshot_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        pass
+        # Imported here as the replay module depends on OrderBook
+        from hummingbot.core.data_type.order_book_replay import message_from_db_record
+        return message_from_db_record(OrderBookMessageType.SNAPSHOT, record, metadata)
 
     @classmethod
     def diff_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
-        pass
+        from hummingbot.core.data_type.order_book_replay import message_from_db_record
+        return message_from_db_record(OrderBookMessageType.DIFF, record, metadata)
 
     @classmethod
     def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
@@ -495,6 +616,6 @@ cdef class OrderBook(PubSub):
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diffs_message(diff)
@@ -4,14 +4,41 @@ from collections import namedtuple
 from enum import Enum
 from functools import total_ordering
 from typing import (
+    Any,
     Dict,
     List,
     Optional,
 )
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
+def parse_order_book_entries(entries: List[Any], update_id: int) -> np.ndarray:
+    """
+    Parses raw exchange price levels (e.g. [["0.1", "2.5"], ...], with optional trailing fields) in one pass into a
+    float64 array of [price, amount, update_id] rows, as expected by OrderBook.apply_numpy_diffs.
+    """
+    array = np.empty((len(entries), 3), dtype=np.float64)
+    if len(entries) == 0:
+        return array
+    try:
+        parsed = np.array(entries, dtype=np.float64)
+        if parsed.ndim != 2 or parsed.shape[1] < 2:
+            raise ValueError("Unexpected order book entry shape.")
+    except (ValueError, TypeError):
+        # Ragged rows or non-numeric trailing fields, only the price and amount are relevant.
+        parsed = np.array([(entry[0], entry[1]) for entry in entries], dtype=np.float64)
+    array[:, :2] = parsed[:, :2]
+    array[:, 2] = update_id
+    return array
+
+
+def order_book_rows_to_array(rows: List[OrderBookRow]) -> np.ndarray:
+    return np.array([(row.price, row.amount, row.update_id) for row in rows], dtype=np.float64).reshape(-1, 3)
+
+
 class OrderBookMessageType(Enum):
     SNAPSHOT = 1
     DIFF = 2
@@ -60,15 +87,50 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
 
     @property
     def asks(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["asks"]
-        ]
+        asks = self.__dict__.get("_asks")
+        if asks is None:
+            asks = self.__dict__["_asks"] = [
+                OrderBookRow(float(price), float(amount), self.update_id)
+                for price, amount, *trash in self.content["asks"]
+            ]
+        return asks
 
     @property
     def bids(self) -> List[OrderBookRow]:
-        return [
-            OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
-        ]
+        bids = self.__dict__.get("_bids")
+        if bids is None:
+            bids = self.__dict__["_bids"] = [
+                OrderBookRow(float(price), float(amount), self.update_id)
+                for price, amount, *trash in self.content["bids"]
+            ]
+        return bids
+
+    @property
+    def asks_array(self) -> np.ndarray:
+        """
+        The asks as a float64 array of [price, amount, update_id] rows. Parsed once and cached on the message.
+        """
+        asks_array = self.__dict__.get("_asks_array")
+        if asks_array is None:
+            asks_array = self.__dict__["_asks_array"] = self._entries_array("asks")
+        return asks_array
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        """
+        The bids as a float64 array of [price, amount, update_id] rows. Parsed once and cached on the message.
+        """
+        bids_array = self.__dict__.get("_bids_array")
+        if bids_array is None:
+            bids_array = self.__dict__["_bids_array"] = self._entries_array("bids")
+        return bids_array
+
+    def _entries_array(self, side: str) -> np.ndarray:
+        if getattr(type(self), side) is getattr(OrderBookMessage, side) and "_" + side not in self.__dict__:
+            # Default semantics, parse the raw exchange entries directly without building any OrderBookRow.
+            return parse_order_book_entries(self.content[side], self.update_id)
+        # Messages with exchange specific semantics, go through their own row parsing.
+        return order_book_rows_to_array(getattr(self, side))
 
     @property
     def has_update_id(self) -> bool:
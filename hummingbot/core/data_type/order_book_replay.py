@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+from sqlalchemy.engine import RowProxy
+from sqlalchemy.engine.base import Engine
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.core.data_type.order_book_snapshot_store import OrderBookSnapshotStore
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.dm_order_book_snapshot import OrderBookSnapshot
+
+
+def replay_order_key(message: OrderBookMessage):
+    # For messages of the same timestamp, snapshots are applied before diffs and diffs before trades.
+    return message.timestamp, message.type.value
+
+
+def merge_replay_messages(*message_streams: Iterable[OrderBookMessage]) -> Iterator[OrderBookMessage]:
+    """
+    Merges timestamp ordered message streams into one deterministic, timestamp ordered stream.
+    """
+    return heapq.merge(*message_streams, key=replay_order_key)
+
+
+def snapshot_messages_from_store(store: OrderBookSnapshotStore,
+                                 exchange: str,
+                                 trading_pairs: List[str],
+                                 start: float,
+                                 end: float) -> Iterator[OrderBookMessage]:
+    """
+    Streams the snapshots recorded in a columnar snapshot store as snapshot messages, in timestamp order.
+    """
+    def pair_messages(trading_pair: str) -> Iterator[OrderBookMessage]:
+        for timestamp, update_id, bids, asks in store.read(exchange, trading_pair, start, end):
+            message = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": trading_pair,
+                "update_id": update_id,
+                "bids": bids,
+                "asks": asks,
+            }, timestamp=timestamp)
+            # The store already returns parsed [price, amount, update_id] arrays.
+            message.__dict__["_bids_array"] = bids
+            message.__dict__["_asks_array"] = asks
+            yield message
+
+    return merge_replay_messages(*[pair_messages(trading_pair) for trading_pair in trading_pairs])
+
+
+def snapshot_messages_from_db(engine: Engine,
+                              exchange: str,
+                              trading_pairs: List[str],
+                              start: float,
+                              end: float) -> Iterator[OrderBookMessage]:
+    """
+    Streams the snapshots recorded in the OrderBookSnapshot table (one row per level, millisecond timestamps) as
+    snapshot messages, in timestamp order.
+    """
+    table = OrderBookSnapshot.__table__
+    query = (table.select()
+             .where(table.c.exchange == exchange)
+             .where(table.c.trading_pair.in_(trading_pairs))
+             .where(table.c.timestamp >= int(start * 1e3))
+             .where(table.c.timestamp <= int(end * 1e3))
+             .order_by(table.c.timestamp, table.c.trading_pair, table.c.id))
+    with engine.connect() as conn:
+        rows = conn.execution_options(stream_results=True).execute(query)
+        for (timestamp, trading_pair, update_id), levels in itertools.groupby(
+                rows, key=lambda row: (row["timestamp"], row["trading_pair"], row["update_id"])):
+            bids, asks = [], []
+            for level in levels:
+                (bids if level["is_bid"] else asks).append([level["price"], level["amount"]])
+            yield OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+                "trading_pair": trading_pair,
+                "update_id": int(update_id),
+                "bids": bids,
+                "asks": asks,
+            }, timestamp=timestamp * 1e-3)
+
+
+def message_from_db_record(message_type: OrderBookMessageType,
+                           record: RowProxy,
+                           metadata: Optional[Dict] = None) -> OrderBookMessage:
+    """
+    Converts a recorded row holding a whole message content (json column) and its timestamp into a message, as used
+    by the snapshot_message_from_db and diff_message_from_db methods of OrderBook.
+    """
+    content: Dict[str, Any] = dict(record.json)
+    if metadata:
+        content.update(metadata)
+    return OrderBookMessage(message_type, content, timestamp=record.timestamp)
+
+
+class HistoricalReplayDataSource(OrderBookTrackerDataSource):
+    """
+    Order book data source backed by recorded snapshot, diff and trade messages instead of an exchange. Messages are
+    not pushed by listeners, they are pulled in timestamp order by an OrderBookReplayer as the clock advances.
+    """
+
+    def __init__(self, trading_pairs: List[str], messages: Iterable[OrderBookMessage]):
+        super().__init__(trading_pairs)
+        self._messages: Iterator[OrderBookMessage] = iter(messages)
+        self._next_message: Optional[OrderBookMessage] = next(self._messages, None)
+
+    @property
+    def exhausted(self) -> bool:
+        return self._next_message is None
+
+    @property
+    def next_timestamp(self) -> Optional[float]:
+        return self._next_message.timestamp if self._next_message is not None else None
+
+    def messages_until(self, timestamp: float) -> Iterator[OrderBookMessage]:
+        """
+        Yields the messages with timestamps up to and including the given timestamp.
+        """
+        while self._next_message is not None and self._next_message.timestamp <= timestamp:
+            message: OrderBookMessage = self._next_message
+            self._next_message = next(self._messages, None)
+            yield message
+
+    async def fetch_trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return self.order_book_create_function()
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class ReplayOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker for historical replay. It does not open any connection, its order books are only updated by an
+    OrderBookReplayer, so it can back a PaperTradeExchange in place of the live tracker.
+    """
+
+    def __init__(self, data_source: HistoricalReplayDataSource, trading_pairs: List[str], exchange_name: str):
+        super().__init__(data_source=data_source, trading_pairs=trading_pairs)
+        self._exchange_name: str = exchange_name
+
+    @property
+    def exchange_name(self) -> str:
+        return self._exchange_name
+
+    def start(self):
+        self.stop()
+        for trading_pair in self._trading_pairs:
+            self._order_books[trading_pair] = self._data_source.order_book_create_function()
+        self._order_books_initialized.set()
+
+    def apply_message(self, message: OrderBookMessage):
+        order_book: Optional[OrderBook] = self._order_books.get(message.trading_pair)
+        if order_book is None:
+            return
+        if message.type is OrderBookMessageType.SNAPSHOT:
+            order_book.apply_snapshot_message(message)
+        elif message.type is OrderBookMessageType.DIFF:
+            order_book.apply_diffs_message(message)
+        elif message.type is OrderBookMessageType.TRADE:
+            order_book.apply_trade(OrderBookTradeEvent(
+                trading_pair=message.trading_pair,
+                timestamp=message.timestamp,
+                price=float(message.content["price"]),
+                amount=float(message.content["amount"]),
+                type=TradeType.SELL if
+                message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+            ))
+
+
+class OrderBookReplayer(PyTimeIterator):
+    """
+    Drives a ReplayOrderBookTracker from its historical data source in lockstep with the clock. On each tick, every
+    message recorded up to the tick's timestamp is applied, in timestamp order.
+
+    Add it to the clock before the connectors and strategies so they see the books as of the current tick. Run the
+    clock with Clock.backtest() / backtest_til() to replay as fast as the strategy allows. With stop_when_exhausted,
+    the backtest ends once all recorded data has been replayed.
+    """
+    _obr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obr_logger is None:
+            cls._obr_logger = logging.getLogger(__name__)
+        return cls._obr_logger
+
+    def __init__(self, order_book_tracker: ReplayOrderBookTracker, stop_when_exhausted: bool = True):
+        super().__init__()
+        self._order_book_tracker: ReplayOrderBookTracker = order_book_tracker
+        self._data_source: HistoricalReplayDataSource = order_book_tracker.data_source
+        self._stop_when_exhausted: bool = stop_when_exhausted
+        self._messages_replayed: Dict[OrderBookMessageType, int] = {message_type: 0
+                                                                    for message_type in OrderBookMessageType}
+
+    @property
+    def order_book_tracker(self) -> ReplayOrderBookTracker:
+        return self._order_book_tracker
+
+    @property
+    def messages_replayed(self) -> Dict[OrderBookMessageType, int]:
+        return self._messages_replayed
+
+    def tick(self, timestamp: float):
+        if not self._order_book_tracker.ready:
+            self._order_book_tracker.start()
+        for message in self._data_source.messages_until(timestamp):
+            self._order_book_tracker.apply_message(message)
+            self._messages_replayed[message.type] += 1
+        if self._stop_when_exhausted and self._data_source.exhausted:
+            self.logger().info(f"Historical data replay completed at {timestamp}.")
+            raise StopIteration
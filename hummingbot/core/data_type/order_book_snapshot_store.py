@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+from datetime import datetime, timezone
+import os
+from os.path import join
+from typing import (
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
+
+from hummingbot import data_path
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+
+# One record per snapshot. offset is the row of the snapshot's first level in the levels file, bids come first.
+SNAPSHOT_INDEX_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("update_id", "<i8"),
+    ("offset", "<i8"),
+    ("bid_count", "<i4"),
+    ("ask_count", "<i4"),
+])
+# Packed [price, amount] rows.
+SNAPSHOT_LEVEL_DTYPE = np.dtype("<f8")
+SNAPSHOT_LEVEL_WIDTH = 2
+
+# (timestamp, update_id, bids, asks) - bids and asks are [price, amount, update_id] float64 arrays
+StoredSnapshot = Tuple[float, int, np.ndarray, np.ndarray]
+
+
+def _partition_name(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y%m%d")
+
+
+def _price_amount_rows(entries: np.ndarray) -> np.ndarray:
+    entries = np.asarray(entries, dtype=SNAPSHOT_LEVEL_DTYPE)
+    if entries.size == 0:
+        return np.empty((0, SNAPSHOT_LEVEL_WIDTH), dtype=SNAPSHOT_LEVEL_DTYPE)
+    return entries[:, :SNAPSHOT_LEVEL_WIDTH]
+
+
+class OrderBookSnapshotStore:
+    """
+    Append-only columnar store for recorded order book snapshots.
+
+    Snapshots are partitioned per exchange / trading pair / UTC day. Each partition holds two files:
+    - <day>.levels: the packed float64 [price, amount] rows of every snapshot, bids then asks
+    - <day>.index: one fixed size record per snapshot (timestamp, update_id, offset, bid_count, ask_count), which
+      doubles as the time index since snapshots are appended in timestamp order.
+
+    Reads memory map the levels file and binary search the index, and return [price, amount, update_id] arrays ready
+    for OrderBook.apply_numpy_snapshot.
+    """
+
+    def __init__(self, root_dir: Optional[str] = None):
+        self._root_dir: str = root_dir or join(data_path(), "order_book_snapshots")
+
+    @property
+    def root_dir(self) -> str:
+        return self._root_dir
+
+    def _pair_dir(self, exchange: str, trading_pair: str) -> str:
+        return join(self._root_dir, exchange, trading_pair)
+
+    def append(self,
+               exchange: str,
+               trading_pair: str,
+               timestamp: float,
+               update_id: int,
+               bids: np.ndarray,
+               asks: np.ndarray):
+        """
+        Appends a snapshot. bids and asks are arrays whose first two columns are price and amount.
+        """
+        pair_dir: str = self._pair_dir(exchange, trading_pair)
+        os.makedirs(pair_dir, exist_ok=True)
+        partition: str = join(pair_dir, _partition_name(timestamp))
+        levels_path: str = f"{partition}.levels"
+        index_path: str = f"{partition}.index"
+
+        levels: np.ndarray = np.concatenate([_price_amount_rows(bids), _price_amount_rows(asks)])
+        offset: int = (os.path.getsize(levels_path) // (SNAPSHOT_LEVEL_DTYPE.itemsize * SNAPSHOT_LEVEL_WIDTH)
+                       if os.path.exists(levels_path) else 0)
+        record: np.ndarray = np.array([(timestamp, update_id, offset, len(bids), len(asks))],
+                                      dtype=SNAPSHOT_INDEX_DTYPE)
+        # Levels are written before the index record, a snapshot only becomes visible once it is fully written.
+        with open(levels_path, "ab") as levels_file:
+            np.ascontiguousarray(levels).tofile(levels_file)
+        with open(index_path, "ab") as index_file:
+            record.tofile(index_file)
+
+    def append_message(self, exchange: str, message: OrderBookMessage):
+        self.append(exchange, message.trading_pair, message.timestamp, message.update_id,
+                    message.bids_array, message.asks_array)
+
+    def _partitions(self, exchange: str, trading_pair: str, start: float, end: float) -> List[str]:
+        pair_dir: str = self._pair_dir(exchange, trading_pair)
+        if not os.path.isdir(pair_dir):
+            return []
+        first, last = _partition_name(start), _partition_name(end)
+        return sorted(join(pair_dir, file_name[:-len(".index")])
+                      for file_name in os.listdir(pair_dir)
+                      if file_name.endswith(".index") and first <= file_name[:-len(".index")] <= last)
+
+    @staticmethod
+    def _read_index(partition: str) -> np.ndarray:
+        index_path: str = f"{partition}.index"
+        # Ignore a trailing partially written record.
+        count: int = os.path.getsize(index_path) // SNAPSHOT_INDEX_DTYPE.itemsize
+        return np.fromfile(index_path, dtype=SNAPSHOT_INDEX_DTYPE, count=count)
+
+    @staticmethod
+    def _read_levels(partition: str) -> np.ndarray:
+        levels_path: str = f"{partition}.levels"
+        if os.path.getsize(levels_path) == 0:
+            return np.empty((0, SNAPSHOT_LEVEL_WIDTH), dtype=SNAPSHOT_LEVEL_DTYPE)
+        return np.memmap(levels_path, dtype=SNAPSHOT_LEVEL_DTYPE, mode="r").reshape(-1, SNAPSHOT_LEVEL_WIDTH)
+
+    @staticmethod
+    def _to_snapshot(record: np.void, levels: np.ndarray) -> StoredSnapshot:
+        offset, bid_count, ask_count = int(record["offset"]), int(record["bid_count"]), int(record["ask_count"])
+        update_id: int = int(record["update_id"])
+        rows: np.ndarray = np.empty((bid_count + ask_count, 3), dtype=np.float64)
+        rows[:, :2] = levels[offset:offset + bid_count + ask_count]
+        rows[:, 2] = update_id
+        return float(record["timestamp"]), update_id, rows[:bid_count], rows[bid_count:]
+
+    def timestamps(self, exchange: str, trading_pair: str, start: float, end: float) -> np.ndarray:
+        """
+        Returns the timestamps of the snapshots recorded in [start, end].
+        """
+        results: List[np.ndarray] = []
+        for partition in self._partitions(exchange, trading_pair, start, end):
+            timestamps: np.ndarray = self._read_index(partition)["timestamp"]
+            results.append(timestamps[np.searchsorted(timestamps, start, side="left"):
+                                      np.searchsorted(timestamps, end, side="right")])
+        return np.concatenate(results) if len(results) > 0 else np.empty(0, dtype=np.float64)
+
+    def read(self, exchange: str, trading_pair: str, start: float, end: float) -> Iterator[StoredSnapshot]:
+        """
+        Yields the snapshots recorded in [start, end], in timestamp order.
+        """
+        for partition in self._partitions(exchange, trading_pair, start, end):
+            index: np.ndarray = self._read_index(partition)
+            timestamps: np.ndarray = index["timestamp"]
+            first: int = int(np.searchsorted(timestamps, start, side="left"))
+            last: int = int(np.searchsorted(timestamps, end, side="right"))
+            if first >= last:
+                continue
+            levels: np.ndarray = self._read_levels(partition)
+            for record in index[first:last]:
+                yield self._to_snapshot(record, levels)
+
+    def read_latest(self, exchange: str, trading_pair: str, timestamp: float) -> Optional[StoredSnapshot]:
+        """
+        Returns the last snapshot recorded at or before the timestamp, looking back through earlier days if needed.
+        """
+        pair_dir: str = self._pair_dir(exchange, trading_pair)
+        if not os.path.isdir(pair_dir):
+            return None
+        day: str = _partition_name(timestamp)
+        partitions: List[str] = sorted((join(pair_dir, file_name[:-len(".index")])
+                                        for file_name in os.listdir(pair_dir)
+                                        if file_name.endswith(".index") and file_name[:-len(".index")] <= day),
+                                       reverse=True)
+        for partition in partitions:
+            index: np.ndarray = self._read_index(partition)
+            position: int = int(np.searchsorted(index["timestamp"], timestamp, side="right"))
+            if position > 0:
+                return self._to_snapshot(index[position - 1], self._read_levels(partition))
+        return None
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from sqlalchemy.engine.base import Engine
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+from hummingbot.model.dm_order_book_snapshot import OrderBookSnapshot
+
+
+class OrderBookSnapshotWriter:
+    """
+    Persists order book snapshot messages to the OrderBookSnapshot table off the event loop.
+
+    Messages are buffered in a bounded queue - `write` blocks once the writer falls behind by `max_queue_size` messages,
+    which applies backpressure to the producer. A background task drains the queue into batches of up to `batch_size`
+    rows and inserts each batch with a single executemany on a dedicated writer thread.
+    """
+    _obsw_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obsw_logger is None:
+            cls._obsw_logger = logging.getLogger(__name__)
+        return cls._obsw_logger
+
+    def __init__(self,
+                 engine: Engine,
+                 exchange: str,
+                 batch_size: int = 10000,
+                 max_queue_size: int = 100,
+                 flush_interval: float = 1.0):
+        self._engine: Engine = engine
+        self._exchange: str = exchange
+        self._batch_size: int = batch_size
+        self._flush_interval: float = flush_interval
+        self._message_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
+        self._writer_task: Optional[asyncio.Task] = None
+        self._rows_written: int = 0
+        self._batches_written: int = 0
+        self._rows_per_second: float = 0.0
+        OrderBookSnapshot.__table__.create(bind=self._engine, checkfirst=True)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._message_queue.qsize()
+
+    @property
+    def rows_written(self) -> int:
+        return self._rows_written
+
+    @property
+    def rows_per_second(self) -> float:
+        """
+        Insert throughput of the last written batch.
+        """
+        return self._rows_per_second
+
+    @property
+    def started(self) -> bool:
+        return self._writer_task is not None
+
+    def start(self):
+        self.stop()
+        self._writer_task = safe_ensure_future(self._write_loop())
+
+    def stop(self):
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+
+    async def write(self, message: OrderBookMessage, trading_pair: str):
+        await self._message_queue.put((message, trading_pair))
+
+    def snapshot_rows(self, message: OrderBookMessage, trading_pair: str) -> List[Dict[str, Any]]:
+        timestamp: int = int(message.timestamp * 1e3)
+        message_type: str = message.type.name
+        update_id: str = str(message.update_id)
+        rows: List[Dict[str, Any]] = []
+        for is_bid, entries in ((1, message.bids_array), (0, message.asks_array)):
+            for price, amount in entries[:, :2].tolist():
+                rows.append({
+                    "trading_pair": trading_pair,
+                    "timestamp": timestamp,
+                    "type": message_type,
+                    "exchange": self._exchange,
+                    "price": price,
+                    "amount": amount,
+                    "update_id": update_id,
+                    "is_bid": is_bid,
+                })
+        return rows
+
+    def _insert_rows(self, rows: List[Dict[str, Any]]) -> float:
+        start: float = time.perf_counter()
+        with self._engine.begin() as conn:
+            conn.execute(OrderBookSnapshot.__table__.insert(), rows)
+        return time.perf_counter() - start
+
+    async def _next_batch(self) -> List[Dict[str, Any]]:
+        rows: List[Dict[str, Any]] = []
+        item: Tuple[OrderBookMessage, str] = await self._message_queue.get()
+        rows.extend(self.snapshot_rows(*item))
+        deadline: float = time.perf_counter() + self._flush_interval
+        while len(rows) < self._batch_size:
+            if self._message_queue.empty():
+                remaining: float = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._message_queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self._message_queue.get_nowait()
+            rows.extend(self.snapshot_rows(*item))
+        return rows
+
+    async def _write_loop(self):
+        ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        last_report_timestamp: float = time.time()
+        while True:
+            try:
+                rows: List[Dict[str, Any]] = await self._next_batch()
+                if len(rows) == 0:
+                    continue
+                elapsed: float = await ev_loop.run_in_executor(self._executor, self._insert_rows, rows)
+                self._rows_written += len(rows)
+                self._batches_written += 1
+                self._rows_per_second = len(rows) / elapsed if elapsed > 0 else float(len(rows))
+
+                # Log some statistics.
+                now: float = time.time()
+                if int(now / 60.0) > int(last_report_timestamp / 60.0):
+                    self.logger().debug(f"Order book snapshot rows written: {self._rows_written} "
+                                        f"in {self._batches_written} batches, "
+                                        f"{self._rows_per_second:.0f} rows/sec, queue depth: {self.queue_depth}")
+                    last_report_timestamp = now
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error writing order book snapshots. Retrying after 5 seconds.",
+                                    exc_info=True)
+                await asyncio.sleep(5.0)
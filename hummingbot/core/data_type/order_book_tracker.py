@@ -1,11 +1,8 @@
 #!/usr/bin/env python
 import asyncio
 from abc import ABC
-from collections import deque
+from collections import defaultdict, deque
 from enum import Enum
-from hummingbot.model.dm_order_book_snapshot import OrderBookSnapshot
-
-from sqlalchemy.orm.session import Session
 import logging
 import pandas as pd
 import re
@@ -13,21 +10,27 @@ from typing import (
     Dict,
     Deque,
     Optional,
+    Set,
     Tuple,
     List)
 import time
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.time_bucketed_async_throttler import TimeBucketedAsyncThrottler
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.data_type.order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
 )
+from hummingbot.core.data_type.order_book_snapshot_writer import OrderBookSnapshotWriter
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.model.sql_connection_manager import SQLConnectionManager
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
+ORDER_BOOK_SNAPSHOT_LIMIT_ID = "order_book_snapshot"
 
 
 class OrderBookTrackerDataSourceType(Enum):
@@ -38,6 +41,10 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    PENDING_DIFF_QUEUE_SIZE: int = 1000
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS: int = 10
+    # Rate limit of the order book snapshot requests sent during initialization, when no throttler is given.
+    SNAPSHOT_RATE_LIMIT: RateLimit = RateLimit(limit_id=ORDER_BOOK_SNAPSHOT_LIMIT_ID, limit=5, time_interval=1.0)
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -46,7 +53,19 @@ class OrderBookTracker(ABC):
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 throttler: Optional[AsyncThrottlerBase] = None,
+                 snapshot_limit_id: Optional[str] = None):
+        """
+        :param throttler: Throttler the order book snapshot requests sent during initialization go through. Defaults
+        to a throttler enforcing SNAPSHOT_RATE_LIMIT.
+        :param snapshot_limit_id: The throttler limit_id of the order book snapshot requests, required with a throttler
+        """
+        if throttler is not None and snapshot_limit_id is None:
+            raise ValueError("snapshot_limit_id is required when a throttler is given.")
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
@@ -55,6 +74,14 @@ class OrderBookTracker(ABC):
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
         self._past_diffs_windows: Dict[str, Deque] = {}
+        # Diff messages received before the order book of their trading pair is initialized
+        self._pending_diff_messages: Dict[str, Deque[OrderBookMessage]] = defaultdict(
+            lambda: deque(maxlen=self.PENDING_DIFF_QUEUE_SIZE))
+        self._snapshot_throttler: AsyncThrottlerBase = throttler or TimeBucketedAsyncThrottler([self.SNAPSHOT_RATE_LIMIT])
+        self._snapshot_limit_id: str = snapshot_limit_id or ORDER_BOOK_SNAPSHOT_LIMIT_ID
+        self._init_start_timestamp: float = 0.0
+        self._init_duration: Optional[float] = None
+        self._order_book_init_durations: Dict[str, float] = {}
         self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
@@ -68,6 +95,7 @@ class OrderBookTracker(ABC):
         self._order_book_diff_router_task: Optional[asyncio.Task] = None
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
+        self._snapshot_writer: Optional[OrderBookSnapshotWriter] = None
 
     @property
     def data_source(self) -> OrderBookTrackerDataSource:
@@ -81,6 +109,30 @@ class OrderBookTracker(ABC):
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> Set[str]:
+        """
+        Trading pairs whose order book is initialized and tracked, before all of them are.
+        """
+        return set(self._tracking_message_queues.keys())
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self._tracking_message_queues
+
+    @property
+    def init_duration(self) -> Optional[float]:
+        """
+        Seconds it took to initialize all the order books, None until they are.
+        """
+        return self._init_duration
+
+    @property
+    def order_book_init_durations(self) -> Dict[str, float]:
+        """
+        Seconds from the start of the initialization until each trading pair's order book was ready.
+        """
+        return self._order_book_init_durations
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -141,10 +193,13 @@ class OrderBookTracker(ABC):
         if self._update_last_trade_prices_task is not None:
             self._update_last_trade_prices_task.cancel()
             self._update_last_trade_prices_task = None
+        if self._snapshot_writer is not None:
+            self._snapshot_writer.stop()
         if len(self._tracking_tasks) > 0:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        self._pending_diff_messages.clear()
         self._order_books_initialized.clear()
 
     async def _update_last_trade_prices_loop(self):
@@ -152,7 +207,6 @@ class OrderBookTracker(ABC):
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
         fall-back mechanism for when the web socket update channel fails.
         '''
-        await self._order_books_initialized.wait()
         while True:
             try:
                 outdateds = [t_pair for t_pair, o_book in self._order_books.items()
@@ -174,34 +228,71 @@ class OrderBookTracker(ABC):
                 self.logger().network("Unexpected error while fetching last trade price.", exc_info=True)
                 await asyncio.sleep(30)
 
+    async def _fetch_new_order_book(self, trading_pair: str, semaphore: asyncio.Semaphore) -> OrderBook:
+        while True:
+            try:
+                async with semaphore:
+                    async with self._snapshot_throttler.execute_task(self._snapshot_limit_id):
+                        return await self._data_source.get_new_order_book(trading_pair)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error fetching the order book snapshot of {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not fetch the order book snapshot of {trading_pair}. "
+                                    f"Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+
+    async def _init_order_book(self, trading_pair: str, semaphore: asyncio.Semaphore):
+        order_book: OrderBook = await self._fetch_new_order_book(trading_pair, semaphore)
+        self._order_books[trading_pair] = order_book
+        message_queue: asyncio.Queue = asyncio.Queue()
+        # Hand over the diffs received while the snapshot was being fetched.
+        for message in self._pending_diff_messages.pop(trading_pair, []):
+            if message.update_id >= order_book.snapshot_uid:
+                message_queue.put_nowait(message)
+        self._tracking_message_queues[trading_pair] = message_queue
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_init_durations[trading_pair] = time.perf_counter() - self._init_start_timestamp
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self._order_book_init_durations)}/{len(self._trading_pairs)} completed.")
+
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books concurrently. Each trading pair's order book is tracked as soon as it is initialized,
+        the tracker is ready once all of them are.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._data_source.get_new_order_book(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+        self._init_start_timestamp = time.perf_counter()
+        self._init_duration = None
+        self._order_book_init_durations.clear()
+        semaphore: asyncio.Semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SNAPSHOT_REQUESTS)
+        await safe_gather(*[self._init_order_book(trading_pair, semaphore) for trading_pair in self._trading_pairs])
+        self._init_duration = time.perf_counter() - self._init_start_timestamp
         self._order_books_initialized.set()
+        self.logger().info(f"Initialized {len(self._trading_pairs)} order books in {self._init_duration:.2f} seconds.")
 
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
         """
         last_message_timestamp: float = time.time()
+        messages_queued: int = 0
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
-                    messages_rejected += 1
+                    if trading_pair in self._trading_pairs:
+                        # Save diff messages received before the order book snapshot is ready
+                        self._pending_diff_messages[trading_pair].append(ob_message)
+                        messages_queued += 1
+                    else:
+                        messages_rejected += 1
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -216,9 +307,11 @@ class OrderBookTracker(ABC):
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug(f"Diff messages processed: {messages_accepted}, rejected: {messages_rejected}")
+                    self.logger().debug(f"Diff messages processed: {messages_accepted}, "
+                                        f"rejected: {messages_rejected}, queued: {messages_queued}")
                     messages_accepted = 0
                     messages_rejected = 0
+                    messages_queued = 0
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -231,7 +324,6 @@ class OrderBookTracker(ABC):
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
@@ -240,7 +332,7 @@ class OrderBookTracker(ABC):
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
 
-                self.write_order_book_snapshot_to_db(ob_message, trading_pair)
+                await self.write_order_book_snapshot_to_db(ob_message, trading_pair)
                 await message_queue.put(ob_message)
             except asyncio.CancelledError:
                 raise
@@ -248,38 +340,18 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
-    # TODO: ASYNC
-    async def write_order_book_snapshot_to_db(self, obmsg: "OrderBookMessage", tpair: str):
-        session: Session = self.session
-        for bid in obmsg.bids:
-            order_book_snapshot: OrderBookSnapshot = OrderBookSnapshot(
-                trading_pair = tpair,
-                timestamp = obmsg.timestamp,
-                exchange = obmsg.type,
-                price = bid.price,
-                amount = bid.amount,
-                update_id = bid.update_id,
-                is_bid = True)
-            session.add(order_book_snapshot)
-            print("[SHAWN] --- ", order_book_snapshot.__repr__())
-
-        for ask in obmsg.asks:
-            order_book_snapshot: OrderBookSnapshot = OrderBookSnapshot(
-                trading_pair = tpair,
-                timestamp = obmsg.timestamp,
-                exchange = obmsg.type,
-                price = ask.price,
-                amount = ask.amount,
-                update_id = ask.update_id,
-                is_bid = False)
-            session.add(order_book_snapshot)
-            print("[SHAWN] --- ", order_book_snapshot.__repr__())
-        await session.commit()
-
     @property
-    def session(self) -> Session:
-        self.trade_fill_db = SQLConnectionManager.get_trade_fills_instance(db_name="dm")
-        return self.trade_fill_db.get_shared_session()
+    def snapshot_writer(self) -> OrderBookSnapshotWriter:
+        if self._snapshot_writer is None:
+            sql: SQLConnectionManager = SQLConnectionManager(SQLConnectionType.TRADE_FILLS, db_name="dm")
+            exchange: str = getattr(self, "exchange_name", self.__class__.__name__)
+            self._snapshot_writer = OrderBookSnapshotWriter(sql.engine, exchange)
+        if not self._snapshot_writer.started:
+            self._snapshot_writer.start()
+        return self._snapshot_writer
+
+    async def write_order_book_snapshot_to_db(self, obmsg: "OrderBookMessage", tpair: str):
+        await self.snapshot_writer.write(obmsg, tpair)
 
     async def _track_single_book(self, trading_pair: str):
         past_diffs_window: Deque[OrderBookMessage] = deque()
@@ -294,7 +366,7 @@ class OrderBookTracker(ABC):
             try:
                 message: OrderBookMessage = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    order_book.apply_diffs_message(message)
                     past_diffs_window.append(message)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
@@ -320,7 +392,6 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+import asyncio
+import itertools
+import logging
+import math
+import multiprocessing
+from multiprocessing.connection import Connection
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.logger import HummingbotLogger
+
+# A depth summary sent from a shard to the parent process:
+# (trading_pair, bids [price, amount, update_id] array, asks array, last trade price)
+DepthSummary = Tuple[str, np.ndarray, np.ndarray, float]
+
+SHARD_READY = "ready"
+SHARD_DEPTH = "depth"
+
+
+def partition_trading_pairs(trading_pairs: List[str], shard_count: int) -> List[List[str]]:
+    """
+    Splits the trading pairs round robin into at most shard_count non-empty shards.
+    """
+    shard_count = max(1, min(shard_count, len(trading_pairs)))
+    return [trading_pairs[i::shard_count] for i in range(shard_count)]
+
+
+def order_book_depth_summary(trading_pair: str, order_book: OrderBook, depth: int) -> DepthSummary:
+    bids = np.array([tuple(row) for row in itertools.islice(order_book.bid_entries(), depth)],
+                    dtype=np.float64).reshape(-1, 3)
+    asks = np.array([tuple(row) for row in itertools.islice(order_book.ask_entries(), depth)],
+                    dtype=np.float64).reshape(-1, 3)
+    return trading_pair, bids, asks, order_book.last_trade_price
+
+
+def _book_version(order_book: OrderBook) -> Tuple[int, int, Optional[float]]:
+    last_trade_price: float = order_book.last_trade_price
+    # NaN (no trade yet) never equals itself, it would make the book look changed on every check
+    return (order_book.snapshot_uid, order_book.last_diff_uid,
+            None if math.isnan(last_trade_price) else last_trade_price)
+
+
+async def _publish_shard_depth(tracker: OrderBookTracker,
+                               connection: Connection,
+                               depth: int,
+                               publish_interval: float):
+    await tracker._order_books_initialized.wait()
+    connection.send((SHARD_READY, list(tracker.order_books.keys())))
+    published_versions: Dict[str, Tuple[int, int, Optional[float]]] = {}
+    while True:
+        summaries: List[DepthSummary] = []
+        for trading_pair, order_book in tracker.order_books.items():
+            version = _book_version(order_book)
+            if published_versions.get(trading_pair) != version:
+                published_versions[trading_pair] = version
+                summaries.append(order_book_depth_summary(trading_pair, order_book, depth))
+        if len(summaries) > 0:
+            connection.send((SHARD_DEPTH, summaries))
+        await asyncio.sleep(publish_interval)
+
+
+def _run_shard(tracker_class: Type[OrderBookTracker],
+               tracker_kwargs: Dict[str, Any],
+               trading_pairs: List[str],
+               connection: Connection,
+               depth: int,
+               publish_interval: float):
+    """
+    Worker process entry point. Owns the websocket connections and order books of its trading pairs and publishes
+    their depth to the parent process whenever they change.
+    """
+    ev_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(ev_loop)
+    tracker: OrderBookTracker = tracker_class(trading_pairs=trading_pairs, **tracker_kwargs)
+    tracker.start()
+    try:
+        ev_loop.run_until_complete(_publish_shard_depth(tracker, connection, depth, publish_interval))
+    except (BrokenPipeError, EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        tracker.stop()
+        connection.close()
+
+
+class ShardedOrderBookTracker:
+    """
+    Runs an order book tracker per shard of trading pairs in separate worker processes, so that websocket handling
+    and order book maintenance for hundreds of trading pairs is spread across CPU cores.
+
+    The parent process keeps an OrderBook per trading pair holding the top `depth` levels of each side, refreshed from
+    the depth summaries the shards send over a pipe. It exposes the same order_books / ready / start / stop
+    interface as OrderBookTracker. A shard process which exits unexpectedly is restarted.
+    """
+    SHARD_RESTART_DELAY = 5.0
+
+    _sobt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._sobt_logger is None:
+            cls._sobt_logger = logging.getLogger(__name__)
+        return cls._sobt_logger
+
+    def __init__(self,
+                 tracker_class: Type[OrderBookTracker],
+                 trading_pairs: List[str],
+                 shard_count: Optional[int] = None,
+                 depth: int = 20,
+                 publish_interval: float = 0.1,
+                 tracker_kwargs: Optional[Dict[str, Any]] = None):
+        self._tracker_class: Type[OrderBookTracker] = tracker_class
+        self._tracker_kwargs: Dict[str, Any] = tracker_kwargs or {}
+        self._trading_pairs: List[str] = trading_pairs
+        self._shards: List[List[str]] = partition_trading_pairs(trading_pairs,
+                                                                shard_count or multiprocessing.cpu_count())
+        self._depth: int = depth
+        self._publish_interval: float = publish_interval
+        self._order_books: Dict[str, OrderBook] = {trading_pair: OrderBook() for trading_pair in trading_pairs}
+        self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._ready_trading_pairs: Set[str] = set()
+        self._ready_shards: Set[int] = set()
+        self._processes: List[Optional[multiprocessing.Process]] = []
+        self._connections: List[Optional[Connection]] = []
+        self._restart_handles: Dict[int, asyncio.TimerHandle] = {}
+        self._last_update_timestamps: Dict[str, float] = {}
+        self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return self._order_books
+
+    @property
+    def ready(self) -> bool:
+        return self._order_books_initialized.is_set()
+
+    @property
+    def shards(self) -> List[List[str]]:
+        return self._shards
+
+    @property
+    def ready_trading_pairs(self) -> Set[str]:
+        return self._ready_trading_pairs
+
+    @property
+    def last_update_timestamps(self) -> Dict[str, float]:
+        """
+        Local time at which each trading pair's depth was last received from its shard.
+        """
+        return self._last_update_timestamps
+
+    @property
+    def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
+        return {
+            trading_pair: order_book.snapshot
+            for trading_pair, order_book in self._order_books.items()
+        }
+
+    def start(self):
+        self.stop()
+        self._processes = [None] * len(self._shards)
+        self._connections = [None] * len(self._shards)
+        for shard_index in range(len(self._shards)):
+            self._start_shard(shard_index)
+
+    def stop(self):
+        for restart_handle in self._restart_handles.values():
+            restart_handle.cancel()
+        self._restart_handles.clear()
+        for shard_index in range(len(self._processes)):
+            self._stop_shard(shard_index)
+        self._connections.clear()
+        self._processes.clear()
+        self._ready_shards.clear()
+        self._ready_trading_pairs.clear()
+        self._order_books_initialized.clear()
+
+    def _start_shard(self, shard_index: int):
+        self._restart_handles.pop(shard_index, None)
+        context = multiprocessing.get_context("spawn")
+        parent_connection, child_connection = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_run_shard,
+            args=(self._tracker_class, self._tracker_kwargs, self._shards[shard_index], child_connection,
+                  self._depth, self._publish_interval),
+            daemon=True
+        )
+        process.start()
+        child_connection.close()
+        self._processes[shard_index] = process
+        self._connections[shard_index] = parent_connection
+        self._ev_loop.add_reader(parent_connection.fileno(), self._read_shard_messages, shard_index)
+
+    def _stop_shard(self, shard_index: int):
+        connection: Optional[Connection] = self._connections[shard_index]
+        if connection is not None:
+            try:
+                self._ev_loop.remove_reader(connection.fileno())
+            except (OSError, ValueError):
+                pass
+            connection.close()
+            self._connections[shard_index] = None
+        process: Optional[multiprocessing.Process] = self._processes[shard_index]
+        if process is not None:
+            if process.is_alive():
+                process.terminate()
+            process.join(timeout=5)
+            self._processes[shard_index] = None
+
+    def _restart_shard(self, shard_index: int):
+        self._stop_shard(shard_index)
+        self._ready_shards.discard(shard_index)
+        self._ready_trading_pairs.difference_update(self._shards[shard_index])
+        self._order_books_initialized.clear()
+        self.logger().info(f"Restarting order book shard {shard_index + 1}/{len(self._shards)} "
+                           f"in {self.SHARD_RESTART_DELAY} seconds.")
+        self._restart_handles[shard_index] = self._ev_loop.call_later(self.SHARD_RESTART_DELAY,
+                                                                      self._start_shard,
+                                                                      shard_index)
+
+    def _read_shard_messages(self, shard_index: int):
+        connection: Connection = self._connections[shard_index]
+        try:
+            while connection.poll():
+                message_type, payload = connection.recv()
+                if message_type == SHARD_DEPTH:
+                    self._apply_depth_summaries(payload)
+                elif message_type == SHARD_READY:
+                    self._set_shard_ready(shard_index, payload)
+        except (EOFError, OSError):
+            self.logger().error(f"Order book shard {shard_index + 1}/{len(self._shards)} exited unexpectedly.",
+                                exc_info=True)
+            self._restart_shard(shard_index)
+
+    def _set_shard_ready(self, shard_index: int, trading_pairs: List[str]):
+        self._ready_shards.add(shard_index)
+        self._ready_trading_pairs.update(trading_pairs)
+        self.logger().info(f"Order book shard {shard_index + 1}/{len(self._shards)} initialized "
+                           f"({len(trading_pairs)} trading pairs).")
+        if len(self._ready_shards) == len(self._shards):
+            self._order_books_initialized.set()
+
+    def _apply_depth_summaries(self, summaries: List[DepthSummary]):
+        now: float = time.time()
+        for trading_pair, bids, asks, last_trade_price in summaries:
+            order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+            if order_book is None:
+                continue
+            order_book.apply_numpy_snapshot(bids, asks)
+            order_book.last_trade_price = last_trade_price
+            self._last_update_timestamps[trading_pair] = now
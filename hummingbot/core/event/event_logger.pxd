@@ -5,6 +5,8 @@ cdef class EventLogger(EventListener):
     cdef:
         str _event_source
         object _logged_events
+        dict _events_by_type
+        object _max_events
         dict _waiting
         dict _wait_returns
     cdef c_call(self, object event_object)
@@ -2,32 +2,51 @@
 
 import asyncio
 from async_timeout import timeout
+from collections import deque
 from typing import (
     List,
     Optional,
+    Type,
 )
 
 from hummingbot.core.event.event_listener cimport EventListener
 
 
 cdef class EventLogger(EventListener):
-    def __init__(self, event_source: Optional[str] = None):
+    """
+    Logs the events it receives, indexed by event class. With max_events, only the most recent max_events events are
+    kept, the oldest ones being dropped as new ones are logged.
+    """
+    def __init__(self, event_source: Optional[str] = None, max_events: Optional[int] = None):
         super().__init__()
         self._event_source = event_source
-        self._logged_events = []
+        self._max_events = max_events
+        self._logged_events = deque()
+        self._events_by_type = {}
         self._waiting = {}
         self._wait_returns = {}
 
     @property
     def event_log(self) -> List[any]:
-        return self._logged_events.copy()
+        return list(self._logged_events)
 
     @property
     def event_source(self) -> str:
         return self._event_source
 
+    @property
+    def max_events(self) -> Optional[int]:
+        return self._max_events
+
+    def event_log_of_type(self, event_type: Type) -> List[any]:
+        """
+        Returns the logged events of the given class, in the order they were logged.
+        """
+        return list(self._events_by_type.get(event_type, ()))
+
     def clear(self):
         self._logged_events.clear()
+        self._events_by_type.clear()
 
     async def wait_for(self, event_type, timeout_seconds: float = 180):
         notifier = asyncio.Event()
@@ -45,8 +64,17 @@ cdef class EventLogger(EventListener):
         self.c_call(event_object)
 
     cdef c_call(self, object event_object):
-        self._logged_events.append(event_object)
         event_object_type = type(event_object)
+        if self._max_events is not None and len(self._logged_events) >= self._max_events:
+            # Events are dropped in the order they were logged, so the oldest event logged is also the oldest event
+            # of its class.
+            dropped_event = self._logged_events.popleft()
+            self._events_by_type[type(dropped_event)].popleft()
+        self._logged_events.append(event_object)
+        events_of_type = self._events_by_type.get(event_object_type)
+        if events_of_type is None:
+            events_of_type = self._events_by_type[event_object_type] = deque()
+        events_of_type.append(event_object)
 
         should_notify = []
         for notifier, waiting_event_type in self._waiting.items():
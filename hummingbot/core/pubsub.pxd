@@ -2,13 +2,13 @@
 
 from libc.stdint cimport int64_t
 from libcpp.unordered_map cimport unordered_map
-from libcpp.unordered_set cimport unordered_set
 from libcpp.utility cimport pair
 from hummingbot.core.PyRef cimport PyRef
 from hummingbot.core.event.event_listener cimport EventListener
 
-ctypedef unordered_set[PyRef] EventListenersCollection
-ctypedef unordered_set[PyRef].iterator EventListenersIterator
+# Listener weak references by listener object address
+ctypedef unordered_map[size_t, PyRef] EventListenersCollection
+ctypedef unordered_map[size_t, PyRef].iterator EventListenersIterator
 ctypedef unordered_map[int64_t, EventListenersCollection] Events
 ctypedef unordered_map[int64_t, EventListenersCollection].iterator EventsIterator
 ctypedef pair[int64_t, EventListenersCollection] EventsPair
@@ -17,11 +17,13 @@ ctypedef pair[int64_t, EventListenersCollection] EventsPair
 cdef class PubSub:
     cdef:
         Events _events
+        dict _listener_snapshots
         object __weakref__
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
     cdef c_add_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
-    cdef c_remove_dead_listeners(self, int64_t event_tag)
+    cdef c_remove_dead_listener(self, int64_t event_tag, size_t listener_id, object listener_weakref)
+    cdef tuple c_get_listener_snapshot(self, int64_t event_tag)
     cdef c_get_listeners(self, int64_t event_tag)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
@@ -14,7 +14,6 @@ from cython.operator cimport(
 from libcpp.vector cimport vector
 from enum import Enum
 import logging
-import random
 from typing import List
 
 from hummingbot.logger import HummingbotLogger
@@ -24,26 +23,37 @@ from hummingbot.core.event.event_listener cimport EventListener
 class_logger = None
 
 
-cdef class PubSub:
+cdef class DeadListenerCallback:
+    """
+    Weak reference callback removing a garbage collected listener from a PubSub. The PubSub is weakly referenced, so
+    the listener weak references it owns do not keep it alive.
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    cdef:
+        object _pubsub_weakref
+        int64_t _event_tag
+        size_t _listener_id
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    def __init__(self, PubSub pubsub, int64_t event_tag, size_t listener_id):
+        self._pubsub_weakref = PyWeakref_NewRef(pubsub, None)
+        self._event_tag = event_tag
+        self._listener_id = listener_id
 
-    Here's how the dead listener GC is performed:
+    def __call__(self, object listener_weakref):
+        cdef object pubsub = <object>PyWeakref_GetObject(self._pubsub_weakref)
+        if pubsub is not None:
+            (<PubSub>pubsub).c_remove_dead_listener(self._event_tag, self._listener_id, listener_weakref)
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+
+cdef class PubSub:
     """
+    PubSub with weak references. This avoids the lapsed listener problem: each listener weak reference has a
+    DeadListenerCallback, which removes the listener from the PubSub as soon as it is garbage collected. Nothing has to
+    be scanned to find the dead listeners.
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
+    The listeners of each event are dispatched from a snapshot tuple of their weak references. The snapshot is only
+    rebuilt by the first c_trigger_event() or c_get_listeners() after the listeners of the event changed, and listeners
+    may add or remove listeners while the snapshot is being dispatched.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -52,6 +62,10 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self, *args, **kwargs):
+        # Set here so that subclasses not calling PubSub.__init__() can still dispatch events
+        self._listener_snapshots = {}
+
     def __init__(self):
         self._events = Events()
 
@@ -72,94 +86,87 @@ cdef class PubSub:
 
     cdef c_add_listener(self, int64_t event_tag, EventListener listener):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection new_listeners
-            EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-        if it != self._events.end():
-            listeners_ptr = address(deref(it).second)
-            deref(listeners_ptr).insert(listener_wrapper)
-        else:
-            new_listeners.insert(listener_wrapper)
-            self._events.insert(EventsPair(event_tag, new_listeners))
-
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+            size_t listener_id = <size_t><PyObject *>listener
+            EventListenersCollection *listeners_ptr = address(self._events[event_tag])
+            object listener_weakref
+        if deref(listeners_ptr).find(listener_id) != deref(listeners_ptr).end():
+            return
+        listener_weakref = PyWeakref_NewRef(listener, DeadListenerCallback(self, event_tag, listener_id))
+        deref(listeners_ptr).insert(pair[size_t, PyRef](listener_id, PyRef(<PyObject *>listener_weakref)))
+        self._listener_snapshots.pop(event_tag, None)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
         cdef:
             EventsIterator it = self._events.find(event_tag)
             EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
-            EventListenersIterator lit
         if it == self._events.end():
             return
         listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).find(listener_wrapper)
-        if lit != deref(listeners_ptr).end():
-            deref(listeners_ptr).erase(lit)
-        self.c_remove_dead_listeners(event_tag)
+        if deref(listeners_ptr).erase(<size_t><PyObject *>listener) > 0:
+            if deref(listeners_ptr).size() < 1:
+                self._events.erase(it)
+            self._listener_snapshots.pop(event_tag, None)
 
-    cdef c_remove_dead_listeners(self, int64_t event_tag):
+    cdef c_remove_dead_listener(self, int64_t event_tag, size_t listener_id, object listener_weakref):
         cdef:
             EventsIterator it = self._events.find(event_tag)
             EventListenersCollection *listeners_ptr
-            object listener_weakref
             EventListenersIterator lit
-            vector[EventListenersIterator] lit_to_remove
         if it == self._events.end():
             return
         listeners_ptr = address(deref(it).second)
-        lit = deref(listeners_ptr).begin()
-        while lit != deref(listeners_ptr).end():
-            listener_weakref = <object>(deref(lit).get())
-            if <object>(PyWeakref_GetObject(listener_weakref)) is None:
-                lit_to_remove.push_back(lit)
-            inc(lit)
-        for lit in lit_to_remove:
-            deref(listeners_ptr).erase(lit)
+        lit = deref(listeners_ptr).find(listener_id)
+        # The listener may have been removed already, and its address reused by a new listener
+        if lit == deref(listeners_ptr).end() or <object>deref(lit).second.get() is not listener_weakref:
+            return
+        deref(listeners_ptr).erase(lit)
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
+        self._listener_snapshots.pop(event_tag, None)
 
-    cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
-
+    cdef tuple c_get_listener_snapshot(self, int64_t event_tag):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
+            tuple snapshot = self._listener_snapshots.get(event_tag)
+            EventsIterator it
+            EventListenersIterator lit
+            vector[PyRef] listener_weakrefs
+        if snapshot is not None:
+            return snapshot
 
-        if it == self._events.end():
-            return []
+        # The weak references are copied before any Python object is created, as a garbage collection could remove
+        # dead listeners from the collection being iterated.
+        it = self._events.find(event_tag)
+        if it != self._events.end():
+            lit = deref(it).second.begin()
+            while lit != deref(it).second.end():
+                listener_weakrefs.push_back(deref(lit).second)
+                inc(lit)
+        snapshot = tuple([<object>pyref.get() for pyref in listener_weakrefs])
+        self._listener_snapshots[event_tag] = snapshot
+        return snapshot
 
+    cdef c_get_listeners(self, int64_t event_tag):
+        cdef:
+            object listener
         retval = []
-        listeners_ptr = address(deref(it).second)
-        for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
+        for listener_weakref in self.c_get_listener_snapshot(event_tag):
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is not None:
+                retval.append(listener)
         return retval
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
-
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
 
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        # The snapshot is an immutable tuple, listeners are allowed to call c_add_listener() and c_remove_listener()
+        # while it is iterated.
+        for listener_weakref in self.c_get_listener_snapshot(event_tag):
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
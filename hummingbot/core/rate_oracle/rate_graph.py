@@ -0,0 +1,151 @@
+from collections import deque
+from decimal import Decimal
+from typing import (
+    Deque,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+)
+
+s_decimal_1 = Decimal("1")
+
+
+class RateGraph:
+    """
+    Conversion rates between tokens, kept as a graph where each token links to the tokens it has a price with.
+    For example, given prices of {"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")}, HBOT links to USDT
+    and USDT links to both HBOT and GBP, so a rate for HBOT-GBP is found through USDT: 100 * 0.75.
+
+    The path with the fewest conversions is searched once for each pair, and kept until a pair is added to or removed
+    from the graph. The rate of a pair is kept until the price of one of the pairs on its path is updated.
+    """
+
+    def __init__(self, prices: Optional[Dict[str, Decimal]] = None):
+        self._prices: Dict[str, Decimal] = {}
+        # token -> linked token -> (pair of the price, whether the price is inverted for the conversion)
+        self._links: Dict[str, Dict[str, Tuple[str, bool]]] = {}
+        self._paths: Dict[str, Optional[Tuple[str, ...]]] = {}
+        self._rates: Dict[str, Decimal] = {}
+        self._rate_pairs_by_price_pair: Dict[str, Set[str]] = {}
+        if prices is not None:
+            self.update_prices(prices)
+
+    @property
+    def prices(self) -> Dict[str, Decimal]:
+        return self._prices.copy()
+
+    def update_prices(self, prices: Dict[str, Decimal]):
+        """
+        Replaces the prices of the graph, only the rates depending on the prices which changed are recalculated.
+        :param prices: The dictionary of trading pairs and their prices
+        """
+        for pair in [pair for pair in self._prices if pair not in prices]:
+            self.remove_price(pair)
+        for pair, price in prices.items():
+            self.set_price(pair, price)
+
+    def set_price(self, pair: str, price: Decimal):
+        """
+        Sets the price of a trading pair, a pair without a valid price is removed from the graph.
+        :param pair: The trading pair, e.g. BTC-USDT
+        :param price: The price of the trading pair
+        """
+        if price.is_nan() or price <= 0:
+            self.remove_price(pair)
+            return
+        current_price: Optional[Decimal] = self._prices.get(pair)
+        if current_price == price:
+            return
+        self._prices[pair] = price
+        if current_price is not None:
+            for rate_pair in self._rate_pairs_by_price_pair.pop(pair, ()):
+                self._rates.pop(rate_pair, None)
+            return
+        tokens = pair.split("-")
+        if len(tokens) != 2:
+            return
+        base, quote = tokens
+        base_links: Dict[str, Tuple[str, bool]] = self._links.setdefault(base, {})
+        if quote not in base_links:
+            base_links[quote] = (pair, False)
+            self._links.setdefault(quote, {})[base] = (pair, True)
+            self._clear_paths()
+
+    def remove_price(self, pair: str):
+        """
+        Removes a trading pair from the graph.
+        :param pair: The trading pair, e.g. BTC-USDT
+        """
+        if self._prices.pop(pair, None) is None:
+            return
+        tokens = pair.split("-")
+        if len(tokens) != 2:
+            return
+        base, quote = tokens
+        if self._links.get(base, {}).get(quote, (None,))[0] != pair:
+            return
+        # The reverse pair links the tokens in place of the removed one when there is a price for it
+        reverse_pair = f"{quote}-{base}"
+        if reverse_pair in self._prices:
+            self._links[quote][base] = (reverse_pair, False)
+            self._links[base][quote] = (reverse_pair, True)
+        else:
+            del self._links[base][quote]
+            del self._links[quote][base]
+        self._clear_paths()
+
+    def rate(self, pair: str) -> Optional[Decimal]:
+        """
+        Finds a conversion rate for a given trading pair, directly from its price or through the fewest conversions
+        between the prices of the graph.
+        :param pair: The trading pair, e.g. BTC-USDT
+        :return The conversion rate, or None if the tokens of the pair are not linked
+        """
+        price: Optional[Decimal] = self._prices.get(pair)
+        if price is not None:
+            return price
+        rate: Optional[Decimal] = self._rates.get(pair)
+        if rate is not None:
+            return rate
+        base, quote = pair.split("-")
+        if base == quote:
+            return s_decimal_1
+        if pair in self._paths:
+            path = self._paths[pair]
+        else:
+            path = self._paths[pair] = self._find_path(base, quote)
+        if path is None:
+            return None
+        rate = s_decimal_1
+        for from_token, to_token in zip(path, path[1:]):
+            price_pair, inverted = self._links[from_token][to_token]
+            price = self._prices[price_pair]
+            rate = rate / price if inverted else rate * price
+            self._rate_pairs_by_price_pair.setdefault(price_pair, set()).add(pair)
+        self._rates[pair] = rate
+        return rate
+
+    def _find_path(self, base: str, quote: str) -> Optional[Tuple[str, ...]]:
+        if base not in self._links or quote not in self._links:
+            return None
+        previous_tokens: Dict[str, Optional[str]] = {base: None}
+        queue: Deque[str] = deque([base])
+        while queue:
+            token = queue.popleft()
+            for linked_token in self._links[token]:
+                if linked_token in previous_tokens:
+                    continue
+                previous_tokens[linked_token] = token
+                if linked_token == quote:
+                    path = [quote]
+                    while previous_tokens[path[-1]] is not None:
+                        path.append(previous_tokens[path[-1]])
+                    return tuple(reversed(path))
+                queue.append(linked_token)
+        return None
+
+    def _clear_paths(self):
+        self._paths.clear()
+        self._rates.clear()
+        self._rate_pairs_by_price_pair.clear()
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 from typing import (
+    TYPE_CHECKING,
     Dict,
     Optional,
     List
@@ -19,8 +20,13 @@ from hummingbot.connector.exchange.kucoin.kucoin_utils import convert_from_excha
 from hummingbot.connector.exchange.ascend_ex.ascend_ex_utils import convert_from_exchange_trading_pair as \
     ascend_ex_convert_from_exchange_pair
 from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.rate_graph import RateGraph
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils import async_ttl_cache
+from hummingbot.core.utils.http_client_manager import HttpClientManager
+
+if TYPE_CHECKING:
+    from hummingbot.connector.exchange_base import ExchangeBase
 
 
 class RateOracleSource(Enum):
@@ -31,6 +37,7 @@ class RateOracleSource(Enum):
     coingecko = 1
     kucoin = 2
     ascend_ex = 3
+    order_book = 4
 
 
 class RateOracle(NetworkBase):
@@ -38,6 +45,8 @@ class RateOracle(NetworkBase):
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
     The find_rate is then used on these prices to find a rate on a given pair.
+    With the order_book source, the prices are the mid prices of the order books of the markets already in use, set with
+    set_order_book_markets, instead of being queried.
     """
     # Set these below class members before query for rates
     source: RateOracleSource = RateOracleSource.binance
@@ -46,7 +55,6 @@ class RateOracle(NetworkBase):
 
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
-    _shared_client: Optional[aiohttp.ClientSession] = None
     _cgecko_supported_vs_tokens: List[str] = []
 
     binance_price_url = "https://api.binance.com/api/v3/ticker/bookTicker"
@@ -73,7 +81,8 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._check_network_interval = 30.0
         self._ev_loop = asyncio.get_event_loop()
-        self._prices: Dict[str, Decimal] = {}
+        self._rate_graph: RateGraph = RateGraph()
+        self._order_book_markets: List["ExchangeBase"] = []
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
 
@@ -82,9 +91,7 @@ class RateOracle(NetworkBase):
 
     @classmethod
     async def _http_client(cls) -> aiohttp.ClientSession:
-        if cls._shared_client is None:
-            cls._shared_client = aiohttp.ClientSession()
-        return cls._shared_client
+        return HttpClientManager.get_instance().get_client()
 
     async def get_ready(self):
         """
@@ -108,7 +115,7 @@ class RateOracle(NetworkBase):
         """
         Actual prices retrieved from URL
         """
-        return self._prices.copy()
+        return self._rate_graph.prices
 
     def rate(self, pair: str) -> Decimal:
         """
@@ -117,7 +124,7 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        return self._rate_graph.rate(pair)
 
     @classmethod
     async def rate_async(cls, pair: str) -> Decimal:
@@ -156,9 +163,13 @@ class RateOracle(NetworkBase):
     async def fetch_price_loop(self):
         while True:
             try:
-                self._prices = await self.get_prices()
-                if self._prices:
-                    self._ready_event.set()
+                if self.source == RateOracleSource.order_book:
+                    self.update_order_book_prices()
+                else:
+                    prices = await self.get_prices()
+                    self._rate_graph.update_prices(prices)
+                    if prices:
+                        self._ready_event.set()
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -180,9 +191,45 @@ class RateOracle(NetworkBase):
             return await cls.get_kucoin_prices()
         elif cls.source == RateOracleSource.ascend_ex:
             return await cls.get_ascend_ex_prices()
+        elif cls.source == RateOracleSource.order_book:
+            return cls.get_instance().get_order_book_prices()
         else:
             raise NotImplementedError
 
+    def set_order_book_markets(self, markets: List["ExchangeBase"]):
+        """
+        Sets the markets whose order books are used for prices with the order_book source, the rates are updated with
+        their prices right away.
+        :param markets: The markets already in use, e.g. the markets of the running strategy
+        """
+        self._order_book_markets = list(markets)
+        self.update_order_book_prices()
+
+    def update_order_book_prices(self):
+        """
+        Updates the rates with the current prices of the order book markets, without waiting for the next price fetch.
+        """
+        prices = self.get_order_book_prices()
+        self._rate_graph.update_prices(prices)
+        if prices:
+            self._ready_event.set()
+
+    def get_order_book_prices(self) -> Dict[str, Decimal]:
+        """
+        Gets the mid prices of the order books of the order book markets, the order books which are empty are skipped.
+        :return A dictionary of trading pairs and prices
+        """
+        results = {}
+        for market in self._order_book_markets:
+            for trading_pair, order_book in market.order_books.items():
+                try:
+                    best_ask, best_bid = order_book.get_price(True), order_book.get_price(False)
+                except EnvironmentError:
+                    continue
+                if best_ask > 0 and best_bid > 0:
+                    results[trading_pair] = (Decimal(str(best_ask)) + Decimal(str(best_bid))) / Decimal("2")
+        return results
+
     @classmethod
     @async_ttl_cache(ttl=1, maxsize=1)
     async def get_binance_prices(cls) -> Dict[str, Decimal]:
@@ -1,3 +1,4 @@
+import asyncio
 import cachetools
 import functools
 import pandas as pd
@@ -6,16 +7,29 @@ import numpy as np
 
 def async_ttl_cache(ttl: int = 3600, maxsize: int = 1):
     cache = cachetools.TTLCache(ttl=ttl, maxsize=maxsize)
+    # Calls in progress, concurrent calls with the same arguments wait for the same call instead of all making it
+    pending = {}
 
     def decorator(fn):
+        def on_done(key: str, future: asyncio.Future):
+            pending.pop(key, None)
+            if not future.cancelled() and future.exception() is None:
+                cache[key] = future.result()
+
         @functools.wraps(fn)
         async def memoize(*args, **kwargs):
             key = str((args, kwargs))
             try:
                 return cache[key]
             except KeyError:
-                cache[key] = await fn(*args, **kwargs)
-                return cache[key]
+                pass
+            future = pending.get(key)
+            if future is None:
+                future = asyncio.ensure_future(fn(*args, **kwargs))
+                pending[key] = future
+                future.add_done_callback(functools.partial(on_done, key))
+            # Shielded so that a cancelled caller doesn't cancel the call for the others
+            return await asyncio.shield(future)
         return memoize
 
     return decorator
@@ -0,0 +1,192 @@
+import asyncio
+import bisect
+import logging
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import (
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+)
+
+import aiohttp
+
+from hummingbot.logger import HummingbotLogger
+
+# Upper bounds, in seconds, of the request duration histogram buckets. The last bucket is unbounded.
+REQUEST_DURATION_BUCKETS: List[float] = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]
+
+
+class RequestTimingHistogram:
+    """
+    Histogram of the durations of the HTTP requests sent to a host.
+    """
+
+    def __init__(self, bucket_bounds: List[float] = REQUEST_DURATION_BUCKETS):
+        self._bucket_bounds: List[float] = bucket_bounds
+        self._bucket_counts: List[int] = [0] * (len(bucket_bounds) + 1)
+        self._count: int = 0
+        self._error_count: int = 0
+        self._total_duration: float = 0.0
+        self._max_duration: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def error_count(self) -> int:
+        return self._error_count
+
+    @property
+    def average_duration(self) -> float:
+        return self._total_duration / self._count if self._count > 0 else 0.0
+
+    @property
+    def max_duration(self) -> float:
+        return self._max_duration
+
+    @property
+    def buckets(self) -> Dict[float, int]:
+        """
+        Request counts per bucket upper bound, the last bucket being float("inf").
+        """
+        return dict(zip(self._bucket_bounds + [float("inf")], self._bucket_counts))
+
+    def record(self, duration: float, failed: bool = False):
+        self._bucket_counts[bisect.bisect_left(self._bucket_bounds, duration)] += 1
+        self._count += 1
+        self._total_duration += duration
+        self._max_duration = max(self._max_duration, duration)
+        if failed:
+            self._error_count += 1
+
+    def percentile(self, pct: float) -> float:
+        """
+        Returns the upper bound of the bucket holding the given percentile (0 - 100) of the request durations.
+        """
+        if self._count == 0:
+            return 0.0
+        target: float = self._count * pct / 100
+        cumulative: int = 0
+        for bound, count in zip(self._bucket_bounds, self._bucket_counts):
+            cumulative += count
+            if cumulative >= target:
+                return bound
+        return self._max_duration
+
+
+class HttpClientManager:
+    """
+    Owns the aiohttp client session shared by the connectors' REST calls, so that requests reuse keep-alive
+    connections instead of paying TCP and TLS handshakes each time.
+
+    The session's connector keeps a connection pool per host (bounded by limit_per_host, and limit overall) and caches
+    DNS lookups. The durations of the requests sent through the session are recorded per host.
+    """
+    _hcm_logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["HttpClientManager"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._hcm_logger is None:
+            cls._hcm_logger = logging.getLogger(__name__)
+        return cls._hcm_logger
+
+    @classmethod
+    def get_instance(cls) -> "HttpClientManager":
+        if cls._shared_instance is None:
+            cls._shared_instance = HttpClientManager()
+        return cls._shared_instance
+
+    def __init__(self,
+                 limit: int = 100,
+                 limit_per_host: int = 20,
+                 ttl_dns_cache: int = 300,
+                 keepalive_timeout: float = 30.0):
+        """
+        :param limit: Maximum number of open connections, across all hosts
+        :param limit_per_host: Maximum number of open connections to a single host
+        :param ttl_dns_cache: Seconds DNS lookups are cached for
+        :param keepalive_timeout: Seconds idle connections are kept open for
+        """
+        self._limit: int = limit
+        self._limit_per_host: int = limit_per_host
+        self._ttl_dns_cache: int = ttl_dns_cache
+        self._keepalive_timeout: float = keepalive_timeout
+        self._client: Optional[aiohttp.ClientSession] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._request_histograms: Dict[str, RequestTimingHistogram] = {}
+
+    @property
+    def request_histograms(self) -> Dict[str, RequestTimingHistogram]:
+        """
+        Request timing histograms per host.
+        """
+        return self._request_histograms
+
+    def configure(self,
+                  limit: Optional[int] = None,
+                  limit_per_host: Optional[int] = None,
+                  ttl_dns_cache: Optional[int] = None,
+                  keepalive_timeout: Optional[float] = None):
+        """
+        Updates the connection pool settings. They apply to the sessions created afterwards.
+        """
+        self._limit = limit if limit is not None else self._limit
+        self._limit_per_host = limit_per_host if limit_per_host is not None else self._limit_per_host
+        self._ttl_dns_cache = ttl_dns_cache if ttl_dns_cache is not None else self._ttl_dns_cache
+        self._keepalive_timeout = keepalive_timeout if keepalive_timeout is not None else self._keepalive_timeout
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        async def on_request_start(session, trace_config_ctx: SimpleNamespace, params):
+            trace_config_ctx.start = asyncio.get_event_loop().time()
+
+        async def on_request_end(session, trace_config_ctx: SimpleNamespace, params):
+            self._record_request(params.url.host, trace_config_ctx.start, failed=params.response.status >= 400)
+
+        async def on_request_exception(session, trace_config_ctx: SimpleNamespace, params):
+            self._record_request(params.url.host, trace_config_ctx.start, failed=True)
+
+        trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_request_exception.append(on_request_exception)
+        return trace_config
+
+    def _record_request(self, host: str, start: float, failed: bool):
+        histogram: Optional[RequestTimingHistogram] = self._request_histograms.get(host)
+        if histogram is None:
+            histogram = self._request_histograms[host] = RequestTimingHistogram()
+        histogram.record(asyncio.get_event_loop().time() - start, failed)
+
+    def get_client(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared client session of the current event loop, creating it if needed.
+        The session must not be closed by its users.
+        """
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        if self._client is None or self._client.closed or self._client_loop is not ev_loop:
+            connector: aiohttp.TCPConnector = aiohttp.TCPConnector(limit=self._limit,
+                                                                   limit_per_host=self._limit_per_host,
+                                                                   ttl_dns_cache=self._ttl_dns_cache,
+                                                                   keepalive_timeout=self._keepalive_timeout)
+            self._client = aiohttp.ClientSession(connector=connector, trace_configs=[self._trace_config()])
+            self._client_loop = ev_loop
+        return self._client
+
+    async def close(self):
+        if self._client is not None and not self._client.closed:
+            await self._client.close()
+        self._client = None
+        self._client_loop = None
+
+
+@asynccontextmanager
+async def shared_http_client() -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Async context yielding the shared client session, for use in place of `async with aiohttp.ClientSession()`.
+    The session is left open on exit so its connections can be reused.
+    """
+    yield HttpClientManager.get_instance().get_client()
@@ -1,7 +1,6 @@
 from typing import Optional, Dict
 from decimal import Decimal
-import importlib
-from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType
+from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType, import_connector_module
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 
 
@@ -20,7 +19,7 @@ async def get_last_price(exchange: str, trading_pair: str) -> Optional[Decimal]:
                          "APIOrderBookDataSource"
             module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
                           f"{conn_setting.base_name()}.{module_name}"
-            module = getattr(importlib.import_module(module_path), class_name)
+            module = getattr(import_connector_module(module_path), class_name)
             args = {"trading_pairs": [trading_pair]}
             if conn_setting.is_sub_domain:
                 args["domain"] = conn_setting.domain_parameter
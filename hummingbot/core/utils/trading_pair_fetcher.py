@@ -1,6 +1,5 @@
 
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-import importlib
 import asyncio
 from typing import (
     Dict,
@@ -11,7 +10,8 @@ from typing import (
     List
 )
 from hummingbot.logger import HummingbotLogger
-from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType, ConnectorSetting
+from hummingbot.client import settings
+from hummingbot.client.settings import CONNECTOR_SETTINGS, ConnectorType, ConnectorSetting, import_connector_module
 import logging
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
@@ -33,6 +33,7 @@ class TradingPairFetcher:
         return cls._sf_shared_instance
 
     def __init__(self):
+        self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
         self.order_book_snapshots: Dict[str, Any] = {}
         self.order_books: Dict[str, Any] = {}
@@ -40,30 +41,57 @@ class TradingPairFetcher:
         self._init_order_books_task: Optional[asyncio.Task] = None
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
-        safe_ensure_future(self.fetch_all())
+        self._fetch_tasks: Dict[str, asyncio.Task] = {}
+        safe_ensure_future(self.fetch_required())
+
+    async def fetch_required(self):
+        """
+        Fetches the trading pairs of the connectors the config uses, the other connectors are only imported and
+        fetched on first use.
+        """
+        await asyncio.gather(*[self.fetch(name) for name in settings.required_exchanges if name in CONNECTOR_SETTINGS])
+        self.ready = True
 
     async def fetch_all(self):
-        for conn_setting in CONNECTOR_SETTINGS.values():
-            # print("[SHAWN] --- Conn_setting: ", conn_setting)
-            module_name = f"{conn_setting.base_name()}_connector" if conn_setting.type is ConnectorType.Connector \
-                else f"{conn_setting.base_name()}_api_order_book_data_source"
-            # print("[SHAWN] --- module_name: ", module_name)
-            module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
-                          f"{conn_setting.base_name()}.{module_name}"
-            # print("[SHAWN] --- module_path: ", module_path)
-            class_name = "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + \
-                         "APIOrderBookDataSource" if conn_setting.type is not ConnectorType.Connector \
-                         else "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + "Connector"
-            # print("[SHAWN] --- class_name: ", class_name)
-
-            module = getattr(importlib.import_module(module_path), class_name)
-            # print("[SHAWN] --- module: ", module)
-
-            args = {}
-            args = conn_setting.add_domain_parameter(args)
+        await asyncio.gather(*[self.fetch(name) for name in CONNECTOR_SETTINGS])
+        self.ready = True
+
+    def fetch(self, connector_name: str) -> asyncio.Task:
+        """
+        Starts fetching the trading pairs of a connector, if not already done.
+        """
+        if connector_name not in self._fetch_tasks:
+            self._fetch_tasks[connector_name] = safe_ensure_future(
+                self.fetch_connector(CONNECTOR_SETTINGS[connector_name]))
+        return self._fetch_tasks[connector_name]
+
+    def get_trading_pairs(self, connector_name: str) -> List[str]:
+        """
+        Returns the trading pairs of a connector, starting to fetch them if they are not known yet.
+        """
+        if connector_name in CONNECTOR_SETTINGS:
+            self.fetch(connector_name)
+        return self.trading_pairs.get(connector_name, [])
+
+    async def fetch_connector(self, conn_setting: ConnectorSetting):
+        module_name = f"{conn_setting.base_name()}_connector" if conn_setting.type is ConnectorType.Connector \
+            else f"{conn_setting.base_name()}_api_order_book_data_source"
+        module_path = f"hummingbot.connector.{conn_setting.type.name.lower()}." \
+                      f"{conn_setting.base_name()}.{module_name}"
+        class_name = "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + \
+                     "APIOrderBookDataSource" if conn_setting.type is not ConnectorType.Connector \
+                     else "".join([o.capitalize() for o in conn_setting.base_name().split("_")]) + "Connector"
+        try:
+            module = getattr(import_connector_module(module_path), class_name)
+        except Exception:
+            self.logger().error(f"Connector {conn_setting.name} failed to load. "
+                                f"Trading pairs autocompletion won't work.", exc_info=True)
+            self.trading_pairs[conn_setting.name] = []
+            return
 
-            # print("[SHAWN] --- Module: ",module)
-            safe_ensure_future(self.call_fetch_pairs(module.fetch_trading_pairs(**args), conn_setting, module))
+        args = {}
+        args = conn_setting.add_domain_parameter(args)
+        await self.call_fetch_pairs(module.fetch_trading_pairs(**args), conn_setting, module)
 
     async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], conn_setting: ConnectorSetting, module: str):
         try:
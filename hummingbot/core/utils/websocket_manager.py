@@ -0,0 +1,394 @@
+import asyncio
+import logging
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import ujson
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+from hummingbot.logger import HummingbotLogger
+
+WebsocketMessageHandler = Callable[[Any], None]
+
+
+class WebsocketVenue:
+    """
+    Describes how the streams of an exchange are multiplexed on its websocket connections: the connection URL, the
+    subscription messages and how a decoded message is routed to its stream.
+    Connections are shared by all the venues with the same name.
+    """
+    # Maximum number of streams subscribed on a single connection
+    max_streams_per_connection: int = 100
+    # Seconds without any message before the connection is pinged
+    message_timeout: float = 30.0
+    # Seconds to wait for the pong before reconnecting
+    ping_timeout: float = 10.0
+    # Seconds to wait before reconnecting after the connection failed
+    reconnect_delay: float = 5.0
+
+    @property
+    def name(self) -> str:
+        raise NotImplementedError
+
+    @property
+    def url(self) -> str:
+        raise NotImplementedError
+
+    def subscribe_messages(self, streams: List[str], request_id: int) -> List[Any]:
+        """
+        :returns: the messages to send to subscribe to the streams
+        """
+        raise NotImplementedError
+
+    def unsubscribe_messages(self, streams: List[str], request_id: int) -> List[Any]:
+        """
+        :returns: the messages to send to unsubscribe from the streams
+        """
+        raise NotImplementedError
+
+    def route(self, message: Any) -> Optional[Tuple[str, Any]]:
+        """
+        :returns: the stream and the payload of a decoded message, None for the messages without stream (e.g.
+        subscription responses)
+        """
+        raise NotImplementedError
+
+    def message_timestamp(self, stream: str, payload: Any) -> Optional[float]:
+        """
+        :returns: the exchange timestamp (in seconds) of a message payload, used for the lag metrics
+        """
+        return None
+
+
+class WebsocketConnectionMetrics:
+    """
+    Throughput and lag of a websocket connection. The lag is the delay between the exchange timestamp of a message and
+    its reception.
+    """
+
+    def __init__(self):
+        self._start_time: float = time.time()
+        self._connections_count: int = 0
+        self._messages_count: int = 0
+        self._bytes_count: int = 0
+        self._decode_errors_count: int = 0
+        self._last_message_time: float = 0.0
+        self._lag_count: int = 0
+        self._total_lag: float = 0.0
+        self._max_lag: float = 0.0
+
+    @property
+    def connections_count(self) -> int:
+        return self._connections_count
+
+    @property
+    def reconnections_count(self) -> int:
+        return max(self._connections_count - 1, 0)
+
+    @property
+    def messages_count(self) -> int:
+        return self._messages_count
+
+    @property
+    def bytes_count(self) -> int:
+        return self._bytes_count
+
+    @property
+    def decode_errors_count(self) -> int:
+        return self._decode_errors_count
+
+    @property
+    def last_message_time(self) -> float:
+        return self._last_message_time
+
+    @property
+    def messages_per_second(self) -> float:
+        duration: float = time.time() - self._start_time
+        return self._messages_count / duration if duration > 0 else 0.0
+
+    @property
+    def average_lag(self) -> float:
+        return self._total_lag / self._lag_count if self._lag_count > 0 else 0.0
+
+    @property
+    def max_lag(self) -> float:
+        return self._max_lag
+
+    def record_connection(self):
+        self._connections_count += 1
+
+    def record_message(self, size: int, received_time: float, lag: Optional[float] = None):
+        self._messages_count += 1
+        self._bytes_count += size
+        self._last_message_time = received_time
+        if lag is not None:
+            self._lag_count += 1
+            self._total_lag += lag
+            self._max_lag = max(self._max_lag, lag)
+
+    def record_decode_error(self):
+        self._decode_errors_count += 1
+
+
+class WebsocketConnection:
+    """
+    A websocket connection of a venue and the handlers of the streams subscribed on it.
+    The connection pings the venue when no message is received, and reconnects and subscribes to its streams again
+    when it fails. Each frame is decoded once and its payload passed to all the handlers of its stream.
+    """
+    _wsc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wsc_logger is None:
+            cls._wsc_logger = logging.getLogger(__name__)
+        return cls._wsc_logger
+
+    def __init__(self, venue: WebsocketVenue):
+        self._venue: WebsocketVenue = venue
+        self._handlers: Dict[str, List[WebsocketMessageHandler]] = {}
+        self._ws: Optional[websockets.WebSocketClientProtocol] = None
+        self._connected: asyncio.Event = asyncio.Event()
+        self._run_task: Optional[asyncio.Task] = None
+        self._last_request_id: int = 0
+        self._metrics: WebsocketConnectionMetrics = WebsocketConnectionMetrics()
+
+    @property
+    def venue(self) -> WebsocketVenue:
+        return self._venue
+
+    @property
+    def streams(self) -> List[str]:
+        return list(self._handlers.keys())
+
+    @property
+    def metrics(self) -> WebsocketConnectionMetrics:
+        return self._metrics
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    @property
+    def available_streams_count(self) -> int:
+        return self._venue.max_streams_per_connection - len(self._handlers)
+
+    async def wait_connected(self):
+        await self._connected.wait()
+
+    def has_stream(self, stream: str) -> bool:
+        return stream in self._handlers
+
+    async def add_handler(self, streams: List[str], handler: WebsocketMessageHandler):
+        new_streams: List[str] = [stream for stream in streams if stream not in self._handlers]
+        for stream in streams:
+            self._handlers.setdefault(stream, []).append(handler)
+        if self._run_task is None:
+            self._run_task = asyncio.ensure_future(self._run())
+        elif len(new_streams) > 0:
+            await self._send_messages(self._venue.subscribe_messages(new_streams, self._next_request_id()))
+
+    async def remove_handler(self, streams: List[str], handler: WebsocketMessageHandler):
+        removed_streams: List[str] = []
+        for stream in streams:
+            handlers: List[WebsocketMessageHandler] = self._handlers.get(stream, [])
+            if handler in handlers:
+                handlers.remove(handler)
+            if stream in self._handlers and len(handlers) == 0:
+                del self._handlers[stream]
+                removed_streams.append(stream)
+        if len(self._handlers) == 0:
+            await self.stop()
+        elif len(removed_streams) > 0:
+            await self._send_messages(self._venue.unsubscribe_messages(removed_streams, self._next_request_id()))
+
+    async def stop(self):
+        if self._run_task is not None:
+            self._run_task.cancel()
+            self._run_task = None
+        if self._ws is not None:
+            await self._ws.close()
+            self._ws = None
+        self._connected.clear()
+
+    def _next_request_id(self) -> int:
+        self._last_request_id += 1
+        return self._last_request_id
+
+    async def _send_messages(self, messages: List[Any]):
+        """
+        Sends messages if connected. Otherwise they are not needed, the subscriptions are sent again on connection.
+        """
+        if self._ws is None:
+            return
+        try:
+            for message in messages:
+                await self._ws.send(ujson.dumps(message))
+        except ConnectionClosed:
+            pass
+
+    async def _run(self):
+        while True:
+            try:
+                async with websockets.connect(self._venue.url) as ws:
+                    self._ws = ws
+                    self._metrics.record_connection()
+                    await self._send_messages(self._venue.subscribe_messages(self.streams, self._next_request_id()))
+                    self._connected.set()
+                    await self._read_messages(ws)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error with the {self._venue.name} WebSocket connection.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error with the {self._venue.name} WebSocket connection. "
+                                    f"Retrying after {self._venue.reconnect_delay:.0f} seconds..."
+                )
+            finally:
+                self._ws = None
+                self._connected.clear()
+            await asyncio.sleep(self._venue.reconnect_delay)
+
+    async def _read_messages(self, ws: websockets.WebSocketClientProtocol):
+        # Return as soon as a ping timed out or the connection was closed, so the run loop can reconnect.
+        try:
+            while True:
+                try:
+                    raw_msg: str = await asyncio.wait_for(ws.recv(), timeout=self._venue.message_timeout)
+                    self._process_message(raw_msg)
+                except asyncio.TimeoutError:
+                    pong_waiter = await ws.ping()
+                    await asyncio.wait_for(pong_waiter, timeout=self._venue.ping_timeout)
+        except asyncio.TimeoutError:
+            self.logger().warning(f"{self._venue.name} WebSocket ping timed out. Going to reconnect...")
+        except ConnectionClosed:
+            self.logger().warning(f"{self._venue.name} WebSocket connection closed. Going to reconnect...")
+
+    def _process_message(self, raw_msg: str):
+        received_time: float = time.time()
+        try:
+            message: Any = ujson.loads(raw_msg)
+        except ValueError:
+            self._metrics.record_decode_error()
+            self.logger().warning(f"Invalid {self._venue.name} WebSocket message: {raw_msg}")
+            return
+        route: Optional[Tuple[str, Any]] = self._venue.route(message)
+        if route is None:
+            self._metrics.record_message(len(raw_msg), received_time)
+            return
+        stream, payload = route
+        exchange_timestamp: Optional[float] = self._venue.message_timestamp(stream, payload)
+        self._metrics.record_message(len(raw_msg),
+                                     received_time,
+                                     received_time - exchange_timestamp if exchange_timestamp is not None else None)
+        for handler in tuple(self._handlers.get(stream, ())):
+            try:
+                handler(payload)
+            except Exception:
+                self.logger().error(f"Unexpected error handling the {stream} stream message {payload}.",
+                                    exc_info=True)
+
+
+class WebsocketManager:
+    """
+    Multiplexes the stream subscriptions of the connectors on as few websocket connections per venue as the venue
+    allows. A stream subscribed by several handlers is only subscribed once, its messages are decoded once and passed
+    to every handler.
+    """
+    _wsm_logger: Optional[HummingbotLogger] = None
+    _shared_instance: Optional["WebsocketManager"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wsm_logger is None:
+            cls._wsm_logger = logging.getLogger(__name__)
+        return cls._wsm_logger
+
+    @classmethod
+    def get_instance(cls) -> "WebsocketManager":
+        if cls._shared_instance is None:
+            cls._shared_instance = WebsocketManager()
+        return cls._shared_instance
+
+    def __init__(self):
+        self._connections: Dict[str, List[WebsocketConnection]] = {}
+        self._lock: asyncio.Lock = asyncio.Lock()
+
+    @property
+    def connections(self) -> Dict[str, List[WebsocketConnection]]:
+        """
+        Open connections per venue name.
+        """
+        return self._connections
+
+    def connection_metrics(self, venue_name: str) -> List[WebsocketConnectionMetrics]:
+        return [connection.metrics for connection in self._connections.get(venue_name, [])]
+
+    async def subscribe(self, venue: WebsocketVenue, streams: List[str], handler: WebsocketMessageHandler):
+        """
+        Passes the payloads of the stream messages to the handler. The streams already subscribed are added to their
+        connection, the other streams to the connections with free capacity, new connections being opened as needed.
+        """
+        async with self._lock:
+            connections: List[WebsocketConnection] = self._connections.setdefault(venue.name, [])
+            new_streams: List[str] = []
+            for stream in dict.fromkeys(streams):
+                connection: Optional[WebsocketConnection] = next(
+                    (connection for connection in connections if connection.has_stream(stream)), None)
+                if connection is not None:
+                    await connection.add_handler([stream], handler)
+                else:
+                    new_streams.append(stream)
+            for connection in connections:
+                if len(new_streams) == 0:
+                    break
+                available_streams_count: int = connection.available_streams_count
+                if available_streams_count > 0:
+                    await connection.add_handler(new_streams[:available_streams_count], handler)
+                    new_streams = new_streams[available_streams_count:]
+            while len(new_streams) > 0:
+                connection = WebsocketConnection(venue)
+                connections.append(connection)
+                await connection.add_handler(new_streams[:venue.max_streams_per_connection], handler)
+                new_streams = new_streams[venue.max_streams_per_connection:]
+
+    async def unsubscribe(self, venue: WebsocketVenue, streams: List[str], handler: WebsocketMessageHandler):
+        """
+        Stops passing the stream messages to the handler. Connections without any stream left are closed.
+        """
+        async with self._lock:
+            connections: List[WebsocketConnection] = self._connections.get(venue.name, [])
+            for connection in list(connections):
+                connection_streams: List[str] = [stream for stream in streams if connection.has_stream(stream)]
+                if len(connection_streams) > 0:
+                    await connection.remove_handler(connection_streams, handler)
+                    if len(connection.streams) == 0:
+                        connections.remove(connection)
+            if len(connections) == 0:
+                self._connections.pop(venue.name, None)
+
+    async def listen(self, venue: WebsocketVenue, streams: List[str], handler: WebsocketMessageHandler):
+        """
+        Subscribes the handler to the streams until cancelled, for use in place of a data source websocket loop.
+        """
+        await self.subscribe(venue, streams, handler)
+        try:
+            await asyncio.get_event_loop().create_future()
+        finally:
+            await self.unsubscribe(venue, streams, handler)
+
+    async def close(self):
+        async with self._lock:
+            for connections in self._connections.values():
+                for connection in connections:
+                    await connection.stop()
+            self._connections.clear()
@@ -1,4 +1,12 @@
-from typing import Dict, List
+import asyncio
+import os
+import pickle
+import select
+import struct
+from collections import deque
+from multiprocessing import Pipe
+from multiprocessing.reduction import ForkingPickler
+from typing import Any, Callable, Deque, Dict, List, Optional
 from decimal import Decimal
 
 child_queue = None
@@ -9,6 +17,104 @@ def set_child_queue(queue):
     child_queue = queue
 
 
+class ScriptChannel:
+    """
+    A one way channel between the strategy and the script processes. It is a pipe whose receiving end is added to the
+    readers of the receiving process event loop, so that items are handled as soon as they arrive, without polling.
+
+    Neither end ever blocks: items which don't fit in the pipe are buffered and written once the pipe is writable
+    again, and at most MAX_BUFFERED_ITEMS are buffered, further items are dropped until the receiving process catches
+    up. Items are framed as multiprocessing Connection messages.
+    """
+    MAX_BUFFERED_ITEMS = 1000
+
+    def __init__(self):
+        self._reader, self._writer = Pipe(duplex=False)
+        os.set_blocking(self._writer.fileno(), False)
+        self._write_buffer: Deque[memoryview] = deque()
+        self._write_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._read_buffer: bytearray = bytearray()
+
+    def __getstate__(self):
+        # Only the pipe ends are passed to the script process
+        return {"_reader": self._reader, "_writer": self._writer}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._write_buffer = deque()
+        self._write_loop = None
+        self._read_buffer = bytearray()
+
+    def put(self, item: Any) -> bool:
+        """
+        Sends an item without blocking.
+        :return: False if the item was dropped as too many items are waiting for the receiving process
+        """
+        if len(self._write_buffer) >= self.MAX_BUFFERED_ITEMS:
+            return False
+        payload = ForkingPickler.dumps(item)
+        self._write_buffer.append(memoryview(struct.pack("!i", len(payload)) + payload))
+        self._flush()
+        return True
+
+    def writable(self) -> bool:
+        """
+        Returns False while items are waiting for the pipe, i.e. when the receiving process is not keeping up.
+        """
+        return len(self._write_buffer) == 0 and len(select.select([], [self._writer], [], 0)[1]) > 0
+
+    def flush(self, timeout: float):
+        """
+        Waits until the buffered items are written to the pipe, e.g. before the sending process exits.
+        """
+        while len(self._write_buffer) > 0 and len(select.select([], [self._writer], [], timeout)[1]) > 0:
+            self._flush()
+
+    def start_listening(self, ev_loop: asyncio.AbstractEventLoop, callback: Callable[[Any], None]):
+        ev_loop.add_reader(self._reader.fileno(), self._read_available, ev_loop, callback)
+
+    def stop_listening(self, ev_loop: asyncio.AbstractEventLoop):
+        ev_loop.remove_reader(self._reader.fileno())
+
+    def _flush(self):
+        try:
+            while len(self._write_buffer) > 0:
+                data: memoryview = self._write_buffer[0]
+                written: int = os.write(self._writer.fileno(), data)
+                if written < len(data):
+                    self._write_buffer[0] = data[written:]
+                    break
+                self._write_buffer.popleft()
+        except BlockingIOError:
+            pass
+        except (BrokenPipeError, OSError):
+            # The receiving process has exited
+            self._write_buffer.clear()
+        if len(self._write_buffer) > 0 and self._write_loop is None:
+            self._write_loop = asyncio.get_event_loop()
+            self._write_loop.add_writer(self._writer.fileno(), self._flush)
+        elif len(self._write_buffer) == 0 and self._write_loop is not None:
+            self._write_loop.remove_writer(self._writer.fileno())
+            self._write_loop = None
+
+    def _read_available(self, ev_loop: asyncio.AbstractEventLoop, callback: Callable[[Any], None]):
+        data: bytes = os.read(self._reader.fileno(), 65536)
+        if len(data) == 0:
+            # The sending process has exited
+            self.stop_listening(ev_loop)
+            return
+        self._read_buffer += data
+        offset: int = 0
+        while len(self._read_buffer) - offset >= 4:
+            size: int = struct.unpack("!i", self._read_buffer[offset:offset + 4])[0]
+            if len(self._read_buffer) - offset - 4 < size:
+                break
+            item = pickle.loads(self._read_buffer[offset + 4:offset + 4 + size])
+            offset += 4 + size
+            callback(item)
+        del self._read_buffer[:offset]
+
+
 class StrategyParameter(object):
     """
     A strategy parameter class that is used as a property for the collection class with its get and set method.
@@ -98,6 +204,17 @@ class PMMParameters:
     # ping_pong_enabled = PMMParameter("ping_pong_enabled")
     # minimum_spread = PMMParameter("minimum_spread")
 
+    @classmethod
+    def parameter_names(cls) -> List[str]:
+        return [name for name, value in cls.__dict__.items() if isinstance(value, StrategyParameter)]
+
+    def update_values(self, updates: Dict[str, Any]):
+        """
+        Updates the parameters values with the changes made in the strategy, without sending them back.
+        """
+        for name, value in updates.items():
+            setattr(self, "_" + name, value)
+
     def __repr__(self):
         return f"{self.__class__.__name__} {str(self.__dict__)}"
 
@@ -113,13 +230,17 @@ class PmmMarketInfo:
 
 
 class OnTick:
+    """
+    Only the strategy parameters that changed since the previous tick are sent, and the balances only when they
+    changed (they are None otherwise).
+    """
     def __init__(self, mid_price: Decimal,
-                 pmm_parameters: PMMParameters,
-                 all_total_balances: Dict[str, Dict[str, Decimal]],
-                 all_available_balances: Dict[str, Dict[str, Decimal]],
+                 pmm_parameter_updates: Dict[str, Any],
+                 all_total_balances: Optional[Dict[str, Dict[str, Decimal]]],
+                 all_available_balances: Optional[Dict[str, Dict[str, Decimal]]],
                  ):
         self.mid_price = mid_price
-        self.pmm_parameters = pmm_parameters
+        self.pmm_parameter_updates = pmm_parameter_updates
         self.all_total_balances = all_total_balances
         self.all_available_balances = all_available_balances
 
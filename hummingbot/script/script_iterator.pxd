@@ -8,7 +8,6 @@ cdef class ScriptIterator(TimeIterator):
         str _script_file_path
         object _strategy
         object _markets
-        double _queue_check_interval
         object _event_pairs
         object _did_complete_buy_order_forwarder
         object _did_complete_sell_order_forwarder
@@ -17,5 +16,10 @@ cdef class ScriptIterator(TimeIterator):
         object _child_queue
         object _ev_loop
         object _script_process
-        object _listen_to_child_task
+        object _parameter_names
+        object _sent_parameters
+        double _last_parameters_sync_timestamp
+        object _sent_total_balances
+        object _sent_available_balances
+        bint _is_tick_skipped
         bint _is_unit_testing_mode
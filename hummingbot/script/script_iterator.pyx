@@ -1,10 +1,10 @@
 # distutils: language=c++
 
+from copy import deepcopy
 from typing import List
 import asyncio
 import logging
-import traceback
-from multiprocessing import Process, Queue
+from multiprocessing import Process
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.clock import Clock
 from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
@@ -14,7 +14,6 @@ from hummingbot.core.event.events import (
     MarketEvent,
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
-from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.script.script_process import run_script
 from hummingbot.script.script_interface import (
@@ -26,10 +25,13 @@ from hummingbot.script.script_interface import (
     CallNotify,
     CallLog,
     PmmMarketInfo,
+    ScriptChannel,
     ScriptError,
 )
 
 sir_logger = None
+# All the strategy parameters are sent to the script on this interval, not only the changes
+PARAMETERS_SYNC_INTERVAL = 60.0
 
 
 cdef class ScriptIterator(TimeIterator):
@@ -44,28 +46,33 @@ cdef class ScriptIterator(TimeIterator):
                  script_file_path: str,
                  markets: List[ExchangeBase],
                  strategy: PureMarketMakingStrategy,
-                 queue_check_interval: float = 0.01,
                  is_unit_testing_mode: bool = False):
         super().__init__()
         self._script_file_path = script_file_path
         self._markets = markets
         self._strategy = strategy
         self._is_unit_testing_mode = is_unit_testing_mode
-        self._queue_check_interval = queue_check_interval
         self._did_complete_buy_order_forwarder = SourceInfoEventForwarder(self._did_complete_buy_order)
         self._did_complete_sell_order_forwarder = SourceInfoEventForwarder(self._did_complete_sell_order)
         self._event_pairs = [
             (MarketEvent.BuyOrderCompleted, self._did_complete_buy_order_forwarder),
             (MarketEvent.SellOrderCompleted, self._did_complete_sell_order_forwarder)
         ]
+        self._parameter_names = PMMParameters.parameter_names()
+        # The values last sent to the script, only the changes are sent on the next tick
+        self._sent_parameters = {}
+        self._last_parameters_sync_timestamp = 0
+        self._sent_total_balances = None
+        self._sent_available_balances = None
+        self._is_tick_skipped = False
         self._ev_loop = asyncio.get_event_loop()
-        self._parent_queue = Queue()
-        self._child_queue = Queue()
-        self._listen_to_child_task = safe_ensure_future(self.listen_to_child_queue(), loop=self._ev_loop)
+        self._parent_queue = ScriptChannel()
+        self._child_queue = ScriptChannel()
+        self._child_queue.start_listening(self._ev_loop, self.on_child_item)
 
         self._script_process = Process(
             target=run_script,
-            args=(script_file_path, self._parent_queue, self._child_queue, queue_check_interval,)
+            args=(script_file_path, self._parent_queue, self._child_queue,)
         )
         self.logger().info(f"starting script in {script_file_path}")
         self._script_process.start()
@@ -85,73 +92,92 @@ cdef class ScriptIterator(TimeIterator):
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
         self._parent_queue.put(None)
-        self._child_queue.put(None)
+        self._parent_queue.flush(timeout=5)
         self._script_process.join()
-        if self._listen_to_child_task is not None:
-            self._listen_to_child_task.cancel()
+        self._child_queue.stop_listening(self._ev_loop)
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
         if not self._strategy.all_markets_ready():
             return
-        cdef object pmm_strategy = PMMParameters()
-        for attr in PMMParameters.__dict__.keys():
-            if attr[:1] != '_':
-                param_value = getattr(self._strategy, attr)
-                setattr(pmm_strategy, attr, param_value)
-        cdef object on_tick = OnTick(self.strategy.get_mid_price(), pmm_strategy,
-                                     self.all_total_balances(), self.all_available_balances())
+        if not self._parent_queue.writable():
+            # The script is not keeping up, the changes are sent on the next tick instead of blocking the strategy
+            if not self._is_tick_skipped:
+                self.logger().warning("The script is not keeping up with the ticks, skipping ticks.")
+            self._is_tick_skipped = True
+            return
+        self._is_tick_skipped = False
+        if timestamp - self._last_parameters_sync_timestamp >= PARAMETERS_SYNC_INTERVAL:
+            self._sent_parameters.clear()
+            self._last_parameters_sync_timestamp = timestamp
+        cdef dict parameter_updates = {}
+        for name in self._parameter_names:
+            value = getattr(self._strategy, name)
+            if name not in self._sent_parameters or self._sent_parameters[name] != value:
+                parameter_updates[name] = value
+                # Copied as dict and list parameters (e.g. order_override) can be changed in place
+                self._sent_parameters[name] = deepcopy(value) if isinstance(value, (dict, list)) else value
+        total_balances = self.all_total_balances()
+        available_balances = self.all_available_balances(total_balances)
+        cdef object on_tick = OnTick(self.strategy.get_mid_price(),
+                                     parameter_updates,
+                                     total_balances if total_balances != self._sent_total_balances else None,
+                                     available_balances if available_balances != self._sent_available_balances
+                                     else None)
+        self._sent_total_balances = total_balances
+        self._sent_available_balances = available_balances
         self._parent_queue.put(on_tick)
 
     def _did_complete_buy_order(self,
                                 event_tag: int,
                                 market: ExchangeBase,
                                 event: BuyOrderCompletedEvent):
-        self._parent_queue.put(event)
+        self.put_to_script(event)
 
     def _did_complete_sell_order(self,
                                  event_tag: int,
                                  market: ExchangeBase,
                                  event: SellOrderCompletedEvent):
-        self._parent_queue.put(event)
-
-    async def listen_to_child_queue(self):
-        while True:
-            try:
-                if self._child_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
-                    continue
-                item = self._child_queue.get()
-                if item is None:
-                    break
-                if isinstance(item, StrategyParameter):
-                    self.logger().info(f"received: {str(item)}")
-                    setattr(self._strategy, item.name, item.updated_value)
-                elif isinstance(item, CallNotify) and not self._is_unit_testing_mode:
-                    # ignore this on unit testing as the below import will mess up unit testing.
-                    from hummingbot.client.hummingbot_application import HummingbotApplication
-                    HummingbotApplication.main_application()._notify(item.msg)
-                elif isinstance(item, CallLog):
-                    self.logger().info(f"script - {item.msg}")
-                elif isinstance(item, ScriptError):
-                    self.logger().info(f"{item}")
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().info("Unexpected error listening to child queue.", exc_info=True)
+        self.put_to_script(event)
+
+    def on_child_item(self, item):
+        """
+        Handles an item from the script process, called by the event loop as soon as the item is received.
+        """
+        try:
+            if isinstance(item, StrategyParameter):
+                self.logger().info(f"received: {str(item)}")
+                # The value last sent is forgotten, so the value actually set (or kept if the change was rejected)
+                # is sent back to the script on the next tick
+                self._sent_parameters.pop(item.name, None)
+                setattr(self._strategy, item.name, item.updated_value)
+            elif isinstance(item, CallNotify) and not self._is_unit_testing_mode:
+                # ignore this on unit testing as the below import will mess up unit testing.
+                from hummingbot.client.hummingbot_application import HummingbotApplication
+                HummingbotApplication.main_application()._notify(item.msg)
+            elif isinstance(item, CallLog):
+                self.logger().info(f"script - {item.msg}")
+            elif isinstance(item, ScriptError):
+                self.logger().info(f"{item}")
+        except Exception:
+            self.logger().info("Unexpected error handling an item from the script.", exc_info=True)
 
     def request_status(self):
-        self._parent_queue.put(OnStatus())
+        self.put_to_script(OnStatus())
 
     def request_command(self, cmd: str, args: List[str]):
-        self._parent_queue.put(OnCommand(cmd, args))
+        self.put_to_script(OnCommand(cmd, args))
+
+    def put_to_script(self, item):
+        if not self._parent_queue.put(item):
+            self.logger().warning(f"The script is not keeping up, {item.__class__.__name__} not sent to the script.")
 
     def all_total_balances(self):
         all_bals = {m.name: m.get_all_balances() for m in self._markets}
         return {exchange: {token: bal for token, bal in bals.items() if bal > 0} for exchange, bals in all_bals.items()}
 
-    def all_available_balances(self):
-        all_bals = self.all_total_balances()
+    def all_available_balances(self, all_bals=None):
+        all_bals = all_bals if all_bals is not None else self.all_total_balances()
         ret_val = {}
         for exchange, balances in all_bals.items():
             connector = [c for c in self._markets if c.name == exchange][0]
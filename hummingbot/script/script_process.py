@@ -3,26 +3,27 @@ import importlib
 import inspect
 import os
 
-from multiprocessing import Queue
 from hummingbot.script.script_base import ScriptBase
-from hummingbot.script.script_interface import set_child_queue, CallNotify
+from hummingbot.script.script_interface import set_child_queue, CallNotify, ScriptChannel
 
 
-def run_script(script_file_name: str, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+def run_script(script_file_name: str, parent_queue: ScriptChannel, child_queue: ScriptChannel):
     try:
         script_class = import_script_sub_class(script_file_name)
         script = script_class()
-        script.assign_init(parent_queue, child_queue, queue_check_interval)
+        script.assign_init(parent_queue, child_queue)
         set_child_queue(child_queue)
         policy = asyncio.get_event_loop_policy()
         policy.set_event_loop(policy.new_event_loop())
         ev_loop = asyncio.get_event_loop()
         ev_loop.create_task(script.run())
         ev_loop.run_forever()
+        child_queue.flush(timeout=5)
         ev_loop.close()
     except Exception as ex:
         child_queue.put(CallNotify(f'Failed to start script {script_file_name}:'))
         child_queue.put(CallNotify(f'{ex}'))
+        child_queue.flush(timeout=5)
 
 
 def import_script_sub_class(script_file_name: str):
@@ -9,10 +9,18 @@ cdef class RingBuffer:
         int64_t _stop_index
         int64_t _length
         bint _is_full
+        # Running mean and sum of squared differences from the mean (Welford) of the values in the buffer
+        double _mean
+        double _m2
 
     cdef void c_add_value(self, float val)
     cdef void c_increment_index(self)
     cdef double c_get_last_value(self)
+    cdef double c_get_first_value(self)
+    cdef int64_t c_get_count(self)
+    cdef double c_get_mean(self)
+    cdef double c_get_variance(self)
+    cdef void c_recompute_moments(self)
     cdef bint c_is_full(self)
     cdef bint c_is_empty(self)
     cdef double c_mean_value(self)
@@ -1,6 +1,7 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport NAN, sqrt
 
 
 pmm_logger = None
@@ -19,19 +20,53 @@ cdef class RingBuffer:
         self._start_index = 0
         self._stop_index = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
 
     def __dealloc__(self):
         self._buffer = None
 
     cdef void c_add_value(self, float val):
+        cdef:
+            double new_value = val
+            double old_value
+            double old_mean = self._mean
+            int64_t count
+        if self._is_full:
+            # The oldest value is replaced, the number of values stays the same
+            old_value = self._buffer[self._stop_index]
+            self._mean += (new_value - old_value) / self._length
+            self._m2 += (new_value - old_value) * (new_value - self._mean + old_value - old_mean)
+        else:
+            count = self.c_get_count() + 1
+            self._mean += (new_value - old_mean) / count
+            self._m2 += (new_value - old_mean) * (new_value - self._mean)
         self._buffer[self._stop_index] = val
         self.c_increment_index()
+        if self._is_full and self._stop_index == 0:
+            # Recomputed once per buffer length so that float errors don't accumulate
+            self.c_recompute_moments()
 
     cdef void c_increment_index(self):
         self._stop_index = (self._stop_index + 1) % self._length
-        if(self._start_index == self._stop_index):
+        if self._is_full:
+            # The oldest value is the next one to be replaced
+            self._start_index = self._stop_index
+        elif(self._start_index == self._stop_index):
             self._is_full = True
-            self._start_index = (self._start_index + 1) % self._length
+
+    cdef void c_recompute_moments(self):
+        cdef:
+            int64_t count = self.c_get_count()
+            int64_t i
+            double total = 0
+            double m2 = 0
+        for i in range(count):
+            total += self._buffer[(self._start_index + i) % self._length]
+        self._mean = total / count if count > 0 else 0
+        for i in range(count):
+            m2 += (self._buffer[(self._start_index + i) % self._length] - self._mean) ** 2
+        self._m2 = m2
 
     cdef bint c_is_empty(self):
         return (not self._is_full) and (self._start_index==self._stop_index)
@@ -41,36 +76,53 @@ cdef class RingBuffer:
             return np.nan
         return self._buffer[self._stop_index-1]
 
+    cdef double c_get_first_value(self):
+        if self.c_is_empty():
+            return np.nan
+        return self._buffer[self._start_index]
+
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_get_count(self):
+        if self._is_full:
+            return self._length
+        return self._stop_index - self._start_index
+
+    cdef double c_get_mean(self):
+        if self.c_is_empty():
+            return NAN
+        return self._mean
+
+    cdef double c_get_variance(self):
+        if self.c_is_empty():
+            return NAN
+        # Float errors can take a zero variance slightly below zero
+        return max(self._m2 / self.c_get_count(), 0.)
+
     cdef double c_mean_value(self):
         result = np.nan
         if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+            result = self.c_get_mean()
         return result
 
     cdef double c_variance(self):
         result = np.nan
         if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+            result = self.c_get_variance()
         return result
 
     cdef double c_std_dev(self):
         result = np.nan
         if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
+            result = sqrt(self.c_get_variance())
         return result
 
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
-
+        cdef np.ndarray[np.double_t, ndim=1] buffer = np.asarray(self._buffer)
         if not self._is_full:
-            indexes = np.arange(self._start_index, stop=self._stop_index, dtype=np.int16)
-        else:
-            indexes = np.arange(self._start_index, stop=self._start_index + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            return buffer[self._start_index:self._stop_index].copy()
+        return np.concatenate((buffer[self._start_index:], buffer[:self._start_index]))
 
     def __init__(self, length):
         self._length = length
@@ -78,6 +130,8 @@ cdef class RingBuffer:
         self._start_index = 0
         self._stop_index = 0
         self._is_full = False
+        self._mean = 0
+        self._m2 = 0
 
     def add_value(self, val):
         self.c_add_value(val)
@@ -88,6 +142,27 @@ cdef class RingBuffer:
     def get_last_value(self):
         return self.c_get_last_value()
 
+    def get_first_value(self):
+        return self.c_get_first_value()
+
+    @property
+    def count(self) -> int:
+        return self.c_get_count()
+
+    @property
+    def current_mean(self) -> float:
+        """
+        The mean of the values in the buffer, even if it is not full.
+        """
+        return self.c_get_mean()
+
+    @property
+    def current_variance(self) -> float:
+        """
+        The (population) variance of the values in the buffer, even if it is not full.
+        """
+        return self.c_get_variance()
+
     @property
     def is_full(self):
         return self.c_is_full()
@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-import numpy as np
 import logging
 from ..ring_buffer import RingBuffer
 
@@ -32,9 +31,9 @@ class BaseTrailingIndicator(ABC):
     def _processing_calculation(self) -> float:
         """
         Processing of the processing buffer to return final value.
-        Default behavior is buffer average
+        Default behavior is buffer average, which the buffer keeps up to date as values are added
         """
-        return np.mean(self._processing_buffer.get_as_numpy_array())
+        return self._processing_buffer.current_mean
 
     @property
     def current_value(self) -> float:
@@ -1,5 +1,4 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
@@ -7,11 +6,25 @@ class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._decay = 1 - 2 / (sampling_length + 1)
+        self._oldest_weight = self._decay ** sampling_length
+        # The weighted sum of the samples and the sum of their weights, the latest sample having a weight of 1
+        self._weighted_sum = 0.
+        self._weights_sum = 0.
+
+    def add_sample(self, value: float):
+        # Same as pandas ewm(span=sampling_length, adjust=True) over the sampling buffer
+        removed_value = self._sampling_buffer.get_first_value() if self._sampling_buffer.is_full else None
+        self._sampling_buffer.add_value(value)
+        self._weighted_sum = self._decay * self._weighted_sum + self._sampling_buffer.get_last_value()
+        self._weights_sum = self._decay * self._weights_sum + 1
+        if removed_value is not None:
+            self._weighted_sum -= self._oldest_weight * removed_value
+            self._weights_sum -= self._oldest_weight
+        self._processing_buffer.add_value(self._indicator_calculation())
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        return self._weighted_sum / self._weights_sum
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
@@ -1,18 +1,26 @@
 from .base_trailing_indicator import BaseTrailingIndicator
-import numpy as np
+from ..ring_buffer import RingBuffer
+import math
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        # The log returns between the prices of the sampling buffer
+        self._returns_buffer = RingBuffer(max(sampling_length - 1, 1))
+
+    def add_sample(self, value: float):
+        previous_price = self._sampling_buffer.get_last_value()
+        self._sampling_buffer.add_value(value)
+        if self._sampling_length > 1 and not math.isnan(previous_price):
+            self._returns_buffer.add_value(math.log(self._sampling_buffer.get_last_value() / previous_price))
+        self._processing_buffer.add_value(self._indicator_calculation())
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        variance = self._returns_buffer.current_variance
+        # Until there are 2 prices there is no return, which counts as no volatility
+        return 0. if math.isnan(variance) else variance
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        if self._processing_buffer.count > 0:
+            return math.sqrt(self._processing_buffer.current_mean)
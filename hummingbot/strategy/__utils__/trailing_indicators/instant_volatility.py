@@ -1,5 +1,5 @@
 from .base_trailing_indicator import BaseTrailingIndicator
-import numpy as np
+import math
 
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
@@ -7,8 +7,7 @@ class InstantVolatilityIndicator(BaseTrailingIndicator):
         super().__init__(sampling_length, processing_length)
 
     def _indicator_calculation(self) -> float:
-        return np.var(self._sampling_buffer.get_as_numpy_array())
+        return self._sampling_buffer.current_variance
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        return np.sqrt(np.mean(processing_array))
+        return math.sqrt(self._processing_buffer.current_mean)
@@ -1,6 +1,8 @@
+from collections import deque
 from decimal import Decimal
 import logging
 import asyncio
+import time
 import pandas as pd
 from typing import List, Dict, Tuple, Optional, Any
 from hummingbot.client.settings import ETH_WALLET_CONNECTORS
@@ -10,7 +12,7 @@ from hummingbot.connector.connector.uniswap.uniswap_connector import UniswapConn
 from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.fixed_rate_source import FixedRateSource
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.amm_arb.utils import create_arb_proposals, ArbProposal
@@ -20,6 +22,7 @@ from hummingbot.strategy.strategy_py_base import StrategyPyBase
 NaN = float("nan")
 s_decimal_zero = Decimal(0)
 amm_logger = None
+QUOTE_LATENCY_CYCLES = 100
 
 
 class AmmArbStrategy(StrategyPyBase):
@@ -74,6 +77,8 @@ class AmmArbStrategy(StrategyPyBase):
         self._last_no_arb_reported = 0
         self._arb_proposals = None
         self._all_markets_ready = False
+        # Durations (in seconds) of the latest quote fetching cycles
+        self._quote_latencies = deque(maxlen=QUOTE_LATENCY_CYCLES)
 
         self._ev_loop = asyncio.get_event_loop()
         self._main_task = None
@@ -129,7 +134,9 @@ class AmmArbStrategy(StrategyPyBase):
         min profitability required, applies the slippage buffer, applies budget constraint, then finally execute the
         arbitrage.
         """
+        start_time = time.perf_counter()
         self._arb_proposals = await create_arb_proposals(self._market_info_1, self._market_info_2, self._order_amount)
+        self._quote_latencies.append(time.perf_counter() - start_time)
         arb_proposals = [
             t.copy() for t in self._arb_proposals
             if t.profit_pct(
@@ -255,6 +262,17 @@ class AmmArbStrategy(StrategyPyBase):
 
         return pd.DataFrame(data=data, columns=columns)
 
+    def quote_latency_msg(self) -> List[str]:
+        """
+        Returns the duration of the latest quote fetching cycle, with the average and maximum of the recent ones.
+        """
+        if len(self._quote_latencies) == 0:
+            return ["    No quote fetched yet."]
+        latencies_ms = [latency * 1000 for latency in self._quote_latencies]
+        return [f"    Last cycle: {latencies_ms[-1]:.0f} ms, "
+                f"average: {sum(latencies_ms) / len(latencies_ms):.0f} ms, "
+                f"max: {max(latencies_ms):.0f} ms (last {len(latencies_ms)} cycles)"]
+
     async def format_status(self) -> str:
         """
         Returns a status string formatted to display nicely on terminal. The strings composes of 4 parts: markets,
@@ -266,10 +284,13 @@ class AmmArbStrategy(StrategyPyBase):
         # active_orders = self.market_info_to_active_orders.get(self._market_info, [])
         columns = ["Exchange", "Market", "Sell Price", "Buy Price", "Mid Price"]
         data = []
-        for market_info in [self._market_info_1, self._market_info_2]:
+        market_infos = [self._market_info_1, self._market_info_2]
+        prices = await safe_gather(*[market_info.market.get_quote_price(market_info.trading_pair, is_buy,
+                                                                        self._order_amount)
+                                     for market_info in market_infos for is_buy in (True, False)])
+        for index, market_info in enumerate(market_infos):
             market, trading_pair, base_asset, quote_asset = market_info
-            buy_price = await market.get_quote_price(trading_pair, True, self._order_amount)
-            sell_price = await market.get_quote_price(trading_pair, False, self._order_amount)
+            buy_price, sell_price = prices[index * 2: index * 2 + 2]
 
             # check for unavailable price data
             buy_price = PerformanceMetrics.smart_round(Decimal(str(buy_price)), 8) if buy_price is not None else '-'
@@ -297,6 +318,8 @@ class AmmArbStrategy(StrategyPyBase):
         lines.extend(["", f"  Quotes Rates ({str(self._rate_source)})"] +
                      ["    " + line for line in str(quotes_rates_df).split("\n")])
 
+        lines.extend(["", "  Quote Latency:"] + self.quote_latency_msg())
+
         warning_lines = self.network_warning([self._market_info_1])
         warning_lines.extend(self.network_warning([self._market_info_2]))
         warning_lines.extend(self.balance_warning([self._market_info_1]))
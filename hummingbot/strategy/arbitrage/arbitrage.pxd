@@ -34,6 +34,12 @@ cdef class ArbitrageStrategy(StrategyBase):
     cdef c_process_market_pair(self, object market_pair)
     cdef c_process_market_pair_inner(self, object buy_market_trading_pair, object sell_market_trading_pair)
     cdef tuple c_find_best_profitable_amount(self, object buy_market_trading_pair, object sell_market_trading_pair)
+    cdef tuple c_find_best_profitable_amount_from_rows(self,
+                                                       object buy_market_trading_pair,
+                                                       object sell_market_trading_pair)
+    cdef tuple c_find_best_profitable_amount_from_books(self,
+                                                        object buy_market_trading_pair,
+                                                        object sell_market_trading_pair)
     cdef bint c_ready_for_new_orders(self, list market_trading_pairs)
 
 cdef list c_find_profitable_arbitrage_orders(object min_profitability,
@@ -41,3 +47,21 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
                                              object sell_market_trading_pair_tuple,
                                              object buy_market_conversion_rate,
                                              object sell_market_conversion_rate)
+
+cdef struct ArbitrageWalkResult:
+    double amount
+    double profitability
+    double bid_price
+    double ask_price
+
+cdef ArbitrageWalkResult c_merge_walk_order_books(OrderBook sell_order_book,
+                                                  OrderBook buy_order_book,
+                                                  double sell_market_conversion_rate,
+                                                  double buy_market_conversion_rate,
+                                                  double min_profitability,
+                                                  double sell_fee_percent,
+                                                  double buy_fee_percent,
+                                                  double total_sell_flat_fees,
+                                                  double total_buy_flat_fees,
+                                                  double sell_market_base_balance,
+                                                  double buy_market_quote_balance)
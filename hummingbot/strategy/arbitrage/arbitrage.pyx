@@ -1,4 +1,10 @@
 # distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+from cython.operator cimport(
+    dereference as deref,
+    preincrement as inc,
+)
+from libcpp.set cimport set as cpp_set
 import logging
 from decimal import Decimal
 import pandas as pd
@@ -15,7 +21,10 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
+from hummingbot.core.data_type.composite_order_book cimport CompositeOrderBook
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -484,11 +493,97 @@ cdef class ArbitrageStrategy(StrategyBase):
         markets and the profitability ratio. This function accounts for trading fees required by both markets before
         arriving at the optimal order size and profitability ratio.
 
+        The order books are walked directly in C when possible. Composite order books (which adjust their entries for
+        the simulated trades) and the profitability step logging options go through the order book rows instead.
+
         :param buy_market_trading_pair_tuple: trading pair for buy side
         :param sell_market_trading_pair_tuple: trading pair for sell side
         :return: (order size, profitability ratio, bid_price, ask_price)
         :rtype: Tuple[float, float, float, float]
         """
+        if (self._logging_options & (self.OPTION_LOG_PROFITABILITY_STEP | self.OPTION_LOG_FULL_PROFITABILITY_STEP) or
+                isinstance(buy_market_trading_pair_tuple.order_book, CompositeOrderBook) or
+                isinstance(sell_market_trading_pair_tuple.order_book, CompositeOrderBook)):
+            return self.c_find_best_profitable_amount_from_rows(buy_market_trading_pair_tuple,
+                                                                sell_market_trading_pair_tuple)
+        return self.c_find_best_profitable_amount_from_books(buy_market_trading_pair_tuple,
+                                                             sell_market_trading_pair_tuple)
+
+    cdef tuple c_find_best_profitable_amount_from_books(self,
+                                                        object buy_market_trading_pair_tuple,
+                                                        object sell_market_trading_pair_tuple):
+        """
+        Finds the best profitable amount with a double precision merge walk over the order books. The fees and
+        balances are looked up once, and the resulting size and prices are converted back to Decimal and quantized.
+        """
+        cdef:
+            ExchangeBase buy_market = buy_market_trading_pair_tuple.market
+            ExchangeBase sell_market = sell_market_trading_pair_tuple.market
+            OrderBook buy_order_book = buy_market_trading_pair_tuple.order_book
+            OrderBook sell_order_book = sell_market_trading_pair_tuple.order_book
+            OrderBookEntry top_bid
+            OrderBookEntry top_ask
+            object top_amount
+            object buy_fee
+            object sell_fee
+            object best_amount
+            ArbitrageWalkResult result
+
+        if sell_order_book._bid_book.empty() or buy_order_book._ask_book.empty():
+            return s_decimal_0, s_decimal_0, s_decimal_0, s_decimal_0
+
+        top_bid = deref(sell_order_book._bid_book.rbegin())
+        top_ask = deref(buy_order_book._ask_book.begin())
+        top_amount = Decimal(repr(min(top_bid.getAmount(), top_ask.getAmount())))
+        buy_fee = buy_market.c_get_fee(
+            buy_market_trading_pair_tuple.base_asset,
+            buy_market_trading_pair_tuple.quote_asset,
+            buy_market.get_taker_order_type(),
+            TradeType.BUY,
+            top_amount,
+            Decimal(repr(top_ask.getPrice()))
+        )
+        sell_fee = sell_market.c_get_fee(
+            sell_market_trading_pair_tuple.base_asset,
+            sell_market_trading_pair_tuple.quote_asset,
+            sell_market.get_taker_order_type(),
+            TradeType.SELL,
+            top_amount,
+            Decimal(repr(top_bid.getPrice()))
+        )
+
+        result = c_merge_walk_order_books(
+            sell_order_book,
+            buy_order_book,
+            float(self.market_conversion_rate(sell_market_trading_pair_tuple)),
+            float(self.market_conversion_rate(buy_market_trading_pair_tuple)),
+            float(self._min_profitability),
+            float(sell_fee.percent),
+            float(buy_fee.percent),
+            float(self.c_sum_flat_fees(sell_market_trading_pair_tuple.quote_asset, sell_fee.flat_fees)),
+            float(self.c_sum_flat_fees(buy_market_trading_pair_tuple.quote_asset, buy_fee.flat_fees)),
+            float(sell_market.c_get_available_balance(sell_market_trading_pair_tuple.base_asset)),
+            float(buy_market.c_get_available_balance(buy_market_trading_pair_tuple.quote_asset))
+        )
+
+        # Rounded to 15 significant digits first so that float error doesn't take the amount below a size increment
+        best_amount = Decimal("%.15g" % max(result.amount, 0))
+        best_amount = min(buy_market.c_quantize_order_amount(buy_market_trading_pair_tuple.trading_pair, best_amount),
+                          sell_market.c_quantize_order_amount(sell_market_trading_pair_tuple.trading_pair, best_amount))
+        return (best_amount,
+                Decimal(repr(result.profitability)),
+                sell_market.c_quantize_order_price(sell_market_trading_pair_tuple.trading_pair,
+                                                   Decimal(repr(result.bid_price))),
+                buy_market.c_quantize_order_price(buy_market_trading_pair_tuple.trading_pair,
+                                                  Decimal(repr(result.ask_price))))
+
+    cdef tuple c_find_best_profitable_amount_from_rows(self,
+                                                       object buy_market_trading_pair_tuple,
+                                                       object sell_market_trading_pair_tuple):
+        """
+        Finds the best profitable amount going through the quantized order book rows in Decimal, checking the fees
+        and balances at every step.
+        """
         cdef:
             object total_bid_value = s_decimal_0  # total revenue
             object total_ask_value = s_decimal_0  # total cost
@@ -614,6 +709,16 @@ cdef class ArbitrageStrategy(StrategyBase):
     def find_best_profitable_amount(self, buy_market: MarketTradingPairTuple, sell_market: MarketTradingPairTuple):
         return self.c_find_best_profitable_amount(buy_market, sell_market)
 
+    def find_best_profitable_amount_from_rows(self,
+                                              buy_market: MarketTradingPairTuple,
+                                              sell_market: MarketTradingPairTuple):
+        return self.c_find_best_profitable_amount_from_rows(buy_market, sell_market)
+
+    def find_best_profitable_amount_from_books(self,
+                                               buy_market: MarketTradingPairTuple,
+                                               sell_market: MarketTradingPairTuple):
+        return self.c_find_best_profitable_amount_from_books(buy_market, sell_market)
+
     def ready_for_new_orders(self, market_pair):
         return self.c_ready_for_new_orders(market_pair)
     # ---------------------------------------------------------------
@@ -707,3 +812,109 @@ cdef list c_find_profitable_arbitrage_orders(object min_profitability,
         pass
 
     return profitable_orders
+
+
+cdef ArbitrageWalkResult c_merge_walk_order_books(OrderBook sell_order_book,
+                                                  OrderBook buy_order_book,
+                                                  double sell_market_conversion_rate,
+                                                  double buy_market_conversion_rate,
+                                                  double min_profitability,
+                                                  double sell_fee_percent,
+                                                  double buy_fee_percent,
+                                                  double total_sell_flat_fees,
+                                                  double total_buy_flat_fees,
+                                                  double sell_market_base_balance,
+                                                  double buy_market_quote_balance):
+    """
+    Walks the bids of the sell market and the asks of the buy market together, the same way
+    c_find_profitable_arbitrage_orders and c_find_best_profitable_amount_from_rows do, in a single pass over the
+    order book entries and in double precision.
+
+    :return: the best profitable amount and its profitability, with the bid and ask prices of the last step walked
+    """
+    cdef:
+        ArbitrageWalkResult result
+        cpp_set[OrderBookEntry].reverse_iterator bid_it = sell_order_book._bid_book.rbegin()
+        cpp_set[OrderBookEntry].iterator ask_it = buy_order_book._ask_book.begin()
+        double bid_leftover_amount = 0
+        double ask_leftover_amount = 0
+        double bid_price = 0
+        double ask_price = 0
+        double bid_price_adjusted
+        double ask_price_adjusted
+        double step_amount
+        double total_bid_value_adjusted = 0
+        double total_ask_value_adjusted = 0
+        double total_previous_step_base_amount = 0
+        double net_sell_proceeds
+        double net_buy_costs
+        double profitability
+        double min_profitability_ratio = 1 + min_profitability
+
+    result.amount = 0
+    result.profitability = 0
+    result.bid_price = 0
+    result.ask_price = 0
+
+    while True:
+        if bid_leftover_amount == 0 and ask_leftover_amount == 0:
+            if bid_it == sell_order_book._bid_book.rend() or ask_it == buy_order_book._ask_book.end():
+                break
+            bid_price = deref(bid_it).getPrice()
+            bid_leftover_amount = deref(bid_it).getAmount()
+            ask_price = deref(ask_it).getPrice()
+            ask_leftover_amount = deref(ask_it).getAmount()
+            inc(bid_it)
+            inc(ask_it)
+        elif bid_leftover_amount > 0 and ask_leftover_amount == 0:
+            if ask_it == buy_order_book._ask_book.end():
+                break
+            ask_price = deref(ask_it).getPrice()
+            ask_leftover_amount = deref(ask_it).getAmount()
+            inc(ask_it)
+        elif ask_leftover_amount > 0 and bid_leftover_amount == 0:
+            if bid_it == sell_order_book._bid_book.rend():
+                break
+            bid_price = deref(bid_it).getPrice()
+            bid_leftover_amount = deref(bid_it).getAmount()
+            inc(bid_it)
+        elif bid_leftover_amount < 0 or ask_leftover_amount < 0:
+            break
+
+        bid_price_adjusted = bid_price * sell_market_conversion_rate
+        ask_price_adjusted = ask_price * buy_market_conversion_rate
+        if bid_price_adjusted < ask_price_adjusted:
+            break
+        if min_profitability < 0 and bid_price_adjusted / ask_price_adjusted < min_profitability_ratio:
+            break
+
+        step_amount = min(bid_leftover_amount, ask_leftover_amount)
+        if step_amount == 0:
+            continue
+        bid_leftover_amount -= step_amount
+        ask_leftover_amount -= step_amount
+        result.bid_price = bid_price
+        result.ask_price = ask_price
+
+        total_bid_value_adjusted += bid_price_adjusted * step_amount
+        total_ask_value_adjusted += ask_price_adjusted * step_amount
+        net_sell_proceeds = total_bid_value_adjusted * (1 - sell_fee_percent) - total_sell_flat_fees
+        net_buy_costs = total_ask_value_adjusted * (1 + buy_fee_percent) + total_buy_flat_fees
+        profitability = net_sell_proceeds / net_buy_costs
+
+        if profitability > min_profitability_ratio:
+            result.amount = total_previous_step_base_amount + step_amount
+            result.profitability = profitability
+
+        if (buy_market_quote_balance < net_buy_costs or
+                sell_market_base_balance < total_previous_step_base_amount + step_amount):
+            if profitability < min_profitability_ratio:
+                break
+            result.amount = min(sell_market_base_balance,
+                                (buy_market_quote_balance / ask_price - total_buy_flat_fees) / (1 + buy_fee_percent))
+            result.profitability = profitability
+            break
+
+        total_previous_step_base_amount += step_amount
+
+    return result
@@ -0,0 +1,8 @@
+#!/usr/bin/env python
+
+from .graph_arbitrage import GraphArbitrageStrategy
+
+
+__all__ = [
+    GraphArbitrageStrategy
+]
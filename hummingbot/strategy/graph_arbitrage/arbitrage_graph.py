@@ -0,0 +1,290 @@
+import math
+from dataclasses import dataclass, field
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+s_float_inf = float("inf")
+s_float_nan = float("nan")
+
+
+@dataclass
+class GraphEdge:
+    """
+    A conversion from one asset to another, either through the top of an order book (buying or selling on a market) or
+    through a conversion rate between two assets considered to be equivalent (e.g. from the rate oracle).
+    """
+    index: int
+    from_asset: str
+    to_asset: str
+    market_info: Optional[MarketTradingPairTuple] = None
+    is_buy: bool = False
+    fee_percent: float = 0.
+    # The top of the order book price, or the conversion rate for the edges without market
+    price: float = s_float_nan
+    # The base asset amount at the top of the order book
+    amount: float = 0.
+    # The amount of to_asset received for each unit of from_asset, net of the percentage fee
+    rate: float = 0.
+    # The amount of from_asset the top of the order book can take
+    capacity: float = 0.
+
+    @property
+    def is_conversion(self) -> bool:
+        return self.market_info is None
+
+    def update(self, price: float, amount: float) -> bool:
+        """
+        Updates the edge with a new order book top, returns True if it has changed.
+        """
+        if price == self.price and amount == self.amount:
+            return False
+        self.price = price
+        self.amount = amount
+        if self.is_conversion:
+            self.rate = price
+            self.capacity = s_float_inf
+        elif not price > 0 or not amount > 0:
+            self.rate = 0.
+            self.capacity = 0.
+        elif self.is_buy:
+            self.rate = (1. - self.fee_percent) / price
+            self.capacity = amount * price
+        else:
+            self.rate = price * (1. - self.fee_percent)
+            self.capacity = amount
+        return True
+
+    def __repr__(self) -> str:
+        if self.is_conversion:
+            return f"convert {self.from_asset} to {self.to_asset}"
+        return (f"{'buy' if self.is_buy else 'sell'} {self.market_info.trading_pair} "
+                f"on {self.market_info.market.display_name}")
+
+
+@dataclass
+class ArbitrageCycle:
+    """
+    A sequence of edges starting and ending with the same asset.
+    """
+    edges: List[GraphEdge]
+    profitability: float = 0.
+    index: int = field(default=-1, repr=False)
+
+    @property
+    def start_asset(self) -> str:
+        return self.edges[0].from_asset
+
+    @property
+    def is_triangular(self) -> bool:
+        """
+        True for paths going through three or more order books of the same exchange.
+        """
+        markets = [e.market_info.market for e in self.edges if not e.is_conversion]
+        return len(markets) >= 3 and all(m is markets[0] for m in markets)
+
+    def max_start_amount(self, from_asset_limits: Optional[List[float]] = None) -> float:
+        """
+        Calculates the largest amount of the start asset that can go through the cycle at the top of the order books.
+        :param from_asset_limits: additional limits (e.g. the available balances) of the from asset of each edge
+        :return: the amount of the start asset
+        """
+        start_amount = s_float_inf
+        start_to_from_rate = 1.
+        for i, edge in enumerate(self.edges):
+            if start_to_from_rate <= 0:
+                return 0.
+            capacity = edge.capacity
+            if from_asset_limits is not None:
+                capacity = min(capacity, from_asset_limits[i])
+            start_amount = min(start_amount, capacity / start_to_from_rate)
+            start_to_from_rate *= edge.rate
+        return start_amount
+
+    def from_amounts(self, start_amount: float) -> List[float]:
+        """
+        Returns the amount of the from asset going through each edge for a given amount of the start asset.
+        """
+        amounts = []
+        amount = start_amount
+        for edge in self.edges:
+            amounts.append(amount)
+            amount *= edge.rate
+        return amounts
+
+    def __repr__(self) -> str:
+        return f"{', '.join(repr(e) for e in self.edges)}: {self.profitability:.2%}"
+
+
+class ArbitrageGraph:
+    """
+    A graph of assets connected by the top of the order books of the markets (one edge for buying and one for selling on
+    each market), and by conversion rates between equivalent assets.
+
+    The same asset held on different exchanges is the same node, so both cross exchange paths (buy on one exchange and
+    sell on another) and triangular paths within an exchange are cycles of the graph. All the cycles up to
+    max_path_length edges are enumerated once when the graph is built and indexed by edge, so that when an order book
+    top changes only the cycles going through its edges are evaluated again.
+    """
+
+    def __init__(self, max_path_length: int = 3):
+        if max_path_length < 2:
+            raise ValueError("The maximum path length needs to be at least 2.")
+        self._max_path_length = max_path_length
+        self._edges: List[GraphEdge] = []
+        self._market_edges: Dict[MarketTradingPairTuple, Tuple[GraphEdge, GraphEdge]] = {}
+        self._conversion_edges: Dict[Tuple[str, str], GraphEdge] = {}
+        self._cycles: List[ArbitrageCycle] = []
+        self._edge_cycles: List[List[int]] = []
+        self._changed_edges: Set[int] = set()
+        self._profitable_cycles: Set[int] = set()
+        self._built = False
+
+    @property
+    def edges(self) -> List[GraphEdge]:
+        return self._edges
+
+    @property
+    def cycles(self) -> List[ArbitrageCycle]:
+        if not self._built:
+            self.build()
+        return self._cycles
+
+    @property
+    def market_infos(self) -> List[MarketTradingPairTuple]:
+        return list(self._market_edges.keys())
+
+    def _add_edge(self, **kwargs) -> GraphEdge:
+        edge = GraphEdge(index=len(self._edges), **kwargs)
+        self._edges.append(edge)
+        self._built = False
+        return edge
+
+    def add_market(self, market_info: MarketTradingPairTuple, fee_percent: float = 0.):
+        """
+        Adds the buy (quote to base) and sell (base to quote) edges of a market.
+        :param market_info: the market
+        :param fee_percent: the taker fee percentage of the market (e.g. 0.001 for 0.1%)
+        """
+        if market_info in self._market_edges:
+            return
+        buy_edge = self._add_edge(from_asset=market_info.quote_asset, to_asset=market_info.base_asset,
+                                  market_info=market_info, is_buy=True, fee_percent=fee_percent)
+        sell_edge = self._add_edge(from_asset=market_info.base_asset, to_asset=market_info.quote_asset,
+                                   market_info=market_info, is_buy=False, fee_percent=fee_percent)
+        self._market_edges[market_info] = (buy_edge, sell_edge)
+        self.update_market(market_info)
+
+    def set_conversion_rate(self, from_asset: str, to_asset: str, rate: float):
+        """
+        Adds or updates the edges between two assets considered equivalent at the given rate.
+        :param from_asset: the asset to convert from
+        :param to_asset: the asset to convert to
+        :param rate: the amount of to_asset for each unit of from_asset
+        """
+        if from_asset == to_asset:
+            return
+        for key, key_rate in (((from_asset, to_asset), rate), ((to_asset, from_asset), 1. / rate if rate else 0.)):
+            edge = self._conversion_edges.get(key)
+            if edge is None:
+                edge = self._add_edge(from_asset=key[0], to_asset=key[1])
+                self._conversion_edges[key] = edge
+            if edge.update(key_rate, s_float_inf):
+                self._changed_edges.add(edge.index)
+
+    def update_market(self, market_info: MarketTradingPairTuple) -> bool:
+        """
+        Reads the top of the order book of a market and updates its edges.
+        :return: True if the top of the order book has changed
+        """
+        buy_edge, sell_edge = self._market_edges[market_info]
+        order_book = market_info.order_book
+        ask = next(order_book.ask_entries(), None)
+        bid = next(order_book.bid_entries(), None)
+        changed = False
+        if buy_edge.update(ask.price if ask is not None else s_float_nan, ask.amount if ask is not None else 0.):
+            self._changed_edges.add(buy_edge.index)
+            changed = True
+        if sell_edge.update(bid.price if bid is not None else s_float_nan, bid.amount if bid is not None else 0.):
+            self._changed_edges.add(sell_edge.index)
+            changed = True
+        return changed
+
+    def refresh(self) -> int:
+        """
+        Updates the edges of all the markets from their order books.
+        :return: the number of markets whose order book top has changed
+        """
+        return sum(self.update_market(market_info) for market_info in self._market_edges)
+
+    def build(self):
+        """
+        Enumerates all the cycles of the graph up to the maximum path length, and evaluates them.
+        A cycle doesn't go through the same market twice nor through two consecutive conversions.
+        """
+        adjacency: Dict[str, List[GraphEdge]] = {}
+        for edge in self._edges:
+            adjacency.setdefault(edge.from_asset, []).append(edge)
+        self._cycles = []
+        self._edge_cycles = [[] for _ in self._edges]
+
+        def extend(path: List[GraphEdge], visited_assets: Set[str]):
+            first, last = path[0], path[-1]
+            for edge in adjacency.get(last.to_asset, []):
+                # The first edge of a cycle is the one with the lowest index, so each cycle is found only once
+                if edge.index <= first.index:
+                    continue
+                if edge.is_conversion and last.is_conversion:
+                    continue
+                if not edge.is_conversion and any(e.market_info == edge.market_info for e in path):
+                    continue
+                if edge.to_asset == first.from_asset:
+                    if not (edge.is_conversion and first.is_conversion):
+                        self._add_cycle(path + [edge])
+                elif edge.to_asset not in visited_assets and len(path) + 1 < self._max_path_length:
+                    visited_assets.add(edge.to_asset)
+                    extend(path + [edge], visited_assets)
+                    visited_assets.remove(edge.to_asset)
+
+        for start_edge in self._edges:
+            extend([start_edge], {start_edge.from_asset, start_edge.to_asset})
+        self._built = True
+        self._changed_edges = set(range(len(self._edges)))
+        self._profitable_cycles = set()
+
+    def _add_cycle(self, edges: List[GraphEdge]):
+        if all(e.is_conversion for e in edges):
+            return
+        cycle = ArbitrageCycle(edges=edges, index=len(self._cycles))
+        self._cycles.append(cycle)
+        for edge in edges:
+            self._edge_cycles[edge.index].append(cycle.index)
+
+    def profitable_cycles(self, min_profitability: float = 0.) -> List[ArbitrageCycle]:
+        """
+        Evaluates the cycles going through the edges that have changed since the last call, and returns the cycles
+        above the given profitability, the most profitable first.
+        :param min_profitability: the minimum profitability (e.g. 0.003 for 0.3%)
+        """
+        if not self._built:
+            self.build()
+        changed_cycles = set()
+        for edge_index in self._changed_edges:
+            changed_cycles.update(self._edge_cycles[edge_index])
+        self._changed_edges.clear()
+        for cycle_index in changed_cycles:
+            cycle = self._cycles[cycle_index]
+            cycle.profitability = math.prod(e.rate for e in cycle.edges) - 1.
+            if cycle.profitability > 0:
+                self._profitable_cycles.add(cycle_index)
+            else:
+                self._profitable_cycles.discard(cycle_index)
+        return sorted((self._cycles[i] for i in self._profitable_cycles if
+                       self._cycles[i].profitability > min_profitability),
+                      key=lambda c: c.profitability, reverse=True)
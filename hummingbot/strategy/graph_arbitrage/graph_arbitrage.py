@@ -0,0 +1,203 @@
+from decimal import Decimal
+import logging
+from typing import (
+    List,
+    Optional,
+)
+
+import pandas as pd
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.core.event.events import OrderType, TradeType
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.graph_arbitrage.arbitrage_graph import ArbitrageCycle, ArbitrageGraph
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_py_base import StrategyPyBase
+
+s_decimal_zero = Decimal(0)
+s_decimal_one = Decimal(1)
+ga_logger = None
+
+
+class GraphArbitrageStrategy(StrategyPyBase):
+    """
+    Arbitrage across any number of markets, on one or more exchanges. The markets are the edges of an ArbitrageGraph
+    between their assets, and the strategy looks for profitable cycles in it: cross exchange paths (buy an asset on an
+    exchange and sell it on another) and triangular paths (e.g. USDT to BTC to ETH to USDT within an exchange).
+    Assets considered equivalent (e.g. USDT and USDC) can be connected with the rate oracle conversion rates.
+    Only the cycles going through the order books whose top has changed are evaluated again on each tick. The taker
+    orders of all the trades of the most profitable cycle are submitted at the same time, sized to the top of the order
+    books and to the available balances.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global ga_logger
+        if ga_logger is None:
+            ga_logger = logging.getLogger(__name__)
+        return ga_logger
+
+    def init_params(self,
+                    market_infos: List[MarketTradingPairTuple],
+                    min_profitability: Decimal,
+                    max_path_length: int = 3,
+                    conversion_assets: Optional[List[str]] = None,
+                    next_trade_delay_interval: float = 15.,
+                    status_report_interval: float = 900,
+                    hb_app_notification: bool = False):
+        """
+        :param market_infos: the markets to arbitrage
+        :param min_profitability: the minimum profitability of a path to trade it (e.g. 0.003 for 0.3%)
+        :param max_path_length: the maximum number of trades of a path, 3 to include triangular paths
+        :param conversion_assets: assets that can be converted between each other using the rate oracle
+        :param next_trade_delay_interval: cool off period after an arbitrage
+        :param status_report_interval: how often to log that there is no arbitrage opportunity
+        :param hb_app_notification: whether to send notifications to the client application
+        """
+        self._market_infos = market_infos
+        self._min_profitability = min_profitability
+        self._conversion_assets = conversion_assets or []
+        self._next_trade_delay_interval = next_trade_delay_interval
+        self._status_report_interval = status_report_interval
+        self._hb_app_notification = hb_app_notification
+        self._graph = ArbitrageGraph(max_path_length)
+        self._profitable_cycles: List[ArbitrageCycle] = []
+        self._all_markets_ready = False
+        self._next_trade_timestamp = 0
+        self._last_no_arb_reported = 0
+        self.add_markets(list(set(market_info.market for market_info in market_infos)))
+
+    @property
+    def graph(self) -> ArbitrageGraph:
+        return self._graph
+
+    @property
+    def min_profitability(self) -> Decimal:
+        return self._min_profitability
+
+    def tick(self, timestamp: float):
+        """
+        Clock tick entry point, is run every second (on normal tick setting).
+        :param timestamp: current tick timestamp
+        """
+        if not self._all_markets_ready:
+            self._all_markets_ready = all([market.ready for market in self.active_markets])
+            if not self._all_markets_ready:
+                self.logger().warning("Markets are not ready. Please wait...")
+                return
+            self.logger().info("Markets are ready. Trading started.")
+            self.build_graph()
+
+        self.update_conversion_rates()
+        self._graph.refresh()
+        self._profitable_cycles = self._graph.profitable_cycles(float(self._min_profitability))
+
+        if timestamp < self._next_trade_timestamp or self.has_active_orders():
+            return
+        if len(self._profitable_cycles) == 0:
+            if self._last_no_arb_reported < timestamp - self._status_report_interval:
+                self.logger().info("No arbitrage opportunity.")
+                self._last_no_arb_reported = timestamp
+            return
+        for cycle in self._profitable_cycles:
+            if self.execute_cycle(cycle):
+                self._next_trade_timestamp = timestamp + self._next_trade_delay_interval
+                break
+
+    def build_graph(self):
+        """
+        Adds the markets to the graph, with their taker fee, and the rate oracle conversions between assets.
+        """
+        for market_info in self._market_infos:
+            fee = market_info.market.get_fee(market_info.base_asset,
+                                             market_info.quote_asset,
+                                             OrderType.LIMIT,
+                                             TradeType.BUY,
+                                             s_decimal_one,
+                                             market_info.get_mid_price())
+            self._graph.add_market(market_info, float(fee.percent))
+        self.update_conversion_rates()
+        self._graph.build()
+        triangular_count = len([c for c in self._graph.cycles if c.is_triangular])
+        self.logger().info(f"Looking for arbitrage on {len(self._graph.cycles)} paths "
+                           f"({triangular_count} triangular) between {len(self._market_infos)} markets.")
+
+    def update_conversion_rates(self):
+        for i, from_asset in enumerate(self._conversion_assets):
+            for to_asset in self._conversion_assets[i + 1:]:
+                rate = RateOracle.get_instance().rate(f"{from_asset}-{to_asset}")
+                if rate is not None:
+                    self._graph.set_conversion_rate(from_asset, to_asset, float(rate))
+
+    def has_active_orders(self) -> bool:
+        """
+        Returns True while the taker orders of the last arbitrage are not all done.
+        """
+        tracked_taker_orders = {**self.order_tracker.get_limit_orders(), **self.order_tracker.get_market_orders()}
+        return any(len(tracked_taker_orders.get(market_info, {})) > 0 for market_info in self._market_infos)
+
+    def execute_cycle(self, cycle: ArbitrageCycle) -> bool:
+        """
+        Sizes the trades of a cycle to the top of the order books and to the available balances, and submits their
+        taker orders.
+        :return: True if the orders were submitted
+        """
+        balances = [float(edge.market_info.market.get_available_balance(edge.from_asset))
+                    if not edge.is_conversion else float("inf") for edge in cycle.edges]
+        start_amount = cycle.max_start_amount(balances)
+        orders = []
+        for edge, from_amount in zip(cycle.edges, cycle.from_amounts(start_amount)):
+            if edge.is_conversion:
+                continue
+            market_info = edge.market_info
+            base_amount = from_amount / edge.price if edge.is_buy else from_amount
+            # Rounded first so that float error doesn't take the amount above the order book or balance amounts
+            amount = market_info.market.quantize_order_amount(market_info.trading_pair,
+                                                              Decimal("%.15g" % base_amount))
+            price = market_info.market.quantize_order_price(market_info.trading_pair, Decimal(repr(edge.price)))
+            if amount <= s_decimal_zero:
+                return False
+            orders.append((edge, amount, price))
+
+        self.log_with_clock(logging.INFO, f"Found arbitrage opportunity!: {cycle}")
+        for edge, amount, price in orders:
+            market_info = edge.market_info
+            place_order_fn = self.buy_with_specific_market if edge.is_buy else self.sell_with_specific_market
+            self.log_with_clock(logging.INFO,
+                                f"Placing {'BUY' if edge.is_buy else 'SELL'} order for {amount} {market_info.base_asset}"
+                                f" at {market_info.market.display_name} at {price} price")
+            place_order_fn(market_info, amount, market_info.market.get_taker_order_type(), price)
+        if self._hb_app_notification:
+            self.notify_hb_app(f"Arbitrage: {cycle}")
+        return True
+
+    def profitable_cycles_df(self, max_rows: int = 10) -> pd.DataFrame:
+        data = []
+        for cycle in self._profitable_cycles[:max_rows]:
+            data.append([", ".join(repr(edge) for edge in cycle.edges),
+                         f"{cycle.profitability:.2%}",
+                         PerformanceMetrics.smart_round(Decimal(repr(cycle.max_start_amount())), 8),
+                         cycle.start_asset])
+        return pd.DataFrame(data=data, columns=["Path", "Profitability", "Top Amount", "Asset"])
+
+    async def format_status(self) -> str:
+        if not self._all_markets_ready:
+            return "  The strategy is not ready, please try again later."
+        lines = []
+        markets_df = self.market_status_data_frame(self._market_infos)
+        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
+
+        assets_df = self.wallet_balance_data_frame(self._market_infos)
+        lines.extend(["", "  Assets:"] + ["    " + line for line in assets_df.to_string(index=False).split("\n")])
+
+        lines.extend(["", f"  Paths: {len(self._graph.cycles)}, profitable: {len(self._profitable_cycles)}"])
+        if len(self._profitable_cycles) > 0:
+            cycles_df = self.profitable_cycles_df()
+            lines.extend(["    " + line for line in cycles_df.to_string(index=False).split("\n")])
+
+        warning_lines = self.network_warning(self._market_infos)
+        warning_lines.extend(self.balance_warning(self._market_infos))
+        if len(warning_lines) > 0:
+            lines.extend(["", "*** WARNINGS ***"] + warning_lines)
+        return "\n".join(lines)
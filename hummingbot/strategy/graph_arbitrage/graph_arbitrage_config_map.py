@@ -0,0 +1,118 @@
+import re
+from decimal import Decimal
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.client.config.config_validators import (
+    validate_decimal,
+    validate_exchange,
+    validate_int,
+)
+import hummingbot.client.settings as settings
+
+
+def parse_markets(value: str) -> Dict[str, List[str]]:
+    """
+    Parses the markets config value, e.g. binance:ETH-USDT,BTC-USDT,ETH-BTC;kucoin:ETH-USDT
+    :return: a dictionary of the trading pairs by exchange
+    """
+    markets = {}
+    for exchange_markets in value.split(";"):
+        exchange, trading_pairs = exchange_markets.split(":")
+        markets[exchange.strip().lower()] = [p.strip().upper() for p in trading_pairs.split(",")]
+    return markets
+
+
+def parse_conversion_assets(value: Optional[str]) -> List[str]:
+    if value is None or len(value.strip()) == 0:
+        return []
+    return [a.strip().upper() for a in value.split(",")]
+
+
+def markets_validate(value: str) -> Optional[str]:
+    if len(value.strip()) == 0:
+        return "Invalid markets. The given entry is empty."
+    for exchange_markets in value.split(";"):
+        if exchange_markets.count(":") != 1:
+            return f"Invalid markets. {exchange_markets} is not in the exchange:TRADING-PAIR,TRADING-PAIR format."
+        exchange, trading_pairs = exchange_markets.split(":")
+        error = validate_exchange(exchange.strip().lower())
+        if error is not None:
+            return error
+        for trading_pair in trading_pairs.split(","):
+            tokens = trading_pair.strip().split("-")
+            if len(tokens) != 2 or not all(re.match("^[a-zA-Z0-9]+$", t) for t in tokens):
+                return f"Invalid market. {trading_pair} is not a valid trading pair."
+    if sum(len(pairs) for pairs in parse_markets(value).values()) < 2:
+        return "Invalid markets. At least 2 markets are required."
+
+
+def markets_on_validated(value: str):
+    settings.required_exchanges.extend(parse_markets(value).keys())
+
+
+def conversion_assets_validate(value: str) -> Optional[str]:
+    assets = parse_conversion_assets(value)
+    if len(assets) == 1:
+        return "Invalid conversion assets. At least 2 assets are required."
+    for asset in assets:
+        if not re.match("^[A-Z0-9]+$", asset):
+            return f"Invalid conversion assets. {asset} is not a valid asset."
+
+
+def conversion_assets_on_validated(value: str):
+    assets = parse_conversion_assets(value)
+    settings.required_rate_oracle = len(assets) > 0
+    settings.rate_oracle_pairs = [f"{b}-{a}" for i, a in enumerate(assets) for b in assets[i + 1:]]
+
+
+graph_arbitrage_config_map = {
+    "strategy": ConfigVar(
+        key="strategy",
+        prompt="",
+        default="graph_arbitrage"
+    ),
+    "markets": ConfigVar(
+        key="markets",
+        prompt="Enter the spot connectors and their trading pairs to arbitrage "
+               "(e.g. binance:ETH-USDT,BTC-USDT,ETH-BTC;kucoin:ETH-USDT) >>> ",
+        prompt_on_new=True,
+        validator=markets_validate,
+        on_validated=markets_on_validated,
+    ),
+    "min_profitability": ConfigVar(
+        key="min_profitability",
+        prompt="What is the minimum profitability for you to make a trade? (Enter 1 to indicate 1%) >>> ",
+        prompt_on_new=True,
+        default=Decimal("0.3"),
+        validator=lambda v: validate_decimal(v, Decimal(0), Decimal("100"), inclusive=True),
+        type_str="decimal",
+    ),
+    "max_path_length": ConfigVar(
+        key="max_path_length",
+        prompt="What is the maximum number of trades in an arbitrage path? (Enter 3 to include triangular paths) >>> ",
+        default=3,
+        validator=lambda v: validate_int(v, 2, 4),
+        type_str="int",
+    ),
+    "conversion_assets": ConfigVar(
+        key="conversion_assets",
+        prompt="Enter the assets that can be converted between each other using the rate oracle, if any "
+               "(e.g. USDT,USDC,BUSD) >>> ",
+        default="",
+        validator=conversion_assets_validate,
+        on_validated=conversion_assets_on_validated,
+        type_str="str",
+    ),
+    "next_trade_delay_interval": ConfigVar(
+        key="next_trade_delay_interval",
+        prompt="How long do you want to wait after an arbitrage before looking for the next one (in seconds)? >>> ",
+        default=15.,
+        validator=lambda v: validate_decimal(v, 0, inclusive=True),
+        type_str="float",
+    ),
+}
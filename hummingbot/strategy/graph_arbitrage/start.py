@@ -0,0 +1,34 @@
+from typing import List, Tuple
+
+from hummingbot.strategy.graph_arbitrage.graph_arbitrage import GraphArbitrageStrategy
+from hummingbot.strategy.graph_arbitrage.graph_arbitrage_config_map import (
+    graph_arbitrage_config_map as c_map,
+    parse_conversion_assets,
+    parse_markets,
+)
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+
+def start(self):
+    markets = parse_markets(c_map.get("markets").value)
+    min_profitability = c_map.get("min_profitability").value / 100
+    max_path_length = c_map.get("max_path_length").value
+    conversion_assets = parse_conversion_assets(c_map.get("conversion_assets").value)
+    next_trade_delay_interval = c_map.get("next_trade_delay_interval").value
+
+    market_names: List[Tuple[str, List[str]]] = list(markets.items())
+    self._initialize_markets(market_names)
+    market_infos = []
+    for exchange, trading_pairs in markets.items():
+        for trading_pair in trading_pairs:
+            base, quote = trading_pair.split("-")
+            market_infos.append(MarketTradingPairTuple(self.markets[exchange], trading_pair, base, quote))
+    self.market_trading_pair_tuples = market_infos
+
+    self.strategy = GraphArbitrageStrategy()
+    self.strategy.init_params(market_infos=market_infos,
+                              min_profitability=min_profitability,
+                              max_path_length=max_path_length,
+                              conversion_assets=conversion_assets,
+                              next_trade_delay_interval=next_trade_delay_interval,
+                              hb_app_notification=True)
@@ -4,19 +4,16 @@ import asyncio
 from typing import Dict, List, Set
 import pandas as pd
 import numpy as np
-from statistics import mean
 from hummingbot.core.clock import Clock
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from .data_types import Proposal, PriceSize
+from .quoting_engine import QuotingEngine, Quotes
 from hummingbot.core.event.events import OrderType, TradeType
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.utils.estimate_fee import estimate_fee
-from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
-    calculate_bid_ask_ratios_from_base_asset_ratio
-)
 from hummingbot.connector.parrot import get_campaign_summary
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.strategy.utils import order_age
@@ -75,10 +72,7 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._ready_to_trade = False
         self._refresh_times = {market: 0 for market in market_infos}
         self._token_balances = {}
-        self._sell_budgets = {}
-        self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
+        self._quoting_engine = QuotingEngine(list(market_infos), volatility_interval, avg_volatility_period)
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
 
@@ -93,12 +87,21 @@ class LiquidityMiningStrategy(StrategyPyBase):
         return [o[1] for o in limit_orders]
 
     @property
-    def sell_budgets(self):
-        return self._sell_budgets
+    def sell_budgets(self) -> Dict[str, Decimal]:
+        return {market: Decimal(str(budget))
+                for market, budget in zip(self._quoting_engine.markets, self._quoting_engine.sell_budgets)}
 
     @property
-    def buy_budgets(self):
-        return self._buy_budgets
+    def buy_budgets(self) -> Dict[str, Decimal]:
+        return {market: Decimal(str(budget))
+                for market, budget in zip(self._quoting_engine.markets, self._quoting_engine.buy_budgets)}
+
+    def market_volatility(self, market: str) -> Decimal:
+        """
+        The volatility of the market, NaN until it is calculated
+        """
+        volatility = self._quoting_engine.volatility[self._quoting_engine.market_index(market)]
+        return s_decimal_nan if np.isnan(volatility) else Decimal(str(volatility))
 
     def tick(self, timestamp: float):
         """
@@ -117,11 +120,12 @@ class LiquidityMiningStrategy(StrategyPyBase):
 
         self.update_mid_prices()
         self.update_volatility()
-        proposals = self.create_base_proposals()
+        quotes = self.create_base_proposals()
         self._token_balances = self.adjusted_available_balances()
         if self._inventory_skew_enabled:
-            self.apply_inventory_skew(proposals)
-        self.apply_budget_constraint(proposals)
+            self.apply_inventory_skew(quotes)
+        self.apply_budget_constraint(quotes)
+        proposals = self.quantize_proposals(quotes)
         self.cancel_active_orders(proposals)
         self.execute_orders_proposal(proposals)
 
@@ -160,10 +164,12 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         data = []
         columns = ["Market", f"Budget({self._token})", "Base bal", "Quote bal", "Base/Quote"]
+        sell_budgets = self.sell_budgets
+        buy_budgets = self.buy_budgets
         for market, market_info in self._market_infos.items():
             mid_price = market_info.get_mid_price()
-            base_bal = self._sell_budgets[market]
-            quote_bal = self._buy_budgets[market]
+            base_bal = sell_budgets[market]
+            quote_bal = buy_budgets[market]
             total_bal_in_quote = (base_bal * mid_price) + quote_bal
             total_bal_in_token = total_bal_in_quote
             if not self.is_token_a_quote_token():
@@ -193,12 +199,13 @@ class LiquidityMiningStrategy(StrategyPyBase):
             best_ask = self._exchange.get_price(market, True)
             best_bid_pct = abs(best_bid - mid_price) / mid_price
             best_ask_pct = (best_ask - mid_price) / mid_price
+            volatility = self.market_volatility(market)
             data.append([
                 market,
                 float(mid_price),
                 f"{best_bid_pct:.2%}",
                 f"{best_ask_pct:.2%}",
-                "" if self._volatility[market].is_nan() else f"{self._volatility[market]:.2%}",
+                "" if volatility.is_nan() else f"{volatility:.2%}",
             ])
         df = pd.DataFrame(data=data, columns=columns).replace(np.nan, '', regex=True)
         df.sort_values(by=["Market"], inplace=True)
@@ -266,26 +273,27 @@ class LiquidityMiningStrategy(StrategyPyBase):
     def stop(self, clock: Clock):
         pass
 
-    def create_base_proposals(self):
+    def create_base_proposals(self) -> Quotes:
         """
         Each tick this strategy creates a set of proposals based on the market_info and the parameters from the
-        constructor.
+        constructor. The proposals of all markets are computed at once by the quoting engine.
+        """
+        return self._quoting_engine.base_quotes(self._token,
+                                                float(self._order_amount),
+                                                float(self._spread),
+                                                float(self._volatility_to_spread_multiplier),
+                                                float(self._max_spread))
+
+    def quantize_proposals(self, quotes: Quotes) -> List[Proposal]:
+        """
+        Creates the proposals with the quotes prices and sizes quantized by the exchange trading rules.
         """
         proposals = []
-        for market, market_info in self._market_infos.items():
-            spread = self._spread
-            if not self._volatility[market].is_nan():
-                # volatility applies only when it is higher than the spread setting.
-                spread = max(spread, self._volatility[market] * self._volatility_to_spread_multiplier)
-            if self._max_spread > s_decimal_zero:
-                spread = min(spread, self._max_spread)
-            mid_price = market_info.get_mid_price()
-            buy_price = mid_price * (Decimal("1") - spread)
-            buy_price = self._exchange.quantize_order_price(market, buy_price)
-            buy_size = self.base_order_size(market, buy_price)
-            sell_price = mid_price * (Decimal("1") + spread)
-            sell_price = self._exchange.quantize_order_price(market, sell_price)
-            sell_size = self.base_order_size(market, sell_price)
+        for index, market in enumerate(self._quoting_engine.markets):
+            buy_price = self._exchange.quantize_order_price(market, Decimal(str(quotes.buy_prices[index])))
+            buy_size = self._exchange.quantize_order_amount(market, Decimal(str(quotes.buy_sizes[index])))
+            sell_price = self._exchange.quantize_order_price(market, Decimal(str(quotes.sell_prices[index])))
+            sell_size = self._exchange.quantize_order_amount(market, Decimal(str(quotes.sell_sizes[index])))
             proposals.append(Proposal(market, PriceSize(buy_price, buy_size), PriceSize(sell_price, sell_size)))
         return proposals
 
@@ -307,23 +315,25 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         Create buy and sell budgets for every market
         """
-        self._sell_budgets = {m: s_decimal_zero for m in self._market_infos}
-        self._buy_budgets = {m: s_decimal_zero for m in self._market_infos}
+        sell_budgets = {m: s_decimal_zero for m in self._market_infos}
+        buy_budgets = {m: s_decimal_zero for m in self._market_infos}
         portfolio_value = self.total_port_value_in_token()
         market_portion = portfolio_value / len(self._market_infos)
         balances = self.adjusted_available_balances()
         for market, market_info in self._market_infos.items():
             base, quote = market.split("-")
             if self.is_token_a_quote_token():
-                self._sell_budgets[market] = balances[base]
+                sell_budgets[market] = balances[base]
                 buy_budget = market_portion - (balances[base] * market_info.get_mid_price())
                 if buy_budget > s_decimal_zero:
-                    self._buy_budgets[market] = buy_budget
+                    buy_budgets[market] = buy_budget
             else:
-                self._buy_budgets[market] = balances[quote]
+                buy_budgets[market] = balances[quote]
                 sell_budget = market_portion - (balances[quote] / market_info.get_mid_price())
                 if sell_budget > s_decimal_zero:
-                    self._sell_budgets[market] = sell_budget
+                    sell_budgets[market] = sell_budget
+        self._quoting_engine.sell_budgets = np.array([float(sell_budgets[m]) for m in self._quoting_engine.markets])
+        self._quoting_engine.buy_budgets = np.array([float(buy_budgets[m]) for m in self._quoting_engine.markets])
 
     def base_order_size(self, trading_pair: str, price: Decimal = s_decimal_zero):
         base, quote = trading_pair.split("-")
@@ -333,20 +343,16 @@ class LiquidityMiningStrategy(StrategyPyBase):
             price = self._market_infos[trading_pair].get_mid_price()
         return self._order_amount / price
 
-    def apply_budget_constraint(self, proposals: List[Proposal]):
-        balances = self._token_balances.copy()
-        for proposal in proposals:
-            if balances[proposal.base()] < proposal.sell.size:
-                proposal.sell.size = balances[proposal.base()]
-            proposal.sell.size = self._exchange.quantize_order_amount(proposal.market, proposal.sell.size)
-            balances[proposal.base()] -= proposal.sell.size
-
-            quote_size = proposal.buy.size * proposal.buy.price
-            quote_size = balances[proposal.quote()] if balances[proposal.quote()] < quote_size else quote_size
-            buy_fee = estimate_fee(self._exchange.name, True)
-            buy_size = quote_size / (proposal.buy.price * (Decimal("1") + buy_fee.percent))
-            proposal.buy.size = self._exchange.quantize_order_amount(proposal.market, buy_size)
-            balances[proposal.quote()] -= quote_size
+    def apply_budget_constraint(self, quotes: Quotes):
+        """
+        Reduces the quotes sizes to the available balances
+        """
+        buy_fee = estimate_fee(self._exchange.name, True)
+        self._quoting_engine.apply_budget_constraint(
+            quotes,
+            {token: float(balance) for token, balance in self._token_balances.items()},
+            float(buy_fee.percent)
+        )
 
     def is_within_tolerance(self, cur_orders: List[LimitOrder], proposal: Proposal):
         """
@@ -417,8 +423,9 @@ class LiquidityMiningStrategy(StrategyPyBase):
                     price=proposal.sell.price
                 )
             if proposal.buy.size > 0 or proposal.sell.size > 0:
-                if not self._volatility[proposal.market].is_nan() and spread > self._spread:
-                    adjusted_vol = self._volatility[proposal.market] * self._volatility_to_spread_multiplier
+                volatility = self.market_volatility(proposal.market)
+                if not volatility.is_nan() and spread > self._spread:
+                    adjusted_vol = volatility * self._volatility_to_spread_multiplier
                     if adjusted_vol > self._spread:
                         self.logger().info(f"({proposal.market}) Spread is widened to {spread:.2%} due to high "
                                            f"market volatility")
@@ -480,24 +487,13 @@ class LiquidityMiningStrategy(StrategyPyBase):
                 adjusted_bals[base] += order.quantity
         return adjusted_bals
 
-    def apply_inventory_skew(self, proposals: List[Proposal]):
+    def apply_inventory_skew(self, quotes: Quotes):
         """
         Apply an inventory split between the quote and base asset
         """
-        for proposal in proposals:
-            buy_budget = self._buy_budgets[proposal.market]
-            sell_budget = self._sell_budgets[proposal.market]
-            mid_price = self._market_infos[proposal.market].get_mid_price()
-            total_order_size = proposal.sell.size + proposal.buy.size
-            bid_ask_ratios = calculate_bid_ask_ratios_from_base_asset_ratio(
-                float(sell_budget),
-                float(buy_budget),
-                float(mid_price),
-                float(self._target_base_pct),
-                float(total_order_size * self._inventory_range_multiplier)
-            )
-            proposal.buy.size *= Decimal(bid_ask_ratios.bid_ratio)
-            proposal.sell.size *= Decimal(bid_ask_ratios.ask_ratio)
+        self._quoting_engine.apply_inventory_skew(quotes,
+                                                  float(self._target_base_pct),
+                                                  float(self._inventory_range_multiplier))
 
     def did_fill_order(self, event):
         """
@@ -506,51 +502,38 @@ class LiquidityMiningStrategy(StrategyPyBase):
         order_id = event.order_id
         market_info = self.order_tracker.get_shadow_market_pair_from_order_id(order_id)
         if market_info is not None:
+            index = self._quoting_engine.market_index(market_info.trading_pair)
             if event.trade_type is TradeType.BUY:
                 msg = f"({market_info.trading_pair}) Maker BUY order (price: {event.price}) of {event.amount} " \
                       f"{market_info.base_asset} is filled."
                 self.log_with_clock(logging.INFO, msg)
                 self.notify_hb_app_with_timestamp(msg)
-                self._buy_budgets[market_info.trading_pair] -= (event.amount * event.price)
-                self._sell_budgets[market_info.trading_pair] += event.amount
+                self._quoting_engine.buy_budgets[index] -= float(event.amount * event.price)
+                self._quoting_engine.sell_budgets[index] += float(event.amount)
             else:
                 msg = f"({market_info.trading_pair}) Maker SELL order (price: {event.price}) of {event.amount} " \
                       f"{market_info.base_asset} is filled."
                 self.log_with_clock(logging.INFO, msg)
                 self.notify_hb_app_with_timestamp(msg)
-                self._sell_budgets[market_info.trading_pair] -= event.amount
-                self._buy_budgets[market_info.trading_pair] += (event.amount * event.price)
+                self._quoting_engine.sell_budgets[index] -= float(event.amount)
+                self._quoting_engine.buy_budgets[index] += float(event.amount * event.price)
 
     def update_mid_prices(self):
         """
         Query asset markets for mid price
         """
-        for market in self._market_infos:
-            mid_price = self._market_infos[market].get_mid_price()
-            self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
+        self._quoting_engine.update_mid_prices(
+            [float(self._market_infos[market].get_mid_price()) for market in self._quoting_engine.markets]
+        )
 
     def update_volatility(self):
         """
         Update volatility data from the market
         """
-        self._volatility = {market: s_decimal_nan for market in self._market_infos}
-        for market, mid_prices in self._mid_prices.items():
-            last_index = len(mid_prices) - 1
-            atr = []
-            first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
-            first_index = max(first_index, 0)
-            for i in range(last_index, first_index, self._volatility_interval * -1):
-                prices = mid_prices[i - self._volatility_interval + 1: i + 1]
-                if not prices:
-                    break
-                atr.append((max(prices) - min(prices)) / min(prices))
-            if atr:
-                self._volatility[market] = mean(atr)
+        self._quoting_engine.update_volatility()
         if self._last_vol_reported < self.current_timestamp - self._volatility_interval:
-            for market, vol in self._volatility.items():
+            for market in self._quoting_engine.markets:
+                vol = self.market_volatility(market)
                 if not vol.is_nan():
                     self.logger().info(f"{market} volatility: {vol:.2%}")
             self._last_vol_reported = self.current_timestamp
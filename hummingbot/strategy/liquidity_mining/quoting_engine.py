@@ -0,0 +1,204 @@
+"""
+Vectorized quoting for the liquidity mining strategy.
+The state of every market (mid prices, volatility, budgets) is kept in numpy arrays aligned on the markets order, so the
+proposals of all the markets are computed at once instead of market by market.
+"""
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+class Quotes:
+    """
+    Order prices and sizes of all markets, aligned on the quoting engine markets.
+    """
+    def __init__(self, buy_prices: np.ndarray, buy_sizes: np.ndarray, sell_prices: np.ndarray,
+                 sell_sizes: np.ndarray):
+        self.buy_prices: np.ndarray = buy_prices
+        self.buy_sizes: np.ndarray = buy_sizes
+        self.sell_prices: np.ndarray = sell_prices
+        self.sell_sizes: np.ndarray = sell_sizes
+
+    def __repr__(self):
+        return f"buy: {self.buy_prices} {self.buy_sizes} sell: {self.sell_prices} {self.sell_sizes}"
+
+
+def calculate_bid_ask_ratios_from_base_asset_ratios(
+        base_asset_amounts: np.ndarray, quote_asset_amounts: np.ndarray, prices: np.ndarray,
+        target_base_asset_ratio: float, base_asset_ranges: np.ndarray) -> (np.ndarray, np.ndarray):
+    """
+    Same as pure_market_making.inventory_skew_calculator.calculate_bid_ask_ratios_from_base_asset_ratio for many
+    markets at once.
+    :return: the bid ratios and the ask ratios
+    """
+    total_portfolio_values = base_asset_amounts * prices + quote_asset_amounts
+    base_asset_values = base_asset_amounts * prices
+    base_asset_range_values = np.minimum(base_asset_ranges * prices, total_portfolio_values * 0.5)
+    target_base_asset_values = total_portfolio_values * target_base_asset_ratio
+    left_limits = np.maximum(target_base_asset_values - base_asset_range_values, 0.0)
+    right_limits = target_base_asset_values + base_asset_range_values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        left_inventory_ratios = np.where(
+            base_asset_values <= left_limits,
+            0.0,
+            0.5 * (base_asset_values - left_limits) / (target_base_asset_values - left_limits))
+        right_inventory_ratios = np.where(
+            base_asset_values >= right_limits,
+            1.0,
+            0.5 + 0.5 * (base_asset_values - target_base_asset_values) / (right_limits - target_base_asset_values))
+    inventory_ratios = np.where(base_asset_values < target_base_asset_values,
+                                left_inventory_ratios,
+                                right_inventory_ratios)
+    bid_ratios = 2.0 - 2.0 * inventory_ratios
+    no_skew = (total_portfolio_values <= 0.0) | (base_asset_ranges <= 0.0)
+    bid_ratios = np.where(no_skew, 0.0, bid_ratios)
+    ask_ratios = np.where(no_skew, 0.0, 2.0 - bid_ratios)
+    return bid_ratios, ask_ratios
+
+
+class QuotingEngine:
+    """
+    Keeps the markets state in arrays and computes the order proposals of all markets in one pass.
+    Budgets and balances are shared between the markets in the markets order, as with a market by market loop.
+    """
+    def __init__(self, markets: List[str], volatility_interval: int, avg_volatility_period: int):
+        self._markets: List[str] = list(markets)
+        self._market_index: Dict[str, int] = {market: index for index, market in enumerate(self._markets)}
+        base_tokens = [market.split("-")[0] for market in self._markets]
+        quote_tokens = [market.split("-")[1] for market in self._markets]
+        self._tokens: List[str] = sorted(set(base_tokens + quote_tokens))
+        token_index = {token: index for index, token in enumerate(self._tokens)}
+        # The token of the sell (base) then buy (quote) order of each market
+        self._balance_token_indexes: np.ndarray = np.empty(2 * len(self._markets), dtype=np.int64)
+        self._balance_token_indexes[0::2] = [token_index[token] for token in base_tokens]
+        self._balance_token_indexes[1::2] = [token_index[token] for token in quote_tokens]
+        self._is_token_base: Dict[str, np.ndarray] = {}
+
+        self._volatility_interval = volatility_interval
+        self._history_length = volatility_interval * avg_volatility_period
+        self._price_history: np.ndarray = np.zeros((len(self._markets), self._history_length), dtype=np.float64)
+        self._history_count = 0
+        self._history_position = 0
+
+        self.mid_prices: np.ndarray = np.full(len(self._markets), np.nan)
+        self.volatility: np.ndarray = np.full(len(self._markets), np.nan)
+        self.buy_budgets: np.ndarray = np.zeros(len(self._markets), dtype=np.float64)
+        self.sell_budgets: np.ndarray = np.zeros(len(self._markets), dtype=np.float64)
+
+    @property
+    def markets(self) -> List[str]:
+        return self._markets
+
+    @property
+    def tokens(self) -> List[str]:
+        return self._tokens
+
+    def market_index(self, market: str) -> int:
+        return self._market_index[market]
+
+    def update_mid_prices(self, mid_prices: Sequence[float]):
+        """
+        Stores the current mid prices, only the prices needed for the volatility calculation are kept.
+        """
+        self.mid_prices = np.asarray(mid_prices, dtype=np.float64)
+        self._price_history[:, self._history_position] = self.mid_prices
+        self._history_position = (self._history_position + 1) % self._history_length
+        self._history_count = min(self._history_count + 1, self._history_length)
+
+    def update_volatility(self):
+        """
+        The volatility is the average of the price range ((max - min) / min) over each volatility interval, counting the
+        intervals back from the last price. Until there are enough prices for an interval, all the prices are used.
+        """
+        if self._history_count == 0:
+            self.volatility = np.full(len(self._markets), np.nan)
+            return
+        if self._history_count < self._volatility_interval:
+            windows_count, window_length = 1, self._history_count
+        else:
+            windows_count, window_length = self._history_count // self._volatility_interval, self._volatility_interval
+        length = windows_count * window_length
+        indexes = (self._history_position - length + np.arange(length)) % self._history_length
+        windows = self._price_history[:, indexes].reshape(len(self._markets), windows_count, window_length)
+        min_prices = windows.min(axis=2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.volatility = ((windows.max(axis=2) - min_prices) / min_prices).mean(axis=1)
+
+    def spreads(self, spread: float, volatility_to_spread_multiplier: float, max_spread: float) -> np.ndarray:
+        """
+        The spread of each market, widened by the volatility when it is higher than the spread setting and capped by
+        max_spread when it is positive.
+        """
+        spreads = np.full(len(self._markets), spread)
+        volatility_spreads = self.volatility * volatility_to_spread_multiplier
+        spreads = np.where(np.isnan(volatility_spreads), spreads, np.maximum(spreads, volatility_spreads))
+        if max_spread > 0:
+            spreads = np.minimum(spreads, max_spread)
+        return spreads
+
+    def base_quotes(self, token: str, order_amount: float, spread: float, volatility_to_spread_multiplier: float,
+                    max_spread: float) -> Quotes:
+        """
+        Creates the buy and sell quotes around the mid prices, the order amount is in token which is either the base
+        or the quote token of the markets.
+        """
+        spreads = self.spreads(spread, volatility_to_spread_multiplier, max_spread)
+        buy_prices = self.mid_prices * (1 - spreads)
+        sell_prices = self.mid_prices * (1 + spreads)
+        if token not in self._is_token_base:
+            self._is_token_base[token] = np.array([market.split("-")[0] == token for market in self._markets])
+        is_token_base = self._is_token_base[token]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            buy_sizes = np.where(is_token_base, order_amount, order_amount / buy_prices)
+            sell_sizes = np.where(is_token_base, order_amount, order_amount / sell_prices)
+        return Quotes(buy_prices, buy_sizes, sell_prices, sell_sizes)
+
+    def apply_inventory_skew(self, quotes: Quotes, target_base_pct: float, inventory_range_multiplier: float):
+        """
+        Skews the order sizes of each market toward its target base asset ratio of the market budgets.
+        """
+        total_order_sizes = quotes.sell_sizes + quotes.buy_sizes
+        bid_ratios, ask_ratios = calculate_bid_ask_ratios_from_base_asset_ratios(
+            self.sell_budgets,
+            self.buy_budgets,
+            self.mid_prices,
+            target_base_pct,
+            total_order_sizes * inventory_range_multiplier
+        )
+        quotes.buy_sizes = quotes.buy_sizes * bid_ratios
+        quotes.sell_sizes = quotes.sell_sizes * ask_ratios
+
+    def apply_budget_constraint(self, quotes: Quotes, balances: Dict[str, float], buy_fee_pct: float):
+        """
+        Reduces the order sizes to the available balances. The balances are used market after market, by the sell
+        order (base token) then the buy order (quote token) of each market.
+        """
+        token_balances = np.array([balances.get(token, 0.) for token in self._tokens], dtype=np.float64)
+        # The sell and buy amounts of each market, interleaved in the order the balances are used
+        amounts = np.empty(2 * len(self._markets), dtype=np.float64)
+        amounts[0::2] = np.nan_to_num(quotes.sell_sizes)
+        amounts[1::2] = np.nan_to_num(quotes.buy_sizes * quotes.buy_prices)
+        used_amounts = _exclusive_cumsum_by_group(amounts, self._balance_token_indexes)
+        amounts = np.clip(token_balances[self._balance_token_indexes] - used_amounts, 0., amounts)
+        quotes.sell_sizes = amounts[0::2]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            buy_sizes = amounts[1::2] / (quotes.buy_prices * (1 + buy_fee_pct))
+        quotes.buy_sizes = np.nan_to_num(buy_sizes, posinf=0.)
+
+
+def _exclusive_cumsum_by_group(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """
+    For each value, the sum of the values before it (in the array order) which are in the same group.
+    """
+    order = np.argsort(groups, kind="stable")
+    sorted_values = values[order]
+    sorted_groups = groups[order]
+    sums_before = np.cumsum(sorted_values) - sorted_values
+    group_starts = np.ones(len(values), dtype=bool)
+    group_starts[1:] = sorted_groups[1:] != sorted_groups[:-1]
+    # The cumulated sum at the start of each group, carried forward over the group
+    group_offsets = sums_before[np.maximum.accumulate(np.where(group_starts, np.arange(len(values)), 0))]
+    result = np.empty(len(values), dtype=np.float64)
+    result[order] = sums_before - group_offsets
+    return result
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 
 from .pure_market_making import PureMarketMakingStrategy
+from .pure_market_making_multi_pair import PureMarketMakingMultiPairStrategy
 from .inventory_cost_price_delegate import InventoryCostPriceDelegate
 __all__ = [
     PureMarketMakingStrategy,
+    PureMarketMakingMultiPairStrategy,
     InventoryCostPriceDelegate,
 ]
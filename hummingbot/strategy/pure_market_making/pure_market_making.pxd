@@ -52,7 +52,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         double _status_report_interval
         int64_t _logging_options
         object _last_own_trade_price
+        dict _shared_available_balances
+        dict _shared_used_balances
 
+    cdef bint c_tick_markets_ready(self, double timestamp)
+    cdef object c_create_proposal(self)
+    cdef c_cancel_orders(self, object proposal)
+    cdef c_create_orders(self, object proposal)
+    cdef c_set_shared_balances(self, dict available_balances, dict used_balances)
     cdef object c_get_mid_price(self)
     cdef object c_create_base_proposal(self)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
@@ -149,6 +149,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_timestamp = 0
         self._status_report_interval = status_report_interval
         self._last_own_trade_price = Decimal('nan')
+        self._shared_available_balances = None
+        self._shared_used_balances = None
 
         self.c_add_markets([market_info.market])
 
@@ -679,6 +681,20 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         StrategyBase.c_stop(self, clock)
 
     cdef c_tick(self, double timestamp):
+        cdef object proposal
+        try:
+            if not self.c_tick_markets_ready(timestamp):
+                return
+            proposal = self.c_create_proposal()
+            self.c_cancel_orders(proposal)
+            self.c_create_orders(proposal)
+        finally:
+            self._last_timestamp = timestamp
+
+    cdef bint c_tick_markets_ready(self, double timestamp):
+        """
+        Starts the tick, returns whether the markets are ready for market making.
+        """
         StrategyBase.c_tick(self, timestamp)
 
         cdef:
@@ -686,50 +702,63 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             int64_t last_tick = <int64_t>(self._last_timestamp // self._status_report_interval)
             bint should_report_warnings = ((current_tick > last_tick) and
                                            (self._logging_options & self.OPTION_LOG_STATUS_REPORT))
-            cdef object proposal
-        try:
+        if not self._all_markets_ready:
+            self._all_markets_ready = all([market.ready for market in self._sb_markets])
+            if self._asset_price_delegate is not None and self._all_markets_ready:
+                self._all_markets_ready = self._asset_price_delegate.ready
             if not self._all_markets_ready:
-                self._all_markets_ready = all([market.ready for market in self._sb_markets])
-                if self._asset_price_delegate is not None and self._all_markets_ready:
-                    self._all_markets_ready = self._asset_price_delegate.ready
-                if not self._all_markets_ready:
-                    # Markets not ready yet. Don't do anything.
-                    if should_report_warnings:
-                        self.logger().warning(f"Markets are not ready. No market making trades are permitted.")
-                    return
-
-            if should_report_warnings:
-                if not all([market.network_status is NetworkStatus.CONNECTED for market in self._sb_markets]):
-                    self.logger().warning(f"WARNING: Some markets are not connected or are down at the moment. Market "
-                                          f"making may be dangerous when markets or networks are unstable.")
-
-            proposal = None
-            asset_mid_price = Decimal("0")
-            # asset_mid_price = self.c_set_mid_price(market_info)
-            if self._create_timestamp <= self._current_timestamp:
-                # 1. Create base order proposals
-                proposal = self.c_create_base_proposal()
-                # 2. Apply functions that limit numbers of buys and sells proposal
-                self.c_apply_order_levels_modifiers(proposal)
-                # 3. Apply functions that modify orders price
-                self.c_apply_order_price_modifiers(proposal)
-                # 4. Apply functions that modify orders size
-                self.c_apply_order_size_modifiers(proposal)
-                # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
-                self.c_apply_budget_constraint(proposal)
-
-                if not self._take_if_crossed:
-                    self.c_filter_out_takers(proposal)
-
-            self._hanging_orders_tracker.process_tick()
-
-            self.c_cancel_active_orders_on_max_age_limit()
-            self.c_cancel_active_orders(proposal)
-            self.c_cancel_orders_below_min_spread()
-            if self.c_to_create_orders(proposal):
-                self.c_execute_orders_proposal(proposal)
-        finally:
-            self._last_timestamp = timestamp
+                # Markets not ready yet. Don't do anything.
+                if should_report_warnings:
+                    self.logger().warning(f"Markets are not ready. No market making trades are permitted.")
+                return False
+
+        if should_report_warnings:
+            if not all([market.network_status is NetworkStatus.CONNECTED for market in self._sb_markets]):
+                self.logger().warning(f"WARNING: Some markets are not connected or are down at the moment. Market "
+                                      f"making may be dangerous when markets or networks are unstable.")
+        return True
+
+    cdef object c_create_proposal(self):
+        """
+        Creates the orders proposal of the tick, None if it is not time to create orders.
+        """
+        cdef object proposal = None
+        if self._create_timestamp <= self._current_timestamp:
+            # 1. Create base order proposals
+            proposal = self.c_create_base_proposal()
+            # 2. Apply functions that limit numbers of buys and sells proposal
+            self.c_apply_order_levels_modifiers(proposal)
+            # 3. Apply functions that modify orders price
+            self.c_apply_order_price_modifiers(proposal)
+            # 4. Apply functions that modify orders size
+            self.c_apply_order_size_modifiers(proposal)
+            # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
+            self.c_apply_budget_constraint(proposal)
+
+            if not self._take_if_crossed:
+                self.c_filter_out_takers(proposal)
+        return proposal
+
+    cdef c_cancel_orders(self, object proposal):
+        self._hanging_orders_tracker.process_tick()
+
+        self.c_cancel_active_orders_on_max_age_limit()
+        self.c_cancel_active_orders(proposal)
+        self.c_cancel_orders_below_min_spread()
+
+    cdef c_create_orders(self, object proposal):
+        if self.c_to_create_orders(proposal):
+            self.c_execute_orders_proposal(proposal)
+
+    cdef c_set_shared_balances(self, dict available_balances, dict used_balances):
+        """
+        Sets the balances shared with the strategies of other trading pairs of the market for the current tick.
+        :param available_balances: the available balance of each asset
+        :param used_balances: the amount of each asset used by the proposals of the other trading pairs, updated by
+        the budget constraint
+        """
+        self._shared_available_balances = available_balances
+        self._shared_used_balances = used_balances
 
     cdef object c_create_base_proposal(self):
         cdef:
@@ -796,8 +825,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         """
         cdef:
             ExchangeBase market = self._market_info.market
-            object base_balance = market.c_get_available_balance(self.base_asset)
-            object quote_balance = market.c_get_available_balance(self.quote_asset)
+            object base_balance
+            object quote_balance
+
+        if self._shared_available_balances is not None:
+            base_balance = self._shared_available_balances[self.base_asset]
+            quote_balance = self._shared_available_balances[self.quote_asset]
+        else:
+            base_balance = market.c_get_available_balance(self.base_asset)
+            quote_balance = market.c_get_available_balance(self.quote_asset)
 
         for order in orders:
             if order.is_buy:
@@ -882,6 +918,12 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             object adjusted_amount
 
         base_balance, quote_balance = self.c_get_adjusted_available_balance(self.active_non_hanging_orders)
+        if self._shared_used_balances is not None:
+            # The balances used by the proposals of the other trading pairs aren't available
+            base_balance = max(base_balance - self._shared_used_balances.get(self.base_asset, s_decimal_zero),
+                               s_decimal_zero)
+            quote_balance = max(quote_balance - self._shared_used_balances.get(self.quote_asset, s_decimal_zero),
+                                s_decimal_zero)
 
         for buy in proposal.buys:
             buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
@@ -916,6 +958,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         proposal.sells = [o for o in proposal.sells if o.size > 0]
 
+        if self._shared_used_balances is not None:
+            # What the proposal uses beyond the balance of the active orders, which are replaced, is no longer available
+            for asset, remaining_balance in ((self.base_asset, base_balance), (self.quote_asset, quote_balance)):
+                self._shared_used_balances[asset] = max(
+                    self._shared_used_balances.get(asset, s_decimal_zero),
+                    self._shared_available_balances[asset] - remaining_balance
+                )
+
     cdef c_filter_out_takers(self, object proposal):
         cdef:
             ExchangeBase market = self._market_info.market
@@ -1119,8 +1169,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             list active_orders = self.active_non_hanging_orders
 
         if active_orders and any(order_age(o) > self._max_order_age for o in active_orders):
-            for order in active_orders:
-                self.c_cancel_order(self._market_info, order.client_order_id)
+            self.c_batch_cancel_orders(self._market_info, [order.client_order_id for order in active_orders])
 
     cdef c_cancel_active_orders(self, object proposal):
         """
@@ -1154,10 +1203,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         if not to_defer_canceling:
             self._hanging_orders_tracker.update_strategy_orders_with_equivalent_orders()
-            for order in self.active_non_hanging_orders:
-                # If is about to be added to hanging_orders then don't cancel
-                if not self._hanging_orders_tracker.is_potential_hanging_order(order):
-                    self.c_cancel_order(self._market_info, order.client_order_id)
+            # If is about to be added to hanging_orders then don't cancel
+            self.c_batch_cancel_orders(self._market_info,
+                                       [order.client_order_id for order in self.active_non_hanging_orders
+                                        if not self._hanging_orders_tracker.is_potential_hanging_order(order)])
         # else:
         #     self.set_timers()
 
@@ -1168,13 +1217,15 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             object price = self.get_price()
         active_orders = [order for order in active_orders
                          if order.client_order_id not in self.hanging_order_ids]
+        cdef list order_ids_to_cancel = []
         for order in active_orders:
             negation = -1 if order.is_buy else 1
             if (negation * (order.price - price) / price) < self._minimum_spread:
                 self.logger().info(f"Order is below minimum spread ({self._minimum_spread})."
                                    f" Cancelling Order: ({'Buy' if order.is_buy else 'Sell'}) "
                                    f"ID - {order.client_order_id}")
-                self.c_cancel_order(self._market_info, order.client_order_id)
+                order_ids_to_cancel.append(order.client_order_id)
+        self.c_batch_cancel_orders(self._market_info, order_ids_to_cancel)
 
     cdef bint c_to_create_orders(self, object proposal):
         non_hanging_orders_non_cancelled = [o for o in self.active_non_hanging_orders if not
@@ -1190,8 +1241,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                                              (self._market_info.market.name == "bamboo_relay" and
                                               not self._market_info.market.use_coordinator))
                                          else NaN)
-            str bid_order_id, ask_order_id
-            bint orders_created = False
+            list orders = []
+            list order_ids
         # Number of pair of orders to track for hanging orders
         number_of_pairs = min((len(proposal.buys), len(proposal.sells))) if self._hanging_orders_enabled else 0
 
@@ -1204,20 +1255,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.buys)} bid orders "
                     f"at (Size, Price): {price_quote_str}"
                 )
-            for idx, buy in enumerate(proposal.buys):
-                bid_order_id = self.c_buy_with_specific_market(
-                    self._market_info,
-                    buy.size,
-                    order_type=self._limit_order_type,
-                    price=buy.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
-                    if order:
-                        self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
-                            CreatedPairOfOrders(order, None))
+            orders.extend([LimitOrder("", self.trading_pair, True, self.base_asset, self.quote_asset,
+                                      buy.price, buy.size)
+                           for buy in proposal.buys])
         if len(proposal.sells) > 0:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
                 price_quote_str = [f"{sell.size.normalize()} {self.base_asset}, "
@@ -1227,21 +1267,30 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.sells)} ask "
                     f"orders at (Size, Price): {price_quote_str}"
                 )
-            for idx, sell in enumerate(proposal.sells):
-                ask_order_id = self.c_sell_with_specific_market(
-                    self._market_info,
-                    sell.size,
-                    order_type=self._limit_order_type,
-                    price=sell.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
-                    if order:
-                        self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
-        if orders_created:
-            self.set_timers()
+            orders.extend([LimitOrder("", self.trading_pair, False, self.base_asset, self.quote_asset,
+                                      sell.price, sell.size)
+                           for sell in proposal.sells])
+        if len(orders) == 0:
+            return
+        # The bids and asks of the proposal are placed together
+        order_ids = self.c_batch_create_orders_with_specific_market(
+            self._market_info,
+            orders,
+            order_type=self._limit_order_type,
+            expiration_seconds=expiration_seconds
+        )
+        bid_order_ids = order_ids[:len(proposal.buys)]
+        ask_order_ids = order_ids[len(proposal.buys):]
+        for idx in range(number_of_pairs):
+            order = next((o for o in self.active_orders if o.client_order_id == bid_order_ids[idx]))
+            if order:
+                self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
+                    CreatedPairOfOrders(order, None))
+        for idx in range(number_of_pairs):
+            order = next((o for o in self.active_orders if o.client_order_id == ask_order_ids[idx]))
+            if order:
+                self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
+        self.set_timers()
 
     cdef set_timers(self):
         cdef double next_cycle = self._current_timestamp + self._order_refresh_time
@@ -19,7 +19,7 @@ from hummingbot.client.config.global_config_map import (
 from hummingbot.client.config.config_helpers import (
     minimum_order_amount,
 )
-from typing import Optional
+from typing import List, Optional
 
 
 def maker_trading_pair_prompt():
@@ -35,6 +35,24 @@ def validate_exchange_trading_pair(value: str) -> Optional[str]:
     return validate_market_trading_pair(exchange, value)
 
 
+def validate_additional_markets(value: str) -> Optional[str]:
+    exchange = pure_market_making_config_map.get("exchange").value
+    market = pure_market_making_config_map.get("market").value
+    trading_pairs = parse_additional_markets(value)
+    for trading_pair in trading_pairs:
+        error = validate_market_trading_pair(exchange, trading_pair)
+        if error is not None:
+            return error
+    if market in trading_pairs or len(set(trading_pairs)) < len(trading_pairs):
+        return "The trading pairs must be different from each other and from the market."
+
+
+def parse_additional_markets(value: Optional[str]) -> List[str]:
+    if value is None:
+        return []
+    return [trading_pair.strip().upper() for trading_pair in value.split(",") if trading_pair.strip() != ""]
+
+
 async def order_amount_prompt() -> str:
     exchange = pure_market_making_config_map["exchange"].value
     trading_pair = pure_market_making_config_map["market"].value
@@ -143,6 +161,14 @@ pure_market_making_config_map = {
                   prompt=maker_trading_pair_prompt,
                   validator=validate_exchange_trading_pair,
                   prompt_on_new=True),
+    "additional_markets":
+        ConfigVar(key="additional_markets",
+                  prompt="Enter the other trading pairs to market make with the same settings, separated by "
+                         "commas (e.g. ETH-USDT,BTC-USDT). The order amount is in the base asset of each "
+                         "trading pair >>> ",
+                  required_if=lambda: False,
+                  default=None,
+                  validator=validate_additional_markets),
     "bid_spread":
         ConfigVar(key="bid_spread",
                   prompt="How far away from the mid price do you want to place the "
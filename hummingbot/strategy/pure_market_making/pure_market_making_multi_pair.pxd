@@ -0,0 +1,10 @@
+# distutils: language=c++
+
+from hummingbot.strategy.strategy_base cimport StrategyBase
+
+
+cdef class PureMarketMakingMultiPairStrategy(StrategyBase):
+    cdef:
+        list _strategies
+
+    cdef dict c_get_available_balances(self)
@@ -0,0 +1,98 @@
+import logging
+from typing import List
+
+from hummingbot.core.clock cimport Clock
+from hummingbot.strategy.strategy_base import StrategyBase
+from hummingbot.connector.exchange_base cimport ExchangeBase
+from .pure_market_making cimport PureMarketMakingStrategy
+from .pure_market_making import PureMarketMakingStrategy
+
+pmm_mp_logger = None
+
+
+cdef class PureMarketMakingMultiPairStrategy(StrategyBase):
+    """
+    Runs the pure market making strategies of several trading pairs of one connector in the same clock tick.
+    The proposals of all pairs are created first, sharing the available balances so that the pairs don't use the
+    same balance, then the orders of all pairs are cancelled and finally the new orders are created.
+    """
+
+    @classmethod
+    def logger(cls):
+        global pmm_mp_logger
+        if pmm_mp_logger is None:
+            pmm_mp_logger = logging.getLogger(__name__)
+        return pmm_mp_logger
+
+    def init_params(self, strategies: List[PureMarketMakingStrategy]):
+        if len(strategies) == 0:
+            raise ValueError("At least one trading pair strategy is required.")
+        if len(set(strategy.market_info.market for strategy in strategies)) > 1:
+            raise ValueError("All the trading pairs must be on the same connector.")
+        self._strategies = list(strategies)
+
+    @property
+    def strategies(self) -> List[PureMarketMakingStrategy]:
+        return self._strategies
+
+    @property
+    def active_orders(self):
+        return [order for strategy in self._strategies for order in strategy.active_orders]
+
+    def format_status(self) -> str:
+        cdef:
+            list lines = []
+        for strategy in self._strategies:
+            lines.extend(["", f"  {strategy.trading_pair}:"] +
+                         ["  " + line for line in strategy.format_status().split("\n")])
+        return "\n".join(lines)
+
+    cdef c_start(self, Clock clock, double timestamp):
+        cdef PureMarketMakingStrategy strategy
+        StrategyBase.c_start(self, clock, timestamp)
+        for strategy in self._strategies:
+            strategy.c_start(clock, timestamp)
+
+    cdef c_stop(self, Clock clock):
+        cdef PureMarketMakingStrategy strategy
+        for strategy in self._strategies:
+            strategy.c_stop(clock)
+        StrategyBase.c_stop(self, clock)
+
+    cdef c_tick(self, double timestamp):
+        StrategyBase.c_tick(self, timestamp)
+        cdef:
+            PureMarketMakingStrategy strategy
+            dict available_balances = self.c_get_available_balances()
+            dict used_balances = {}
+            list ready_strategies = []
+            list proposals = []
+        try:
+            for strategy in self._strategies:
+                if strategy.c_tick_markets_ready(timestamp):
+                    strategy.c_set_shared_balances(available_balances, used_balances)
+                    ready_strategies.append(strategy)
+                    proposals.append(strategy.c_create_proposal())
+            for strategy, proposal in zip(ready_strategies, proposals):
+                strategy.c_cancel_orders(proposal)
+            for strategy, proposal in zip(ready_strategies, proposals):
+                strategy.c_create_orders(proposal)
+        finally:
+            for strategy in self._strategies:
+                strategy.c_set_shared_balances(None, None)
+                strategy._last_timestamp = timestamp
+
+    cdef dict c_get_available_balances(self):
+        """
+        The available balance of each asset of the trading pairs, read once for all the pairs of the tick.
+        """
+        cdef:
+            PureMarketMakingStrategy strategy
+            ExchangeBase market
+            dict balances = {}
+        for strategy in self._strategies:
+            market = strategy.market_info.market
+            for asset in (strategy.base_asset, strategy.quote_asset):
+                if asset not in balances:
+                    balances[asset] = market.c_get_available_balance(asset)
+        return balances
@@ -9,13 +9,19 @@ from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPr
 from hummingbot.strategy.api_asset_price_delegate import APIAssetPriceDelegate
 from hummingbot.strategy.pure_market_making import (
     PureMarketMakingStrategy,
+    PureMarketMakingMultiPairStrategy,
     InventoryCostPriceDelegate,
 )
-from hummingbot.strategy.pure_market_making.pure_market_making_config_map import pure_market_making_config_map as c_map
+from hummingbot.strategy.pure_market_making.pure_market_making_config_map import (
+    pure_market_making_config_map as c_map,
+    parse_additional_markets,
+)
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
 from hummingbot.connector.exchange_base import ExchangeBase
 from decimal import Decimal
 
+s_decimal_neg_one = Decimal("-1")
+
 
 def start(self):
     try:
@@ -54,13 +60,22 @@ def start(self):
         order_override = c_map.get("order_override").value
 
         trading_pair: str = raw_trading_pair
-        maker_assets: Tuple[str, str] = self._initialize_market_assets(exchange, [trading_pair])[0]
-        market_names: List[Tuple[str, List[str]]] = [(exchange, [trading_pair])]
-        self._initialize_wallet(token_trading_pairs=list(set(maker_assets)))
+        additional_trading_pairs: List[str] = parse_additional_markets(c_map.get("additional_markets").value)
+        if len(additional_trading_pairs) > 0 and \
+                (price_source != "current_market" or price_type == "inventory_cost" or len(order_override or {}) > 0):
+            raise ValueError("Additional markets are only supported with the current market price source, "
+                             "without inventory cost price type and order override.")
+        if len(additional_trading_pairs) > 0 and (price_ceiling != s_decimal_neg_one or price_floor != s_decimal_neg_one):
+            # The price ceiling and floor are prices of the market, they don't apply to the other trading pairs
+            raise ValueError("Additional markets are only supported without price ceiling and price floor.")
+        trading_pairs: List[str] = [trading_pair] + additional_trading_pairs
+        all_maker_assets: List[Tuple[str, str]] = self._initialize_market_assets(exchange, trading_pairs)
+        market_names: List[Tuple[str, List[str]]] = [(exchange, trading_pairs)]
+        self.assets = set(asset for assets in all_maker_assets for asset in assets)
+        self._initialize_wallet(token_trading_pairs=list(self.assets))
         self._initialize_markets(market_names)
-        self.assets = set(maker_assets)
-        maker_data = [self.markets[exchange], trading_pair] + list(maker_assets)
-        self.market_trading_pair_tuples = [MarketTradingPairTuple(*maker_data)]
+        self.market_trading_pair_tuples = [MarketTradingPairTuple(self.markets[exchange], pair, *assets)
+                                           for pair, assets in zip(trading_pairs, all_maker_assets)]
         asset_price_delegate = None
         if price_source == "external_market":
             asset_trading_pair: str = price_source_market
@@ -78,40 +93,48 @@ def start(self):
         take_if_crossed = c_map.get("take_if_crossed").value
 
         strategy_logging_options = PureMarketMakingStrategy.OPTION_LOG_ALL
-        self.strategy = PureMarketMakingStrategy()
-        self.strategy.init_params(
-            market_info=MarketTradingPairTuple(*maker_data),
-            bid_spread=bid_spread,
-            ask_spread=ask_spread,
-            order_levels=order_levels,
-            order_amount=order_amount,
-            order_level_spread=order_level_spread,
-            order_level_amount=order_level_amount,
-            inventory_skew_enabled=inventory_skew_enabled,
-            inventory_target_base_pct=inventory_target_base_pct,
-            inventory_range_multiplier=inventory_range_multiplier,
-            filled_order_delay=filled_order_delay,
-            hanging_orders_enabled=hanging_orders_enabled,
-            order_refresh_time=order_refresh_time,
-            max_order_age=max_order_age,
-            order_optimization_enabled=order_optimization_enabled,
-            ask_order_optimization_depth=ask_order_optimization_depth,
-            bid_order_optimization_depth=bid_order_optimization_depth,
-            add_transaction_costs_to_orders=add_transaction_costs_to_orders,
-            logging_options=strategy_logging_options,
-            asset_price_delegate=asset_price_delegate,
-            inventory_cost_price_delegate=inventory_cost_price_delegate,
-            price_type=price_type,
-            take_if_crossed=take_if_crossed,
-            price_ceiling=price_ceiling,
-            price_floor=price_floor,
-            ping_pong_enabled=ping_pong_enabled,
-            hanging_orders_cancel_pct=hanging_orders_cancel_pct,
-            order_refresh_tolerance_pct=order_refresh_tolerance_pct,
-            minimum_spread=minimum_spread,
-            hb_app_notification=True,
-            order_override={} if order_override is None else order_override,
-        )
+        strategies = []
+        for market_info in self.market_trading_pair_tuples:
+            strategy = PureMarketMakingStrategy()
+            strategy.init_params(
+                market_info=market_info,
+                bid_spread=bid_spread,
+                ask_spread=ask_spread,
+                order_levels=order_levels,
+                order_amount=order_amount,
+                order_level_spread=order_level_spread,
+                order_level_amount=order_level_amount,
+                inventory_skew_enabled=inventory_skew_enabled,
+                inventory_target_base_pct=inventory_target_base_pct,
+                inventory_range_multiplier=inventory_range_multiplier,
+                filled_order_delay=filled_order_delay,
+                hanging_orders_enabled=hanging_orders_enabled,
+                order_refresh_time=order_refresh_time,
+                max_order_age=max_order_age,
+                order_optimization_enabled=order_optimization_enabled,
+                ask_order_optimization_depth=ask_order_optimization_depth,
+                bid_order_optimization_depth=bid_order_optimization_depth,
+                add_transaction_costs_to_orders=add_transaction_costs_to_orders,
+                logging_options=strategy_logging_options,
+                asset_price_delegate=asset_price_delegate,
+                inventory_cost_price_delegate=inventory_cost_price_delegate,
+                price_type=price_type,
+                take_if_crossed=take_if_crossed,
+                price_ceiling=price_ceiling,
+                price_floor=price_floor,
+                ping_pong_enabled=ping_pong_enabled,
+                hanging_orders_cancel_pct=hanging_orders_cancel_pct,
+                order_refresh_tolerance_pct=order_refresh_tolerance_pct,
+                minimum_spread=minimum_spread,
+                hb_app_notification=True,
+                order_override={} if order_override is None else order_override,
+            )
+            strategies.append(strategy)
+        if len(strategies) == 1:
+            self.strategy = strategies[0]
+        else:
+            self.strategy = PureMarketMakingMultiPairStrategy()
+            self.strategy.init_params(strategies)
     except Exception as e:
         self._notify(str(e))
         self.logger().error("Unknown error during initialization.", exc_info=True)
@@ -47,6 +47,10 @@ cdef class StrategyBase(TimeIterator):
     cdef str c_sell_with_specific_market(self, object market_trading_pair_tuple, object amount, object order_type = *,
                                          object price = *, double expiration_seconds = *, position_action = *, )
     cdef c_cancel_order(self, object market_pair, str order_id)
+    cdef list c_batch_create_orders_with_specific_market(self, object market_trading_pair_tuple, list orders,
+                                                         object order_type = *, double expiration_seconds = *,
+                                                         position_action = *)
+    cdef c_batch_cancel_orders(self, object market_trading_pair_tuple, list order_ids)
 
     cdef c_start_tracking_limit_order(self, object market_pair, str order_id, bint is_buy, object price,
                                       object quantity)
@@ -11,6 +11,8 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.connector.connector_base cimport ConnectorBase
+from hummingbot.connector.exchange_base cimport ExchangeBase
+from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.event.events import (
     OrderFilledEvent,
@@ -534,6 +536,84 @@ cdef class StrategyBase(TimeIterator):
 
     def cancel_order(self, market_trading_pair_tuple: MarketTradingPairTuple, order_id: str):
         self.c_cancel_order(market_trading_pair_tuple, order_id)
+
+    def batch_create_orders_with_specific_market(self, market_trading_pair_tuple, orders,
+                                                 order_type=OrderType.LIMIT,
+                                                 expiration_seconds=NaN,
+                                                 position_action=PositionAction.OPEN):
+        return self.c_batch_create_orders_with_specific_market(market_trading_pair_tuple, orders,
+                                                               order_type,
+                                                               expiration_seconds,
+                                                               position_action)
+
+    cdef list c_batch_create_orders_with_specific_market(self, object market_trading_pair_tuple, list orders,
+                                                         object order_type=OrderType.LIMIT,
+                                                         double expiration_seconds=NaN,
+                                                         position_action=PositionAction.OPEN):
+        """
+        Places the limit orders with the market batch order API and starts tracking them.
+        :param orders: The orders to place, their client order ids are not used
+        :returns The client order ids of the orders, in the same order
+        """
+        if self._sb_delegate_lock:
+            raise RuntimeError("Delegates are not allowed to execute orders directly.")
+
+        if not order_type.is_limit_type():
+            raise ValueError("Only limit orders can be placed in batch.")
+
+        if not all(isinstance(order.price, Decimal) and isinstance(order.quantity, Decimal) for order in orders):
+            raise TypeError("price and amount must be Decimal objects.")
+
+        cdef:
+            kwargs = {"expiration_ts": self._current_timestamp + expiration_seconds,
+                      "position_action": position_action}
+            ExchangeBase market = market_trading_pair_tuple.market
+            list created_orders
+            LimitOrder order
+
+        if market not in self._sb_markets:
+            raise ValueError(f"Market object for batch orders is not in the whitelisted markets set.")
+
+        if len(orders) == 0:
+            return []
+
+        created_orders = market.c_batch_create_orders(orders, order_type, kwargs)
+
+        # Start order tracking
+        for order in created_orders:
+            self.c_start_tracking_limit_order(market_trading_pair_tuple,
+                                              order.client_order_id,
+                                              order.is_buy,
+                                              order.price,
+                                              order.quantity)
+
+        return [order.client_order_id for order in created_orders]
+
+    def batch_cancel_orders(self, market_trading_pair_tuple: MarketTradingPairTuple, order_ids: List[str]):
+        self.c_batch_cancel_orders(market_trading_pair_tuple, order_ids)
+
+    cdef c_batch_cancel_orders(self, object market_trading_pair_tuple, list order_ids):
+        """
+        Cancels the limit orders with the market batch cancel API, the orders which are already being cancelled are
+        skipped as with c_cancel_order.
+        """
+        cdef:
+            ExchangeBase market = market_trading_pair_tuple.market
+            list orders_to_cancel = []
+            LimitOrder order
+
+        for order_id in order_ids:
+            order = self._sb_order_tracker.c_get_limit_order(market_trading_pair_tuple, order_id)
+            if order is None:
+                self.c_cancel_order(market_trading_pair_tuple, order_id)
+            elif self._sb_order_tracker.c_check_and_track_cancel(order_id):
+                self.log_with_clock(
+                    logging.INFO,
+                    f"({market_trading_pair_tuple.trading_pair}) Cancelling the limit order {order_id}."
+                )
+                orders_to_cancel.append(order)
+        if len(orders_to_cancel) > 0:
+            market.c_batch_cancel_orders(orders_to_cancel)
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
@@ -574,6 +654,9 @@ cdef class StrategyBase(TimeIterator):
             list restored_order_ids = []
 
         for order in limit_orders:
+            # Restored orders of other trading pairs belong to other strategies of the market
+            if order.trading_pair != market_pair.trading_pair:
+                continue
             restored_order_ids.append(order.client_order_id)
             self.c_start_tracking_limit_order(market_pair,
                                               order.client_order_id,
@@ -86,6 +86,7 @@ def main():
         "hummingbot.strategy.amm_arb",
         "hummingbot.strategy.arbitrage",
         "hummingbot.strategy.cross_exchange_market_making",
+        "hummingbot.strategy.graph_arbitrage",
         "hummingbot.strategy.pure_market_making",
         "hummingbot.strategy.perpetual_market_making",
         "hummingbot.strategy.avellaneda_market_making",
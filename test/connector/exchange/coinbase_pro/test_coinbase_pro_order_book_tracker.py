@@ -142,7 +142,8 @@ class CoinbaseProOrderBookTrackerUnitTest(unittest.TestCase):
         self.run_parallel(asyncio.sleep(5))
 
         test_order_book_row = test_active_order_tracker.active_bids[Decimal(price)]
-        self.assertEqual(test_order_book_row[order_id]["remaining_size"], remaining_size)
+        # The remaining sizes are floats, as kept by the L3 order book of the tracker
+        self.assertEqual(1.0, test_order_book_row[order_id]["remaining_size"])
 
         # Test change message diff
         new_size = "2.00"
@@ -162,7 +163,7 @@ class CoinbaseProOrderBookTrackerUnitTest(unittest.TestCase):
         self.run_parallel(asyncio.sleep(5))
 
         test_order_book_row = test_active_order_tracker.active_bids[Decimal(price)]
-        self.assertEqual(test_order_book_row[order_id]["remaining_size"], new_size)
+        self.assertEqual(2.0, test_order_book_row[order_id]["remaining_size"])
 
         # Test match message diff
         match_size = "0.50"
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from decimal import Decimal
+from typing import List
+from unittest.mock import MagicMock, patch
+
+from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance_tracker import PerformanceTracker
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+# The models related to TradeFill need to be loaded for it to be instantiated
+from hummingbot.model.order import Order  # noqa: F401
+from hummingbot.model.order_status import OrderStatus  # noqa: F401
+from hummingbot.model.trade_fill import TradeFill
+
+trading_pair = "HBOT-USDT"
+base, quote = trading_pair.split("-")
+config_file_path = "conf_pure_mm_1.yml"
+
+
+class PerformanceTrackerUnitTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.checkpoint_path = os.path.join(self.temp_dir.name, "performance.json")
+        self.start_time = 1640000000.0
+        self.tracker = PerformanceTracker(config_file_path, self.start_time, checkpoint_path=self.checkpoint_path)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def trade_fill(self, order_id: str, trade_type: TradeType, amount: float, price: float, timestamp: int,
+                   fee: TradeFee = TradeFee(0.0, []), market: str = "binance") -> TradeFill:
+        return TradeFill(config_file_path=config_file_path,
+                         strategy="pure_market_making",
+                         market=market,
+                         symbol=trading_pair,
+                         base_asset=base,
+                         quote_asset=quote,
+                         timestamp=timestamp,
+                         order_id=order_id,
+                         trade_type=trade_type.name,
+                         order_type=OrderType.LIMIT.name,
+                         price=price,
+                         amount=amount,
+                         leverage=1,
+                         trade_fee=TradeFee.to_json(fee),
+                         exchange_trade_id=f"trade_{order_id}",
+                         position="NILL")
+
+    def fills(self) -> List[TradeFill]:
+        start = int(self.start_time * 1e3)
+        return [
+            self.trade_fill("order1", TradeType.BUY, 100, 10, start + 1000, TradeFee(Decimal("0.001"), [])),
+            self.trade_fill("order2", TradeType.SELL, 40, 12.5, start + 2000, TradeFee(0.0, [(quote, 1.5)])),
+            self.trade_fill("order3", TradeType.SELL, 80, 14, start + 3000, TradeFee(0.0, [(base, 0.25)])),
+            self.trade_fill("order4", TradeType.BUY, 20, 11, start + 4000),
+        ]
+
+    def test_performance_matches_full_calculation(self):
+        trades = self.fills()
+        self.tracker.bootstrap(lambda start_timestamp: trades)
+        cur_bals = {base: Decimal("150"), quote: Decimal("8000")}
+        cur_price = Decimal("13")
+
+        with patch("hummingbot.client.performance.get_last_price") as get_last_price_mock:
+            get_last_price_mock.return_value = cur_price
+            expected = asyncio.get_event_loop().run_until_complete(
+                PerformanceMetrics.create("binance", trading_pair, trades, cur_bals))
+        perf = self.tracker.performance_metrics("binance", trading_pair, cur_bals, cur_price)
+
+        for attr in ["num_buys", "num_sells", "num_trades", "b_vol_base", "s_vol_base", "tot_vol_base",
+                     "b_vol_quote", "s_vol_quote", "tot_vol_quote", "avg_b_price", "avg_s_price", "avg_tot_price",
+                     "start_base_bal", "start_quote_bal", "cur_base_bal", "cur_quote_bal", "start_price", "cur_price",
+                     "start_base_ratio_pct", "cur_base_ratio_pct", "hold_value", "cur_value", "trade_pnl"]:
+            self.assertEqual(getattr(expected, attr), getattr(perf, attr), attr)
+        # Fees paid in base are valued at the fill price rather than the current one
+        self.assertAlmostEqual(float(expected.fees[quote]), float(perf.fees[quote]))
+        self.assertEqual(Decimal("0.25"), perf.fees[base])
+        self.assertAlmostEqual(1.0 + 1.5 + 0.25 * 14, float(perf.fee_in_quote))
+        self.assertAlmostEqual(float(perf.trade_pnl - perf.fee_in_quote), float(perf.total_pnl))
+
+        state = self.tracker.market_states[("binance", trading_pair)]
+        self.assertAlmostEqual(400, float(state.realized_pnl))
+        self.assertAlmostEqual(float(state.trade_pnl(cur_price)),
+                               float(state.realized_pnl + state.unrealized_pnl(cur_price)))
+
+    def test_fills_before_start_time_are_ignored(self):
+        trades = self.fills()
+        trades[0].timestamp = int(self.start_time * 1e3) - 1
+        self.tracker.bootstrap(lambda start_timestamp: trades)
+
+        self.assertEqual(3, self.tracker.trade_count)
+        self.assertEqual(Decimal("12.5"), self.tracker.market_states[("binance", trading_pair)].start_price)
+
+    def test_fill_events_are_recorded(self):
+        market = MagicMock()
+        market.display_name = "binance_PaperTrade"
+        tracker = PerformanceTracker(config_file_path, time.time() - 1, checkpoint_path=self.checkpoint_path)
+        tracker.start([market])
+        market.add_listener.assert_called_with(MarketEvent.OrderFilled, tracker._fill_order_forwarder)
+
+        for order_id in ["order1", "order2"]:
+            tracker._did_fill_order(MarketEvent.OrderFilled.value, market, OrderFilledEvent(
+                time.time(), order_id, trading_pair, TradeType.BUY, OrderType.LIMIT, Decimal("10"), Decimal("1"),
+                TradeFee(Decimal("0"), [])))
+
+        self.assertEqual(2, tracker.trade_count)
+        self.assertEqual(Decimal("2"), tracker.market_states[("binance_PaperTrade", trading_pair)].b_vol_base)
+        tracker.stop()
+        market.remove_listener.assert_called_with(MarketEvent.OrderFilled, tracker._fill_order_forwarder)
+
+    def test_resume_from_checkpoint(self):
+        trades = self.fills()
+        self.tracker.bootstrap(lambda start_timestamp: trades[:3])
+        self.tracker.save_checkpoint()
+
+        requested_timestamps = []
+
+        def get_trades(start_timestamp: int) -> List[TradeFill]:
+            requested_timestamps.append(start_timestamp)
+            return [t for t in trades if t.timestamp >= start_timestamp]
+
+        resumed = PerformanceTracker(config_file_path, self.start_time, checkpoint_path=self.checkpoint_path)
+        resumed.bootstrap(get_trades)
+
+        # Only the fills around the checkpoint are queried, and the ones already accounted for are skipped
+        self.assertEqual([trades[2].timestamp - PerformanceTracker.FILL_DEDUP_WINDOW_MS], requested_timestamps)
+        self.assertEqual(4, resumed.trade_count)
+        self.assertEqual(self.tracker.market_states[("binance", trading_pair)].fees,
+                         resumed.market_states[("binance", trading_pair)].fees)
+        self.assertEqual(Decimal("120"), resumed.market_states[("binance", trading_pair)].b_vol_base)
+
+        # The checkpoint of another session is not used
+        other_session = PerformanceTracker(config_file_path, self.start_time + 1, checkpoint_path=self.checkpoint_path)
+        other_session.bootstrap(lambda start_timestamp: [])
+        self.assertEqual(0, other_session.trade_count)
@@ -0,0 +1,208 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Dict
+from unittest.mock import MagicMock
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.performance_tracker import (
+    MarketPerformanceState,
+    PerformanceTracker,
+)
+from hummingbot.client.risk_guard import RiskGuard
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    OrderFilledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.core.time_iterator import TimeIterator
+from hummingbot.strategy.strategy_base import StrategyBase
+
+trading_pair = "HBOT-USDT"
+base, quote = trading_pair.split("-")
+risk_config_keys = ["kill_switch_enabled", "kill_switch_rate", "risk_max_drawdown_pct", "risk_max_position_pct",
+                    "risk_max_orders_per_minute"]
+
+
+class MockExchange(ExchangeBase):
+    def __init__(self, balances: Dict[str, Decimal]):
+        super().__init__()
+        self._mock_balances = balances
+        self._mock_order_books = {trading_pair: OrderBook()}
+
+    @property
+    def display_name(self) -> str:
+        return "mock_exchange"
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return self._mock_order_books
+
+    def get_all_balances(self) -> Dict[str, Decimal]:
+        return dict(self._mock_balances)
+
+
+class RiskGuardUnitTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.config_values = {key: global_config_map[key].value for key in risk_config_keys}
+        for key in risk_config_keys:
+            global_config_map[key].value = None
+        self.market = MockExchange({base: Decimal("100"), quote: Decimal("1000")})
+        self.strategy = TimeIterator()
+        self.clock = Clock(ClockMode.BACKTEST)
+        self.clock.add_iterator(self.strategy)
+        self.application = MagicMock()
+        self.application.markets = {"mock_exchange": self.market}
+        self.application.performance_tracker = None
+        self.application.clock = self.clock
+        self.application.strategy = self.strategy
+
+    def tearDown(self) -> None:
+        for key, value in self.config_values.items():
+            global_config_map[key].value = value
+        super().tearDown()
+
+    def start_guard(self, **config) -> RiskGuard:
+        for key, value in config.items():
+            global_config_map[key].value = value
+        risk_guard = RiskGuard(self.application)
+        risk_guard.start()
+        return risk_guard
+
+    def fill(self, trade_type: TradeType, amount: str, price: str):
+        self.market.trigger_event(MarketEvent.OrderFilled, OrderFilledEvent(
+            1640000000, "order", trading_pair, trade_type, OrderType.LIMIT, Decimal(price), Decimal(amount),
+            TradeFee(Decimal("0"))))
+
+    def trade(self, price: str):
+        self.market.order_books[trading_pair].trigger_event(OrderBookEvent.TradeEvent, OrderBookTradeEvent(
+            trading_pair, 1640000000, TradeType.SELL, float(price), 1.0))
+
+    def assert_bot_stopped(self, risk_guard: RiskGuard, reason: str):
+        self.application.stop.assert_called_once()
+        self.assertIn(f"[{reason}]", self.application._notify.call_args[0][0])
+        self.assertIn(self.strategy, self.clock.paused_iterators)
+        self.assertFalse(risk_guard.started)
+
+    def test_kill_switch(self):
+        risk_guard = self.start_guard(kill_switch_enabled=True, kill_switch_rate=Decimal("-5"))
+        self.fill(TradeType.BUY, "100", "10")
+        self.assertEqual(Decimal("0"), risk_guard.average_return)
+
+        # The return follows the mark price of the order book trades
+        self.trade("9.6")
+        self.assertAlmostEqual(-40 / 1960, float(risk_guard.market_return("mock_exchange", trading_pair)))
+        self.application.stop.assert_not_called()
+        self.trade("9")
+        self.assertAlmostEqual(-100 / 1900, float(risk_guard.average_return))
+        self.assert_bot_stopped(risk_guard, "Kill switch threshold reached")
+
+        # The guard doesn't listen to the markets anymore
+        self.trade("5")
+        self.application.stop.assert_called_once()
+
+    def test_max_drawdown(self):
+        risk_guard = self.start_guard(risk_max_drawdown_pct=Decimal("3"))
+        self.fill(TradeType.BUY, "100", "10")
+        self.trade("12")
+        self.trade("11.5")
+        self.assertAlmostEqual(200 / 2200 - 150 / 2150, float(risk_guard.drawdown))
+        self.application.stop.assert_not_called()
+        self.trade("11")
+        self.assert_bot_stopped(risk_guard, "Max drawdown reached")
+
+    def test_max_position(self):
+        risk_guard = self.start_guard(risk_max_position_pct=Decimal("60"))
+        self.fill(TradeType.BUY, "100", "10")
+        self.fill(TradeType.SELL, "50", "10")
+        self.application.stop.assert_not_called()
+        self.fill(TradeType.BUY, "80", "10")
+        self.assert_bot_stopped(risk_guard, "Max position reached")
+
+    def create_order(self):
+        self.market.trigger_event(MarketEvent.BuyOrderCreated, BuyOrderCreatedEvent(
+            1640000000, OrderType.LIMIT, trading_pair, Decimal("1"), Decimal("10"), "order"))
+
+    def test_max_order_rate(self):
+        risk_guard = self.start_guard(risk_max_orders_per_minute=3)
+        risk_guard.ORDER_RATE_WINDOW = 0.2
+        for _ in range(3):
+            self.create_order()
+        self.assertFalse(risk_guard.strategy_paused)
+        self.create_order()
+
+        # The strategy is paused rather than the bot stopped
+        self.assertTrue(risk_guard.strategy_paused)
+        self.assertIn(self.strategy, self.clock.paused_iterators)
+        self.application.stop.assert_not_called()
+        self.ev_loop.run_until_complete(asyncio.sleep(0.3))
+        self.assertFalse(risk_guard.strategy_paused)
+        self.assertNotIn(self.strategy, self.clock.paused_iterators)
+        self.assertIn(self.strategy, self.clock.child_iterators)
+
+    def test_max_order_rate_pause_keeps_strategy_running(self):
+        self.clock.remove_iterator(self.strategy)
+        self.strategy = self.application.strategy = StrategyBase()
+        self.strategy.add_markets([self.market])
+        self.clock.add_iterator(self.strategy)
+        self.clock.backtest_til(1)
+        events = [MarketEvent.BuyOrderCreated, MarketEvent.SellOrderCreated, MarketEvent.OrderFilled,
+                  MarketEvent.OrderCancelled, MarketEvent.BuyOrderCompleted, MarketEvent.SellOrderCompleted]
+        risk_guard = self.start_guard(risk_max_orders_per_minute=1)
+        risk_guard.ORDER_RATE_WINDOW = 0.2
+        listeners = {event: self.market.get_listeners(event) for event in events}
+        self.create_order()
+        self.create_order()
+        self.assertTrue(risk_guard.strategy_paused)
+        # The strategy isn't ticked while paused, but still listens to its markets
+        self.clock.backtest_til(3)
+        self.assertEqual(1, self.strategy.current_timestamp)
+        self.assertEqual([self.market], self.strategy.active_markets)
+        for event in events:
+            self.assertEqual(listeners[event], self.market.get_listeners(event))
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.3))
+        self.assertFalse(risk_guard.strategy_paused)
+        self.clock.backtest_til(4)
+        self.assertEqual(4, self.strategy.current_timestamp)
+        for event in events:
+            self.assertEqual(listeners[event], self.market.get_listeners(event))
+
+    def test_fills_before_start_from_performance_tracker(self):
+        tracker = PerformanceTracker("conf_pure_mm_1.yml", 1640000000.0)
+        self.application.performance_tracker = tracker
+        self.application.init_time = 1640000000.0
+        self.application.strategy_file_name = "conf_pure_mm_1.yml"
+        # 100 HBOT were bought at 10 before the guard started, and the last price is 9
+        state = tracker.market_states[("mock_exchange", trading_pair)] = MarketPerformanceState()
+        state.record(trading_pair, TradeType.BUY, Decimal("10"), Decimal("100"), TradeFee(Decimal("0")))
+        state.last_price = Decimal("9")
+        self.market._mock_balances.update({base: Decimal("200"), quote: Decimal("0")})
+
+        risk_guard = self.start_guard(kill_switch_enabled=True, kill_switch_rate=Decimal("-5"))
+        self.assertAlmostEqual(-100 / 1900, float(risk_guard.average_return))
+        self.assert_bot_stopped(risk_guard, "Kill switch threshold reached")
+        # The state of the tracker is left as it is
+        self.assertEqual(Decimal("9"), tracker.market_states[("mock_exchange", trading_pair)].last_price)
+
+    def test_disabled(self):
+        listeners_count = len(self.market.get_listeners(MarketEvent.OrderFilled))
+        risk_guard = self.start_guard()
+        self.assertFalse(risk_guard.enabled)
+        self.assertFalse(risk_guard.started)
+        self.assertEqual(listeners_count, len(self.market.get_listeners(MarketEvent.OrderFilled)))
@@ -0,0 +1,86 @@
+import inspect
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import hummingbot.client.settings as settings
+from hummingbot.client.config.config_var import ConfigVar
+from hummingbot.connector.exchange.binance import binance_utils
+
+
+class ConnectorManifestTest(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = os.path.join(self.temp_dir.name, ".connector_manifest.json")
+        patcher = patch.object(settings, "CONNECTOR_MANIFEST_PATH", self.manifest_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+
+    @staticmethod
+    def config_var_attributes(config_var: ConfigVar):
+        attributes = {k: v for k, v in vars(config_var).items() if not callable(v)}
+        required_if_vars = inspect.getclosurevars(config_var._required_if).nonlocals
+        attributes["required_if_exchange"] = required_if_vars.get("exchange")
+        return attributes
+
+    def assert_same_settings(self, expected, actual):
+        self.assertEqual(set(expected), set(actual))
+        for name, setting in expected.items():
+            self.assertEqual(setting._replace(config_keys=None), actual[name]._replace(config_keys=None))
+            self.assertEqual(set(setting.config_keys), set(actual[name].config_keys))
+            for key, config_var in setting.config_keys.items():
+                self.assertEqual(self.config_var_attributes(config_var),
+                                 self.config_var_attributes(actual[name].config_keys[key]))
+
+    def test_connector_settings_are_created_from_the_cached_manifest(self):
+        generated_settings = settings._create_connector_settings()
+        self.assertTrue(os.path.isfile(self.manifest_path))
+
+        with patch.object(settings, "import_connector_module", wraps=settings.import_connector_module) as import_mock:
+            cached_settings = settings._create_connector_settings()
+        # Only the connectors with config keys the manifest can't describe (a validator, a custom condition) are
+        # imported
+        self.assertEqual({"hummingbot.connector.exchange.bamboo_relay.bamboo_relay_utils",
+                          "hummingbot.connector.connector.terra.terra_utils"},
+                         {call.args[0] for call in import_mock.call_args_list})
+        self.assert_same_settings(generated_settings, cached_settings)
+        self.assert_same_settings(settings.CONNECTOR_SETTINGS, cached_settings)
+
+    def test_config_keys_match_the_utils_module(self):
+        settings._create_connector_settings()
+        binance_settings = settings._create_connector_settings()["binance"]
+        self.assertEqual(binance_utils.DEFAULT_FEES, binance_settings.default_fees)
+        self.assertEqual(set(binance_utils.KEYS), set(binance_settings.config_keys))
+        for key, config_var in binance_utils.KEYS.items():
+            self.assertIsNot(config_var, binance_settings.config_keys[key])
+            self.assertEqual(self.config_var_attributes(config_var),
+                             self.config_var_attributes(binance_settings.config_keys[key]))
+
+        binance_us_settings = settings._create_connector_settings()["binance_us"]
+        self.assertTrue(binance_us_settings.is_sub_domain)
+        self.assertEqual("us", binance_us_settings.domain_parameter)
+        self.assertEqual("binance_us", self.config_var_attributes(
+            binance_us_settings.config_keys["binance_us_api_key"])["required_if_exchange"])
+
+    def test_manifest_is_generated_again_when_connector_utils_change(self):
+        settings._create_connector_settings()
+        with patch.object(settings, "_manifest_fingerprint", return_value="changed"), \
+                patch.object(settings, "import_connector_module",
+                             wraps=settings.import_connector_module) as import_mock:
+            settings._create_connector_settings()
+            self.assertGreater(import_mock.call_count, 30)
+            import_mock.reset_mock()
+            settings._create_connector_settings()
+            self.assertEqual(2, import_mock.call_count)
+
+    def test_connector_import_report(self):
+        with patch.dict(settings.connector_import_times, clear=True):
+            settings.connector_import_times.update({"module_a": 0.5, "module_b": 1.25, "module_c": 0.25})
+            self.assertEqual(["Connector modules imported: 3 in 2.000s",
+                              "     1.250s  module_b",
+                              "     0.500s  module_a"],
+                             settings.connector_import_report(max_rows=2))
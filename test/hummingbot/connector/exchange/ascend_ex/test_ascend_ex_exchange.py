@@ -0,0 +1,130 @@
+import asyncio
+import json
+import re
+import unittest
+from decimal import Decimal
+from typing import Awaitable
+from unittest.mock import patch
+
+from aioresponses import aioresponses
+
+from hummingbot.connector.exchange.ascend_ex import ascend_ex_constants as CONSTANTS
+from hummingbot.connector.exchange.ascend_ex import ascend_ex_utils
+from hummingbot.connector.exchange.ascend_ex.ascend_ex_exchange import AscendExExchange, AscendExTradingRule
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.event.events import MarketEvent, OrderType, TradeType
+from test.mock.mock_listener import MockEventListener
+
+
+class TestAscendExExchange(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.base_asset = "COINALPHA"
+        cls.quote_asset = "HBOT"
+        cls.trading_pair = f"{cls.base_asset}-{cls.quote_asset}"
+        cls.api_key = "someKey"
+        cls.api_secret = "someSecret"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = AscendExExchange(self.api_key, self.api_secret, trading_pairs=[self.trading_pair])
+        self.exchange._account_group = 6
+        self.exchange._trading_rules = {
+            self.trading_pair: AscendExTradingRule(self.trading_pair,
+                                                   min_price_increment=Decimal("0.01"),
+                                                   min_base_amount_increment=Decimal("0.1"),
+                                                   min_notional_size=Decimal("1"),
+                                                   max_notional_size=Decimal("100000"))
+        }
+        self.event_listener = MockEventListener()
+        self.batch_url = re.compile(
+            f"^{ascend_ex_utils.get_rest_url_private(6)}/{CONSTANTS.ORDER_BATCH_PATH_URL}".replace(".", r"\."))
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def get_orders(self):
+        return [LimitOrder("", self.trading_pair, True, self.base_asset, self.quote_asset,
+                           Decimal("9.991"), Decimal("1.04")),
+                LimitOrder("", self.trading_pair, False, self.base_asset, self.quote_asset,
+                           Decimal("10.01"), Decimal("2"))]
+
+    @staticmethod
+    def get_request_data(mock_api, method: str):
+        request = next(calls[0] for key, calls in mock_api.requests.items() if key[0] == method)
+        return json.loads(request.kwargs["data"])
+
+    def test_batch_create_orders_splits_batches(self):
+        orders = self.get_orders() * (CONSTANTS.MAX_ORDERS_PER_BATCH // 2 + 1)
+        with patch.object(self.exchange, "_create_orders_batch") as create_orders_batch_mock:
+            created_orders = self.exchange.batch_create_orders(orders)
+        self.assertEqual(len(orders), len(created_orders))
+        self.assertEqual(len(orders), len(set(order.client_order_id for order in created_orders)))
+        self.assertEqual([order.is_buy for order in orders], [order.is_buy for order in created_orders])
+        self.assertEqual(2, create_orders_batch_mock.call_count)
+        self.assertEqual(created_orders[:CONSTANTS.MAX_ORDERS_PER_BATCH],
+                         create_orders_batch_mock.call_args_list[0][0][0])
+
+    @aioresponses()
+    def test_create_orders_batch(self, mock_api):
+        orders = [LimitOrder(f"order-{i}", order.trading_pair, order.is_buy, order.base_currency,
+                             order.quote_currency, order.price, order.quantity)
+                  for i, order in enumerate(self.get_orders())]
+        resp = {
+            "code": 0,
+            "data": {
+                "ac": "CASH",
+                "action": "batch-place-order",
+                "info": [{"id": "order-0", "orderId": "exchangeId0", "orderType": "Limit"},
+                         {"id": "order-1", "orderId": "exchangeId1", "orderType": "Limit"}],
+                "status": "Ack"
+            }
+        }
+        mock_api.post(self.batch_url, body=json.dumps(resp))
+
+        self.async_run_with_timeout(self.exchange._create_orders_batch(orders, OrderType.LIMIT))
+
+        orders_params = self.get_request_data(mock_api, "POST")["orders"]
+        self.assertEqual(["order-0", "order-1"], [params["id"] for params in orders_params])
+        self.assertEqual(["buy", "sell"], [params["side"] for params in orders_params])
+        self.assertEqual(["9.99", "10.01"], [params["orderPrice"] for params in orders_params])
+        self.assertEqual(["1.0", "2.0"], [params["orderQty"] for params in orders_params])
+        self.assertEqual("exchangeId0", self.exchange.in_flight_orders["order-0"].exchange_order_id)
+        self.assertEqual("exchangeId1", self.exchange.in_flight_orders["order-1"].exchange_order_id)
+        self.assertEqual(TradeType.SELL, self.exchange.in_flight_orders["order-1"].trade_type)
+
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
+    @aioresponses()
+    def test_create_orders_batch_fails(self, _, mock_api):
+        orders = [LimitOrder(f"order-{i}", order.trading_pair, order.is_buy, order.base_currency,
+                             order.quote_currency, order.price, order.quantity)
+                  for i, order in enumerate(self.get_orders())]
+        resp = {"code": 300013, "message": "Some invalid order"}
+        mock_api.post(self.batch_url, body=json.dumps(resp))
+        self.exchange.add_listener(MarketEvent.OrderFailure, self.event_listener)
+
+        self.async_run_with_timeout(self.exchange._create_orders_batch(orders, OrderType.LIMIT))
+
+        self.assertEqual(0, len(self.exchange.in_flight_orders))
+        self.assertEqual(2, self.event_listener.events_count)
+        self.assertEqual("order-1", self.event_listener.last_event.order_id)
+
+    @aioresponses()
+    def test_execute_batch_cancel(self, mock_api):
+        for i, order in enumerate(self.get_orders()):
+            self.exchange.start_tracking_order(f"order-{i}", f"exchangeId{i}", order.trading_pair,
+                                               TradeType.BUY if order.is_buy else TradeType.SELL,
+                                               order.price, order.quantity, OrderType.LIMIT)
+        resp = {"code": 0, "data": {"ac": "CASH", "action": "batch-cancel-order", "info": [], "status": "Ack"}}
+        mock_api.delete(self.batch_url, body=json.dumps(resp))
+
+        self.async_run_with_timeout(self.exchange._execute_batch_cancel(["order-0", "order-1", "unknown"]))
+
+        orders_params = self.get_request_data(mock_api, "DELETE")["orders"]
+        self.assertEqual(["exchangeId0", "exchangeId1"], [params["orderId"] for params in orders_params])
+        self.assertEqual(["COINALPHA/HBOT", "COINALPHA/HBOT"], [params["symbol"] for params in orders_params])
+        # The orders are cancelled by the order status updates
+        self.assertEqual(2, len(self.exchange.in_flight_orders))
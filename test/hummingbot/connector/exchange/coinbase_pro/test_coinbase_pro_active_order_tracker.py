@@ -0,0 +1,218 @@
+import os
+import random
+import time
+import unittest
+from decimal import Decimal
+from typing import Dict, List
+
+from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_active_order_tracker import CoinbaseProActiveOrderTracker
+from hummingbot.connector.exchange.coinbase_pro.coinbase_pro_order_book import CoinbaseProOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class DictActiveOrderTracker:
+    """
+    The dictionary based tracker replaced by the L3 order book engine, used as reference for the level sizes and the
+    replay durations: orders are kept by price then order id and each level size is summed again on every message.
+    """
+    def __init__(self):
+        self.active_bids: Dict[Decimal, Dict[str, str]] = {}
+        self.active_asks: Dict[Decimal, Dict[str, str]] = {}
+
+    def convert_snapshot_message_to_order_book_row(self, message: OrderBookMessage):
+        self.active_bids.clear()
+        self.active_asks.clear()
+        for orders, active_orders in [(message.content["bids"], self.active_bids),
+                                      (message.content["asks"], self.active_asks)]:
+            for price, size, order_id in orders:
+                active_orders.setdefault(Decimal(price), {})[order_id] = size
+        return ([OrderBookRow(float(price), self.volume(self.active_bids, price), message.update_id)
+                 for price in sorted(self.active_bids, reverse=True)],
+                [OrderBookRow(float(price), self.volume(self.active_asks, price), message.update_id)
+                 for price in sorted(self.active_asks, reverse=True)])
+
+    @staticmethod
+    def volume(active_orders, price) -> float:
+        return sum([float(size) for size in active_orders[price].values()])
+
+    def convert_diff_message_to_order_book_row(self, message: OrderBookMessage):
+        content = message.content
+        order_id = content.get("order_id") or content.get("maker_order_id")
+        price = Decimal(content["price"])
+        active_orders = self.active_bids if content["side"] == "buy" else self.active_asks
+        if content["type"] == "open":
+            active_orders.setdefault(price, {})[order_id] = content["remaining_size"]
+        elif price not in active_orders or order_id not in active_orders[price]:
+            return [], []
+        elif content["type"] == "change":
+            active_orders[price][order_id] = content["new_size"]
+        elif content["type"] == "match":
+            active_orders[price][order_id] = str(float(active_orders[price][order_id]) - float(content["size"]))
+        else:
+            del active_orders[price][order_id]
+            if len(active_orders[price]) == 0:
+                del active_orders[price]
+        quantity = self.volume(active_orders, price) if price in active_orders else 0.0
+        rows = [OrderBookRow(float(price), quantity, message.update_id)]
+        return (rows, []) if content["side"] == "buy" else ([], rows)
+
+
+class CoinbaseProActiveOrderTrackerUnitTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 123456789
+
+    def setUp(self):
+        self.random = random.Random(self.INITIAL_RANDOM_SEED)
+        self.sequence = 1
+        self.tracker = CoinbaseProActiveOrderTracker()
+        self.order_book = OrderBook()
+
+    def diff_message(self, msg: Dict[str, any]) -> OrderBookMessage:
+        self.sequence += 1
+        msg["sequence"] = self.sequence
+        return CoinbaseProOrderBook.diff_message_from_exchange(msg, timestamp=1640000000.0 + self.sequence)
+
+    def snapshot_message(self, bids: List[List[str]], asks: List[List[str]]) -> OrderBookMessage:
+        return CoinbaseProOrderBook.snapshot_message_from_exchange(
+            {"sequence": self.sequence, "bids": bids, "asks": asks}, 1640000000.0, metadata={"trading_pair": "BTC-USD"})
+
+    def recorded_feed(self, messages_count: int):
+        """
+        A full channel feed with open, change, match and done messages on a few hundred price levels.
+        """
+        snapshot_orders = {"buy": [], "sell": []}
+        live_orders = []
+        for index in range(400):
+            side = "buy" if index % 2 == 0 else "sell"
+            price = f"{self.random.randint(9000, 9999) if side == 'buy' else self.random.randint(10000, 11000)}.00"
+            order = [price, f"{self.random.randint(1, 5000) / 1000:.3f}", f"snapshot-{index}"]
+            snapshot_orders[side].append(order)
+            live_orders.append((order[2], side, price, order[1]))
+        snapshot = self.snapshot_message(snapshot_orders["buy"], snapshot_orders["sell"])
+
+        messages = []
+        for index in range(messages_count):
+            action = self.random.random()
+            if action < 0.4 or len(live_orders) < 50:
+                side = self.random.choice(["buy", "sell"])
+                price = f"{self.random.randint(9000, 9999) if side == 'buy' else self.random.randint(10000, 11000)}.00"
+                size = f"{self.random.randint(1, 5000) / 1000:.3f}"
+                live_orders.append((f"order-{index}", side, price, size))
+                messages.append(self.diff_message({"type": "open", "order_id": f"order-{index}", "side": side,
+                                                   "price": price, "remaining_size": size}))
+                continue
+            position = self.random.randrange(len(live_orders))
+            order_id, side, price, size = live_orders[position]
+            if action < 0.5:
+                new_size = f"{float(size) / 2:.4f}"
+                live_orders[position] = (order_id, side, price, new_size)
+                messages.append(self.diff_message({"type": "change", "order_id": order_id, "side": side,
+                                                   "price": price, "new_size": new_size, "old_size": size}))
+            elif action < 0.7:
+                match_size = f"{float(size) / 4:.5f}"
+                live_orders[position] = (order_id, side, price, str(float(size) - float(match_size)))
+                messages.append(self.diff_message({"type": "match", "maker_order_id": order_id,
+                                                   "taker_order_id": "taker", "side": side, "price": price,
+                                                   "size": match_size}))
+            else:
+                live_orders.pop(position)
+                messages.append(self.diff_message({"type": "done", "order_id": order_id, "side": side,
+                                                   "price": price, "reason": "canceled", "remaining_size": size}))
+        return snapshot, messages
+
+    @staticmethod
+    def replay_dict_tracker(snapshot: OrderBookMessage, messages: List[OrderBookMessage]) -> OrderBook:
+        tracker = DictActiveOrderTracker()
+        order_book = OrderBook()
+        bids, asks = tracker.convert_snapshot_message_to_order_book_row(snapshot)
+        order_book.apply_snapshot(bids, asks, snapshot.update_id)
+        for message in messages:
+            bids, asks = tracker.convert_diff_message_to_order_book_row(message)
+            order_book.apply_diffs(bids, asks, message.update_id)
+        return order_book
+
+    @staticmethod
+    def replay_l3_tracker(snapshot: OrderBookMessage, messages: List[OrderBookMessage]) -> OrderBook:
+        tracker = CoinbaseProActiveOrderTracker()
+        order_book = OrderBook()
+        tracker.apply_snapshot_message(order_book, snapshot)
+        for message in messages:
+            tracker.apply_diff_message(order_book, message)
+        return order_book
+
+    def assert_same_levels(self, expected_rows, rows):
+        expected_levels = {row.price: row.amount for row in expected_rows}
+        levels = {row.price: row.amount for row in rows}
+        self.assertEqual(set(expected_levels), set(levels))
+        for price, amount in expected_levels.items():
+            self.assertAlmostEqual(amount, levels[price], places=9)
+
+    def test_order_messages(self):
+        self.tracker.apply_snapshot_message(self.order_book, self.snapshot_message(
+            [["100.00", "1.5", "bid-1"], ["100.00", "0.5", "bid-2"]], [["101.00", "2", "ask-1"]]))
+        self.assertEqual({Decimal("100"): {"bid-1": {"order_id": "bid-1", "remaining_size": 1.5},
+                                           "bid-2": {"order_id": "bid-2", "remaining_size": 0.5}}},
+                         self.tracker.active_bids)
+        self.assertEqual(2, self.tracker.volume_for_bid_price("100.00"))
+
+        self.tracker.apply_diff_message(self.order_book, self.diff_message(
+            {"type": "open", "order_id": "ask-2", "side": "sell", "price": "101.00", "remaining_size": "1"}))
+        self.assertEqual([OrderBookRow(101, 3, self.sequence)], list(self.order_book.ask_entries()))
+        self.tracker.apply_diff_message(self.order_book, self.diff_message(
+            {"type": "change", "order_id": "bid-1", "side": "buy", "price": "100.00", "new_funds": "50"}))
+        self.assertEqual(1, self.tracker.volume_for_bid_price(100))
+        self.tracker.apply_diff_message(self.order_book, self.diff_message(
+            {"type": "match", "maker_order_id": "ask-1", "taker_order_id": "taker", "side": "sell",
+             "price": "101.00", "size": "0.5"}))
+        self.assertEqual([OrderBookRow(101, 2.5, self.sequence)], list(self.order_book.ask_entries()))
+        for order_id in ["bid-1", "bid-2"]:
+            self.tracker.apply_diff_message(self.order_book, self.diff_message(
+                {"type": "done", "order_id": order_id, "side": "buy", "price": "100.00", "reason": "filled"}))
+        self.assertEqual([], list(self.order_book.bid_entries()))
+        self.assertEqual({}, self.tracker.active_bids)
+
+        # Market orders are not on the book
+        self.tracker.apply_diff_message(self.order_book, self.diff_message(
+            {"type": "change", "order_id": "market", "side": "buy", "price": "null", "new_funds": "50"}))
+        self.tracker.apply_diff_message(self.order_book, self.diff_message(
+            {"type": "done", "order_id": "market", "side": "buy", "reason": "filled"}))
+        with self.assertRaises(ValueError):
+            self.tracker.apply_diff_message(self.order_book, self.diff_message({"type": "open", "side": "buy"}))
+
+    def test_order_book_rows(self):
+        bids, asks = self.tracker.convert_snapshot_message_to_order_book_row(self.snapshot_message(
+            [["99.00", "1", "bid-1"], ["100.00", "1", "bid-2"]], [["101.00", "2", "ask-1"]]))
+        self.assertEqual([OrderBookRow(100, 1, 1), OrderBookRow(99, 1, 1)], bids)
+        self.assertEqual([OrderBookRow(101, 2, 1)], asks)
+        bids, asks = self.tracker.convert_diff_message_to_order_book_row(self.diff_message(
+            {"type": "done", "order_id": "bid-1", "side": "buy", "price": "99.00", "reason": "canceled"}))
+        self.assertEqual([OrderBookRow(99, 0, self.sequence)], bids)
+        self.assertEqual([], asks)
+
+    def test_recorded_feed_replay(self):
+        snapshot, messages = self.recorded_feed(5000)
+        expected_order_book = self.replay_dict_tracker(snapshot, messages)
+        order_book = self.replay_l3_tracker(snapshot, messages)
+        self.assert_same_levels(expected_order_book.bid_entries(), order_book.bid_entries())
+        self.assert_same_levels(expected_order_book.ask_entries(), order_book.ask_entries())
+        self.assertEqual(expected_order_book.get_price(True), order_book.get_price(True))
+        self.assertEqual(expected_order_book.get_price(False), order_book.get_price(False))
+
+    @unittest.skipUnless(os.environ.get("HUMMINGBOT_BENCHMARKS"), "Set HUMMINGBOT_BENCHMARKS=1 to run the benchmarks.")
+    def test_recorded_feed_replay_benchmark(self):
+        snapshot, messages = self.recorded_feed(50000)
+
+        start = time.perf_counter()
+        expected_order_book = self.replay_dict_tracker(snapshot, messages)
+        dict_duration = time.perf_counter() - start
+
+        start = time.perf_counter()
+        order_book = self.replay_l3_tracker(snapshot, messages)
+        l3_duration = time.perf_counter() - start
+
+        # Timings are reported only, they depend too much on the machine to be asserted on
+        print(f"\nReplay of {len(messages)} L3 messages: dictionary tracker {dict_duration * 1e3:.1f} ms, "
+              f"L3 order book engine {l3_duration * 1e3:.1f} ms ({dict_duration / l3_duration:.1f}x)")
+        self.assert_same_levels(expected_order_book.bid_entries(), order_book.bid_entries())
+        self.assert_same_levels(expected_order_book.ask_entries(), order_book.ask_entries())
@@ -3,7 +3,7 @@ import unittest
 import unittest.mock
 from decimal import Decimal
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
-from hummingbot.core.event.events import OrderType, TradeType, TradeFee
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent, OrderType, TradeType, TradeFee
 from hummingbot.connector.connector_base import ConnectorBase
 
 
@@ -46,3 +46,28 @@ class ConnectorBaseUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("300"), bals["USDT"])
         self.assertEqual(Decimal("1.5"), bals["HBOT"])
         print(bals)
+
+    def test_order_filled_balances(self):
+        connector = ConnectorBase()
+        fee = TradeFee(percent=Decimal("0"), flat_fees=[])
+        fills = [
+            OrderFilledEvent(1, "1", "HBOT-USDT", TradeType.BUY, OrderType.LIMIT, Decimal("10"), Decimal("2"), fee),
+            OrderFilledEvent(2, "2", "ETH-USDT", TradeType.SELL, OrderType.LIMIT, Decimal("100"), Decimal("1"), fee),
+            OrderFilledEvent(3, "3", "HBOT-USDT", TradeType.SELL, OrderType.LIMIT, Decimal("11"), Decimal("1"), fee),
+        ]
+        for fill in fills:
+            connector.trigger_event(MarketEvent.OrderFilled, fill)
+
+        self.assertEqual({"HBOT": Decimal("1"), "USDT": Decimal("91"), "ETH": Decimal("-1")},
+                         connector.order_filled_balances())
+        self.assertEqual({"HBOT": Decimal("-1"), "USDT": Decimal("111"), "ETH": Decimal("-1")},
+                         connector.order_filled_balances(1))
+        self.assertEqual({"HBOT": Decimal("-1"), "USDT": Decimal("11")}, connector.order_filled_balances(2))
+        self.assertEqual({}, connector.order_filled_balances(3))
+
+        # A fill reported out of order
+        connector.trigger_event(MarketEvent.OrderFilled, OrderFilledEvent(
+            2.5, "4", "HBOT-USDT", TradeType.BUY, OrderType.LIMIT, Decimal("9"), Decimal("1"), fee))
+        self.assertEqual({"HBOT": Decimal("0"), "USDT": Decimal("2")}, connector.order_filled_balances(2))
+        self.assertEqual({"HBOT": Decimal("2"), "USDT": Decimal("82"), "ETH": Decimal("-1")},
+                         connector.order_filled_balances())
@@ -0,0 +1,53 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.event.events import OrderType
+
+
+class MockExchange(ExchangeBase):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def buy(self, trading_pair: str, amount: Decimal, order_type=OrderType.MARKET, price: Decimal = Decimal("NaN"),
+            **kwargs) -> str:
+        self.calls.append(("buy", trading_pair, amount, order_type, price, kwargs))
+        return f"buy-{len(self.calls)}"
+
+    def sell(self, trading_pair: str, amount: Decimal, order_type=OrderType.MARKET, price: Decimal = Decimal("NaN"),
+             **kwargs) -> str:
+        self.calls.append(("sell", trading_pair, amount, order_type, price, kwargs))
+        return f"sell-{len(self.calls)}"
+
+    def cancel(self, trading_pair: str, client_order_id: str):
+        self.calls.append(("cancel", trading_pair, client_order_id))
+        return client_order_id
+
+
+class ExchangeBaseUnitTest(unittest.TestCase):
+
+    def test_batch_create_orders(self):
+        exchange = MockExchange()
+        orders = [LimitOrder("", "ETH-USDT", True, "ETH", "USDT", Decimal("99"), Decimal("1")),
+                  LimitOrder("", "ETH-USDT", False, "ETH", "USDT", Decimal("101"), Decimal("2"))]
+        created_orders = exchange.batch_create_orders(orders, OrderType.LIMIT_MAKER, expiration_ts=10)
+
+        # The orders are placed one by one
+        self.assertEqual([("buy", "ETH-USDT", Decimal("1"), OrderType.LIMIT_MAKER, Decimal("99"), {"expiration_ts": 10}),
+                          ("sell", "ETH-USDT", Decimal("2"), OrderType.LIMIT_MAKER, Decimal("101"),
+                           {"expiration_ts": 10})],
+                         exchange.calls)
+        self.assertEqual(["buy-1", "sell-2"], [order.client_order_id for order in created_orders])
+        self.assertEqual([True, False], [order.is_buy for order in created_orders])
+        self.assertEqual([Decimal("99"), Decimal("101")], [order.price for order in created_orders])
+        self.assertEqual([Decimal("1"), Decimal("2")], [order.quantity for order in created_orders])
+
+    def test_batch_cancel_orders(self):
+        exchange = MockExchange()
+        orders = [LimitOrder("buy-1", "ETH-USDT", True, "ETH", "USDT", Decimal("99"), Decimal("1")),
+                  LimitOrder("sell-2", "BTC-USDT", False, "BTC", "USDT", Decimal("101"), Decimal("2"))]
+        exchange.batch_cancel_orders(orders)
+
+        self.assertEqual([("cancel", "ETH-USDT", "buy-1"), ("cancel", "BTC-USDT", "sell-2")], exchange.calls)
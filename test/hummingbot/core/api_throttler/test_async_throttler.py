@@ -224,3 +224,11 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
             self.ev_loop.run_until_complete(
                 asyncio.wait_for(context.acquire(), 1.0)
             )
+
+    def test_acquire_records_wait_time_stats(self):
+        self.ev_loop.run_until_complete(self.execute_requests(no_request=1, limit_id=TEST_POOL_ID, throttler=self.throttler))
+
+        stats = self.throttler.wait_time_stats[TEST_POOL_ID]
+        self.assertEqual(1, stats.request_count)
+        self.assertEqual(0, stats.throttled_count)
+        self.assertEqual(0, self.throttler.wait_time_stats[TEST_PATH_URL].request_count)
@@ -0,0 +1,128 @@
+import asyncio
+import time
+import unittest
+
+from typing import List
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.time_bucketed_async_throttler import (
+    RateLimitBuckets,
+    TimeBucketedAsyncThrottler,
+)
+
+TEST_PATH_URL = "/hummingbot"
+TEST_POOL_ID = "TEST"
+TEST_WEIGHTED_POOL_ID = "TEST_WEIGHTED"
+TEST_WEIGHTED_TASK_1_ID = "/weighted_task_1"
+TEST_WEIGHTED_TASK_2_ID = "/weighted_task_2"
+TEST_FAST_ID = "/fast"
+
+
+class TimeBucketedAsyncThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=5.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1, time_interval=5.0, linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_POOL_ID, limit=10, time_interval=5.0),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_1_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 5)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_2_ID,
+                      limit=1000,
+                      time_interval=5.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_WEIGHTED_POOL_ID, 1)]),
+            RateLimit(limit_id=TEST_FAST_ID, limit=2, time_interval=0.2),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = TimeBucketedAsyncThrottler(rate_limits=self.rate_limits)
+
+    def tearDown(self) -> None:
+        global_config_map["rate_limits_share_pct"].value = None
+        super().tearDown()
+
+    def acquire(self, limit_id: str, timeout: float = 1.0):
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.throttler.execute_task(limit_id).acquire(), timeout))
+
+    def test_buckets_running_total(self):
+        buckets = RateLimitBuckets(RateLimit(limit_id=TEST_POOL_ID, limit=3, time_interval=10.0), window=10.0)
+
+        buckets.add(100.0, 1)
+        buckets.add(100.5, 1)
+        buckets.add(105.0, 1)
+        self.assertEqual(3, buckets.capacity_used)
+        self.assertFalse(buckets.has_capacity(1))
+        # The first bucket [100, 101) expires once all of it has left the window.
+        self.assertEqual(3.0, buckets.time_until_capacity(108.0, 1))
+        self.assertEqual(8.0, buckets.time_until_capacity(108.0, 3))
+
+        buckets.expire(110.9)
+        self.assertEqual(3, buckets.capacity_used)
+        buckets.expire(111.0)
+        self.assertEqual(1, buckets.capacity_used)
+        self.assertTrue(buckets.has_capacity(2))
+        self.assertEqual(0.0, buckets.time_until_capacity(111.0, 2))
+
+    def test_within_capacity_pool_non_weighted_task(self):
+        context = self.throttler.execute_task(TEST_PATH_URL)
+        self.assertTrue(context.within_capacity())
+
+        self.acquire(TEST_PATH_URL)
+
+        self.assertEqual(1, self.throttler.capacity_used(TEST_PATH_URL))
+        self.assertEqual(1, self.throttler.capacity_used(TEST_POOL_ID))
+        self.assertFalse(self.throttler.execute_task(TEST_PATH_URL).within_capacity())
+        self.assertFalse(self.throttler.execute_task(TEST_POOL_ID).within_capacity())
+
+    def test_within_capacity_pool_weighted_tasks(self):
+        self.acquire(TEST_WEIGHTED_TASK_1_ID)
+        self.acquire(TEST_WEIGHTED_TASK_2_ID)
+        self.assertEqual(6, self.throttler.capacity_used(TEST_WEIGHTED_POOL_ID))
+
+        # Another Task 1(weight=5) will exceed the capacity(11/10)
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_1_ID).within_capacity())
+        # However Task 2(weight=1) will not exceed the capacity(7/10)
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        self.acquire(TEST_POOL_ID)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.acquire(TEST_POOL_ID, timeout=0.5)
+
+    def test_acquire_waits_until_capacity_is_freed(self):
+        start = time.time()
+        for _ in range(3):
+            self.acquire(TEST_FAST_ID)
+        elapsed = time.time() - start
+
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 0.6)
+
+        stats = self.throttler.wait_time_stats[TEST_FAST_ID]
+        self.assertEqual(3, stats.request_count)
+        self.assertEqual(1, stats.throttled_count)
+        self.assertGreaterEqual(stats.max_wait_time, 0.15)
+        self.assertAlmostEqual(stats.total_wait_time / 3, stats.average_wait_time)
+
+    def test_concurrent_requests_stay_within_limit(self):
+        timestamps: List[float] = []
+
+        async def request():
+            async with self.throttler.execute_task(TEST_FAST_ID):
+                timestamps.append(time.time())
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(asyncio.gather(*[request() for _ in range(6)]), 3.0))
+
+        self.assertEqual(6, len(timestamps))
+        timestamps.sort()
+        for i in range(2, len(timestamps)):
+            # No more than 2 requests in any 0.2s window.
+            self.assertGreaterEqual(timestamps[i] - timestamps[i - 2], 0.2)
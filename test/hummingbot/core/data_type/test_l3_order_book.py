@@ -0,0 +1,81 @@
+import unittest
+
+from hummingbot.core.data_type.l3_order_book import L3OrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+class L3OrderBookUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.l3_book = L3OrderBook()
+        self.order_book = OrderBook()
+
+    @staticmethod
+    def book_levels(entries):
+        return {row.price: row.amount for row in entries}
+
+    def test_price_levels_aggregate_orders(self):
+        self.l3_book.add_order("bid-1", True, 100, 1)
+        self.l3_book.add_order("bid-2", True, 100, 2)
+        self.l3_book.add_order("bid-3", True, 99, 0.5)
+        self.l3_book.add_order("ask-1", False, 101, 1.5)
+
+        self.assertEqual(4, self.l3_book.order_count)
+        self.assertEqual({100: 3, 99: 0.5}, self.l3_book.get_levels(True))
+        self.assertEqual({101: 1.5}, self.l3_book.get_levels(False))
+        self.assertEqual({100: {"bid-1": 1, "bid-2": 2}, 99: {"bid-3": 0.5}}, self.l3_book.get_orders_by_price(True))
+        self.assertEqual((False, 101, 1.5), self.l3_book.get_order("ask-1"))
+        self.assertIsNone(self.l3_book.get_order("unknown"))
+
+    def test_order_changes(self):
+        self.l3_book.add_order("bid-1", True, 100, 1)
+        self.l3_book.add_order("bid-2", True, 100, 2)
+
+        self.assertTrue(self.l3_book.set_order_size("bid-1", 4))
+        self.assertEqual(6, self.l3_book.get_level_size(True, 100))
+        self.assertTrue(self.l3_book.reduce_order_size("bid-2", 0.5))
+        self.assertEqual(5.5, self.l3_book.get_level_size(True, 100))
+        self.assertTrue(self.l3_book.remove_order("bid-1"))
+        self.assertEqual(1.5, self.l3_book.get_level_size(True, 100))
+        # Unknown orders are ignored
+        self.assertFalse(self.l3_book.set_order_size("bid-1", 1))
+        self.assertFalse(self.l3_book.reduce_order_size("bid-1", 1))
+        self.assertFalse(self.l3_book.remove_order("bid-1"))
+        # An order is moved when it is added again
+        self.l3_book.add_order("bid-2", True, 98, 1)
+        self.assertEqual({98: 1}, self.l3_book.get_levels(True))
+
+    def test_level_removed_with_its_last_order(self):
+        self.l3_book.add_order("ask-1", False, 101, 0.1)
+        self.l3_book.add_order("ask-2", False, 101, 0.2)
+        self.l3_book.reduce_order_size("ask-1", 0.3)
+        self.assertEqual((False, 101, 0), self.l3_book.get_order("ask-1"))
+        self.l3_book.remove_order("ask-2")
+        self.assertEqual(0, self.l3_book.get_level_size(False, 101))
+        self.l3_book.remove_order("ask-1")
+        self.assertEqual({}, self.l3_book.get_levels(False))
+
+    def test_apply_changed_levels_to_order_book(self):
+        self.l3_book.add_order("bid-1", True, 100, 1)
+        self.l3_book.add_order("bid-2", True, 99, 2)
+        self.l3_book.add_order("ask-1", False, 101, 1)
+        self.l3_book.apply_snapshot_to(self.order_book, 1)
+        self.assertEqual({100: 1, 99: 2}, self.book_levels(self.order_book.bid_entries()))
+        self.assertEqual({101: 1}, self.book_levels(self.order_book.ask_entries()))
+
+        self.l3_book.add_order("bid-3", True, 100, 0.5)
+        self.l3_book.remove_order("bid-2")
+        self.l3_book.add_order("ask-2", False, 102, 3)
+        self.l3_book.remove_order("ask-2")
+        self.l3_book.apply_diffs_to(self.order_book, 2)
+        self.assertEqual({100: 1.5}, self.book_levels(self.order_book.bid_entries()))
+        self.assertEqual({101: 1}, self.book_levels(self.order_book.ask_entries()))
+        self.assertEqual(2, self.order_book.last_diff_uid)
+
+    def test_clear(self):
+        self.l3_book.add_order("bid-1", True, 100, 1)
+        self.l3_book.clear()
+        self.assertEqual(0, self.l3_book.order_count)
+        self.assertEqual({}, self.l3_book.get_levels(True))
+        # The cleared levels are not reported as changes
+        self.l3_book.apply_diffs_to(self.order_book, 1)
+        self.assertEqual([], list(self.order_book.bid_entries()))
@@ -3,6 +3,7 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 import numpy as np
 
 
@@ -50,6 +51,92 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_index_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1], [13, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 2)
+        self.assertEqual(12, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_price_for_volume(False, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(6, result.result_volume)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertAlmostEqual((11 + 12) / 2, result.result_price)
+        self.assertEqual(2, result.result_volume)
+        result = order_book.get_vwap_for_volume(False, 4)
+        self.assertAlmostEqual((10 + 9 * 2 + 8) / 4, result.result_price)
+
+        result = order_book.get_quote_volume_for_base_amount(True, 2.5)
+        self.assertAlmostEqual(11 + 12 * 1.5, result.result_volume)
+        result = order_book.get_quote_volume_for_base_amount(True, 100)
+        self.assertAlmostEqual(11 + 24 + 39, result.result_volume)
+
+        result = order_book.get_price_for_quote_volume(True, 30)
+        self.assertEqual(12, result.result_price)
+
+        result = order_book.get_volume_for_price(True, 12.5)
+        self.assertEqual(12, result.result_price)
+        self.assertEqual(3, result.result_volume)
+        result = order_book.get_volume_for_price(False, 9)
+        self.assertEqual(9, result.result_price)
+        self.assertEqual(3, result.result_volume)
+        result = order_book.get_volume_for_price(False, 11)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(0, result.result_volume)
+
+        result = order_book.get_quote_volume_for_price(False, 8)
+        self.assertEqual(8, result.result_price)
+        self.assertEqual(10 + 18 + 24, result.result_volume)
+
+    def test_depth_index_invalidated_by_diffs(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        self.assertEqual(3, order_book.get_volume_for_price(True, 12).result_volume)
+
+        order_book.apply_numpy_diffs(np.array([[10, 0, 2]], dtype=np.float64),
+                                     np.array([[11.5, 4, 2], [11, 0, 2]], dtype=np.float64))
+        self.assertEqual(6, order_book.get_volume_for_price(True, 12).result_volume)
+        self.assertEqual(11.5, order_book.get_price_for_volume(True, 1).result_price)
+        self.assertEqual(9, order_book.get_price_for_volume(False, 1).result_price)
+
+        order_book.apply_numpy_snapshot(np.empty((0, 3), dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual(0, order_book.get_volume_for_price(True, 12).result_volume)
+        self.assertTrue(np.isnan(order_book.get_vwap_for_volume(False, 1).result_price))
+
+    def test_apply_messages(self):
+        order_book = OrderBook()
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 1,
+            "bids": [["10", "1"], ["9", "2"]],
+            "asks": [["11", "1"], ["12", "2"]],
+        }, timestamp=1.0)
+        diff = OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 2,
+            "bids": [["10", "0"], ["9.5", "4"]],
+            "asks": [],
+        }, timestamp=2.0)
+
+        order_book.apply_snapshot_message(snapshot)
+        self.assertEqual(1, order_book.snapshot_uid)
+        self.assertEqual(10, order_book.get_price(False))
+
+        order_book.apply_diffs_message(diff)
+        self.assertEqual(2, order_book.last_diff_uid)
+        self.assertEqual(9.5, order_book.get_price(False))
+        self.assertEqual([9.5, 4, 2], list(next(order_book.bid_entries())))
+
+        order_book.restore_from_snapshot_and_diffs(snapshot, [diff])
+        self.assertEqual(9.5, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+    parse_order_book_entries,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class OrderBookMessageTests(unittest.TestCase):
+
+    def _diff_message(self, bids, asks, update_id=10):
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks
+        }, timestamp=1.0)
+
+    def test_parse_order_book_entries(self):
+        array = parse_order_book_entries([["1.5", "2"], ["1.4", "0"]], 7)
+        self.assertEqual([[1.5, 2.0, 7.0], [1.4, 0.0, 7.0]], array.tolist())
+
+        array = parse_order_book_entries([["1.5", "2", "abc"], ["1.4", "3", "def"]], 7)
+        self.assertEqual([[1.5, 2.0, 7.0], [1.4, 3.0, 7.0]], array.tolist())
+
+        array = parse_order_book_entries([], 7)
+        self.assertEqual((0, 3), array.shape)
+
+    def test_rows_are_parsed_once(self):
+        message = self._diff_message([["1.5", "2"]], [["1.6", "3"]])
+
+        self.assertEqual([OrderBookRow(1.5, 2.0, 10)], message.bids)
+        self.assertEqual([OrderBookRow(1.6, 3.0, 10)], message.asks)
+        self.assertIs(message.bids, message.bids)
+        self.assertIs(message.asks, message.asks)
+
+    def test_entries_arrays(self):
+        message = self._diff_message([["1.5", "2"], ["1.4", "1"]], [["1.6", "3"]])
+
+        self.assertEqual([[1.5, 2.0, 10.0], [1.4, 1.0, 10.0]], message.bids_array.tolist())
+        self.assertEqual([[1.6, 3.0, 10.0]], message.asks_array.tolist())
+        self.assertEqual(np.float64, message.bids_array.dtype)
+        self.assertIs(message.bids_array, message.bids_array)
+
+    def test_entries_arrays_use_overridden_rows(self):
+        class CustomOrderBookMessage(OrderBookMessage):
+            @property
+            def bids(self):
+                return [OrderBookRow(float(entry["price"]), float(entry["size"]), self.update_id)
+                        for entry in self.content["bids"]]
+
+        message = CustomOrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 3,
+            "bids": [{"price": "1.5", "size": "2"}],
+            "asks": [],
+        }, timestamp=1.0)
+
+        self.assertEqual([[1.5, 2.0, 3.0]], message.bids_array.tolist())
+        self.assertEqual((0, 3), message.asks_array.shape)
@@ -0,0 +1,174 @@
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+from sqlalchemy import create_engine
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_replay import (
+    HistoricalReplayDataSource,
+    OrderBookReplayer,
+    ReplayOrderBookTracker,
+    merge_replay_messages,
+    snapshot_messages_from_db,
+    snapshot_messages_from_store,
+)
+from hummingbot.core.data_type.order_book_snapshot_store import OrderBookSnapshotStore
+from hummingbot.core.data_type.order_book_snapshot_writer import OrderBookSnapshotWriter
+from hummingbot.core.event.events import TradeType
+
+
+class OrderBookReplayTests(unittest.TestCase):
+    start_timestamp: float = 1630000000.0
+
+    def _snapshot(self, trading_pair: str, timestamp: float, update_id: int, best_bid: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": [[best_bid, 1.0], [best_bid - 1, 2.0]],
+            "asks": [[best_bid + 1, 1.0], [best_bid + 2, 2.0]],
+        }, timestamp=timestamp)
+
+    def _diff(self, trading_pair: str, timestamp: float, update_id: int, bids, asks) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": asks,
+        }, timestamp=timestamp)
+
+    def _trade(self, trading_pair: str, timestamp: float, price: float) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.TRADE, {
+            "trading_pair": trading_pair,
+            "trade_id": int(timestamp),
+            "update_id": int(timestamp),
+            "price": price,
+            "amount": 1.0,
+            "trade_type": float(TradeType.BUY.value),
+        }, timestamp=timestamp)
+
+    def _replayer(self, trading_pairs, messages, stop_when_exhausted=True) -> OrderBookReplayer:
+        data_source = HistoricalReplayDataSource(trading_pairs, messages)
+        tracker = ReplayOrderBookTracker(data_source, trading_pairs, "binance")
+        return OrderBookReplayer(tracker, stop_when_exhausted=stop_when_exhausted)
+
+    def test_merge_replay_messages_orders_by_timestamp_then_type(self):
+        start = self.start_timestamp
+        merged = list(merge_replay_messages(
+            [self._trade("BTC-USDT", start + 1, 100.5), self._diff("BTC-USDT", start + 2, 2, [], [])],
+            [self._diff("LTC-USDT", start + 1, 2, [], [])],
+            [self._snapshot("ETH-USDT", start + 1, 1, 10), self._diff("ETH-USDT", start + 1, 2, [], [])],
+        ))
+
+        self.assertEqual([(start + 1, OrderBookMessageType.SNAPSHOT),
+                          (start + 1, OrderBookMessageType.DIFF),
+                          (start + 1, OrderBookMessageType.DIFF),
+                          (start + 1, OrderBookMessageType.TRADE),
+                          (start + 2, OrderBookMessageType.DIFF)],
+                         [(message.timestamp, message.type) for message in merged])
+
+    def test_replay_follows_clock(self):
+        start = self.start_timestamp
+        replayer = self._replayer(["BTC-USDT"], [
+            self._snapshot("BTC-USDT", start + 1, 1, 100),
+            self._diff("BTC-USDT", start + 2.5, 2, [[100.5, 3.0]], [[101.0, 0.0]]),
+            self._trade("BTC-USDT", start + 3, 100.5),
+            self._diff("BTC-USDT", start + 10, 3, [[99.0, 0.0]], []),
+        ])
+        clock = Clock(ClockMode.BACKTEST, 1.0, start, start + 60)
+        clock.add_iterator(replayer)
+
+        clock.backtest_til(start + 1)
+        order_book = replayer.order_book_tracker.order_books["BTC-USDT"]
+        self.assertTrue(replayer.order_book_tracker.ready)
+        self.assertEqual(100, order_book.get_price(False))
+        self.assertEqual(101, order_book.get_price(True))
+
+        clock.backtest_til(start + 2)
+        self.assertEqual(100, order_book.get_price(False))
+
+        clock.backtest_til(start + 3)
+        self.assertEqual(100.5, order_book.get_price(False))
+        self.assertEqual(102, order_book.get_price(True))
+        self.assertEqual(100.5, order_book.last_trade_price)
+        self.assertEqual(1, replayer.messages_replayed[OrderBookMessageType.TRADE])
+
+        # The replay stops the backtest once the recorded data is exhausted.
+        clock.backtest()
+        self.assertEqual(start + 10, clock.current_timestamp)
+        self.assertEqual([[100.5, 3.0], [100.0, 1.0]],
+                         [[entry.price, entry.amount] for entry in order_book.bid_entries()])
+
+    def test_replay_continues_when_not_stopping_on_exhaustion(self):
+        start = self.start_timestamp
+        replayer = self._replayer(["BTC-USDT"], [self._snapshot("BTC-USDT", start + 1, 1, 100)],
+                                  stop_when_exhausted=False)
+        clock = Clock(ClockMode.BACKTEST, 1.0, start, start + 5)
+        clock.add_iterator(replayer)
+
+        clock.backtest()
+
+        self.assertEqual(start + 5, clock.current_timestamp)
+        self.assertTrue(replayer.order_book_tracker.data_source.exhausted)
+
+    def test_replay_from_snapshot_store(self):
+        start = self.start_timestamp
+        with tempfile.TemporaryDirectory() as root_dir:
+            store = OrderBookSnapshotStore(root_dir)
+            for i in range(3):
+                store.append("binance", "BTC-USDT", start + i, i + 1,
+                             np.array([[100.0 + i, 1.0]]), np.array([[101.0 + i, 1.0]]))
+                store.append("binance", "ETH-USDT", start + i + 0.5, i + 1,
+                             np.array([[10.0 + i, 1.0]]), np.array([[11.0 + i, 1.0]]))
+
+            messages = snapshot_messages_from_store(store, "binance", ["BTC-USDT", "ETH-USDT"], start, start + 60)
+            replayer = self._replayer(["BTC-USDT", "ETH-USDT"], messages)
+            clock = Clock(ClockMode.BACKTEST, 1.0, start, start + 60)
+            clock.add_iterator(replayer)
+
+            clock.backtest_til(start + 1)
+            order_books = replayer.order_book_tracker.order_books
+            self.assertEqual(101, order_books["BTC-USDT"].get_price(False))
+            self.assertEqual(10, order_books["ETH-USDT"].get_price(False))
+            self.assertEqual(2, order_books["BTC-USDT"].snapshot_uid)
+
+            clock.backtest()
+            self.assertEqual(start + 3, clock.current_timestamp)
+            self.assertEqual(102, order_books["BTC-USDT"].get_price(False))
+            self.assertEqual(12, order_books["ETH-USDT"].get_price(False))
+            self.assertEqual(6, replayer.messages_replayed[OrderBookMessageType.SNAPSHOT])
+
+    def test_snapshot_messages_from_db(self):
+        start = self.start_timestamp
+        engine = create_engine("sqlite://")
+        writer = OrderBookSnapshotWriter(engine, "binance")
+        rows = []
+        for i, trading_pair in enumerate(["BTC-USDT", "ETH-USDT", "BTC-USDT"]):
+            rows.extend(writer.snapshot_rows(self._snapshot(trading_pair, start + i, i + 1, 100 + i), trading_pair))
+        writer._insert_rows(rows)
+
+        messages = list(snapshot_messages_from_db(engine, "binance", ["BTC-USDT"], start, start + 60))
+
+        self.assertEqual([(start, 1), (start + 2, 3)], [(message.timestamp, message.update_id) for message in messages])
+        self.assertEqual([[102, 1, 3], [101, 2, 3]], messages[1].bids_array.tolist())
+        self.assertEqual([[103, 1, 3], [104, 2, 3]], messages[1].asks_array.tolist())
+
+    def test_order_book_messages_from_db_records(self):
+        record = SimpleNamespace(json={"trading_pair": "BTC-USDT", "update_id": 5, "bids": [[100, 1]], "asks": []},
+                                 timestamp=self.start_timestamp)
+
+        snapshot_message = OrderBook.snapshot_message_from_db(record, {"exchange": "binance"})
+        self.assertEqual(OrderBookMessageType.SNAPSHOT, snapshot_message.type)
+        self.assertEqual(self.start_timestamp, snapshot_message.timestamp)
+        self.assertEqual(5, snapshot_message.update_id)
+        self.assertEqual([[100, 1, 5]], snapshot_message.bids_array.tolist())
+        self.assertEqual("binance", snapshot_message.content["exchange"])
+
+        diff_message = OrderBook.diff_message_from_db(record)
+        self.assertEqual(OrderBookMessageType.DIFF, diff_message.type)
+        self.assertEqual("BTC-USDT", diff_message.trading_pair)
+        # The record is left as it is
+        self.assertNotIn("exchange", record.json)
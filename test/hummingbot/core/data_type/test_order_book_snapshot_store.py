@@ -0,0 +1,69 @@
+import tempfile
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_snapshot_store import OrderBookSnapshotStore
+
+DAY = 24 * 60 * 60
+
+
+class OrderBookSnapshotStoreTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.root_dir = tempfile.TemporaryDirectory()
+        self.store = OrderBookSnapshotStore(self.root_dir.name)
+        self.start = 1630000000.0
+
+    def tearDown(self) -> None:
+        self.root_dir.cleanup()
+        super().tearDown()
+
+    def _append(self, timestamp: float, update_id: int, best_bid: float):
+        bids = np.array([[best_bid, 1], [best_bid - 1, 2]], dtype=np.float64)
+        asks = np.array([[best_bid + 1, 3]], dtype=np.float64)
+        self.store.append("binance", "BTC-USDT", timestamp, update_id, bids, asks)
+
+    def test_read_window(self):
+        self._append(self.start, 1, 100)
+        self._append(self.start + 10, 2, 101)
+        self._append(self.start + DAY, 3, 102)
+
+        snapshots = list(self.store.read("binance", "BTC-USDT", self.start + 5, self.start + DAY))
+
+        self.assertEqual([2, 3], [update_id for _, update_id, _, _ in snapshots])
+        timestamp, update_id, bids, asks = snapshots[0]
+        self.assertEqual(self.start + 10, timestamp)
+        self.assertEqual([[101, 1, 2], [100, 2, 2]], bids.tolist())
+        self.assertEqual([[102, 3, 2]], asks.tolist())
+        self.assertEqual([self.start, self.start + 10],
+                         self.store.timestamps("binance", "BTC-USDT", self.start, self.start + 20).tolist())
+        self.assertEqual([], list(self.store.read("binance", "ETH-USDT", self.start, self.start + DAY)))
+
+    def test_read_latest(self):
+        self._append(self.start, 1, 100)
+        self._append(self.start + 10, 2, 101)
+
+        self.assertEqual(1, self.store.read_latest("binance", "BTC-USDT", self.start + 5)[1])
+        self.assertEqual(2, self.store.read_latest("binance", "BTC-USDT", self.start + 2 * DAY)[1])
+        self.assertIsNone(self.store.read_latest("binance", "BTC-USDT", self.start - 1))
+
+    def test_round_trip_into_order_book(self):
+        message = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "BTC-USDT",
+            "update_id": 5,
+            "bids": [["10", "1"], ["9", "2"]],
+            "asks": [],
+        }, timestamp=self.start)
+        self.store.append_message("binance", message)
+
+        _, _, bids, asks = self.store.read_latest("binance", "BTC-USDT", self.start)
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(bids, asks)
+
+        self.assertEqual(10, order_book.get_price(False))
+        self.assertEqual(5, order_book.snapshot_uid)
+        self.assertEqual(0, len(list(order_book.ask_entries())))
@@ -0,0 +1,72 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from sqlalchemy import create_engine
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_snapshot_writer import OrderBookSnapshotWriter
+from hummingbot.model.dm_order_book_snapshot import OrderBookSnapshot
+
+
+class OrderBookSnapshotWriterTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.db_dir.name, 'dm.sqlite')}")
+        self.writer = OrderBookSnapshotWriter(self.engine, "binance", batch_size=3, flush_interval=0.1)
+
+    def tearDown(self) -> None:
+        self.writer.stop()
+        self.engine.dispose()
+        self.db_dir.cleanup()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine, timeout: float = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    @staticmethod
+    def _snapshot_message(update_id: int) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": update_id,
+            "bids": [["10", "1"], ["9", "2"]],
+            "asks": [["11", "3"]],
+        }, timestamp=1.5)
+
+    def test_snapshot_rows(self):
+        rows = self.writer.snapshot_rows(self._snapshot_message(7), "COINALPHA-HBOT")
+
+        self.assertEqual(3, len(rows))
+        self.assertEqual({
+            "trading_pair": "COINALPHA-HBOT",
+            "timestamp": 1500,
+            "type": "SNAPSHOT",
+            "exchange": "binance",
+            "price": 10.0,
+            "amount": 1.0,
+            "update_id": "7",
+            "is_bid": 1,
+        }, rows[0])
+        self.assertEqual(0, rows[2]["is_bid"])
+
+    def test_write_in_batches(self):
+        self.writer.start()
+
+        async def write_and_wait():
+            await self.writer.write(self._snapshot_message(1), "COINALPHA-HBOT")
+            await self.writer.write(self._snapshot_message(2), "COINALPHA-HBOT")
+            while self.writer.rows_written < 6:
+                await asyncio.sleep(0.05)
+
+        self.async_run_with_timeout(write_and_wait())
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(OrderBookSnapshot.__table__.select()).fetchall()
+        self.assertEqual(6, len(rows))
+        self.assertEqual({"1", "2"}, {row["update_id"] for row in rows})
+        self.assertEqual(0, self.writer.queue_depth)
+        self.assertGreater(self.writer.rows_per_second, 0)
@@ -0,0 +1,128 @@
+import asyncio
+import time
+import unittest
+from typing import Dict, List
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str], delays: Dict[str, float]):
+        super().__init__(trading_pairs)
+        self._delays: Dict[str, float] = delays
+        self.requests_in_flight: int = 0
+        self.max_requests_in_flight: int = 0
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.requests_in_flight += 1
+        self.max_requests_in_flight = max(self.max_requests_in_flight, self.requests_in_flight)
+        try:
+            await asyncio.sleep(self._delays.get(trading_pair, 0.1))
+        finally:
+            self.requests_in_flight -= 1
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 10)
+        return order_book
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = [f"COIN{i}-USDT" for i in range(8)]
+        self.data_source = MockOrderBookTrackerDataSource(self.trading_pairs, delays={"COIN0-USDT": 0.5})
+        self.tracker = OrderBookTracker(self.data_source, self.trading_pairs)
+        self.tracker.MAX_CONCURRENT_SNAPSHOT_REQUESTS = 4
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def _diff(self, trading_pair: str, update_id: int) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "trading_pair": trading_pair,
+            "update_id": update_id,
+            "bids": [[1.0, float(update_id)]],
+            "asks": [],
+        }, timestamp=time.time())
+
+    def test_init_order_books_concurrently(self):
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.tracker._init_order_books(), 5))
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(set(self.trading_pairs), self.tracker.ready_trading_pairs)
+        self.assertEqual(4, self.data_source.max_requests_in_flight)
+        # Throttled at 5 snapshot requests per second, far from one pair per second.
+        self.assertLess(self.tracker.init_duration, 3.0)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_book_init_durations.keys()))
+        self.assertGreater(self.tracker.order_book_init_durations["COIN0-USDT"],
+                           self.tracker.order_book_init_durations["COIN1-USDT"])
+
+    def test_trading_pairs_ready_before_tracker(self):
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+        self.ev_loop.run_until_complete(asyncio.sleep(0.3))
+
+        self.assertFalse(self.tracker.ready)
+        self.assertFalse(self.tracker.is_trading_pair_ready("COIN0-USDT"))
+        self.assertTrue(self.tracker.is_trading_pair_ready("COIN1-USDT"))
+
+        self.ev_loop.run_until_complete(init_task)
+        self.assertTrue(self.tracker.is_trading_pair_ready("COIN0-USDT"))
+
+    def test_diffs_received_before_order_book_init_are_applied(self):
+        router_task = self.ev_loop.create_task(self.tracker._order_book_diff_router())
+        try:
+            for update_id in (9, 11, 12):
+                self.tracker._order_book_diff_stream.put_nowait(self._diff("COIN0-USDT", update_id))
+            self.tracker._order_book_diff_stream.put_nowait(self._diff("OTHER-USDT", 1))
+            self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+            self.assertEqual(3, len(self.tracker._pending_diff_messages["COIN0-USDT"]))
+            self.assertNotIn("OTHER-USDT", self.tracker._pending_diff_messages)
+
+            self.ev_loop.run_until_complete(self.tracker._init_order_books())
+            self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+        finally:
+            router_task.cancel()
+
+        order_book = self.tracker.order_books["COIN0-USDT"]
+        # The diff older than the snapshot is discarded
+        self.assertEqual(12, order_book.last_diff_uid)
+        self.assertEqual([[1.0, 12.0]], [[entry.price, entry.amount] for entry in order_book.bid_entries()])
+        self.assertNotIn("COIN0-USDT", self.tracker._pending_diff_messages)
+
+    def test_init_order_books_through_throttler(self):
+        throttler = AsyncThrottler([RateLimit(limit_id="depth", limit=100, time_interval=1.0)])
+        tracker = OrderBookTracker(self.data_source, self.trading_pairs, throttler=throttler, snapshot_limit_id="depth")
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(tracker._init_order_books(), 5))
+
+        self.assertTrue(tracker.ready)
+        self.assertEqual(len(self.trading_pairs), throttler.wait_time_stats["depth"].request_count)
+        tracker.stop()
+
+        with self.assertRaises(ValueError):
+            OrderBookTracker(self.data_source, self.trading_pairs, throttler=throttler)
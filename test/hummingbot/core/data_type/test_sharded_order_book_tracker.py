@@ -0,0 +1,117 @@
+import asyncio
+import time
+import unittest
+from typing import Callable, List
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.sharded_order_book_tracker import (
+    ShardedOrderBookTracker,
+    _book_version,
+    order_book_depth_summary,
+    partition_trading_pairs,
+)
+
+
+class MockShardOrderBookTracker(OrderBookTracker):
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(data_source=None, trading_pairs=trading_pairs)
+
+    def start(self):
+        for trading_pair in self._trading_pairs:
+            order_book = OrderBook()
+            order_book.apply_numpy_snapshot(np.array([[10, 1, 1]], dtype=np.float64),
+                                            np.array([[11, 1, 1]], dtype=np.float64))
+            self._order_books[trading_pair] = order_book
+        self._order_books_initialized.set()
+
+    def stop(self):
+        pass
+
+
+class ShardedOrderBookTrackerTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.tracker = ShardedOrderBookTracker(OrderBookTracker,
+                                               trading_pairs=["A-B", "C-D", "E-F"],
+                                               shard_count=2,
+                                               depth=2)
+
+    def test_partition_trading_pairs(self):
+        self.assertEqual([["A-B", "E-F"], ["C-D"]], partition_trading_pairs(["A-B", "C-D", "E-F"], 2))
+        self.assertEqual([["A-B"]], partition_trading_pairs(["A-B"], 4))
+        self.assertEqual([["A-B", "C-D"]], partition_trading_pairs(["A-B", "C-D"], 0))
+
+    def test_order_book_depth_summary(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1]], dtype=np.float64),
+                                        np.array([[11, 1, 1]], dtype=np.float64))
+        order_book.last_trade_price = 10.5
+
+        trading_pair, bids, asks, last_trade_price = order_book_depth_summary("A-B", order_book, 2)
+
+        self.assertEqual("A-B", trading_pair)
+        self.assertEqual([[10, 1, 1], [9, 2, 1]], bids.tolist())
+        self.assertEqual([[11, 1, 1]], asks.tolist())
+        self.assertEqual(10.5, last_trade_price)
+
+    def test_apply_depth_summaries(self):
+        source = OrderBook()
+        source.apply_numpy_snapshot(np.array([[10, 1, 5]], dtype=np.float64),
+                                    np.array([[11, 2, 5]], dtype=np.float64))
+        source.last_trade_price = 10.2
+
+        self.tracker._apply_depth_summaries([order_book_depth_summary("C-D", source, 2)])
+
+        order_book = self.tracker.order_books["C-D"]
+        self.assertEqual(10, order_book.get_price(False))
+        self.assertEqual(11, order_book.get_price(True))
+        self.assertEqual(10.2, order_book.last_trade_price)
+        self.assertIn("C-D", self.tracker.last_update_timestamps)
+
+    def test_ready_when_all_shards_ready(self):
+        self.tracker._set_shard_ready(0, ["A-B", "E-F"])
+        self.assertFalse(self.tracker.ready)
+        self.assertEqual({"A-B", "E-F"}, self.tracker.ready_trading_pairs)
+
+        self.tracker._set_shard_ready(1, ["C-D"])
+        self.assertTrue(self.tracker.ready)
+
+    def test_book_version_of_untraded_book_unchanged(self):
+        order_book = OrderBook()
+        self.assertEqual(_book_version(order_book), _book_version(order_book))
+        order_book.last_trade_price = 10.5
+        self.assertEqual(_book_version(order_book), _book_version(order_book))
+
+    def run_until(self, condition: Callable[[], bool], timeout: float = 30):
+        end = time.time() + timeout
+        while not condition():
+            self.assertLess(time.time(), end)
+            self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+
+    def test_shard_restarted_after_exit(self):
+        tracker = ShardedOrderBookTracker(MockShardOrderBookTracker,
+                                          trading_pairs=["A-B", "C-D"],
+                                          shard_count=2,
+                                          publish_interval=0.05)
+        tracker.SHARD_RESTART_DELAY = 0.5
+        tracker.start()
+        try:
+            self.run_until(lambda: tracker.ready)
+            self.assertEqual(11, tracker.order_books["C-D"].get_price(True))
+
+            process = tracker._processes[1]
+            process.kill()
+            self.run_until(lambda: not tracker.ready)
+            self.assertEqual({"A-B"}, tracker.ready_trading_pairs)
+
+            self.run_until(lambda: tracker.ready)
+            self.assertEqual({"A-B", "C-D"}, tracker.ready_trading_pairs)
+            self.assertIsNot(process, tracker._processes[1])
+            self.assertTrue(tracker._processes[1].is_alive())
+        finally:
+            tracker.stop()
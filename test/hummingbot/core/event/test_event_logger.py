@@ -0,0 +1,44 @@
+import asyncio
+import unittest
+
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderCancelledEvent, OrderExpiredEvent
+
+
+class EventLoggerTest(unittest.TestCase):
+
+    def test_event_log_of_type(self):
+        event_logger = EventLogger()
+        events = [OrderCancelledEvent(1, "A"), OrderExpiredEvent(2, "B"), OrderCancelledEvent(3, "C")]
+        for event in events:
+            event_logger(event)
+
+        self.assertEqual(events, event_logger.event_log)
+        self.assertEqual([events[0], events[2]], event_logger.event_log_of_type(OrderCancelledEvent))
+        self.assertEqual([events[1]], event_logger.event_log_of_type(OrderExpiredEvent))
+        self.assertEqual([], event_logger.event_log_of_type(int))
+
+        event_logger.clear()
+        self.assertEqual([], event_logger.event_log)
+        self.assertEqual([], event_logger.event_log_of_type(OrderCancelledEvent))
+
+    def test_bounded_event_log(self):
+        event_logger = EventLogger(max_events=3)
+        events = [OrderCancelledEvent(1, "A"), OrderExpiredEvent(2, "B"), OrderCancelledEvent(3, "C"),
+                  OrderExpiredEvent(4, "D"), OrderCancelledEvent(5, "E")]
+        for event in events:
+            event_logger(event)
+
+        self.assertEqual(3, event_logger.max_events)
+        self.assertEqual(events[2:], event_logger.event_log)
+        self.assertEqual([events[2], events[4]], event_logger.event_log_of_type(OrderCancelledEvent))
+        self.assertEqual([events[3]], event_logger.event_log_of_type(OrderExpiredEvent))
+
+    def test_wait_for(self):
+        ev_loop = asyncio.get_event_loop()
+        event_logger = EventLogger(max_events=1)
+        event = OrderExpiredEvent(1, "A")
+        ev_loop.call_later(0.01, event_logger, OrderCancelledEvent(1, "B"))
+        ev_loop.call_later(0.01, event_logger, event)
+
+        self.assertIs(event, ev_loop.run_until_complete(event_logger.wait_for(OrderExpiredEvent, 1)))
@@ -0,0 +1,88 @@
+import random
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.rate_oracle.rate_graph import RateGraph
+from hummingbot.core.rate_oracle.utils import find_rate
+
+
+class RateGraphTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+        self.graph = RateGraph(self.prices)
+
+    def test_rate(self):
+        self.assertEqual(Decimal("100"), self.graph.rate("HBOT-USDT"))
+        self.assertEqual(None, self.graph.rate("ZBOT-USDT"))
+        self.assertEqual(Decimal("1"), self.graph.rate("HBOT-HBOT"))
+        self.assertEqual(Decimal("0.01"), self.graph.rate("USDT-HBOT"))
+        self.assertEqual(Decimal("2"), self.graph.rate("HBOT-AAVE"))
+        self.assertEqual(Decimal("0.5"), self.graph.rate("AAVE-HBOT"))
+        self.assertEqual(Decimal("75"), self.graph.rate("HBOT-GBP"))
+        self.assertEqual(Decimal("1") / Decimal("75"), self.graph.rate("GBP-HBOT"))
+        self.assertEqual(self.prices, self.graph.prices)
+
+    def test_rate_through_several_conversions(self):
+        self.graph.set_price("GBP-JPY", Decimal("150"))
+        self.graph.set_price("ETH-AAVE", Decimal("10"))
+        # ETH -> AAVE -> USDT -> GBP -> JPY
+        self.assertEqual(Decimal("56250"), self.graph.rate("ETH-JPY"))
+        # A shorter path is used once it exists
+        self.graph.set_price("ETH-USDT", Decimal("400"))
+        self.assertEqual(Decimal("45000"), self.graph.rate("ETH-JPY"))
+
+    def test_rate_updated_with_prices(self):
+        self.assertEqual(Decimal("75"), self.graph.rate("HBOT-GBP"))
+        hbot_aave_rate = self.graph.rate("HBOT-AAVE")
+        self.assertEqual(Decimal("2"), hbot_aave_rate)
+
+        self.graph.set_price("USDT-GBP", Decimal("0.8"))
+        self.assertEqual(Decimal("80"), self.graph.rate("HBOT-GBP"))
+        # Rates which do not depend on the updated price are kept rather than calculated again
+        self.assertIs(hbot_aave_rate, self.graph.rate("HBOT-AAVE"))
+
+        self.graph.update_prices({"HBOT-USDT": Decimal("120"), "USDT-GBP": Decimal("0.8")})
+        self.assertEqual(Decimal("96"), self.graph.rate("HBOT-GBP"))
+        self.assertEqual(None, self.graph.rate("HBOT-AAVE"))
+        self.assertNotIn("AAVE-USDT", self.graph.prices)
+
+    def test_reverse_pair_links_tokens_once_pair_removed(self):
+        self.graph.set_price("USDT-HBOT", Decimal("0.02"))
+        self.assertEqual(Decimal("0.02"), self.graph.rate("USDT-HBOT"))
+        self.assertEqual(Decimal("2"), self.graph.rate("HBOT-AAVE"))
+
+        self.graph.remove_price("HBOT-USDT")
+        self.assertEqual(Decimal("50"), self.graph.rate("HBOT-USDT"))
+        self.assertEqual(Decimal("1"), self.graph.rate("HBOT-AAVE"))
+
+        self.graph.remove_price("USDT-HBOT")
+        self.assertEqual(None, self.graph.rate("HBOT-AAVE"))
+
+    def test_invalid_prices_removed(self):
+        self.graph.set_price("HBOT-USDT", Decimal("0"))
+        self.assertNotIn("HBOT-USDT", self.graph.prices)
+        self.assertEqual(None, self.graph.rate("HBOT-GBP"))
+        self.graph.set_price("AAVE-USDT", Decimal("NaN"))
+        self.assertEqual(None, self.graph.rate("AAVE-GBP"))
+
+    def test_same_rates_as_find_rate(self):
+        rng = random.Random(123456789)
+        quotes = ["USDT", "BTC", "ETH", "BNB", "BUSD", "EUR"]
+        prices = {}
+        for index in range(1500):
+            prices[f"TOKEN{index}-{rng.choice(quotes)}"] = Decimal(str(rng.randint(1, 100000) / 100))
+        for quote in quotes[1:]:
+            prices[f"{quote}-USDT"] = Decimal(str(rng.randint(1, 100000) / 100))
+        pairs = [f"TOKEN{rng.randrange(1500)}-{rng.choice(['USDT', 'EUR'])}" for _ in range(20)]
+
+        graph = RateGraph(prices)
+        for tick in range(3):
+            graph.set_price("BTC-USDT", Decimal(str(40000 + tick)))
+            for pair in pairs:
+                rate = graph.rate(pair)
+                self.assertIsNotNone(rate)
+                expected_rate = find_rate(graph.prices, pair)
+                if expected_rate is not None:
+                    self.assertEqual(expected_rate, rate)
@@ -7,7 +7,9 @@ import asyncio
 from yarl import URL
 
 from hummingbot.core.rate_oracle.utils import find_rate
-from hummingbot.core.rate_oracle.rate_oracle import RateOracle
+from hummingbot.core.rate_oracle.rate_oracle import RateOracle, RateOracleSource
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.mock_api.mock_web_server import MockWebServer
 from .fixture import Fixture
 
@@ -139,3 +141,34 @@ class RateOracleTest(unittest.TestCase):
     async def _test_get_ascend_ex_prices(self):
         prices = await RateOracle.get_ascend_ex_prices()
         self._assert_rate_dict(prices)
+
+    def test_order_book_prices(self):
+        btc_order_book = OrderBook()
+        btc_order_book.apply_snapshot([OrderBookRow(39990, 1, 1)], [OrderBookRow(40010, 1, 1)], 1)
+        eth_order_book = OrderBook()
+        eth_order_book.apply_snapshot([OrderBookRow(2990, 1, 1)], [OrderBookRow(3010, 1, 1)], 1)
+        market = mock.MagicMock()
+        market.order_books = {"BTC-USDT": btc_order_book, "ETH-USDT": eth_order_book, "HBOT-USDT": OrderBook()}
+
+        oracle = RateOracle()
+        oracle.set_order_book_markets([market])
+        # Empty order books are skipped
+        self.assertEqual({"BTC-USDT": Decimal("40000"), "ETH-USDT": Decimal("3000")}, oracle.get_order_book_prices())
+        # The rates are available as soon as the markets are set, before the first price fetch
+        self.assertEqual(Decimal("40000") / Decimal("3000"), oracle.rate("BTC-ETH"))
+        self.assertIsNone(oracle.rate("HBOT-ETH"))
+
+        eth_order_book.apply_snapshot([OrderBookRow(3990, 1, 2)], [OrderBookRow(4010, 1, 2)], 2)
+        oracle.update_order_book_prices()
+        self.assertEqual(Decimal("10"), oracle.rate("BTC-ETH"))
+        eth_order_book.apply_snapshot([OrderBookRow(2990, 1, 3)], [OrderBookRow(3010, 1, 3)], 3)
+
+        source = RateOracle.source
+        RateOracle.source = RateOracleSource.order_book
+        try:
+            fetch_task = self.ev_loop.create_task(oracle.fetch_price_loop())
+            self.ev_loop.run_until_complete(asyncio.wait_for(oracle.get_ready(), 1))
+            fetch_task.cancel()
+        finally:
+            RateOracle.source = source
+        self.assertEqual(Decimal("40000") / Decimal("3000"), oracle.rate("BTC-ETH"))
@@ -124,3 +124,26 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_pause_iterator(self):
+        time_iterator: TimeIterator = TimeIterator()
+        self.clock_backtest.add_iterator(time_iterator)
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
+        self.assertEqual(self.backtest_start_timestamp + self.tick_size, time_iterator.current_timestamp)
+
+        # A paused iterator is kept on the clock, but not ticked
+        self.clock_backtest.pause_iterator(time_iterator)
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size * 3)
+        self.assertEqual([time_iterator], self.clock_backtest.paused_iterators)
+        self.assertEqual([time_iterator], self.clock_backtest.child_iterators)
+        self.assertEqual(self.backtest_start_timestamp + self.tick_size, time_iterator.current_timestamp)
+
+        self.clock_backtest.resume_iterator(time_iterator)
+        self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size * 4)
+        self.assertEqual([], self.clock_backtest.paused_iterators)
+        self.assertEqual(self.backtest_start_timestamp + self.tick_size * 4, time_iterator.current_timestamp)
+
+        # Removing an iterator also resumes it
+        self.clock_backtest.pause_iterator(time_iterator)
+        self.clock_backtest.remove_iterator(time_iterator)
+        self.assertEqual([], self.clock_backtest.paused_iterators)
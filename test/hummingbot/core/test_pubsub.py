@@ -1,13 +1,32 @@
 import unittest
 import gc
+import os
+import time
 import weakref
+from typing import Any
 
+from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.pubsub import PubSub
 
 from test.mock.mock_events import MockEventType, MockEvent
 from test.mock.mock_listener import MockEventListener
 
 
+class ListenerChangingListener(EventListener):
+    def __init__(self, pubsub: PubSub, event_tag: MockEventType, listener: EventListener, add: bool):
+        super().__init__()
+        self._pubsub = pubsub
+        self._event_tag = event_tag
+        self._listener = listener
+        self._add = add
+
+    def __call__(self, event: Any):
+        if self._add:
+            self._pubsub.add_listener(self._event_tag, self._listener)
+        else:
+            self._pubsub.remove_listener(self._event_tag, self._listener)
+
+
 class PubSubTest(unittest.TestCase):
     def setUp(self) -> None:
         self.pubsub = PubSub()
@@ -89,6 +108,94 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_lapsed_listener_remove_on_collection(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_one, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.listener_zero = None  # remove strong reference
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(2, self.listener_one.events_count)
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+        self.assertEqual([], self.pubsub.get_listeners(self.event_tag_one))
+
+    def test_listener_added_again_after_remove(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.remove_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, self.listener_zero.events_count)
+
+    def test_listeners_changed_while_triggering(self):
+        remover = ListenerChangingListener(self.pubsub, self.event_tag_zero, self.listener_zero, add=False)
+        adder = ListenerChangingListener(self.pubsub, self.event_tag_zero, self.listener_one, add=True)
+        self.pubsub.add_listener(self.event_tag_zero, remover)
+        self.pubsub.add_listener(self.event_tag_zero, adder)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+
+        # The listeners of the event when it is triggered are called
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, self.listener_zero.events_count)
+        self.assertEqual(0, self.listener_one.events_count)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, self.listener_zero.events_count)
+        self.assertEqual(1, self.listener_one.events_count)
+
+    def test_pubsub_collected_with_listeners(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        pubsub_weakref = weakref.ref(self.pubsub)
+        self.pubsub = None
+        gc.collect()
+        self.assertIsNone(pubsub_weakref())
+        # The listener collection callback of the collected pubsub is ignored
+        self.listener_zero = None
+        gc.collect()
+
+    def test_trigger_event_after_listeners_change(self):
+        listeners = [MockEventListener() for _ in range(20)]
+        for listener in listeners:
+            self.pubsub.add_listener(self.event_tag_zero, listener)
+        for _ in range(3):
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(3, listeners[0].events_count)
+
+        # The listeners added or removed between events are taken into account on the next event
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.remove_listener(self.event_tag_zero, listeners[0])
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(3, listeners[0].events_count)
+        self.assertEqual(4, listeners[1].events_count)
+        self.assertEqual(1, self.listener_zero.events_count)
+        self.assertEqual(20, len(self.pubsub.get_listeners(self.event_tag_zero)))
+
+    @unittest.skipUnless(os.environ.get("HUMMINGBOT_BENCHMARKS"), "Set HUMMINGBOT_BENCHMARKS=1 to run the benchmarks.")
+    def test_trigger_event_benchmark(self):
+        listeners = [MockEventListener() for _ in range(20)]
+        for listener in listeners:
+            self.pubsub.add_listener(self.event_tag_zero, listener)
+        iterations = 10000
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        snapshot_duration = (time.perf_counter() - start) / iterations
+
+        # Changing the listeners before each event rebuilds the listener snapshot on every event, which is the copy of
+        # the listeners the previous dispatch made on each event
+        start = time.perf_counter()
+        for _ in range(iterations):
+            self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+            self.pubsub.remove_listener(self.event_tag_zero, self.listener_zero)
+            self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        copy_duration = (time.perf_counter() - start) / iterations
+
+        # Timings are reported only, they depend too much on the machine to be asserted on
+        print(f"\nEvent dispatch to {len(listeners)} listeners: {snapshot_duration * 1e6:.2f} us from the snapshot, "
+              f"{copy_duration * 1e6:.2f} us copying the listeners (with a listener change)")
+        self.assertEqual(2 * iterations, listeners[0].events_count)
+
 
 if __name__ == "__main__":
     unittest.main()
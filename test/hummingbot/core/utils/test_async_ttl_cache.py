@@ -21,3 +21,37 @@ class AsyncTTLCacheUnitTest(unittest.TestCase):
         time.sleep(2)
         ret_4 = asyncio.get_event_loop().run_until_complete(self.get_timestamp())
         self.assertGreater(ret_4, ret_3)
+
+    def test_async_ttl_cache_concurrent_calls(self):
+        calls = []
+
+        @async_ttl_cache(ttl=3, maxsize=10)
+        async def get_price(trading_pair: str, is_buy: bool):
+            calls.append((trading_pair, is_buy))
+            call_number = len(calls)
+            await asyncio.sleep(0.1)
+            return call_number
+
+        results = asyncio.get_event_loop().run_until_complete(asyncio.gather(
+            get_price("ETH-USDT", True), get_price("ETH-USDT", True), get_price("ETH-USDT", False)
+        ))
+        # The identical calls in progress share the same call
+        self.assertEqual([("ETH-USDT", True), ("ETH-USDT", False)], calls)
+        self.assertEqual(results[0], results[1])
+        self.assertNotEqual(results[0], results[2])
+        asyncio.get_event_loop().run_until_complete(get_price("ETH-USDT", True))
+        self.assertEqual(2, len(calls))
+
+    def test_async_ttl_cache_failed_call_is_not_cached(self):
+        calls = []
+
+        @async_ttl_cache(ttl=3, maxsize=10)
+        async def get_price():
+            calls.append(1)
+            if len(calls) == 1:
+                raise IOError("Network error")
+            return len(calls)
+
+        with self.assertRaises(IOError):
+            asyncio.get_event_loop().run_until_complete(get_price())
+        self.assertEqual(2, asyncio.get_event_loop().run_until_complete(get_price()))
@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+
+from aiohttp import web
+
+from hummingbot.core.utils.http_client_manager import (
+    HttpClientManager,
+    RequestTimingHistogram,
+    shared_http_client,
+)
+
+
+class RequestTimingHistogramTest(unittest.TestCase):
+
+    def test_record(self):
+        histogram = RequestTimingHistogram(bucket_bounds=[0.1, 1.0])
+        for duration in [0.05, 0.1, 0.5, 0.7, 3.0]:
+            histogram.record(duration)
+        histogram.record(0.2, failed=True)
+
+        self.assertEqual(6, histogram.count)
+        self.assertEqual(1, histogram.error_count)
+        self.assertEqual({0.1: 2, 1.0: 3, float("inf"): 1}, histogram.buckets)
+        self.assertAlmostEqual(4.55 / 6, histogram.average_duration)
+        self.assertEqual(3.0, histogram.max_duration)
+        self.assertEqual(0.1, histogram.percentile(30))
+        self.assertEqual(1.0, histogram.percentile(50))
+        self.assertEqual(3.0, histogram.percentile(99))
+
+
+class HttpClientManagerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.manager = HttpClientManager(limit=10, limit_per_host=2)
+
+    def tearDown(self) -> None:
+        self.ev_loop.run_until_complete(self.manager.close())
+        super().tearDown()
+
+    async def _serve(self) -> web.AppRunner:
+        async def ping(request):
+            return web.json_response({"pong": True})
+
+        async def missing(request):
+            return web.json_response({}, status=404)
+
+        app = web.Application()
+        app.router.add_get("/ping", ping)
+        app.router.add_get("/missing", missing)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        return runner
+
+    async def _get_client(self):
+        return self.manager.get_client()
+
+    def test_client_is_shared_and_pooled(self):
+        client = self.ev_loop.run_until_complete(self._get_client())
+
+        self.assertIs(client, self.ev_loop.run_until_complete(self._get_client()))
+        self.assertEqual(10, client.connector.limit)
+        self.assertEqual(2, client.connector.limit_per_host)
+
+        # A closed client is replaced
+        self.ev_loop.run_until_complete(client.close())
+        self.assertIsNot(client, self.ev_loop.run_until_complete(self._get_client()))
+
+    def test_shared_http_client_does_not_close_client(self):
+        async def use_client():
+            async with shared_http_client() as client:
+                pass
+            return client
+
+        client = self.ev_loop.run_until_complete(use_client())
+
+        self.assertFalse(client.closed)
+        self.assertIs(client, self.ev_loop.run_until_complete(use_client()))
+        self.ev_loop.run_until_complete(HttpClientManager.get_instance().close())
+
+    def test_requests_are_timed_per_host(self):
+        async def send_requests():
+            runner = await self._serve()
+            port = runner.addresses[0][1]
+            try:
+                client = self.manager.get_client()
+                for path in ["ping", "ping", "missing"]:
+                    async with client.get(f"http://127.0.0.1:{port}/{path}") as response:
+                        await response.read()
+            finally:
+                await runner.cleanup()
+
+        self.ev_loop.run_until_complete(send_requests())
+
+        histogram = self.manager.request_histograms["127.0.0.1"]
+        self.assertEqual(3, histogram.count)
+        self.assertEqual(1, histogram.error_count)
+        self.assertGreater(histogram.max_duration, 0)
@@ -41,7 +41,8 @@ class TestTradingPairFetcher(TestCase):
     def test_fetched_connector_trading_pairs(self):
         with patch('hummingbot.core.utils.trading_pair_fetcher.CONNECTOR_SETTINGS',
                    {"mock_exchange_1": self.MockConnectorSetting()}) as _, \
-                patch('hummingbot.core.utils.trading_pair_fetcher.importlib.import_module',
+                patch('hummingbot.client.settings.required_exchanges', ["mock_exchange_1"]), \
+                patch('hummingbot.core.utils.trading_pair_fetcher.import_connector_module',
                       return_value=self.MockConnectorDataSourceModule()) as _, \
                 patch('hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance', None):
             from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
@@ -49,3 +50,21 @@ class TestTradingPairFetcher(TestCase):
             asyncio.get_event_loop().run_until_complete(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher))
             trading_pairs = trading_pair_fetcher.trading_pairs
             self.assertEqual(trading_pairs, {'mockConnector': 'MOCK-HBOT'})
+
+    def test_connectors_not_required_are_fetched_on_first_use(self):
+        with patch('hummingbot.core.utils.trading_pair_fetcher.CONNECTOR_SETTINGS',
+                   {"mock_exchange_1": self.MockConnectorSetting()}) as _, \
+                patch('hummingbot.client.settings.required_exchanges', []), \
+                patch('hummingbot.core.utils.trading_pair_fetcher.import_connector_module',
+                      return_value=self.MockConnectorDataSourceModule()) as import_mock, \
+                patch('hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance', None):
+            from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
+            trading_pair_fetcher = TradingPairFetcher()
+            asyncio.get_event_loop().run_until_complete(self.wait_until_trading_pair_fetcher_ready(trading_pair_fetcher))
+            self.assertEqual({}, trading_pair_fetcher.trading_pairs)
+            import_mock.assert_not_called()
+
+            self.assertEqual([], trading_pair_fetcher.get_trading_pairs("mock_exchange_1"))
+            asyncio.get_event_loop().run_until_complete(trading_pair_fetcher.fetch("mock_exchange_1"))
+            self.assertEqual({'mockConnector': 'MOCK-HBOT'}, trading_pair_fetcher.trading_pairs)
+            self.assertEqual(1, import_mock.call_count)
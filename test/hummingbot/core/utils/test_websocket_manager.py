@@ -0,0 +1,195 @@
+import asyncio
+import json
+import time
+import unittest
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+from hummingbot.core.utils.websocket_manager import (
+    WebsocketManager,
+    WebsocketVenue,
+)
+
+
+class MockVenue(WebsocketVenue):
+    max_streams_per_connection = 3
+    reconnect_delay = 0.0
+
+    def __init__(self, url: str):
+        self._url = url
+
+    @property
+    def name(self) -> str:
+        return "mock"
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    def subscribe_messages(self, streams: List[str], request_id: int) -> List[Any]:
+        return [{"op": "subscribe", "streams": streams, "id": request_id}]
+
+    def unsubscribe_messages(self, streams: List[str], request_id: int) -> List[Any]:
+        return [{"op": "unsubscribe", "streams": streams, "id": request_id}]
+
+    def route(self, message: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+        if "stream" not in message:
+            return None
+        return message["stream"], message["data"]
+
+    def message_timestamp(self, stream: str, payload: Dict[str, Any]) -> Optional[float]:
+        return payload.get("ts")
+
+
+class WebsocketManagerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.server_connections: List[web.WebSocketResponse] = []
+        self.received_messages: List[List[Dict[str, Any]]] = []
+        self.runner, port = self.ev_loop.run_until_complete(self._serve())
+        self.venue = MockVenue(f"ws://127.0.0.1:{port}/ws")
+        self.manager = WebsocketManager()
+        self.payloads: Dict[str, List[Any]] = {"first": [], "second": []}
+
+    def tearDown(self) -> None:
+        self.ev_loop.run_until_complete(self.manager.close())
+        self.ev_loop.run_until_complete(self.runner.cleanup())
+        super().tearDown()
+
+    async def _serve(self) -> Tuple[web.AppRunner, int]:
+        async def handle_ws(request):
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            self.server_connections.append(ws)
+            messages = []
+            self.received_messages.append(messages)
+            async for msg in ws:
+                messages.append(json.loads(msg.data))
+            return ws
+
+        app = web.Application()
+        app.router.add_get("/ws", handle_ws)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        return runner, site._server.sockets[0].getsockname()[1]
+
+    def run_async(self, coroutine, timeout: float = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    def wait_until(self, condition: Callable[[], bool], timeout: float = 5):
+        async def wait():
+            while not condition():
+                await asyncio.sleep(0.01)
+        self.run_async(wait(), timeout)
+
+    def handler(self, name: str) -> Callable[[Any], None]:
+        return self.payloads[name].append
+
+    def send(self, connection_index: int, message: Any):
+        self.run_async(self.server_connections[connection_index].send_str(json.dumps(message)))
+
+    def test_streams_shared_by_handlers(self):
+        first_handler, second_handler = self.handler("first"), self.handler("second")
+        self.run_async(self.manager.subscribe(self.venue, ["btc@trade", "btc@depth"], first_handler))
+        self.run_async(self.manager.subscribe(self.venue, ["btc@trade"], second_handler))
+        self.wait_until(lambda: len(self.received_messages) == 1 and len(self.received_messages[0]) == 1)
+
+        # The streams are subscribed once, on a single connection
+        self.assertEqual(1, len(self.manager.connections["mock"]))
+        self.assertEqual(["btc@trade", "btc@depth"], self.received_messages[0][0]["streams"])
+
+        self.send(0, {"stream": "btc@trade", "data": {"price": 1}})
+        self.send(0, {"stream": "btc@depth", "data": {"bids": []}})
+        self.wait_until(lambda: len(self.payloads["first"]) == 2)
+        self.assertEqual([{"price": 1}, {"bids": []}], self.payloads["first"])
+        # The message is decoded once for all its handlers
+        self.assertEqual(1, len(self.payloads["second"]))
+        self.assertIs(self.payloads["first"][0], self.payloads["second"][0])
+
+        # Streams added to a live connection are subscribed right away
+        self.run_async(self.manager.subscribe(self.venue, ["eth@trade"], second_handler))
+        self.wait_until(lambda: len(self.received_messages[0]) == 2)
+        self.assertEqual({"op": "subscribe", "streams": ["eth@trade"], "id": 2}, self.received_messages[0][1])
+
+    def test_connections_limited_by_venue_streams(self):
+        self.run_async(self.manager.subscribe(self.venue, ["a", "b"], self.handler("first")))
+        self.run_async(self.manager.subscribe(self.venue, ["c", "d", "a"], self.handler("second")))
+        connections = self.manager.connections["mock"]
+        self.assertEqual(2, len(connections))
+        self.assertEqual(["a", "b", "c"], connections[0].streams)
+        self.assertEqual(["d"], connections[1].streams)
+        self.wait_until(lambda: len(self.server_connections) == 2)
+
+    def test_unsubscribe(self):
+        first_handler, second_handler = self.handler("first"), self.handler("second")
+        self.run_async(self.manager.subscribe(self.venue, ["a", "b"], first_handler))
+        self.run_async(self.manager.subscribe(self.venue, ["b"], second_handler))
+        self.run_async(self.manager.connections["mock"][0].wait_connected())
+
+        self.run_async(self.manager.unsubscribe(self.venue, ["a", "b"], first_handler))
+        self.wait_until(lambda: len(self.received_messages[0]) == 2)
+        # b is still used by the second handler
+        self.assertEqual({"op": "unsubscribe", "streams": ["a"], "id": 2}, self.received_messages[0][1])
+        self.send(0, {"stream": "b", "data": {"id": 1}})
+        self.wait_until(lambda: len(self.payloads["second"]) == 1)
+        self.assertEqual([], self.payloads["first"])
+
+        # The connection is closed with its last stream
+        self.run_async(self.manager.unsubscribe(self.venue, ["b"], second_handler))
+        self.assertEqual({}, self.manager.connections)
+        self.wait_until(lambda: self.server_connections[0].closed)
+
+    def test_listen(self):
+        listen_task = self.ev_loop.create_task(self.manager.listen(self.venue, ["a"], self.handler("first")))
+        self.wait_until(lambda: len(self.server_connections) == 1)
+        self.send(0, {"stream": "a", "data": {"id": 1}})
+        self.wait_until(lambda: len(self.payloads["first"]) == 1)
+        listen_task.cancel()
+        self.wait_until(lambda: listen_task.done())
+        self.assertEqual({}, self.manager.connections)
+
+    def test_reconnect_subscribes_again(self):
+        self.run_async(self.manager.subscribe(self.venue, ["a", "b"], self.handler("first")))
+        self.wait_until(lambda: len(self.received_messages) == 1 and len(self.received_messages[0]) == 1)
+
+        self.run_async(self.server_connections[0].close())
+        self.wait_until(lambda: len(self.received_messages) == 2 and len(self.received_messages[1]) == 1)
+        self.assertEqual(["a", "b"], self.received_messages[1][0]["streams"])
+        self.send(1, {"stream": "a", "data": {"id": 1}})
+        self.wait_until(lambda: len(self.payloads["first"]) == 1)
+        self.assertEqual(1, self.manager.connections["mock"][0].metrics.reconnections_count)
+
+    def test_metrics(self):
+        def failing_handler(payload: Any):
+            raise ValueError("handler failure")
+
+        self.run_async(self.manager.subscribe(self.venue, ["a"], failing_handler))
+        self.run_async(self.manager.subscribe(self.venue, ["a"], self.handler("first")))
+        self.wait_until(lambda: len(self.server_connections) == 1)
+        now = time.time()
+        self.send(0, {"stream": "a", "data": {"ts": now - 2}})
+        self.send(0, {"stream": "a", "data": {"ts": now - 1}})
+        self.run_async(self.server_connections[0].send_str("not json"))
+        self.send(0, {"id": 1, "result": None})
+        self.send(0, {"stream": "a", "data": {}})
+        self.wait_until(lambda: len(self.payloads["first"]) == 3)
+
+        # Handler errors do not stop the other handlers
+        metrics = self.manager.connection_metrics("mock")[0]
+        self.assertEqual(1, metrics.connections_count)
+        self.assertEqual(4, metrics.messages_count)
+        self.assertEqual(1, metrics.decode_errors_count)
+        self.assertGreater(metrics.bytes_count, 0)
+        self.assertGreater(metrics.messages_per_second, 0)
+        self.assertGreaterEqual(metrics.max_lag, 2)
+        self.assertGreaterEqual(metrics.average_lag, 1.5)
+        self.assertLess(metrics.average_lag, 3)
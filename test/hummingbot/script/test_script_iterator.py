@@ -0,0 +1,205 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.script.script_base import ScriptBase
+from hummingbot.script.script_interface import (
+    OnTick,
+    PMMParameters,
+    PmmMarketInfo,
+    ScriptChannel,
+    StrategyParameter,
+    set_child_queue,
+)
+from hummingbot.script.script_iterator import ScriptIterator
+
+SCRIPT = """
+from decimal import Decimal
+from hummingbot.script.script_base import ScriptBase
+
+
+class WidenSpreadScript(ScriptBase):
+    def on_tick(self):
+        if self.pmm_parameters.bid_spread < Decimal("0.02"):
+            self.pmm_parameters.bid_spread = Decimal("0.02")
+"""
+
+
+class MockStrategy:
+    def __init__(self):
+        for name in PMMParameters.parameter_names():
+            setattr(self, name, None)
+        self.bid_spread = Decimal("0.01")
+        self.ask_spread = Decimal("0.01")
+        self.order_override = {}
+        self.market_info = MagicMock()
+        self.market_info.market.name = "mock_exchange"
+        self.trading_pair = "HBOT-USDT"
+
+    def all_markets_ready(self):
+        return True
+
+    def get_mid_price(self):
+        return Decimal("100")
+
+
+class ScriptIteratorTest(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.ev_loop = asyncio.get_event_loop()
+        self.strategy = MockStrategy()
+        self.market = MagicMock()
+        self.market.name = "mock_exchange"
+        self.market.get_all_balances.return_value = {"HBOT": Decimal("10"), "USDT": Decimal("0")}
+        self.market.get_available_balance.return_value = Decimal("5")
+        self.clock = Clock(ClockMode.BACKTEST, 1, 1000, 2000)
+
+    def run_loop_until(self, condition, timeout: float = 10):
+        end_time = time.time() + timeout
+        while not condition() and time.time() < end_time:
+            self.ev_loop.run_until_complete(asyncio.sleep(0.01))
+
+    def test_channel_items_are_handled_by_the_event_loop(self):
+        channel = ScriptChannel()
+        received = []
+        channel.start_listening(self.ev_loop, received.append)
+        channel.put("first")
+        channel.put(OnTick(Decimal("1"), {"bid_spread": Decimal("0.01")}, None, None))
+        self.run_loop_until(lambda: len(received) == 2)
+        self.assertEqual("first", received[0])
+        self.assertEqual({"bid_spread": Decimal("0.01")}, received[1].pmm_parameter_updates)
+        channel.stop_listening(self.ev_loop)
+
+        # The channel isn't writable once the pipe is full, instead of blocking the sender
+        while channel.writable():
+            channel.put(b"x" * 1000)
+        self.assertFalse(channel.writable())
+
+    def test_channel_put_buffers_items_without_blocking(self):
+        channel = ScriptChannel()
+        channel.MAX_BUFFERED_ITEMS = 100
+        items = []
+        # The items which don't fit in the pipe are buffered, and dropped once the buffer is full
+        while channel.put(str(len(items)).encode() * 1000):
+            items.append(str(len(items)).encode() * 1000)
+        self.assertFalse(channel.writable())
+        self.assertLess(channel.MAX_BUFFERED_ITEMS, len(items))
+
+        received = []
+        channel.start_listening(self.ev_loop, received.append)
+        self.run_loop_until(lambda: len(received) == len(items))
+        channel.stop_listening(self.ev_loop)
+        self.assertEqual(items, received)
+        self.assertTrue(channel.writable())
+
+    def test_only_changes_are_sent_on_tick(self):
+        channels = []
+
+        def create_channel():
+            channels.append(ScriptChannel())
+            return channels[-1]
+
+        with patch("hummingbot.script.script_iterator.Process"), \
+                patch("hummingbot.script.script_iterator.ScriptChannel", side_effect=create_channel):
+            script_iterator = ScriptIterator("script.py", [self.market], self.strategy, is_unit_testing_mode=True)
+        parent_channel, child_channel = channels
+        script_iterator.start(self.clock)
+        self.assertIsInstance(parent_channel._reader.recv(), PmmMarketInfo)
+
+        script_iterator.tick(1001)
+        on_tick = parent_channel._reader.recv()
+        self.assertEqual(set(PMMParameters.parameter_names()), set(on_tick.pmm_parameter_updates))
+        self.assertEqual({"mock_exchange": {"HBOT": Decimal("10")}}, on_tick.all_total_balances)
+        self.assertEqual({"mock_exchange": {"HBOT": Decimal("5")}}, on_tick.all_available_balances)
+
+        script_iterator.tick(1002)
+        on_tick = parent_channel._reader.recv()
+        self.assertEqual(Decimal("100"), on_tick.mid_price)
+        self.assertEqual({}, on_tick.pmm_parameter_updates)
+        self.assertIsNone(on_tick.all_total_balances)
+        self.assertIsNone(on_tick.all_available_balances)
+
+        self.strategy.ask_spread = Decimal("0.03")
+        self.strategy.order_override["order_1"] = ["buy", 0.5, 100]
+        script_iterator.tick(1003)
+        on_tick = parent_channel._reader.recv()
+        self.assertEqual({"ask_spread": Decimal("0.03"), "order_override": {"order_1": ["buy", 0.5, 100]}},
+                         on_tick.pmm_parameter_updates)
+
+        # Parameters changed by the script are applied to the strategy
+        parameter = StrategyParameter("bid_spread")
+        parameter.updated_value = Decimal("0.05")
+        child_channel.put(parameter)
+        self.run_loop_until(lambda: self.strategy.bid_spread == Decimal("0.05"))
+        self.assertEqual(Decimal("0.05"), self.strategy.bid_spread)
+        child_channel.stop_listening(self.ev_loop)
+
+    def test_all_parameters_sent_after_a_change_from_the_script_and_periodically(self):
+        channels = []
+
+        def create_channel():
+            channels.append(ScriptChannel())
+            return channels[-1]
+
+        with patch("hummingbot.script.script_iterator.Process"), \
+                patch("hummingbot.script.script_iterator.ScriptChannel", side_effect=create_channel):
+            script_iterator = ScriptIterator("script.py", [self.market], self.strategy, is_unit_testing_mode=True)
+        parent_channel, child_channel = channels
+        script_iterator.start(self.clock)
+        parent_channel._reader.recv()
+        script_iterator.tick(1001)
+        parent_channel._reader.recv()
+
+        # The strategy rejects the change from the script, which gets the value of the strategy back on the next tick
+        with patch.object(MockStrategy, "bid_spread", property(lambda strategy: Decimal("0.01"), lambda *_: None),
+                          create=True):
+            parameter = StrategyParameter("bid_spread")
+            parameter.updated_value = Decimal("0.5")
+            script_iterator.on_child_item(parameter)
+            script_iterator.tick(1002)
+            on_tick = parent_channel._reader.recv()
+            self.assertEqual({"bid_spread": Decimal("0.01")}, on_tick.pmm_parameter_updates)
+
+        script_iterator.tick(1060)
+        self.assertEqual({}, parent_channel._reader.recv().pmm_parameter_updates)
+        script_iterator.tick(1061)
+        on_tick = parent_channel._reader.recv()
+        self.assertEqual(set(PMMParameters.parameter_names()), set(on_tick.pmm_parameter_updates))
+        child_channel.stop_listening(self.ev_loop)
+
+    def test_script_updates_parameters_applied_in_script(self):
+        script_base = ScriptBase()
+        child_channel = MagicMock()
+        script_base.assign_init(MagicMock(), child_channel)
+        set_child_queue(child_channel)
+        script_base.on_parent_item(OnTick(Decimal("100"), {"bid_spread": Decimal("0.01"), "ask_spread": Decimal("0.01")},
+                                          {"binance": {"HBOT": Decimal("10")}}, {"binance": {"HBOT": Decimal("5")}}))
+        script_base.on_parent_item(OnTick(Decimal("101"), {"ask_spread": Decimal("0.02")}, None, None))
+        self.assertEqual([Decimal("100"), Decimal("101")], script_base.mid_prices)
+        self.assertEqual(Decimal("0.01"), script_base.pmm_parameters.bid_spread)
+        self.assertEqual(Decimal("0.02"), script_base.pmm_parameters.ask_spread)
+        self.assertEqual({"binance": {"HBOT": Decimal("10")}}, script_base.all_total_balances)
+        child_channel.put.assert_not_called()
+
+        script_base.pmm_parameters.bid_spread = Decimal("0.03")
+        child_channel.put.assert_called_once()
+        self.assertEqual("bid_spread", child_channel.put.call_args[0][0].name)
+        self.assertEqual(Decimal("0.03"), child_channel.put.call_args[0][0].updated_value)
+
+    def test_script_process(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script_file_path = os.path.join(temp_dir, "widen_spread_script.py")
+            with open(script_file_path, "w") as script_file:
+                script_file.write(SCRIPT)
+            script_iterator = ScriptIterator(script_file_path, [self.market], self.strategy, is_unit_testing_mode=True)
+            self.clock.add_iterator(script_iterator)
+            self.clock.backtest_til(1001)
+            self.run_loop_until(lambda: self.strategy.bid_spread == Decimal("0.02"))
+            self.assertEqual(Decimal("0.02"), self.strategy.bid_spread)
+            script_iterator.stop(self.clock)
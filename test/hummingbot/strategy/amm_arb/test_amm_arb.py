@@ -315,3 +315,8 @@ class AmmArbUnitTest(unittest.TestCase):
 
         current_status = self.ev_loop.run_until_complete(self.strategy.format_status())
         self.assertTrue(expected_status in current_status)
+        self.assertTrue("  Quote Latency:\n    No quote fetched yet." in current_status)
+
+        self.strategy._quote_latencies.extend([0.1, 0.3])
+        current_status = self.ev_loop.run_until_complete(self.strategy.format_status())
+        self.assertTrue("    Last cycle: 300 ms, average: 200 ms, max: 300 ms (last 2 cycles)" in current_status)
@@ -33,6 +33,28 @@ class MockConnector2(ConnectorBase):
         return self.get_quote_price(trading_pair, is_buy, amount)
 
 
+class WaitingMockConnector(ConnectorBase):
+    """
+    Answers the price requests only once the expected number of requests are waiting, requests made one after the
+    other never get an answer.
+    """
+    def __init__(self, requests: asyncio.Event, expected_requests: int):
+        super().__init__()
+        self.requests = requests
+        self.expected_requests = expected_requests
+        self.request_count = 0
+
+    async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        self.request_count += 1
+        if self.request_count == self.expected_requests:
+            self.requests.set()
+        await self.requests.wait()
+        return Decimal("101") if is_buy else Decimal("100")
+
+    async def get_order_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
+        return await self.get_quote_price(trading_pair, is_buy, amount)
+
+
 class AmmArbUtilsUnitTest(unittest.TestCase):
 
     def test_create_arb_proposals(self):
@@ -51,3 +73,18 @@ class AmmArbUtilsUnitTest(unittest.TestCase):
         self.assertEqual(buy_1_sell_2_profit_pct, arb_proposals[0].profit_pct())
         buy_2_sell_1_profit_pct = (Decimal("104") - Decimal("103")) / Decimal("103")
         self.assertEqual(buy_2_sell_1_profit_pct, arb_proposals[1].profit_pct())
+
+    def test_create_arb_proposals_fetches_prices_concurrently(self):
+        connector_1_requests = asyncio.Event()
+        connector_2_requests = asyncio.Event()
+        connector_1 = WaitingMockConnector(connector_1_requests, 4)
+        connector_2 = WaitingMockConnector(connector_2_requests, 4)
+        market_info1 = MarketTradingPairTuple(connector_1, trading_pair, base, quote)
+        market_info2 = MarketTradingPairTuple(connector_2, trading_pair, base, quote)
+        # The 8 prices are requested at the same time, requested one after the other the first request would never
+        # get an answer
+        arb_proposals = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(
+            utils.create_arb_proposals(market_info1, market_info2, Decimal("1")), 1))
+        self.assertEqual(2, len(arb_proposals))
+        self.assertEqual(4, connector_1.request_count)
+        self.assertEqual(4, connector_2.request_count)
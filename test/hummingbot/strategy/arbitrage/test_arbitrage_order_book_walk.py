@@ -0,0 +1,148 @@
+import os
+import random
+import time
+import unittest
+from decimal import Decimal
+from typing import Dict, List
+
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import OrderType, TradeFee, TradeType
+from hummingbot.strategy.arbitrage.arbitrage import ArbitrageStrategy
+from hummingbot.strategy.arbitrage.arbitrage_market_pair import ArbitrageMarketPair
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+# Powers of two, so that the float prices and amounts of the order books are exactly on the quantization grid
+TICK = 2 ** -12
+LOT = 2 ** -7
+PRICE_QUANTUM = Decimal(TICK)
+SIZE_QUANTUM = Decimal(LOT)
+
+
+class MockExchange(ExchangeBase):
+    def __init__(self, name: str, fee_percent: Decimal):
+        self._name = name
+        super().__init__()
+        self._fee_percent = fee_percent
+        self.mock_order_books: Dict[str, OrderBook] = {}
+        self.balances: Dict[str, Decimal] = {}
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def display_name(self):
+        return self._name
+
+    def supported_order_types(self):
+        return [OrderType.LIMIT]
+
+    def get_order_book(self, trading_pair: str) -> OrderBook:
+        return self.mock_order_books[trading_pair]
+
+    def get_fee(self, base_currency: str, quote_currency: str, order_type: OrderType, order_side: TradeType,
+                amount: Decimal, price: Decimal = Decimal("NaN")) -> TradeFee:
+        return TradeFee(self._fee_percent, [])
+
+    def get_available_balance(self, currency: str) -> Decimal:
+        return self.balances.get(currency, Decimal("0"))
+
+    def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
+        return PRICE_QUANTUM
+
+    def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
+        return SIZE_QUANTUM
+
+
+class ArbitrageOrderBookWalkTest(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.buy_market = MockExchange("buy_exchange", Decimal("0.001"))
+        self.sell_market = MockExchange("sell_exchange", Decimal("0.002"))
+        self.buy_market_info = MarketTradingPairTuple(self.buy_market, "HBOT-USDT", "HBOT", "USDT")
+        self.sell_market_info = MarketTradingPairTuple(self.sell_market, "HBOT-USDT", "HBOT", "USDT")
+        self.strategy = ArbitrageStrategy()
+        self.strategy.init_params([ArbitrageMarketPair(self.buy_market_info, self.sell_market_info)],
+                                  min_profitability=Decimal("0.003"),
+                                  logging_options=ArbitrageStrategy.OPTION_LOG_ORDER_COMPLETED)
+        self.set_balances(Decimal("1e9"), Decimal("1e9"))
+
+    def set_balances(self, buy_market_quote_balance: Decimal, sell_market_base_balance: Decimal):
+        self.buy_market.balances["USDT"] = buy_market_quote_balance
+        self.sell_market.balances["HBOT"] = sell_market_base_balance
+
+    @staticmethod
+    def book_rows(rng: random.Random, top_price: float, ticks: int, depth: int) -> List[OrderBookRow]:
+        return [OrderBookRow(top_price + i * ticks * TICK, rng.randint(1, 256) * LOT, 1) for i in range(depth)]
+
+    def set_books(self, seed: int, depth: int, spread_ticks: int = 80):
+        rng = random.Random(seed)
+        sell_market_mid_price = 1.0 + spread_ticks * TICK
+        buy_book = OrderBook()
+        buy_book.apply_snapshot(self.book_rows(rng, 1.0 - TICK, -1, depth), self.book_rows(rng, 1.0, 1, depth), 1)
+        sell_book = OrderBook()
+        sell_book.apply_snapshot(self.book_rows(rng, sell_market_mid_price - TICK, -1, depth),
+                                 self.book_rows(rng, sell_market_mid_price, 1, depth), 1)
+        self.buy_market.mock_order_books["HBOT-USDT"] = buy_book
+        self.sell_market.mock_order_books["HBOT-USDT"] = sell_book
+
+    def assert_same_results(self):
+        rows_result = self.strategy.find_best_profitable_amount_from_rows(self.buy_market_info, self.sell_market_info)
+        books_result = self.strategy.find_best_profitable_amount_from_books(self.buy_market_info,
+                                                                            self.sell_market_info)
+        rows_amount = self.buy_market.quantize_order_amount("HBOT-USDT", Decimal(rows_result[0]))
+        self.assertEqual(rows_amount, books_result[0])
+        self.assertAlmostEqual(rows_result[1], books_result[1], places=12)
+        self.assertEqual(rows_result[2:], books_result[2:])
+        return books_result
+
+    def test_same_result_as_rows_walk(self):
+        for seed in range(5):
+            self.set_books(seed, depth=300)
+            amount, profitability, bid_price, ask_price = self.assert_same_results()
+            self.assertGreater(amount, 0)
+            self.assertGreater(profitability, Decimal("1.003"))
+            self.assertGreaterEqual(bid_price, ask_price)
+
+    def test_same_result_when_limited_by_balances(self):
+        self.set_books(1, depth=300)
+        self.set_balances(Decimal("1e9"), Decimal("12.5"))
+        self.assertEqual(Decimal("12.5"), self.assert_same_results()[0])
+
+        self.set_balances(Decimal("10"), Decimal("1e9"))
+        self.assert_same_results()
+
+    def test_same_result_when_not_profitable(self):
+        self.set_books(2, depth=50, spread_ticks=-40)
+        self.assertEqual((Decimal("0"), Decimal("0"), Decimal("0"), Decimal("0")), self.assert_same_results())
+
+        self.buy_market.mock_order_books["HBOT-USDT"] = OrderBook()
+        self.assertEqual((Decimal("0"), Decimal("0"), Decimal("0"), Decimal("0")),
+                         self.strategy.find_best_profitable_amount(self.buy_market_info, self.sell_market_info))
+
+    def test_same_result_on_deep_order_books(self):
+        self.set_books(3, depth=2000, spread_ticks=800)
+        self.assert_same_results()
+
+    @unittest.skipUnless(os.environ.get("HUMMINGBOT_BENCHMARKS"), "Set HUMMINGBOT_BENCHMARKS=1 to run the benchmarks.")
+    def test_order_book_walk_benchmark(self):
+        self.set_books(3, depth=2000, spread_ticks=800)
+        iterations = 10
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            self.strategy.find_best_profitable_amount_from_rows(self.buy_market_info, self.sell_market_info)
+        rows_duration = (time.perf_counter() - start) / iterations
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            self.strategy.find_best_profitable_amount_from_books(self.buy_market_info, self.sell_market_info)
+        books_duration = (time.perf_counter() - start) / iterations
+
+        # Timings are reported only, they depend too much on the machine to be asserted on
+        print(f"\nArbitrage search on 2000 level order books: rows walk {rows_duration * 1e3:.3f} ms, "
+              f"order books walk {books_duration * 1e3:.3f} ms ({rows_duration / books_duration:.0f}x)")
+        self.assert_same_results()
@@ -0,0 +1,149 @@
+import math
+import unittest
+from typing import Dict
+from unittest.mock import MagicMock, patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.strategy.graph_arbitrage.arbitrage_graph import ArbitrageGraph
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+
+class ArbitrageGraphTest(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.order_books: Dict[str, Dict[str, OrderBook]] = {}
+        self.exchange_a = self.create_market("exchange_a")
+        self.exchange_b = self.create_market("exchange_b")
+        self.a_eth_usdt = self.market_info(self.exchange_a, "ETH-USDT", 2000, 2001)
+        self.a_btc_usdt = self.market_info(self.exchange_a, "BTC-USDT", 40000, 40010)
+        self.a_eth_btc = self.market_info(self.exchange_a, "ETH-BTC", 0.05, 0.05001)
+        self.b_eth_usdt = self.market_info(self.exchange_b, "ETH-USDT", 1999, 2000)
+
+    def create_market(self, name: str) -> MagicMock:
+        market = MagicMock()
+        market.display_name = name
+        self.order_books[name] = {}
+        market.get_order_book.side_effect = lambda trading_pair: self.order_books[name][trading_pair]
+        return market
+
+    def set_order_book(self, market: MagicMock, trading_pair: str, bid: float, ask: float, amount: float = 1.):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(bid, amount, 1)], [OrderBookRow(ask, amount, 1)], 1)
+        self.order_books[market.display_name][trading_pair] = order_book
+
+    def market_info(self, market: MagicMock, trading_pair: str, bid: float, ask: float) -> MarketTradingPairTuple:
+        self.set_order_book(market, trading_pair, bid, ask)
+        return MarketTradingPairTuple(market, trading_pair, *trading_pair.split("-"))
+
+    def create_graph(self, max_path_length: int = 3, fee_percent: float = 0.001) -> ArbitrageGraph:
+        graph = ArbitrageGraph(max_path_length)
+        for market_info in (self.a_eth_usdt, self.a_btc_usdt, self.a_eth_btc, self.b_eth_usdt):
+            graph.add_market(market_info, fee_percent)
+        graph.build()
+        return graph
+
+    def test_cycles(self):
+        graph = self.create_graph(max_path_length=2)
+        self.assertEqual({"buy ETH-USDT on exchange_a, sell ETH-USDT on exchange_b",
+                          "sell ETH-USDT on exchange_a, buy ETH-USDT on exchange_b"},
+                         {", ".join(repr(e) for e in c.edges) for c in graph.cycles})
+
+        graph = self.create_graph(max_path_length=3)
+        self.assertEqual(6, len(graph.cycles))
+        triangular_cycles = [c for c in graph.cycles if c.is_triangular]
+        self.assertEqual({"buy ETH-USDT on exchange_a, sell ETH-BTC on exchange_a, sell BTC-USDT on exchange_a",
+                          "sell ETH-USDT on exchange_a, buy BTC-USDT on exchange_a, buy ETH-BTC on exchange_a"},
+                         {", ".join(repr(e) for e in c.edges) for c in triangular_cycles})
+        for cycle in graph.cycles:
+            self.assertEqual(cycle.edges[0].from_asset, cycle.edges[-1].to_asset)
+
+    def test_cross_exchange_and_triangular_arbitrage(self):
+        graph = self.create_graph()
+        self.assertEqual([], graph.profitable_cycles())
+
+        # ETH is cheaper on exchange b than on exchange a
+        self.set_order_book(self.exchange_b, "ETH-USDT", 1980, 1985)
+        graph.refresh()
+        cycles = graph.profitable_cycles()
+        self.assertEqual(["sell ETH-USDT on exchange_a, buy ETH-USDT on exchange_b",
+                          "sell BTC-USDT on exchange_a, buy ETH-USDT on exchange_b, sell ETH-BTC on exchange_a"],
+                         [", ".join(repr(e) for e in c.edges) for c in cycles])
+        self.assertAlmostEqual(2000 * 0.999 * 0.999 / 1985 - 1, cycles[0].profitability)
+        self.assertAlmostEqual(0.05 * 40000 * 0.999 ** 3 / 1985 - 1, cycles[1].profitability)
+        self.assertFalse(cycles[1].is_triangular)
+        self.assertEqual([], graph.profitable_cycles(min_profitability=0.01))
+
+        # ETH is cheaper in BTC than in USDT on exchange a
+        self.set_order_book(self.exchange_b, "ETH-USDT", 1999, 2000)
+        self.set_order_book(self.exchange_a, "ETH-BTC", 0.048, 0.0485)
+        graph.refresh()
+        cycles = graph.profitable_cycles()
+        self.assertEqual(2, len(cycles))
+        self.assertTrue(cycles[0].is_triangular)
+        self.assertEqual("sell ETH-USDT on exchange_a, buy BTC-USDT on exchange_a, buy ETH-BTC on exchange_a",
+                         ", ".join(repr(e) for e in cycles[0].edges))
+        self.assertAlmostEqual(0.999 ** 3 / 40010 / 0.0485 * 2000 - 1, cycles[0].profitability)
+        self.assertFalse(cycles[1].is_triangular)
+        self.assertGreater(cycles[0].profitability, cycles[1].profitability)
+
+    def test_only_cycles_through_changed_order_books_are_evaluated(self):
+        graph = self.create_graph()
+        graph.profitable_cycles()
+
+        with patch.object(math, "prod", wraps=math.prod) as prod_mock:
+            self.assertEqual(0, graph.refresh())
+            graph.profitable_cycles()
+            self.assertEqual(0, prod_mock.call_count)
+
+            # Only the bid changes, which is on the BTC to USDT edge of 2 triangular cycles
+            self.set_order_book(self.exchange_a, "BTC-USDT", 40001, 40010)
+            self.assertEqual(1, graph.refresh())
+            graph.profitable_cycles()
+            self.assertEqual(2, prod_mock.call_count)
+
+            self.set_order_book(self.exchange_b, "ETH-USDT", 1990, 1991)
+            self.assertEqual(1, graph.refresh())
+            cycles = graph.profitable_cycles()
+            self.assertEqual(2 + 4, prod_mock.call_count)
+            self.assertEqual(2, len(cycles))
+
+            # The profitable cycle is still reported when other order books change
+            self.set_order_book(self.exchange_a, "ETH-BTC", 0.05, 0.05002)
+            graph.refresh()
+            self.assertEqual(cycles, graph.profitable_cycles())
+
+    def test_max_start_amount(self):
+        graph = self.create_graph(fee_percent=0.)
+        self.set_order_book(self.exchange_b, "ETH-USDT", 1980, 1985, amount=0.5)
+        graph.refresh()
+        cycle = [c for c in graph.profitable_cycles() if len(c.edges) == 2][0]
+
+        # The cycle starts with ETH, sold on exchange a for 2000 USDT and bought back on exchange b for 1985 USDT
+        self.assertEqual("ETH", cycle.start_asset)
+        # Limited by the 0.5 ETH at the top of exchange b asks
+        self.assertAlmostEqual(0.5 * 1985 / 2000, cycle.max_start_amount())
+        self.assertEqual(2, len(cycle.from_amounts(0.4)))
+        self.assertAlmostEqual(0.4, cycle.from_amounts(0.4)[0])
+        self.assertAlmostEqual(0.4 * 2000, cycle.from_amounts(0.4)[1])
+        # Limited by the balances
+        self.assertAlmostEqual(0.2, cycle.max_start_amount([0.2, 10000]))
+        self.assertAlmostEqual(500 / 2000, cycle.max_start_amount([10, 500]))
+
+    def test_conversion_rates(self):
+        b_eth_usdc = self.market_info(self.exchange_b, "ETH-USDC", 1990, 1991)
+        graph = ArbitrageGraph()
+        graph.add_market(self.a_eth_usdt)
+        graph.add_market(b_eth_usdc)
+        graph.set_conversion_rate("USDC", "USDT", 1.)
+        self.assertEqual(2, len(graph.cycles))
+        cycles = graph.profitable_cycles()
+        self.assertEqual(1, len(cycles))
+        self.assertEqual("sell ETH-USDT on exchange_a, convert USDT to USDC, buy ETH-USDC on exchange_b",
+                         ", ".join(repr(e) for e in cycles[0].edges))
+        self.assertAlmostEqual(2000 / 1991 - 1, cycles[0].profitability)
+
+        # USDC is worth more than USDT, the arbitrage is no longer profitable
+        graph.set_conversion_rate("USDC", "USDT", 1.005)
+        self.assertEqual([], graph.profitable_cycles())
@@ -0,0 +1,129 @@
+import unittest
+from decimal import Decimal
+from typing import Dict, List, Tuple
+
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import OrderType, TradeFee, TradeType
+from hummingbot.strategy.graph_arbitrage.graph_arbitrage import GraphArbitrageStrategy
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+
+
+class MockExchange(ExchangeBase):
+    def __init__(self, name: str):
+        self._name = name
+        super().__init__()
+        self.mock_order_books: Dict[str, OrderBook] = {}
+        self.balances: Dict[str, Decimal] = {}
+        self.orders: List[Tuple[str, bool, Decimal, Decimal]] = []
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def display_name(self):
+        return self._name
+
+    @property
+    def ready(self):
+        return True
+
+    def get_order_book(self, trading_pair: str) -> OrderBook:
+        return self.mock_order_books[trading_pair]
+
+    def set_order_book(self, trading_pair: str, bid: float, ask: float, amount: float):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(bid, amount, 1)], [OrderBookRow(ask, amount, 1)], 1)
+        self.mock_order_books[trading_pair] = order_book
+
+    def get_fee(self, base_currency: str, quote_currency: str, order_type: OrderType, order_side: TradeType,
+                amount: Decimal, price: Decimal = Decimal("NaN")) -> TradeFee:
+        return TradeFee(Decimal("0"), [])
+
+    def get_available_balance(self, currency: str) -> Decimal:
+        return self.balances.get(currency, Decimal("0"))
+
+    def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
+        return Decimal("0.0001")
+
+    def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
+        return Decimal("0.001")
+
+    def get_taker_order_type(self):
+        return OrderType.MARKET
+
+    def buy(self, trading_pair: str, amount: Decimal, order_type=OrderType.MARKET, price: Decimal = Decimal("NaN"),
+            **kwargs) -> str:
+        self.orders.append((trading_pair, True, amount, price))
+        return f"buy-{len(self.orders)}"
+
+    def sell(self, trading_pair: str, amount: Decimal, order_type=OrderType.MARKET, price: Decimal = Decimal("NaN"),
+             **kwargs) -> str:
+        self.orders.append((trading_pair, False, amount, price))
+        return f"sell-{len(self.orders)}"
+
+
+class GraphArbitrageStrategyTest(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.exchange_a = MockExchange("exchange_a")
+        self.exchange_b = MockExchange("exchange_b")
+        self.exchange_a.set_order_book("ETH-USDT", 2000, 2001, 2)
+        self.exchange_a.set_order_book("BTC-USDT", 40000, 40010, 2)
+        self.exchange_a.set_order_book("ETH-BTC", 0.05, 0.0501, 2)
+        self.exchange_b.set_order_book("ETH-USDT", 1999, 2000, 2)
+        self.market_infos = [
+            MarketTradingPairTuple(self.exchange_a, "ETH-USDT", "ETH", "USDT"),
+            MarketTradingPairTuple(self.exchange_a, "BTC-USDT", "BTC", "USDT"),
+            MarketTradingPairTuple(self.exchange_a, "ETH-BTC", "ETH", "BTC"),
+            MarketTradingPairTuple(self.exchange_b, "ETH-USDT", "ETH", "USDT"),
+        ]
+        for exchange in (self.exchange_a, self.exchange_b):
+            exchange.balances = {"ETH": Decimal("10"), "BTC": Decimal("1"), "USDT": Decimal("100000")}
+        self.strategy = GraphArbitrageStrategy()
+        self.strategy.init_params(market_infos=self.market_infos,
+                                  min_profitability=Decimal("0.003"),
+                                  next_trade_delay_interval=10)
+        self.clock = Clock(ClockMode.BACKTEST, 1, 999, 2000)
+        self.clock.add_iterator(self.strategy)
+
+    def test_no_arbitrage(self):
+        self.clock.backtest_til(1000)
+        self.assertEqual(6, len(self.strategy.graph.cycles))
+        self.assertEqual([], self.exchange_a.orders + self.exchange_b.orders)
+
+    def test_cross_exchange_arbitrage(self):
+        self.clock.backtest_til(1000)
+        self.exchange_b.set_order_book("ETH-USDT", 1980, 1985, 0.5)
+        self.clock.backtest_til(1001)
+
+        # The path starts with ETH, the ETH sold on exchange a is bought back for less on exchange b
+        self.assertEqual([("ETH-USDT", False, Decimal("0.496"), Decimal("2000"))], self.exchange_a.orders)
+        self.assertEqual([("ETH-USDT", True, Decimal("0.5"), Decimal("1985"))], self.exchange_b.orders)
+
+        # No new arbitrage while the orders are active, and during the cool off period
+        self.clock.backtest_til(1002)
+        self.assertEqual(1, len(self.exchange_b.orders))
+        self.strategy.stop_tracking_market_order(self.market_infos[0], "sell-1")
+        self.strategy.stop_tracking_market_order(self.market_infos[3], "buy-1")
+        self.clock.backtest_til(1005)
+        self.assertEqual(1, len(self.exchange_b.orders))
+        self.clock.backtest_til(1011)
+        self.assertEqual(2, len(self.exchange_b.orders))
+
+    def test_triangular_arbitrage_limited_by_balance(self):
+        self.exchange_a.balances["BTC"] = Decimal("0.02")
+        self.clock.backtest_til(1000)
+        self.exchange_a.set_order_book("ETH-BTC", 0.048, 0.0485, 2)
+        self.clock.backtest_til(1001)
+
+        # ETH is sold for the USDT needed to buy the 0.02 BTC available to buy ETH
+        self.assertEqual([("ETH-USDT", False, Decimal("0.4"), Decimal("2000")),
+                          ("BTC-USDT", True, Decimal("0.02"), Decimal("40010")),
+                          ("ETH-BTC", True, Decimal("0.412"), Decimal("0.0485"))],
+                         self.exchange_a.orders)
+        self.assertEqual([], self.exchange_b.orders)
@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+import hummingbot.client.settings as settings
+import hummingbot.strategy.graph_arbitrage.graph_arbitrage_config_map as graph_arbitrage_config_map_module
+
+
+class GraphArbitrageConfigMapTests(TestCase):
+
+    def test_parse_markets(self):
+        self.assertEqual({"binance": ["ETH-USDT", "BTC-USDT", "ETH-BTC"], "kucoin": ["ETH-USDT"]},
+                         graph_arbitrage_config_map_module.parse_markets(
+                             "binance:ETH-USDT,BTC-USDT,eth-btc; kucoin: ETH-USDT"))
+
+    def test_markets_validation(self):
+        validate = graph_arbitrage_config_map_module.markets_validate
+        self.assertIsNone(validate("binance:ETH-USDT,BTC-USDT,ETH-BTC"))
+        self.assertIsNone(validate("binance:ETH-USDT;kucoin:ETH-USDT"))
+
+        self.assertEqual("Invalid markets. The given entry is empty.", validate(" "))
+        self.assertEqual("Invalid markets. binance is not in the exchange:TRADING-PAIR,TRADING-PAIR format.",
+                         validate("binance"))
+        self.assertTrue(validate("unknown_exchange:ETH-USDT,BTC-USDT").startswith("Invalid exchange"))
+        self.assertEqual("Invalid market. ETH-USDT-BTC is not a valid trading pair.",
+                         validate("binance:ETH-USDT,ETH-USDT-BTC"))
+        self.assertEqual("Invalid markets. At least 2 markets are required.", validate("binance:ETH-USDT"))
+
+    def test_conversion_assets(self):
+        validate = graph_arbitrage_config_map_module.conversion_assets_validate
+        self.assertIsNone(validate(""))
+        self.assertIsNone(validate("USDT,USDC,BUSD"))
+        self.assertEqual("Invalid conversion assets. At least 2 assets are required.", validate("USDT"))
+        self.assertEqual("Invalid conversion assets. US$ is not a valid asset.", validate("USDT,US$"))
+
+        graph_arbitrage_config_map_module.conversion_assets_on_validated("USDT,USDC,BUSD")
+        self.assertTrue(settings.required_rate_oracle)
+        self.assertEqual(["USDC-USDT", "BUSD-USDT", "BUSD-USDC"], settings.rate_oracle_pairs)
+
+        graph_arbitrage_config_map_module.conversion_assets_on_validated("")
+        self.assertFalse(settings.required_rate_oracle)
+        self.assertEqual([], settings.rate_oracle_pairs)
@@ -0,0 +1,105 @@
+import unittest
+from statistics import mean
+
+import numpy as np
+
+from hummingbot.strategy.liquidity_mining.quoting_engine import (
+    QuotingEngine,
+    calculate_bid_ask_ratios_from_base_asset_ratios,
+)
+from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
+    calculate_bid_ask_ratios_from_base_asset_ratio
+)
+
+
+class QuotingEngineTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 123456789
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+        self.markets = ["ETH-USDT", "ETH-BTC", "ETH-BUSD"]
+        self.engine = QuotingEngine(self.markets, volatility_interval=5, avg_volatility_period=3)
+
+    @staticmethod
+    def interval_volatility(prices, interval):
+        atr = []
+        for i in range(len(prices) - 1, -1, -interval):
+            window = prices[max(i - interval + 1, 0): i + 1]
+            if len(window) < interval and len(prices) >= interval:
+                break
+            atr.append((max(window) - min(window)) / min(window))
+        return mean(atr)
+
+    def test_volatility(self):
+        self.assertTrue(np.all(np.isnan(self.engine.volatility)))
+        prices = []
+        for i in range(40):
+            mid_prices = np.random.uniform(90, 110, len(self.markets))
+            prices.append(mid_prices)
+            self.engine.update_mid_prices(mid_prices)
+            self.engine.update_volatility()
+            # Only the prices of the last 3 intervals are used
+            history = np.array(prices[-15:])
+            for index in range(len(self.markets)):
+                self.assertAlmostEqual(self.interval_volatility(list(history[:, index]), 5),
+                                       self.engine.volatility[index])
+
+    def test_base_quotes(self):
+        self.engine.update_mid_prices([100, 0.05, 200])
+        self.engine.volatility = np.array([np.nan, 0.02, 0.5])
+        quotes = self.engine.base_quotes("ETH", 2, spread=0.01, volatility_to_spread_multiplier=1, max_spread=0.1)
+        # The spread is widened by the volatility, up to max spread
+        self.assertTrue(np.allclose([99, 0.049, 180], quotes.buy_prices))
+        self.assertTrue(np.allclose([101, 0.051, 220], quotes.sell_prices))
+        self.assertTrue(np.allclose([2, 2, 2], quotes.buy_sizes))
+        self.assertTrue(np.allclose([2, 2, 2], quotes.sell_sizes))
+
+        engine = QuotingEngine(["BTC-USDT", "ETH-USDT"], volatility_interval=5, avg_volatility_period=3)
+        engine.update_mid_prices([40000, 2000])
+        quotes = engine.base_quotes("USDT", 100, spread=0.01, volatility_to_spread_multiplier=1, max_spread=-1)
+        # The order amount is in quote token
+        self.assertTrue(np.allclose([100 / 39600, 100 / 1980], quotes.buy_sizes))
+        self.assertTrue(np.allclose([100 / 40400, 100 / 2020], quotes.sell_sizes))
+
+    def test_inventory_skew_ratios(self):
+        size = 50
+        base_amounts = np.random.uniform(0, 10, size)
+        quote_amounts = np.random.uniform(0, 1000, size)
+        base_amounts[:3] = 0
+        quote_amounts[:2] = 0
+        prices = np.random.uniform(50, 150, size)
+        ranges = np.random.uniform(0, 5, size)
+        ranges[5] = 0
+        bid_ratios, ask_ratios = calculate_bid_ask_ratios_from_base_asset_ratios(
+            base_amounts, quote_amounts, prices, 0.3, ranges)
+        for i in range(size):
+            ratios = calculate_bid_ask_ratios_from_base_asset_ratio(
+                base_amounts[i], quote_amounts[i], prices[i], 0.3, ranges[i])
+            self.assertAlmostEqual(ratios.bid_ratio, bid_ratios[i])
+            self.assertAlmostEqual(ratios.ask_ratio, ask_ratios[i])
+
+    def test_budget_constraint(self):
+        engine = QuotingEngine(["ETH-USDT", "BTC-USDT", "ETH-BTC", "LTC-BTC"],
+                               volatility_interval=5, avg_volatility_period=3)
+        engine.update_mid_prices([2000, 40000, 0.05, 0.004])
+        quotes = engine.base_quotes("USDT", 1000, spread=0.0, volatility_to_spread_multiplier=1, max_spread=-1)
+        quotes.buy_sizes = np.array([1, 0.05, 2, 50])
+        quotes.sell_sizes = np.array([0.3, 0.05, 0.5, 10])
+        balances = {"ETH": 0.6, "BTC": 0.14, "USDT": 3000, "LTC": 100}
+        engine.apply_budget_constraint(quotes, balances, buy_fee_pct=0.001)
+
+        # Same as constraining the markets one after the other
+        for index, (buy_size, sell_size, market) in enumerate([(1, 0.3, "ETH-USDT"), (0.05, 0.05, "BTC-USDT"),
+                                                               (2, 0.5, "ETH-BTC"), (50, 10, "LTC-BTC")]):
+            base, quote = market.split("-")
+            price = engine.mid_prices[index]
+            expected_sell_size = min(sell_size, balances[base])
+            balances[base] -= expected_sell_size
+            quote_size = min(buy_size * price, balances[quote])
+            balances[quote] -= quote_size
+            self.assertAlmostEqual(expected_sell_size, quotes.sell_sizes[index])
+            self.assertAlmostEqual(quote_size / (price * 1.001), quotes.buy_sizes[index])
+        # The ETH balance was used by ETH-USDT first, the BTC balance by the BTC-USDT sell order then ETH-BTC
+        self.assertAlmostEqual(0.3, quotes.sell_sizes[2])
+        self.assertAlmostEqual(0.09 / (0.05 * 1.001), quotes.buy_sizes[2])
+        self.assertEqual(0, quotes.buy_sizes[3])
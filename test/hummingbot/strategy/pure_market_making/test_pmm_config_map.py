@@ -1,9 +1,10 @@
 import unittest
 from copy import deepcopy
+from unittest.mock import patch
 
 from hummingbot.strategy.pure_market_making.pure_market_making_config_map import (
     pure_market_making_config_map as pmm_config_map, on_validate_price_source,
-    validate_price_type
+    validate_price_type, validate_additional_markets, parse_additional_markets
 )
 
 
@@ -78,3 +79,20 @@ class TestPMMConfigMap(unittest.TestCase):
 
         error = validate_price_type(value="custom")
         self.assertIsNone(error)
+
+    def test_parse_additional_markets(self):
+        self.assertEqual([], parse_additional_markets(None))
+        self.assertEqual(["ETH-USDT", "BTC-USDT"], parse_additional_markets(" eth-usdt, BTC-USDT,"))
+
+    @patch("hummingbot.strategy.pure_market_making.pure_market_making_config_map.validate_market_trading_pair")
+    def test_validate_additional_markets(self, validate_market_trading_pair_mock):
+        validate_market_trading_pair_mock.return_value = None
+        pmm_config_map["exchange"].value = "binance"
+        pmm_config_map["market"].value = "ETH-USDT"
+
+        self.assertIsNone(validate_additional_markets("BTC-USDT,LTC-USDT"))
+        self.assertIsNotNone(validate_additional_markets("BTC-USDT,ETH-USDT"))
+        self.assertIsNotNone(validate_additional_markets("BTC-USDT,btc-usdt"))
+
+        validate_market_trading_pair_mock.return_value = "Invalid trading pair."
+        self.assertEqual("Invalid trading pair.", validate_additional_markets("BTC-USDT"))
@@ -0,0 +1,253 @@
+import unittest
+from decimal import Decimal
+from typing import Dict, List, Tuple
+
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.events import (
+    MarketEvent,
+    OrderCancelledEvent,
+    OrderType,
+    TradeFee,
+    TradeType,
+)
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making import (
+    PureMarketMakingMultiPairStrategy,
+    PureMarketMakingStrategy,
+)
+import hummingbot.strategy.pure_market_making.start as strategy_start
+from hummingbot.strategy.pure_market_making.pure_market_making_config_map import (
+    pure_market_making_config_map as c_map
+)
+from test.hummingbot.strategy import assign_config_default
+
+
+class MockExchange(ExchangeBase):
+    def __init__(self):
+        super().__init__()
+        self.mock_order_books: Dict[str, OrderBook] = {}
+        self.balances: Dict[str, Decimal] = {}
+        self.actions: List[Tuple[str, str]] = []
+        self.batches: List[Tuple[str, int]] = []
+        self.orders: List[Tuple[str, bool, Decimal, Decimal]] = []
+
+    @property
+    def name(self):
+        return "mock_exchange"
+
+    @property
+    def display_name(self):
+        return self.name
+
+    @property
+    def ready(self):
+        return True
+
+    @property
+    def limit_orders(self):
+        return []
+
+    def get_order_book(self, trading_pair: str) -> OrderBook:
+        return self.mock_order_books[trading_pair]
+
+    def set_order_book(self, trading_pair: str, bid: float, ask: float, amount: float):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(bid, amount, 1)], [OrderBookRow(ask, amount, 1)], 1)
+        self.mock_order_books[trading_pair] = order_book
+
+    def get_fee(self, base_currency: str, quote_currency: str, order_type: OrderType, order_side: TradeType,
+                amount: Decimal, price: Decimal = Decimal("NaN")) -> TradeFee:
+        return TradeFee(Decimal("0"), [])
+
+    def get_balance(self, currency: str) -> Decimal:
+        return self.balances.get(currency, Decimal("0"))
+
+    def get_available_balance(self, currency: str) -> Decimal:
+        return self.balances.get(currency, Decimal("0"))
+
+    def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
+        return Decimal("0.0001")
+
+    def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
+        return Decimal("0.001")
+
+    def get_maker_order_type(self):
+        return OrderType.LIMIT
+
+    def buy(self, trading_pair: str, amount: Decimal, order_type=OrderType.LIMIT, price: Decimal = Decimal("NaN"),
+            **kwargs) -> str:
+        self.orders.append((trading_pair, True, amount, price))
+        order_id = f"//buy-{len(self.orders)}"
+        self.actions.append(("create", order_id))
+        return order_id
+
+    def sell(self, trading_pair: str, amount: Decimal, order_type=OrderType.LIMIT, price: Decimal = Decimal("NaN"),
+             **kwargs) -> str:
+        self.orders.append((trading_pair, False, amount, price))
+        order_id = f"//sell-{len(self.orders)}"
+        self.actions.append(("create", order_id))
+        return order_id
+
+    def batch_create_orders(self, orders_to_create: List[LimitOrder], order_type: OrderType = OrderType.LIMIT,
+                            **kwargs) -> List[LimitOrder]:
+        self.batches.append(("create", len(orders_to_create)))
+        return super().batch_create_orders(orders_to_create, order_type, **kwargs)
+
+    def batch_cancel_orders(self, orders_to_cancel: List[LimitOrder]):
+        self.batches.append(("cancel", len(orders_to_cancel)))
+        return super().batch_cancel_orders(orders_to_cancel)
+
+    def cancel(self, trading_pair: str, client_order_id: str):
+        self.actions.append(("cancel", client_order_id))
+        self.trigger_event(MarketEvent.OrderCancelled, OrderCancelledEvent(self.current_timestamp, client_order_id))
+        return client_order_id
+
+
+class PureMarketMakingMultiPairTest(unittest.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.exchange = MockExchange()
+        self.exchange.set_order_book("ETH-USDT", 1999, 2001, 10)
+        self.exchange.set_order_book("BTC-USDT", 39990, 40010, 10)
+        self.exchange.balances = {"ETH": Decimal("10"), "BTC": Decimal("1"), "USDT": Decimal("3000")}
+        self.market_infos = [MarketTradingPairTuple(self.exchange, "ETH-USDT", "ETH", "USDT"),
+                             MarketTradingPairTuple(self.exchange, "BTC-USDT", "BTC", "USDT")]
+        self.strategies = []
+        for market_info in self.market_infos:
+            strategy = PureMarketMakingStrategy()
+            strategy.init_params(market_info,
+                                 bid_spread=Decimal("0.01"),
+                                 ask_spread=Decimal("0.01"),
+                                 order_amount=Decimal("0.05"),
+                                 order_refresh_time=30,
+                                 filled_order_delay=30)
+            self.strategies.append(strategy)
+        self.strategy = PureMarketMakingMultiPairStrategy()
+        self.strategy.init_params(self.strategies)
+        self.clock = Clock(ClockMode.BACKTEST, 1, 999, 2000)
+        self.clock.add_iterator(self.strategy)
+
+    def test_init_params_validation(self):
+        with self.assertRaises(ValueError):
+            PureMarketMakingMultiPairStrategy().init_params([])
+        other_strategy = PureMarketMakingStrategy()
+        other_strategy.init_params(MarketTradingPairTuple(MockExchange(), "ETH-USDT", "ETH", "USDT"),
+                                   bid_spread=Decimal("0.01"),
+                                   ask_spread=Decimal("0.01"),
+                                   order_amount=Decimal("1"))
+        with self.assertRaises(ValueError):
+            PureMarketMakingMultiPairStrategy().init_params([self.strategies[0], other_strategy])
+
+    def test_orders_created_for_all_pairs(self):
+        self.clock.backtest_til(1000)
+        self.assertEqual(4, len(self.exchange.orders))
+        self.assertEqual({"ETH-USDT", "BTC-USDT"}, set(order[0] for order in self.exchange.orders))
+        self.assertEqual(2, len(self.strategies[0].active_orders))
+        self.assertEqual(2, len(self.strategies[1].active_orders))
+        self.assertEqual(4, len(self.strategy.active_orders))
+
+    def test_shared_quote_balance(self):
+        # The quote balance is enough for the ETH buy order only, it is not used a second time for the BTC buy order
+        self.exchange.balances["USDT"] = Decimal("100")
+        self.clock.backtest_til(1000)
+        buys = [order for order in self.exchange.orders if order[1]]
+        self.assertEqual(1, len(buys))
+        self.assertEqual("ETH-USDT", buys[0][0])
+        self.assertEqual(Decimal("0.05"), buys[0][2])
+        self.assertEqual(2, len([order for order in self.exchange.orders if not order[1]]))
+
+    def test_cancels_before_creates(self):
+        self.clock.backtest_til(1000)
+        self.exchange.actions.clear()
+        self.exchange.set_order_book("ETH-USDT", 2099, 2101, 10)
+        self.exchange.set_order_book("BTC-USDT", 41990, 42010, 10)
+        self.clock.backtest_til(1031)
+        # The orders of both pairs are cancelled before the new orders of both pairs are created
+        actions = [action for action, _ in self.exchange.actions]
+        self.assertEqual(["cancel"] * 4 + ["create"] * 4, actions)
+        self.assertEqual(2, len(self.strategies[0].active_orders))
+        self.assertEqual(2, len(self.strategies[1].active_orders))
+
+    def test_orders_placed_and_cancelled_in_batch(self):
+        self.clock.backtest_til(1000)
+        # The bid and ask of each pair are placed with one batch
+        self.assertEqual([("create", 2), ("create", 2)], self.exchange.batches)
+        self.exchange.batches.clear()
+        # The prices move within the spreads, so the orders are only cancelled when they are refreshed
+        self.exchange.set_order_book("ETH-USDT", 2009, 2011, 10)
+        self.exchange.set_order_book("BTC-USDT", 40190, 40210, 10)
+        self.clock.backtest_til(1029)
+        self.assertEqual([], self.exchange.batches)
+        self.clock.backtest_til(1031)
+        self.assertEqual([("cancel", 2), ("cancel", 2), ("create", 2), ("create", 2)], self.exchange.batches)
+
+
+class PureMarketMakingMultiPairStartTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.strategy = None
+        self.markets = {"binance": MockExchange()}
+        self.notifications = []
+        self.log_errors = []
+        assign_config_default(c_map)
+        c_map.get("exchange").value = "binance"
+        c_map.get("market").value = "ETH-USDT"
+        c_map.get("additional_markets").value = "BTC-USDT,LTC-BTC"
+        c_map.get("order_amount").value = Decimal("2")
+        c_map.get("order_refresh_time").value = 60.
+        c_map.get("bid_spread").value = Decimal("1")
+        c_map.get("ask_spread").value = Decimal("2")
+        c_map.get("order_levels").value = 2
+        c_map.get("order_level_amount").value = Decimal("0.5")
+        c_map.get("order_level_spread").value = Decimal("0.2")
+
+    def _initialize_market_assets(self, market, trading_pairs):
+        return [tuple(trading_pair.split("-")) for trading_pair in trading_pairs]
+
+    def _initialize_wallet(self, token_trading_pairs):
+        pass
+
+    def _initialize_markets(self, market_names):
+        pass
+
+    def _notify(self, message):
+        self.notifications.append(message)
+
+    def logger(self):
+        return self
+
+    def error(self, message, exc_info):
+        self.log_errors.append(message)
+
+    def test_strategy_creation(self):
+        strategy_start.start(self)
+        self.assertIsInstance(self.strategy, PureMarketMakingMultiPairStrategy)
+        self.assertEqual(["ETH-USDT", "BTC-USDT", "LTC-BTC"],
+                         [strategy.trading_pair for strategy in self.strategy.strategies])
+        self.assertEqual({"ETH", "USDT", "BTC", "LTC"}, self.assets)
+        for strategy in self.strategy.strategies:
+            # The order amount is in the base asset of each trading pair
+            self.assertEqual(Decimal("2"), strategy.order_amount)
+            self.assertEqual(strategy.market_info.base_asset, strategy.trading_pair.split("-")[0])
+            self.assertEqual(Decimal("0.01"), strategy.bid_spread)
+            self.assertEqual(Decimal("0.02"), strategy.ask_spread)
+            self.assertEqual(2, strategy.order_levels)
+            self.assertEqual(Decimal("0.5"), strategy.order_level_amount)
+            self.assertEqual(Decimal("0.002"), strategy.order_level_spread)
+            self.assertEqual(Decimal("-1"), strategy.price_ceiling)
+            self.assertEqual(Decimal("-1"), strategy.price_floor)
+
+    def test_price_ceiling_and_floor_not_supported(self):
+        for key in ["price_ceiling", "price_floor"]:
+            c_map.get(key).value = Decimal("3000")
+            strategy_start.start(self)
+            self.assertIsNone(self.strategy)
+            self.assertEqual("Additional markets are only supported without price ceiling and price floor.",
+                             self.notifications[-1])
+            c_map.get(key).value = Decimal("-1")
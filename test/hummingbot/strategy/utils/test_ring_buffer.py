@@ -95,3 +95,36 @@ class RingBufferTest(unittest.TestCase):
         value = Decimal(3.141592653)
         self.buffer.add_value(value)
         self.assertAlmostEqual(float(value), self.buffer.get_last_value(), 6)
+
+    def test_get_first_value(self):
+        self.assertTrue(np.isnan(self.buffer.get_first_value()))
+        for i in range(self.BUFFER_LENGTH + 5):
+            self.buffer.add_value(i)
+            self.assertEqual(self.buffer.get_as_numpy_array()[0], self.buffer.get_first_value())
+        self.assertEqual(5, self.buffer.get_first_value())
+
+    def test_get_as_numpy_array_keeps_order(self):
+        for i in range(self.BUFFER_LENGTH // 2):
+            self.buffer.add_value(i)
+        self.assertEqual(list(range(self.BUFFER_LENGTH // 2)), list(self.buffer.get_as_numpy_array()))
+        for i in range(self.BUFFER_LENGTH // 2, self.BUFFER_LENGTH * 2 + 3):
+            self.buffer.add_value(i)
+        self.assertEqual(list(range(self.BUFFER_LENGTH + 3, self.BUFFER_LENGTH * 2 + 3)),
+                         list(self.buffer.get_as_numpy_array()))
+
+    def test_current_mean_and_variance_match_numpy(self):
+        self.assertEqual(0, self.buffer.count)
+        self.assertTrue(np.isnan(self.buffer.current_mean))
+        self.assertTrue(np.isnan(self.buffer.current_variance))
+        np.random.seed(123456789)
+        # Large values with a small spread, a naive sum of squares would lose the variance here
+        for value in np.random.normal(1e4, 1, self.BUFFER_LENGTH * 50):
+            self.buffer.add_value(value)
+            values = self.buffer.get_as_numpy_array()
+            self.assertEqual(values.size, self.buffer.count)
+            self.assertAlmostEqual(np.mean(values), self.buffer.current_mean, 8)
+            self.assertAlmostEqual(np.var(values), self.buffer.current_variance, 8)
+            if self.buffer.is_full:
+                self.assertEqual(self.buffer.current_mean, self.buffer.mean_value)
+                self.assertEqual(self.buffer.current_variance, self.buffer.variance)
+                self.assertAlmostEqual(np.std(values), self.buffer.std_dev, 8)
@@ -0,0 +1,34 @@
+import unittest
+import numpy as np
+import pandas as pd
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import \
+    ExponentialMovingAverageIndicator
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 123456789
+    BUFFER_LENGTH = 30
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def test_processing_length_should_be_1(self):
+        with self.assertRaises(Exception):
+            ExponentialMovingAverageIndicator(self.BUFFER_LENGTH, 2)
+
+    def test_constant_samples(self):
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+        for i in range(self.BUFFER_LENGTH * 3):
+            indicator.add_sample(10)
+            self.assertAlmostEqual(10, indicator.current_value, 10)
+
+    def test_incremental_average_matches_pandas(self):
+        indicator = ExponentialMovingAverageIndicator(self.BUFFER_LENGTH)
+        sampling_window = []
+        for sample in np.random.normal(100, 10, self.BUFFER_LENGTH * 20):
+            indicator.add_sample(sample)
+            # The buffers store their values as floats
+            sampling_window = (sampling_window + [np.float32(sample)])[-self.BUFFER_LENGTH:]
+            expected = pd.Series(np.array(sampling_window, dtype=np.float64))\
+                .ewm(span=self.BUFFER_LENGTH, adjust=True).mean().iloc[-1]
+            self.assertAlmostEqual(expected, indicator.current_value, delta=expected * 1e-6)
@@ -66,3 +66,21 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_incremental_volatility_matches_full_calculation(self):
+        returns = np.random.normal(0, 0.1, 499)
+        samples = [100]
+        for r in returns:
+            samples.append(samples[-1] * np.exp(r))
+        indicator = HistoricalVolatilityIndicator(50, 10)
+        sampling_window = []
+        processing_window = []
+        for sample in samples:
+            indicator.add_sample(sample)
+            # The buffers store their values as floats
+            sampling_window = (sampling_window + [np.float32(sample)])[-50:]
+            log_returns = np.diff(np.log(np.array(sampling_window, dtype=np.float64)))
+            variance = np.var(log_returns) if log_returns.size > 0 else np.nan
+            processing_window = (processing_window + [np.float32(variance)])[-10:]
+            expected = np.sqrt(np.mean(np.nan_to_num(processing_window)))
+            self.assertAlmostEqual(expected, indicator.current_value, delta=expected * 1e-6)
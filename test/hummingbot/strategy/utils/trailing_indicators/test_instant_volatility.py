@@ -57,3 +57,16 @@ class InstantVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_incremental_volatility_matches_full_calculation(self):
+        samples = np.random.normal(100, 10, 500)
+        indicator = InstantVolatilityIndicator(50, 10)
+        sampling_window = []
+        processing_window = []
+        for sample in samples:
+            indicator.add_sample(sample)
+            # The buffers store their values as floats
+            sampling_window = (sampling_window + [np.float32(sample)])[-50:]
+            processing_window = (processing_window + [np.float32(np.var(sampling_window))])[-10:]
+            expected = np.sqrt(np.mean(processing_window))
+            self.assertAlmostEqual(expected, indicator.current_value, delta=expected * 1e-6)